@@ -60,6 +60,7 @@ from .spiceypy import (
     get_found_catch_state,
     spice_found_exception_thrower,
     config,
+    spice_lock,
     UDFUNC,
     UDFUNS,
     UDFUNB,
@@ -0,0 +1,368 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) [2015-2025] [Andrew Annex]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import collections
+import concurrent.futures
+import functools
+import inspect
+import queue
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy
+from numpy import ndarray
+
+from . import config
+from . import spiceypy as _spiceypy
+
+__all__ = ["AsyncSpice", "default", "run"]
+
+
+class _Call:
+    # a queued call, catch is the found check setting of the awaiting thread
+    __slots__ = ("future", "function", "args", "kwargs", "catch")
+
+    def __init__(
+        self,
+        future: concurrent.futures.Future,
+        function: Callable,
+        args: tuple,
+        kwargs: dict,
+        catch: bool,
+    ) -> None:
+        self.future = future
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        self.catch = catch
+
+
+class _Slots:
+    # a counting semaphore that coroutines of any event loop can wait on, an
+    # asyncio.Semaphore is bound to the first loop that waits on it
+    def __init__(self, value: int) -> None:
+        self._value = value
+        self._lock = threading.Lock()
+        self._waiters = collections.deque()
+
+    async def acquire(self) -> None:
+        with self._lock:
+            if self._value > 0 and not self._waiters:
+                self._value -= 1
+                return
+            loop = asyncio.get_running_loop()
+            waiter = (loop, loop.create_future())
+            self._waiters.append(waiter)
+        try:
+            await waiter[1]
+        except asyncio.CancelledError:
+            with self._lock:
+                handed = waiter not in self._waiters
+                if not handed:
+                    self._waiters.remove(waiter)
+            # a slot handed over while the waiter was being cancelled is passed on
+            if handed:
+                self.release()
+            raise
+
+    def release(self) -> None:
+        with self._lock:
+            while self._waiters:
+                loop, future = self._waiters.popleft()
+                try:
+                    loop.call_soon_threadsafe(_wake, future)
+                except RuntimeError:
+                    # the loop of the waiter is closed
+                    continue
+                return
+            self._value += 1
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        self.release()
+
+
+def _wake(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+def _resolve(function: Union[str, Callable]) -> Callable:
+    if callable(function):
+        return function
+    if not function.startswith("_"):
+        f = getattr(_spiceypy, function, None)
+        if inspect.isfunction(f):
+            return f
+    raise AttributeError(f"spiceypy has no function {function!r}")
+
+
+def _merge_key(call: _Call) -> Optional[Tuple[tuple, list]]:
+    # calls of a cyice dispatched function with a scalar epoch that agree on
+    # every other argument can be answered by one call of its _v function
+    if call.kwargs:
+        return None
+    name = getattr(call.function, "__name__", "")
+    info = _spiceypy._cyice_dispatched.get(name)
+    if info is None or getattr(_spiceypy, name) is not call.function:
+        return None
+    spec, epoch, names = info
+    if epoch < 0:
+        return None
+    coerced = _spiceypy._cyice_args(spec, epoch, names, call.args, {})
+    if coerced is None or coerced[0]:
+        return None
+    cargs = coerced[1]
+    key = [name, epoch, call.catch]
+    for i, x in enumerate(cargs):
+        if i != epoch:
+            key.append(x.tobytes() if isinstance(x, ndarray) else x)
+    return tuple(key), cargs
+
+
+def _item(value: Any, k: int) -> Any:
+    # the k-th element of a _v output in the form the _s function returns it
+    x = value[k]
+    if isinstance(x, ndarray):
+        return x.copy()
+    if isinstance(x, numpy.generic):
+        return x.item()
+    return x
+
+
+class AsyncSpice:
+    """
+    Awaitable SPICE calls served by one dedicated thread.
+
+    Calls are queued and run in submission order on a thread owned by the
+    instance, so a long gf search or a large vectorized call never blocks
+    the event loop. At most max_pending calls are queued at once, further
+    callers wait for a free slot. An instance is not tied to an event loop,
+    it may be used from successive asyncio.run calls or several loops.
+    Cancelling the awaiting task of a call that has not started yet removes
+    it from the queue.
+
+    When merge is set, queued calls of a function with a cyice vectorized
+    counterpart that only differ in their epoch, such as many concurrent
+    spkezr requests for one target and observer, are answered by a single
+    call of the _v function. If that call fails the calls are run one by
+    one, so every caller gets its own result or error.
+
+    Any public spiceypy function is available as an awaitable attribute:
+
+    >>> async with AsyncSpice() as spice:
+    ...     await spice.furnsh("path/to/kernel.txt")
+    ...     state, lt = await spice.spkezr("MOON", et, "J2000", "LT+S", "EARTH")
+    """
+
+    def __init__(self, max_pending: int = 1024, merge: bool = True) -> None:
+        """
+        :param max_pending: maximum number of queued calls
+        :param merge: merge calls that only differ in their epoch into one _v call
+        """
+        self.max_pending = max_pending
+        self.merge = merge
+        # number of calls answered by merged _v calls
+        self.merged = 0
+        self._slots = _Slots(max_pending)
+        self._queue = queue.SimpleQueue()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._serve, name="spiceypy-aio", daemon=True
+        )
+        self._thread.start()
+
+    async def __aenter__(self) -> "AsyncSpice":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    def __getattr__(self, name: str) -> Callable:
+        function = _resolve(name)
+
+        @functools.wraps(function)
+        async def call(*args, **kwargs):
+            return await self.run(function, *args, **kwargs)
+
+        return call
+
+    async def run(self, function: Union[str, Callable], *args, **kwargs) -> Any:
+        """
+        Run a function on the SPICE thread and wait for its result.
+
+        :param function: spiceypy or cyice function, or the name of a spiceypy function
+        :param args: positional arguments of the function
+        :param kwargs: keyword arguments of the function
+        :return: the result of the function
+        """
+        if self._closed:
+            raise RuntimeError("AsyncSpice is closed")
+        function = _resolve(function)
+        async with self._slots:
+            future = concurrent.futures.Future()
+            self._queue.put(
+                _Call(future, function, args, kwargs, config.catch_false_founds)
+            )
+            return await asyncio.wrap_future(future)
+
+    def close(self, wait: bool = True) -> None:
+        """
+        Stop the SPICE thread once the queued calls have run.
+
+        :param wait: block until the thread has stopped
+        """
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+        if wait:
+            self._thread.join()
+
+    async def aclose(self) -> None:
+        """
+        Stop the SPICE thread once the queued calls have run, without blocking the event loop.
+        """
+        self.close(wait=False)
+        await asyncio.get_running_loop().run_in_executor(None, self._thread.join)
+
+    def _serve(self) -> None:
+        while True:
+            calls = [self._queue.get()]
+            while True:
+                try:
+                    calls.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = None in calls
+            self._process([call for call in calls if call is not None])
+            if stop:
+                return
+
+    def _process(self, calls: List[_Call]) -> None:
+        if not (
+            self.merge
+            and len(calls) > 1
+            and config.use_cyice
+            and _spiceypy._load_cyice() is not None
+        ):
+            for call in calls:
+                self._run_one(call)
+            return
+        # merged calls only read SPICE state so they may be run together, but
+        # never moved past a call that may change it, such as furnsh
+        groups: Dict[tuple, List[Tuple[_Call, list]]] = {}
+        for call in calls:
+            merge = _merge_key(call)
+            if merge is None:
+                self._run_groups(groups)
+                groups = {}
+                self._run_one(call)
+            else:
+                groups.setdefault(merge[0], []).append((call, merge[1]))
+        self._run_groups(groups)
+
+    def _run_groups(self, groups: Dict[tuple, List[Tuple[_Call, list]]]) -> None:
+        for key, group in groups.items():
+            # drop the calls cancelled while queued
+            group = [
+                (call, cargs)
+                for call, cargs in group
+                if call.future.set_running_or_notify_cancel()
+            ]
+            if len(group) == 1:
+                self._execute(group[0][0])
+                continue
+            if not group:
+                continue
+            name, epoch, catch = key[:3]
+            args = list(group[0][1])
+            args[epoch] = numpy.array([cargs[epoch] for _, cargs in group])
+            config.catch_false_founds = catch
+            try:
+                res = getattr(_spiceypy._load_cyice(), f"{name}_v")(*args)
+            except Exception:
+                for call, _ in group:
+                    self._execute(call)
+                continue
+            self.merged += len(group)
+            for k, (call, _) in enumerate(group):
+                if isinstance(res, tuple):
+                    call.future.set_result(tuple(_item(value, k) for value in res))
+                else:
+                    call.future.set_result(_item(res, k))
+
+    @classmethod
+    def _run_one(cls, call: _Call) -> None:
+        # calls cancelled while queued are dropped
+        if call.future.set_running_or_notify_cancel():
+            cls._execute(call)
+
+    @staticmethod
+    def _execute(call: _Call) -> None:
+        config.catch_false_founds = call.catch
+        try:
+            result = call.function(*call.args, **call.kwargs)
+        except Exception as err:
+            call.future.set_exception(err)
+        else:
+            call.future.set_result(result)
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def default() -> AsyncSpice:
+    """
+    Return the AsyncSpice instance used by the module level functions, creating it on first use.
+
+    :return: the default AsyncSpice instance
+    """
+    global _default
+    with _default_lock:
+        if _default is None or _default._closed:
+            _default = AsyncSpice()
+        return _default
+
+
+async def run(function: Union[str, Callable], *args, **kwargs) -> Any:
+    """
+    Run a function on the SPICE thread of the default instance and wait for its result.
+
+    :param function: spiceypy or cyice function, or the name of a spiceypy function
+    :param args: positional arguments of the function
+    :param kwargs: keyword arguments of the function
+    :return: the result of the function
+    """
+    return await default().run(function, *args, **kwargs)
+
+
+def __getattr__(name: str) -> Callable:
+    # awaitable versions of the public spiceypy functions, spiceypy.aio.spkezr(...)
+    if name.startswith("_"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(default(), name)
@@ -67,6 +67,28 @@ def load_earth_kernels():
     spice.furnsh(CoreKernels.testMetaKernel)
 
 
+@pytest.fixture
+def load_phobos_dsk():
+    spice.furnsh(ExtraKernels.phobosDsk)
+    handle = spice.kdata(0, "DSK", 256, 5, 256)[3]
+    dladsc = spice.dlabfs(handle)
+    dskdsc = spice.dskgd(handle, dladsc)
+    return handle, dladsc, dskdsc
+
+
+def phobos_rays(dskdsc, n):
+    # rays from outside the shape model towards its center, every fifth one
+    # pointing away from the body and missing it
+    lons = np.linspace(-np.pi, np.pi, n, endpoint=False)
+    lats = np.linspace(-1.2, 1.2, n)
+    vertices = np.array(
+        [spice.latrec(2.0 * dskdsc.co3max, lon, lat) for lon, lat in zip(lons, lats)]
+    )
+    raydirs = -vertices
+    raydirs[::5] = vertices[::5]
+    return vertices, raydirs
+
+
 @pytest.fixture(autouse=True)
 def clear_kernel_pool_and_reset():
     spice.kclear()
@@ -78,6 +100,15 @@ def clear_kernel_pool_and_reset():
     spice.reset()
 
 
+@pytest.fixture(autouse=True)
+def ctypes_spiceypy():
+    # benchmark the ctypes wrappers rather than the cyice dispatch from spiceypy
+    use_cyice = spice.config.use_cyice
+    spice.config.use_cyice = False
+    yield
+    spice.config.use_cyice = use_cyice
+
+
 @pytest.fixture
 def grouped_benchmark(request, benchmark):
     benchmark.group = request.param
@@ -477,6 +508,267 @@ def test_dpr(function, grouped_benchmark):
     assert function() == 180.0 / np.arccos(-1.0)
 
 
+@pytest.mark.parametrize("grouped_benchmark", ["dsk02_export"], indirect=True)
+def test_dsk02_export(grouped_benchmark, load_phobos_dsk):
+    handle, dladsc, dskdsc = load_phobos_dsk
+    grouped_benchmark(cyice.dsk02_export, handle, dladsc)
+    vrtces, plates, params, spaixd, spaixi, dskdsc2 = cyice.dsk02_export(handle, dladsc)
+    nv, np_ = spice.dskz02(handle, dladsc)
+    assert vrtces.shape == (nv, 3) and plates.shape == (np_, 3)
+    assert plates.dtype == np.int32
+    npt.assert_array_equal(vrtces, spice.dskv02(handle, dladsc, 1, nv))
+    npt.assert_array_equal(plates, spice.dskp02(handle, dladsc, 1, np_))
+    bookkeeping = spice.dskb02(handle, dladsc)
+    assert params == cyice.dskb02(handle, dladsc)
+    for name, value in zip(cyice.DSKB02_DTYPE.names, bookkeeping):
+        npt.assert_array_equal(params[name], value)
+    npt.assert_array_equal(spaixd[:6], params["vtxbds"].ravel())
+    npt.assert_array_equal(spaixd[6:9], params["voxori"])
+    assert spaixd[9] == params["voxsiz"]
+    npt.assert_array_equal(spaixi[:3], params["vgrext"])
+    assert spaixi.size == (
+        100007 + params["voxnpt"] + params["voxnpl"] + nv + params["vtxnpl"]
+    )
+    for name in ("surfce", "center", "dclass", "frmcde", "co3min", "co3max"):
+        assert dskdsc2[name] == getattr(dskdsc, name)
+    # the exported arrays write an identical segment
+    dskpath = os.path.join(cwd, "TESTdsk02_export.bds")
+    if spice.exists(dskpath):
+        os.remove(dskpath)
+    out = spice.dskopn(dskpath, "TESTdsk02_export.bds", 0)
+    spice.dskw02(
+        out,
+        dskdsc2["center"],
+        dskdsc2["surfce"],
+        dskdsc2["dclass"],
+        spice.frmnam(dskdsc2["frmcde"]),
+        dskdsc2["corsys"],
+        dskdsc2["corpar"],
+        *[dskdsc2[name] for name in cyice.DSKDSC_DTYPE.names[7:]],
+        vrtces,
+        plates,
+        spaixd,
+        spaixi,
+    )
+    spice.dskcls(out)
+    copy = spice.dasopr(dskpath)
+    exported = cyice.dsk02_export(copy, spice.dlabfs(copy))
+    spice.dascls(copy)
+    os.remove(dskpath)
+    for value, expected in zip(exported, (vrtces, plates, params, spaixd, spaixi)):
+        npt.assert_array_equal(value, expected)
+
+
+def test_dskmi2_dskrb2(load_phobos_dsk):
+    handle, dladsc, dskdsc = load_phobos_dsk
+    vrtces, plates = cyice.dsk02_export(handle, dladsc)[:2]
+    spxisz = 100007 + 20000 + 2 * len(vrtces) + 3 * len(plates)
+    sizes = (5.0, 4, 10000, 10000, 10000, True, spxisz)
+    spaixd, spaixi = cyice.dskmi2(vrtces, plates, *sizes)
+    expected_spaixd, expected_spaixi = spice.dskmi2(vrtces, plates, *sizes)
+    npt.assert_array_equal(spaixd, expected_spaixd)
+    # the unused end of the integer index is cut off
+    assert spaixi.size == 100007 + spaixi[4] + spaixi[5] + len(vrtces) + spaixi[6]
+    npt.assert_array_equal(spaixi, expected_spaixi[: spaixi.size])
+    corpar = np.zeros(10)
+    assert cyice.dskrb2(vrtces, plates, 1, corpar) == spice.dskrb2(
+        vrtces, plates, 1, corpar
+    )
+
+
+@pytest.mark.parametrize("max_plates", [None, 300])
+def test_write_dsk_type2(load_phobos_dsk, max_plates):
+    handle, dladsc, dskdsc = load_phobos_dsk
+    vrtces, plates = cyice.dsk02_export(handle, dladsc)[:2]
+    dskpath = os.path.join(cwd, "TESTwrite_dsk_type2.bds")
+    if spice.exists(dskpath):
+        os.remove(dskpath)
+    first, last = -50 * spice.jyear(), 50 * spice.jyear()
+    segments = cyice.write_dsk_type2(
+        dskpath,
+        vrtces,
+        plates,
+        401,
+        1,
+        "IAU_PHOBOS",
+        first,
+        last,
+        max_plates=max_plates,
+    )
+    step = max_plates or len(plates)
+    assert [s.first_plate for s in segments] == list(range(0, len(plates), step))
+    assert sum(s.np for s in segments) == len(plates)
+    for segment in segments:
+        assert segment.index_time > 0.0 and segment.write_time > 0.0
+    copy = spice.dasopr(dskpath)
+    segment_dladsc = spice.dlabfs(copy)
+    for segment in segments:
+        segment_vrtces, segment_plates, params, *_, segment_dskdsc = cyice.dsk02_export(
+            copy, segment_dladsc
+        )
+        assert (params["nv"], params["np"]) == (segment.nv, segment.np)
+        assert segment_dskdsc["center"] == 401 and segment_dskdsc["surfce"] == 1
+        assert segment_dskdsc["co3min"] == segment.mncor3
+        assert segment_dskdsc["co3max"] == segment.mxcor3
+        assert (segment_dskdsc["start"], segment_dskdsc["stop"]) == (first, last)
+        # each segment holds the corners of its run of plates
+        expected = plates[segment.first_plate : segment.first_plate + segment.np]
+        npt.assert_array_equal(segment_vrtces[segment_plates - 1], vrtces[expected - 1])
+        if max_plates is None:
+            npt.assert_array_equal(segment_vrtces, vrtces)
+            npt.assert_array_equal(segment_plates, plates)
+        with spice.no_found_check():
+            segment_dladsc, found = spice.dlafns(copy, segment_dladsc)
+    assert not found
+    spice.dascls(copy)
+    os.remove(dskpath)
+
+
+def test_write_dsk_type2_errors(load_phobos_dsk):
+    handle, dladsc, dskdsc = load_phobos_dsk
+    vrtces, plates = cyice.dsk02_export(handle, dladsc)[:2]
+    dskpath = os.path.join(cwd, "TESTwrite_dsk_type2_errors.bds")
+    args = (401, 1, "IAU_PHOBOS", 0.0, 1.0)
+    with pytest.raises(ValueError):
+        cyice.write_dsk_type2(dskpath, vrtces, plates + len(vrtces), *args)
+    with pytest.raises(ValueError):
+        cyice.write_dsk_type2(dskpath, vrtces, plates, *args, max_plates=0)
+    assert not spice.exists(dskpath)
+
+
+@pytest.mark.parametrize(
+    "function", [cyice.dskx02_s, cyice.dskx02, spice.dskx02], ids=get_module_name
+)
+@pytest.mark.parametrize("grouped_benchmark", ["dskx02"], indirect=True)
+def test_dskx02(function, grouped_benchmark, load_phobos_dsk):
+    handle, dladsc, dskdsc = load_phobos_dsk
+    vertex = spice.latrec(2.0 * dskdsc.co3max, 0.0, 0.0)
+    raydir = spice.vminus(vertex)
+    grouped_benchmark(function, handle, dladsc, vertex, raydir)
+    plid, xpt, found = function(handle, dladsc, vertex, raydir)
+    assert found
+    assert plid in (349, 350, 420, 421, 422, 423)
+    npt.assert_almost_equal(xpt, [12.36679999999999957083, 0.0, 0.0])
+
+
+@pytest.mark.parametrize(
+    "function", [cyice.dskx02, cyice.dskx02_v], ids=get_module_name
+)
+@pytest.mark.parametrize("grouped_benchmark", ["dskx02_v"], indirect=True)
+def test_dskx02_v(function, grouped_benchmark, load_phobos_dsk):
+    handle, dladsc, dskdsc = load_phobos_dsk
+    vertices, raydirs = phobos_rays(dskdsc, 100)
+    grouped_benchmark(function, handle, dladsc, vertices, raydirs)
+    plids, xpts, founds = function(handle, dladsc, vertices, raydirs)
+    assert founds.dtype == np.bool_
+    assert not founds[::5].any()
+    for i in range(len(vertices)):
+        plid, xpt, found = spice.dskx02(handle, dladsc, vertices[i], raydirs[i])
+        assert founds[i] == found
+        if found:
+            assert plids[i] == plid
+            npt.assert_array_equal(xpts[i], xpt)
+        else:
+            npt.assert_array_equal(xpts[i], 0.0)
+    # the descriptor may also be given as a record or its integers
+    record = np.frombuffer(dladsc, dtype=cyice.DLADSC_DTYPE)[0]
+    npt.assert_array_equal(function(handle, record, vertices, raydirs)[0], plids)
+    npt.assert_array_equal(
+        function(handle, list(np.frombuffer(dladsc, np.int32)), vertices, raydirs)[0],
+        plids,
+    )
+
+
+@pytest.mark.parametrize(
+    "function", [cyice.dskxsi_s, cyice.dskxsi, spice.dskxsi], ids=get_module_name
+)
+@pytest.mark.parametrize("grouped_benchmark", ["dskxsi"], indirect=True)
+def test_dskxsi(function, grouped_benchmark, load_phobos_dsk):
+    handle, dladsc, dskdsc = load_phobos_dsk
+    target = spice.bodc2n(dskdsc.center)
+    fixref = spice.frmnam(dskdsc.frmcde)
+    vertex = spice.latrec(1.0e10, 0.0, 0.0)
+    raydir = spice.vminus(vertex)
+    srflst = [dskdsc.surfce]
+    grouped_benchmark(function, False, target, srflst, 0.0, fixref, vertex, raydir)
+    xpt, handle2, dladsc2, dskdsc2, dc, ic = function(
+        False, target, srflst, 0.0, fixref, vertex, raydir
+    )[:6]
+    assert handle2 == handle
+    assert ic[0] in (349, 350, 420, 421, 422, 423)
+    assert dc[0] == pytest.approx(0.0)
+    npt.assert_almost_equal(xpt, [12.36679999999999957083, 0.0, 0.0])
+
+
+@pytest.mark.parametrize(
+    "function", [cyice.dskxsi, cyice.dskxsi_v], ids=get_module_name
+)
+@pytest.mark.parametrize("grouped_benchmark", ["dskxsi_v"], indirect=True)
+def test_dskxsi_v(function, grouped_benchmark, load_phobos_dsk):
+    handle, dladsc, dskdsc = load_phobos_dsk
+    target = spice.bodc2n(dskdsc.center)
+    fixref = spice.frmnam(dskdsc.frmcde)
+    vertices, raydirs = phobos_rays(dskdsc, 100)
+    args = (False, target, [dskdsc.surfce], 0.0, fixref, vertices, raydirs)
+    with spice.no_found_check():
+        grouped_benchmark(function, *args)
+        xpts, handles, dladscs, dskdscs, dcs, ics, founds = function(*args)
+        plids, exp_xpts, exp_founds = cyice.dskx02_v(handle, dladsc, vertices, raydirs)
+    npt.assert_array_equal(founds, exp_founds)
+    npt.assert_array_almost_equal(xpts[founds], exp_xpts[founds])
+    npt.assert_array_equal(ics[founds, 0], plids[founds])
+    assert (handles[founds] == handle).all()
+    assert dladscs.dtype == cyice.DLADSC_DTYPE
+    assert (dskdscs["center"][founds] == dskdsc.center).all()
+    assert (dskdscs["surfce"][founds] == dskdsc.surfce).all()
+    with pytest.raises(spice.NotFoundError):
+        function(*args)
+
+
+@pytest.mark.parametrize(
+    "function", [cyice.dskxv, cyice.dskxv_v, spice.dskxv], ids=get_module_name
+)
+@pytest.mark.parametrize("grouped_benchmark", ["dskxv"], indirect=True)
+def test_dskxv(function, grouped_benchmark, load_phobos_dsk):
+    handle, dladsc, dskdsc = load_phobos_dsk
+    target = spice.bodc2n(dskdsc.center)
+    fixref = spice.frmnam(dskdsc.frmcde)
+    vertices, raydirs = phobos_rays(dskdsc, 100)
+    args = (False, target, [dskdsc.surfce], 0.0, fixref, vertices, raydirs)
+    grouped_benchmark(function, *args)
+    xpts, founds = function(*args)
+    plids, exp_xpts, exp_founds = cyice.dskx02_v(handle, dladsc, vertices, raydirs)
+    npt.assert_array_equal(founds, exp_founds)
+    npt.assert_array_almost_equal(np.asarray(xpts)[exp_founds], exp_xpts[exp_founds])
+
+
+def test_dskxv_broadcast(load_phobos_dsk):
+    handle, dladsc, dskdsc = load_phobos_dsk
+    target = spice.bodc2n(dskdsc.center)
+    fixref = spice.frmnam(dskdsc.frmcde)
+    vertices, raydirs = phobos_rays(dskdsc, 12)
+    # one vertex for a (3, 4) grid of directions, as for the pixels of an image
+    xpts, founds = cyice.dskxv_v(
+        False, target, [], 0.0, fixref, vertices[1], raydirs.reshape(3, 4, 3)
+    )
+    assert xpts.shape == (3, 4, 3)
+    assert founds.shape == (3, 4)
+    exp = cyice.dskxv_v(
+        False, target, [], 0.0, fixref, np.tile(vertices[1], (12, 1)), raydirs
+    )
+    npt.assert_array_equal(xpts.reshape(12, 3), exp[0])
+    npt.assert_array_equal(founds.ravel(), exp[1])
+    xpts, founds = cyice.dskxv_v(
+        False, target, [], 0.0, fixref, vertices[:0], raydirs[:0]
+    )
+    assert xpts.shape == (0, 3)
+    xpts, founds, failed, messages = cyice.dskxv_v(
+        False, "NOT A BODY", [], 0.0, fixref, vertices, raydirs, errors="mask"
+    )
+    assert failed.all()
+    assert messages[0] == "SPICE(IDCODENOTFOUND)"
+
+
 # E
 
 
@@ -1133,6 +1425,27 @@ def test_latsph(function, grouped_benchmark):
     npt.assert_array_almost_equal(res, expected, decimal=7)
 
 
+@pytest.mark.parametrize(
+    "function", [cyice.latsrf, cyice.latsrf_v, spice.latsrf], ids=get_module_name
+)
+@pytest.mark.parametrize("grouped_benchmark", ["latsrf"], indirect=True)
+def test_latsrf(function, grouped_benchmark, load_phobos_dsk):
+    handle, dladsc, dskdsc = load_phobos_dsk
+    target = spice.bodc2n(dskdsc.center)
+    fixref = spice.frmnam(dskdsc.frmcde)
+    lon, lat = np.meshgrid(np.linspace(-np.pi, np.pi, 20), np.linspace(-1.5, 1.5, 10))
+    lonlat = np.stack([lon, lat], axis=-1).reshape(-1, 2)
+    args = ("DSK/UNPRIORITIZED", target, 0.0, fixref, lonlat)
+    grouped_benchmark(function, *args)
+    srfpts = function(*args)
+    assert np.shape(srfpts) == (200, 3)
+    radii = np.linalg.norm(srfpts, axis=1)
+    assert (radii > 0.5 * dskdsc.co3max).all() and (radii <= dskdsc.co3max).all()
+    # (H, W, 2) grids keep their shape
+    grid = cyice.latsrf_v(*args[:-1], lonlat.reshape(10, 20, 2))
+    npt.assert_array_equal(grid.reshape(-1, 3), srfpts)
+
+
 @pytest.mark.parametrize(
     "function", [cyice.limbpt_s, cyice.limbpt, spice.limbpt], ids=get_module_name
 )
@@ -1394,6 +1707,20 @@ def test_pi(function, grouped_benchmark):
     assert function() == np.pi
 
 
+@pytest.mark.parametrize("function", [cyice.pltar, spice.pltar], ids=get_module_name)
+@pytest.mark.parametrize("grouped_benchmark", ["pltar"], indirect=True)
+def test_pltar(function, grouped_benchmark, load_phobos_dsk):
+    vrtces = [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]
+    plates = [[1, 4, 3], [1, 2, 4], [1, 3, 2], [2, 3, 4]]
+    assert function(vrtces, plates) == pytest.approx(2.3660254037844)
+    handle, dladsc, dskdsc = load_phobos_dsk
+    nv, np_ = spice.dskz02(handle, dladsc)
+    vrtces = spice.dskv02(handle, dladsc, 1, nv)
+    plates = spice.dskp02(handle, dladsc, 1, np_)
+    grouped_benchmark(function, vrtces, plates)
+    assert function(vrtces, plates) == spice.pltar(vrtces.tolist(), plates.tolist())
+
+
 @pytest.mark.parametrize(
     "function", [cyice.pxform_s, cyice.pxform, spice.pxform], ids=get_module_name
 )
@@ -1906,6 +2233,29 @@ def test_spkapo_v(function, grouped_benchmark, load_core_kernels):
     assert isinstance(ltime, np.ndarray)
 
 
+@pytest.mark.parametrize("grouped_benchmark", ["spkapo_v"], indirect=True)
+def test_spkapo_v_states(grouped_benchmark, load_core_kernels):
+    MARS, MOON = 499, 301
+    spice.furnsh(CoreKernels.testMetaKernel)
+    et = spice.str2et("Jan 1 2004 5:00 PM")
+    ets = et + np.arange(100) * 60.0
+    states = cyice.spkssb_v(MOON, ets, "J2000")
+    grouped_benchmark(cyice.spkapo_v, MARS, ets, "J2000", states, "LT+S")
+    pos_vec, ltime = cyice.spkapo_v(MARS, ets, "J2000", states, "LT+S")
+    assert pos_vec.shape == (100, 3)
+    expected_pos = np.array(
+        [
+            1.64534472413454592228e08,
+            2.51219951337271928787e07,
+            1.11454124484200235456e07,
+        ]
+    )
+    npt.assert_array_almost_equal(pos_vec[0], expected_pos, decimal=5)
+    pos, lt = cyice.spkapo_s(MARS, ets[-1], "J2000", states[-1], "LT+S")
+    npt.assert_array_equal(pos_vec[-1], pos)
+    assert ltime[-1] == lt
+
+
 @pytest.mark.parametrize(
     "function", [cyice.spkcpo_s, cyice.spkcpo, spice.spkcpo], ids=get_module_name
 )
@@ -2537,6 +2887,26 @@ def test_sincpt_v(function, grouped_benchmark, load_cassini_kernels):
     npt.assert_almost_equal(trgepc[0], 415065064.9055491)
 
 
+@pytest.mark.parametrize(
+    "function", [cyice.srfnrm, cyice.srfnrm_v, spice.srfnrm], ids=get_module_name
+)
+@pytest.mark.parametrize("grouped_benchmark", ["srfnrm"], indirect=True)
+def test_srfnrm(function, grouped_benchmark, load_phobos_dsk):
+    handle, dladsc, dskdsc = load_phobos_dsk
+    target = spice.bodc2n(dskdsc.center)
+    fixref = spice.frmnam(dskdsc.frmcde)
+    lon, lat = np.meshgrid(np.linspace(-np.pi, np.pi, 20), np.linspace(-1.5, 1.5, 10))
+    lonlat = np.stack([lon, lat], axis=-1).reshape(-1, 2)
+    srfpts = cyice.latsrf("DSK/UNPRIORITIZED", target, 0.0, fixref, lonlat)
+    args = ("DSK/UNPRIORITIZED", target, 0.0, fixref, srfpts)
+    grouped_benchmark(function, *args)
+    normls = function(*args)
+    npt.assert_array_almost_equal(np.linalg.norm(normls, axis=1), 1.0)
+    npt.assert_array_equal(normls, spice.srfnrm(*args[:-1], srfpts.tolist()))
+    # outward normals point away from the center
+    assert (np.sum(normls * srfpts, axis=1) > 0.0).all()
+
+
 @pytest.mark.parametrize(
     "function", [cyice.srfrec_s, cyice.srfrec, spice.srfrec], ids=get_module_name
 )
@@ -0,0 +1,37 @@
+import os
+import re
+import subprocess
+import sys
+
+# import time of spiceypy in a fresh interpreter as reported by python -X importtime,
+# numpy is subtracted as it is a dependency whose import time spiceypy does not control
+LIMIT = float(os.environ.get("SPICEYPY_IMPORT_TIME_LIMIT", "1.0"))
+IMPORTTIME = re.compile(r"import time:\s+\d+ \|\s+(\d+) \|\s+(\S+)$")
+
+
+def import_time():
+    res = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import spiceypy"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # cumulative microseconds per module, numpy is nested below a spiceypy module
+    times = {}
+    for line in res.stderr.splitlines():
+        if match := IMPORTTIME.match(line):
+            times.setdefault(match.group(2), int(match.group(1)))
+    return (times["spiceypy"] - times["numpy"]) / 1e6
+
+
+def test_import_spiceypy(benchmark):
+    benchmark.group = "import"
+    # warm the bytecode cache so the first round does not compile
+    import_time()
+    times = []
+    benchmark.pedantic(lambda: times.append(import_time()), rounds=5, iterations=1)
+    benchmark.extra_info["import_time"] = min(times)
+    assert min(times) < LIMIT, (
+        f"importing spiceypy took {min(times):.3f} s, more than {LIMIT} s, "
+        "see python -X importtime -c 'import spiceypy'"
+    )
@@ -0,0 +1,87 @@
+import pytest
+import numpy as np
+import spiceypy as spice
+from spiceypy import config
+from spiceypy.utils import support_types as stypes
+from spiceypy.utils.libspicehelper import libspice
+from spiceypy.tests.gettestkernels import download_kernels, CoreKernels
+
+# cost of each layer of a ctypes call: argument conversion, the foreign call,
+# output conversion, and the whole wrapper for a few hot scalar functions
+V = np.array([1.0, 2.0, 3.0])
+M = np.eye(3)
+
+
+@pytest.fixture(autouse=True)
+def load_core_kernels():
+    # benchmark the ctypes path rather than the cyice dispatch
+    use_cyice = config.use_cyice
+    config.use_cyice = False
+    spice.kclear()
+    spice.reset()
+    spice.furnsh(CoreKernels.testMetaKernel)
+    yield
+    spice.kclear()
+    spice.reset()
+    config.use_cyice = use_cyice
+
+
+def setup_module(module):
+    download_kernels()
+
+
+def test_to_double_vector(benchmark):
+    benchmark.group = "marshaling inputs"
+    benchmark(stypes.to_double_vector, V)
+
+
+def test_to_double_vector_list(benchmark):
+    benchmark.group = "marshaling inputs"
+    benchmark(stypes.to_double_vector, [1.0, 2.0, 3.0])
+
+
+def test_to_double_matrix(benchmark):
+    benchmark.group = "marshaling inputs"
+    benchmark(stypes.to_double_matrix, M)
+
+
+def test_string_to_char_p(benchmark):
+    benchmark.group = "marshaling inputs"
+    benchmark(stypes.string_to_char_p, "J2000")
+
+
+def test_empty_double_vector(benchmark):
+    benchmark.group = "marshaling outputs"
+    benchmark(stypes.empty_double_vector, 3)
+
+
+def test_c_vector_to_python(benchmark):
+    benchmark.group = "marshaling outputs"
+    benchmark(stypes.c_vector_to_python, stypes.empty_double_vector(6))
+
+
+def test_c_matrix_to_numpy(benchmark):
+    benchmark.group = "marshaling outputs"
+    benchmark(stypes.c_matrix_to_numpy, stypes.empty_double_matrix())
+
+
+def test_mxv_c(benchmark):
+    benchmark.group = "marshaling foreign call"
+    m = stypes.to_double_matrix(M)
+    v = stypes.to_double_vector(V)
+    benchmark(libspice.mxv_c, m, v, stypes.empty_double_vector(3))
+
+
+@pytest.mark.parametrize(
+    "name, args",
+    [
+        ("mxv", (M, V)),
+        ("reclat", (V,)),
+        ("pxform", ("J2000", "IAU_EARTH", 0.0)),
+        ("spkezr", ("MOON", 0.0, "J2000", "NONE", "EARTH")),
+    ],
+    ids=["mxv", "reclat", "pxform", "spkezr"],
+)
+def test_wrapper(benchmark, name, args):
+    benchmark.group = "marshaling wrappers"
+    benchmark(getattr(spice, name), *args)
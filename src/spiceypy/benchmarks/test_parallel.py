@@ -0,0 +1,67 @@
+import pytest
+import numpy as np
+import numpy.testing as npt
+import spiceypy as spice
+from spiceypy import cyice
+from spiceypy.parallel import ParallelExecutor
+from spiceypy.tests.gettestkernels import download_kernels, CoreKernels
+
+# throughput of a large spkezr_v call as the number of worker processes grows,
+# compare the "parallel spkezr_v" group against the serial cyice call. The
+# timings include unmapping and unlinking the shared memory of the outputs, and
+# the "copy" variant the copy a caller needing arrays it owns would make
+N_EPOCHS = 1_000_000
+
+
+@pytest.fixture(autouse=True)
+def load_core_kernels():
+    spice.kclear()
+    spice.reset()
+    spice.furnsh(CoreKernels.testMetaKernel)
+    yield
+    spice.kclear()
+    spice.reset()
+
+
+def setup_module(module):
+    download_kernels()
+
+
+def test_spkezr_v_serial(benchmark):
+    benchmark.group = "parallel spkezr_v"
+    ets = np.linspace(0.0, 86400.0 * 365, N_EPOCHS)
+    benchmark(cyice.spkezr_v, "MOON", ets, "J2000", "LT+S", "EARTH")
+
+
+@pytest.mark.parametrize("copy", [False, True], ids=["view", "copy"])
+@pytest.mark.parametrize("workers", [1, 2, 4, 8])
+def test_spkezr_v_parallel(benchmark, workers, copy):
+    benchmark.group = "parallel spkezr_v"
+    benchmark.extra_info["workers"] = workers
+    benchmark.extra_info["copy"] = copy
+    ets = np.linspace(0.0, 86400.0 * 365, N_EPOCHS)
+    with ParallelExecutor(max_workers=workers) as executor:
+        # start the workers and load their kernels outside of the timing
+        executor.run(
+            "spkezr_v",
+            "MOON",
+            ets[: 2 * workers],
+            "J2000",
+            "LT+S",
+            "EARTH",
+            chunksize=1,
+        )
+
+        def run():
+            states, lts = executor.run(
+                "spkezr_v", "MOON", ets, "J2000", "LT+S", "EARTH"
+            )
+            if copy:
+                states, lts = states.copy(), lts.copy()
+            # the outputs are released here, inside the timing
+            return states[-10:].copy()
+
+        states = benchmark(run)
+    npt.assert_array_equal(
+        states, cyice.spkezr_v("MOON", ets[-10:], "J2000", "LT+S", "EARTH")[0]
+    )
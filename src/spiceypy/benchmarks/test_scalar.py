@@ -0,0 +1,53 @@
+import pytest
+import numpy as np
+import spiceypy as spice
+from spiceypy.tests.gettestkernels import download_kernels, CoreKernels
+
+cyice = pytest.importorskip("spiceypy.cyice")
+
+# per call cost of the cyice _s wrappers returning new arrays, writing into
+# a caller's array with out= and returning tuples of floats with astuple=True
+V = np.array([1.0, 2.0, 3.0])
+M = np.eye(3)
+
+CALLS = [
+    ("spkezr_s", ("MOON", 0.0, "J2000", "NONE", "EARTH"), np.empty(6)),
+    ("spkpos_s", ("MOON", 0.0, "J2000", "NONE", "EARTH"), np.empty(3)),
+    ("pxform_s", ("J2000", "IAU_EARTH", 0.0), np.empty((3, 3))),
+    ("sxform_s", ("J2000", "IAU_EARTH", 0.0), np.empty((6, 6))),
+    ("mxv_s", (M, V), np.empty(3)),
+    ("vcrss_s", (V, V), np.empty(3)),
+]
+IDS = [name for name, _, _ in CALLS]
+
+
+@pytest.fixture(autouse=True)
+def load_core_kernels():
+    spice.kclear()
+    spice.reset()
+    spice.furnsh(CoreKernels.testMetaKernel)
+    yield
+    spice.kclear()
+    spice.reset()
+
+
+def setup_module(module):
+    download_kernels()
+
+
+@pytest.mark.parametrize("name, args, out", CALLS, ids=IDS)
+def test_scalar_array(benchmark, name, args, out):
+    benchmark.group = f"scalar {name}"
+    benchmark(getattr(cyice, name), *args)
+
+
+@pytest.mark.parametrize("name, args, out", CALLS, ids=IDS)
+def test_scalar_out(benchmark, name, args, out):
+    benchmark.group = f"scalar {name}"
+    benchmark(getattr(cyice, name), *args, out=out)
+
+
+@pytest.mark.parametrize("name, args, out", CALLS, ids=IDS)
+def test_scalar_astuple(benchmark, name, args, out):
+    benchmark.group = f"scalar {name}"
+    benchmark(getattr(cyice, name), *args, astuple=True)
@@ -0,0 +1,41 @@
+import pytest
+import numpy as np
+import spiceypy as spice
+
+# a loop of ctypes calls over N vectors against one call with stacked vectors,
+# which runs in numpy, see spiceypy.utils.vectormath
+N = 1000
+rng = np.random.default_rng(0)
+V1 = rng.normal(size=(N, 3))
+V2 = rng.normal(size=(N, 3))
+M = spice.rotate(rng.normal(size=N), 3)
+ANGLES = rng.normal(size=N)
+
+CALLS = [
+    ("vdot", (V1, V2)),
+    ("vcrss", (V1, V2)),
+    ("vnorm", (V1,)),
+    ("vhat", (V1,)),
+    ("vsep", (V1, V2)),
+    ("mxv", (M, V1)),
+    ("mtxv", (M, V1)),
+    ("mxm", (M, M)),
+    ("vrotv", (V1, V2, ANGLES)),
+    ("rotmat", (M, ANGLES, 1)),
+]
+IDS = [name for name, _ in CALLS]
+
+
+@pytest.mark.parametrize("name, args", CALLS, ids=IDS)
+def test_loop(benchmark, name, args):
+    benchmark.group = f"vectormath {name}"
+    f = getattr(spice, name)
+    columns = [a.tolist() if isinstance(a, np.ndarray) else [a] * N for a in args]
+    rows = list(zip(*columns))
+    benchmark(lambda: [f(*row) for row in rows])
+
+
+@pytest.mark.parametrize("name, args", CALLS, ids=IDS)
+def test_stacked(benchmark, name, args):
+    benchmark.group = f"vectormath {name}"
+    benchmark(getattr(spice, name), *args)
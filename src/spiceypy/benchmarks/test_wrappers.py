@@ -0,0 +1,50 @@
+import inspect
+
+import pytest
+import numpy as np
+import spiceypy as spice
+from spiceypy import config
+from spiceypy.tests.gettestkernels import download_kernels, CoreKernels
+
+# per call cost of the error checking wrappers of the ctypes functions, each
+# group compares a function with its undecorated body (inspect.unwrap)
+V1 = np.array([1.0, 2.0, 3.0])
+V2 = np.array([-3.0, 0.5, 2.0])
+M = np.eye(3)
+
+CALLS = {
+    "vdot": (V1, V2),
+    "mxv": (M, V1),
+    "reclat": (V1,),
+    "bodn2c": ("EARTH",),
+    "bodc2n": (399,),
+    "str2et": ("2000 JAN 01 12:00:00 TDB",),
+}
+
+
+@pytest.fixture(autouse=True)
+def load_core_kernels():
+    # benchmark the ctypes path rather than the cyice dispatch
+    use_cyice = config.use_cyice
+    config.use_cyice = False
+    spice.kclear()
+    spice.reset()
+    spice.furnsh(CoreKernels.testMetaKernel)
+    yield
+    spice.kclear()
+    spice.reset()
+    config.use_cyice = use_cyice
+
+
+def setup_module(module):
+    download_kernels()
+
+
+@pytest.mark.parametrize("name", list(CALLS))
+@pytest.mark.parametrize("wrapped", [True, False], ids=["wrapped", "unwrapped"])
+def test_wrapper_overhead(benchmark, name, wrapped):
+    benchmark.group = f"wrapper overhead {name}"
+    function = getattr(spice, name)
+    if not wrapped:
+        function = inspect.unwrap(function)
+    benchmark(function, *CALLS[name])
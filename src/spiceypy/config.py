@@ -22,4 +22,40 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-catch_false_founds = True
+import sys
+import threading
+import types
+
+
+class _Local(threading.local):
+    # per thread settings, class attributes are the defaults of new threads
+    catch_false_founds = True
+
+
+_local = _Local()
+
+
+class _Config(types.ModuleType):
+    # module class giving each thread its own catch_false_founds, so that
+    # found_check and no_found_check contexts in one thread do not leak into
+    # calls made concurrently by other threads
+
+    @property
+    def catch_false_founds(self) -> bool:
+        return _local.catch_false_founds
+
+    @catch_false_founds.setter
+    def catch_false_founds(self, value: bool) -> None:
+        _local.catch_false_founds = value
+
+
+sys.modules[__name__].__class__ = _Config
+
+# route spiceypy functions that have a compiled counterpart in spiceypy.cyice
+# to the cyice implementation when it is importable, set False to opt out
+use_cyice = True
+
+# run the vector and matrix routines, such as vdot and mxv, in numpy with
+# spiceypy.utils.vectormath when an argument is a numpy array holding a stack
+# of vectors, matrices or angles, set False to always call CSPICE
+use_vectormath = True
@@ -32,6 +32,10 @@ _ = load_cspice()
 # from spiceypy.cyice import cyice as _cyice
 try:
     from spiceypy.cyice.cyice import (
+        DLADSC_DTYPE,
+        DSK02Segment,
+        DSKB02_DTYPE,
+        DSKDSC_DTYPE,
         azlcpo,
         azlcpo_s,
         azlcpo_v,
@@ -66,6 +70,19 @@ try:
         deltet_s,
         deltet_v,
         dpr,
+        dsk02_export,
+        dskb02,
+        dskmi2,
+        dskrb2,
+        dskw02,
+        dskx02,
+        dskx02_s,
+        dskx02_v,
+        dskxsi,
+        dskxsi_s,
+        dskxsi_v,
+        dskxv,
+        dskxv_v,
         et2lst,
         et2lst_s,
         et2lst_v,
@@ -117,6 +134,8 @@ try:
         latsph,
         latsph_s,
         latsph_v,
+        latsrf,
+        latsrf_v,
         limbpt,
         limbpt_s,
         limbpt_v,
@@ -137,6 +156,7 @@ try:
         phaseq_s,
         phaseq_v,
         pi,
+        pltar,
         pxform,
         pxform_s,
         pxform_v,
@@ -221,6 +241,7 @@ try:
         spkezr,
         spkezr_s,
         spkezr_v,
+        spkezr_targets,
         spkgeo,
         spkgeo_s,
         spkgeo_v,
@@ -236,6 +257,8 @@ try:
         spkssb,
         spkssb_s,
         spkssb_v,
+        srfnrm,
+        srfnrm_v,
         srfrec,
         srfrec_s,
         srfrec_v,
@@ -272,12 +295,17 @@ try:
         utc2et,
         utc2et_s,
         utc2et_v,
+        write_dsk_type2,
         xfmsta,
         xfmsta_s,
         xfmsta_v,
     )
 
     __all__ = [
+        "DLADSC_DTYPE",
+        "DSK02Segment",
+        "DSKB02_DTYPE",
+        "DSKDSC_DTYPE",
         "azlcpo",
         "azlcpo_s",
         "azlcpo_v" "azlrec",
@@ -311,6 +339,19 @@ try:
         "deltet_s",
         "deltet_v",
         "dpr",
+        "dsk02_export",
+        "dskb02",
+        "dskmi2",
+        "dskrb2",
+        "dskw02",
+        "dskx02",
+        "dskx02_s",
+        "dskx02_v",
+        "dskxsi",
+        "dskxsi_s",
+        "dskxsi_v",
+        "dskxv",
+        "dskxv_v",
         "et2lst",
         "et2lst_s",
         "et2lst_v",
@@ -362,6 +403,8 @@ try:
         "latsph",
         "latsph_s",
         "latsph_v",
+        "latsrf",
+        "latsrf_v",
         "limbpt",
         "limbpt_s",
         "limbpt_v",
@@ -382,6 +425,7 @@ try:
         "phaseq_s",
         "phaseq_v",
         "pi",
+        "pltar",
         "pxform",
         "pxform_s",
         "pxform_v",
@@ -465,6 +509,7 @@ try:
         "spkezr",
         "spkezr_s",
         "spkezr_v",
+        "spkezr_targets",
         "spkgeo",
         "spkgeo_s",
         "spkgeo_v",
@@ -480,6 +525,8 @@ try:
         "spkssb",
         "spkssb_s",
         "spkssb_v",
+        "srfnrm",
+        "srfnrm_v",
         "srfrec",
         "srfrec_s",
         "srfrec_v",
@@ -516,10 +563,18 @@ try:
         "utc2et",
         "utc2et_s",
         "utc2et_v",
+        "write_dsk_type2",
         "xfmsta",
         "xfmsta_s",
         "xfmsta_v",
     ]
+
+    # wrappers generated from the CSPICE prototypes, see utils/gen_wrappers.py
+    from spiceypy.cyice import cyice as _cyice
+
+    for _name in _cyice.GENERATED:
+        globals()[_name] = getattr(_cyice, _name)
+    __all__ += _cyice.GENERATED
 except ImportError as ie:
     raise ImportError(
         "spiceypy.cyice is not available on this platform. "
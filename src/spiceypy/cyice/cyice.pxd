@@ -49,31 +49,77 @@ cdef extern from "SpiceUsr.h" nogil:
     cdef const int SPICEFALSE = 0
     cdef const int SPICETRUE = 1
 
+    # Planes and ellipses
+    ctypedef struct SpicePlane:
+        SpiceDouble normal[3]
+        SpiceDouble constant
+    ctypedef const SpicePlane ConstSpicePlane
+
+    ctypedef struct SpiceEllipse:
+        SpiceDouble center[3]
+        SpiceDouble semiMajor[3]
+        SpiceDouble semiMinor[3]
+    ctypedef const SpiceEllipse ConstSpiceEllipse
+
+    # DLA and DSK descriptors
+    ctypedef struct SpiceDLADescr:
+        SpiceInt bwdptr
+        SpiceInt fwdptr
+        SpiceInt ibase
+        SpiceInt isize
+        SpiceInt dbase
+        SpiceInt dsize
+        SpiceInt cbase
+        SpiceInt csize
+    ctypedef const SpiceDLADescr ConstSpiceDLADescr
+
+    ctypedef struct SpiceDSKDescr:
+        SpiceInt surfce
+        SpiceInt center
+        SpiceInt dclass
+        SpiceInt dtype
+        SpiceInt frmcde
+        SpiceInt corsys
+        SpiceDouble corpar[10]
+        SpiceDouble co1min
+        SpiceDouble co1max
+        SpiceDouble co2min
+        SpiceDouble co2max
+        SpiceDouble co3min
+        SpiceDouble co3max
+        SpiceDouble start
+        SpiceDouble stop
+    ctypedef const SpiceDSKDescr ConstSpiceDSKDescr
+
     # Cells
-    # TODO I was overriding stuff in here with this enum! rename each kind to a unique name
-    # cdef enum SpiceCellDataType:
-    #     char = 0,
-    #     double = 1,
-    #     int = 2,
-    #     time = 3,
-    #     bool = 4
-
-    # cdef struct _SpiceCell:
-    #     SpiceCellDataType dtype
-    #     SpiceInt           length
-    #     SpiceInt           size
-    #     SpiceInt           card
-    #     SpiceBoolean       isSet
-    #     SpiceBoolean       adjust
-    #     SpiceBoolean       init
-    #     void * base
-    #     void * data
-
-    # ctypedef _SpiceCell SpiceCell
-    # ctypedef const SpiceCell ConstSpiceCell
+    ctypedef enum SpiceDataType:
+        SPICE_CHR
+        SPICE_DP
+        SPICE_INT
+        SPICE_TIME
+        SPICE_BOOL
+
+    ctypedef struct SpiceCell:
+        SpiceDataType dtype
+        SpiceInt      length
+        SpiceInt      size
+        SpiceInt      card
+        SpiceBoolean  isSet
+        SpiceBoolean  adjust
+        SpiceBoolean  init
+        void        * base
+        void        * data
+    ctypedef const SpiceCell ConstSpiceCell
+
+    # number of elements of the control area at the start of a cell's base
+    enum: SPICE_CELL_CTRLSZ
 
     # A
 
+    cdef void axisar_c(ConstSpiceDouble[3] axis,
+                       SpiceDouble         angle,
+                       SpiceDouble[3][3]   r)
+
     cdef void azlcpo_c(ConstSpiceChar    * method,
                        ConstSpiceChar    * target,
                        SpiceDouble         et,
@@ -98,6 +144,17 @@ cdef extern from "SpiceUsr.h" nogil:
 
     cdef SpiceDouble b1950_c()
 
+    cdef SpiceBoolean bodfnd_c(SpiceInt         body,
+                               ConstSpiceChar * item)
+
+    cdef void bodn2c_c(ConstSpiceChar * name,
+                       SpiceInt       * code,
+                       SpiceBoolean   * found)
+
+    cdef void bods2c_c(ConstSpiceChar * name,
+                       SpiceInt       * code,
+                       SpiceBoolean   * found)
+
     #C
 
     cdef void ckgp_c(SpiceInt            inst,
@@ -151,14 +208,341 @@ cdef extern from "SpiceUsr.h" nogil:
     #D
     # deltet
 
+    cdef void dazldr_c(SpiceDouble       x,
+                       SpiceDouble       y,
+                       SpiceDouble       z,
+                       SpiceBoolean      azccw,
+                       SpiceBoolean      elplsz,
+                       SpiceDouble[3][3] jacobi)
+
+    cdef void dcyldr_c(SpiceDouble       x,
+                       SpiceDouble       y,
+                       SpiceDouble       z,
+                       SpiceDouble[3][3] jacobi)
+
     cdef void deltet_c(SpiceDouble      epoch,
                        ConstSpiceChar * eptype,
                        SpiceDouble    * delta)
 
+    cdef SpiceDouble det_c(ConstSpiceDouble[3][3] m1)
+
+    cdef void dgeodr_c(SpiceDouble       x,
+                       SpiceDouble       y,
+                       SpiceDouble       z,
+                       SpiceDouble       re,
+                       SpiceDouble       f,
+                       SpiceDouble[3][3] jacobi)
+
+    cdef void dlatdr_c(SpiceDouble       x,
+                       SpiceDouble       y,
+                       SpiceDouble       z,
+                       SpiceDouble[3][3] jacobi)
+
+    cdef void dpgrdr_c(ConstSpiceChar  * body,
+                       SpiceDouble       x,
+                       SpiceDouble       y,
+                       SpiceDouble       z,
+                       SpiceDouble       re,
+                       SpiceDouble       f,
+                       SpiceDouble[3][3] jacobi)
+
     cdef SpiceDouble dpr_c()
 
+    cdef void drdazl_c(SpiceDouble       range,
+                       SpiceDouble       az,
+                       SpiceDouble       el,
+                       SpiceBoolean      azccw,
+                       SpiceBoolean      elplsz,
+                       SpiceDouble[3][3] jacobi)
+
+    cdef void drdcyl_c(SpiceDouble       r,
+                       SpiceDouble       clon,
+                       SpiceDouble       z,
+                       SpiceDouble[3][3] jacobi)
+
+    cdef void drdgeo_c(SpiceDouble       lon,
+                       SpiceDouble       lat,
+                       SpiceDouble       alt,
+                       SpiceDouble       re,
+                       SpiceDouble       f,
+                       SpiceDouble[3][3] jacobi)
+
+    cdef void drdlat_c(SpiceDouble       r,
+                       SpiceDouble       lon,
+                       SpiceDouble       lat,
+                       SpiceDouble[3][3] jacobi)
+
+    cdef void drdpgr_c(ConstSpiceChar  * body,
+                       SpiceDouble       lon,
+                       SpiceDouble       lat,
+                       SpiceDouble       alt,
+                       SpiceDouble       re,
+                       SpiceDouble       f,
+                       SpiceDouble[3][3] jacobi)
+
+    cdef void drdsph_c(SpiceDouble       r,
+                       SpiceDouble       colat,
+                       SpiceDouble       slon,
+                       SpiceDouble[3][3] jacobi)
+
+    cdef void dskb02_c(SpiceInt              handle,
+                       ConstSpiceDLADescr  * dladsc,
+                       SpiceInt            * nv,
+                       SpiceInt            * np,
+                       SpiceInt            * nvxtot,
+                       SpiceDouble[3][2]     vtxbds,
+                       SpiceDouble         * voxsiz,
+                       SpiceDouble[3]        voxori,
+                       SpiceInt[3]           vgrext,
+                       SpiceInt            * cgscal,
+                       SpiceInt            * vtxnpl,
+                       SpiceInt            * voxnpt,
+                       SpiceInt            * voxnpl)
+
+    cdef void dskcls_c(SpiceInt              handle,
+                       SpiceBoolean          optmiz)
+
+    cdef void dskd02_c(SpiceInt              handle,
+                       ConstSpiceDLADescr  * dladsc,
+                       SpiceInt              item,
+                       SpiceInt              start,
+                       SpiceInt              room,
+                       SpiceInt            * n,
+                       SpiceDouble         * values)
+
+    cdef void dskgd_c(SpiceInt              handle,
+                      ConstSpiceDLADescr  * dladsc,
+                      SpiceDSKDescr       * dskdsc)
+
+    cdef void dski02_c(SpiceInt              handle,
+                       ConstSpiceDLADescr  * dladsc,
+                       SpiceInt              item,
+                       SpiceInt              start,
+                       SpiceInt              room,
+                       SpiceInt            * n,
+                       SpiceInt            * values)
+
+    cdef void dskmi2_c(SpiceInt              nv,
+                       ConstSpiceDouble    (*vrtces)[3],
+                       SpiceInt              np,
+                       ConstSpiceInt       (*plates)[3],
+                       SpiceDouble           finscl,
+                       SpiceInt              corscl,
+                       SpiceInt              worksz,
+                       SpiceInt              voxpsz,
+                       SpiceInt              voxlsz,
+                       SpiceBoolean          makvtl,
+                       SpiceInt              spxisz,
+                       SpiceInt            (*work)[2],
+                       SpiceDouble         * spaixd,
+                       SpiceInt            * spaixi)
+
+    cdef void dskopn_c(ConstSpiceChar      * fname,
+                       ConstSpiceChar      * ifname,
+                       SpiceInt              ncomch,
+                       SpiceInt            * handle)
+
+    cdef void dskp02_c(SpiceInt              handle,
+                       ConstSpiceDLADescr  * dladsc,
+                       SpiceInt              start,
+                       SpiceInt              room,
+                       SpiceInt            * n,
+                       SpiceInt            (*plates)[3])
+
+    cdef void dskrb2_c(SpiceInt              nv,
+                       ConstSpiceDouble    (*vrtces)[3],
+                       SpiceInt              np,
+                       ConstSpiceInt       (*plates)[3],
+                       SpiceInt              corsys,
+                       ConstSpiceDouble    * corpar,
+                       SpiceDouble         * mncor3,
+                       SpiceDouble         * mxcor3)
+
+    cdef void dskv02_c(SpiceInt              handle,
+                       ConstSpiceDLADescr  * dladsc,
+                       SpiceInt              start,
+                       SpiceInt              room,
+                       SpiceInt            * n,
+                       SpiceDouble         (*vrtces)[3])
+
+    cdef void dskw02_c(SpiceInt              handle,
+                       SpiceInt              center,
+                       SpiceInt              surfid,
+                       SpiceInt              dclass,
+                       ConstSpiceChar      * frame,
+                       SpiceInt              corsys,
+                       ConstSpiceDouble    * corpar,
+                       SpiceDouble           mncor1,
+                       SpiceDouble           mxcor1,
+                       SpiceDouble           mncor2,
+                       SpiceDouble           mxcor2,
+                       SpiceDouble           mncor3,
+                       SpiceDouble           mxcor3,
+                       SpiceDouble           first,
+                       SpiceDouble           last,
+                       SpiceInt              nv,
+                       ConstSpiceDouble    (*vrtces)[3],
+                       SpiceInt              np,
+                       ConstSpiceInt       (*plates)[3],
+                       ConstSpiceDouble    * spaixd,
+                       ConstSpiceInt       * spaixi)
+
+    cdef void dskx02_c(SpiceInt              handle,
+                       ConstSpiceDLADescr  * dladsc,
+                       ConstSpiceDouble[3]   vertex,
+                       ConstSpiceDouble[3]   raydir,
+                       SpiceInt            * plid,
+                       SpiceDouble[3]        xpt,
+                       SpiceBoolean        * found)
+
+    cdef void dskxsi_c(SpiceBoolean          pri,
+                       ConstSpiceChar      * target,
+                       SpiceInt              nsurf,
+                       ConstSpiceInt       * srflst,
+                       SpiceDouble           et,
+                       ConstSpiceChar      * fixref,
+                       ConstSpiceDouble[3]   vertex,
+                       ConstSpiceDouble[3]   raydir,
+                       SpiceInt              maxd,
+                       SpiceInt              maxi,
+                       SpiceDouble[3]        xpt,
+                       SpiceInt            * handle,
+                       SpiceDLADescr       * dladsc,
+                       SpiceDSKDescr       * dskdsc,
+                       SpiceDouble         * dc,
+                       SpiceInt            * ic,
+                       SpiceBoolean        * found)
+
+    cdef void dskxv_c(SpiceBoolean          pri,
+                      ConstSpiceChar      * target,
+                      SpiceInt              nsurf,
+                      ConstSpiceInt       * srflst,
+                      SpiceDouble           et,
+                      ConstSpiceChar      * fixref,
+                      SpiceInt              nrays,
+                      ConstSpiceDouble    (*vtxarr)[3],
+                      ConstSpiceDouble    (*dirarr)[3],
+                      SpiceDouble         (*xptarr)[3],
+                      SpiceBoolean        * fndarr)
+
+    cdef void dsphdr_c(SpiceDouble       x,
+                       SpiceDouble       y,
+                       SpiceDouble       z,
+                       SpiceDouble[3][3] jacobi)
+
+    cdef void ducrss_c(ConstSpiceDouble[6] s1,
+                       ConstSpiceDouble[6] s2,
+                       SpiceDouble[6]      sout)
+
+    cdef void dvcrss_c(ConstSpiceDouble[6] s1,
+                       ConstSpiceDouble[6] s2,
+                       SpiceDouble[6]      sout)
+
+    cdef SpiceDouble dvdot_c(ConstSpiceDouble[6] s1,
+                             ConstSpiceDouble[6] s2)
+
+    cdef void dvhat_c(ConstSpiceDouble[6] s1,
+                      SpiceDouble[6]      sout)
+
+    cdef SpiceDouble dvnorm_c(ConstSpiceDouble[6] state)
+
+    cdef SpiceDouble dvsep_c(ConstSpiceDouble[6] s1,
+                             ConstSpiceDouble[6] s2)
+
     #E
 
+    cdef void edlimb_c(SpiceDouble         a,
+                       SpiceDouble         b,
+                       SpiceDouble         c,
+                       ConstSpiceDouble[3] viewpt,
+                       SpiceEllipse      * limb)
+
+    cdef void ednmpt_c(SpiceDouble         a,
+                       SpiceDouble         b,
+                       SpiceDouble         c,
+                       ConstSpiceDouble[3] normal,
+                       SpiceDouble[3]      point)
+
+    cdef void edpnt_c(ConstSpiceDouble[3] p,
+                      SpiceDouble         a,
+                      SpiceDouble         b,
+                      SpiceDouble         c,
+                      SpiceDouble[3]      ep)
+
+    cdef void ekappr_c(SpiceInt   handle,
+                       SpiceInt   segno,
+                       SpiceInt * recno)
+
+    cdef void ekccnt_c(ConstSpiceChar * table,
+                       SpiceInt       * ccount)
+
+    cdef void ekcls_c(SpiceInt handle)
+
+    cdef void ekdelr_c(SpiceInt handle,
+                       SpiceInt segno,
+                       SpiceInt recno)
+
+    cdef void ekfind_c(ConstSpiceChar * query,
+                       SpiceInt         errmln,
+                       SpiceInt       * nmrows,
+                       SpiceBoolean   * error,
+                       SpiceChar      * errmsg)
+
+    cdef void ekgc_c(SpiceInt       selidx,
+                     SpiceInt       row,
+                     SpiceInt       elment,
+                     SpiceInt       cdatln,
+                     SpiceChar    * cdata,
+                     SpiceBoolean * null,
+                     SpiceBoolean * found)
+
+    cdef void ekgd_c(SpiceInt       selidx,
+                     SpiceInt       row,
+                     SpiceInt       elment,
+                     SpiceDouble  * ddata,
+                     SpiceBoolean * null,
+                     SpiceBoolean * found)
+
+    cdef void ekgi_c(SpiceInt       selidx,
+                     SpiceInt       row,
+                     SpiceInt       elment,
+                     SpiceInt     * idata,
+                     SpiceBoolean * null,
+                     SpiceBoolean * found)
+
+    cdef void ekinsr_c(SpiceInt handle,
+                       SpiceInt segno,
+                       SpiceInt recno)
+
+    cdef void eklef_c(ConstSpiceChar * fname,
+                      SpiceInt       * handle)
+
+    cdef SpiceInt eknelt_c(SpiceInt selidx,
+                           SpiceInt row)
+
+    cdef SpiceInt eknseg_c(SpiceInt handle)
+
+    cdef void ekntab_c(SpiceInt * n)
+
+    cdef void ekopn_c(ConstSpiceChar * fname,
+                      ConstSpiceChar * ifname,
+                      SpiceInt         ncomch,
+                      SpiceInt       * handle)
+
+    cdef void ekopr_c(ConstSpiceChar * fname,
+                      SpiceInt       * handle)
+
+    cdef void ekops_c(SpiceInt * handle)
+
+    cdef void ekopw_c(ConstSpiceChar * fname,
+                      SpiceInt       * handle)
+
+    cdef void ektnam_c(SpiceInt    n,
+                       SpiceInt    tablen,
+                       SpiceChar * table)
+
+    cdef void ekuef_c(SpiceInt handle)
+
     cdef void et2lst_c(SpiceDouble        et,
                        SpiceInt           body,
                        SpiceDouble        lon,
@@ -181,6 +565,20 @@ cdef extern from "SpiceUsr.h" nogil:
                       SpiceInt      callen,
                       SpiceChar   * calstr)
 
+    cdef void eul2m_c(SpiceDouble       angle3,
+                      SpiceDouble       angle2,
+                      SpiceDouble       angle1,
+                      SpiceInt          axis3,
+                      SpiceInt          axis2,
+                      SpiceInt          axis1,
+                      SpiceDouble[3][3] r)
+
+    cdef void eul2xf_c(ConstSpiceDouble[6] eulang,
+                       SpiceInt            axisa,
+                       SpiceInt            axisb,
+                       SpiceInt            axisc,
+                       SpiceDouble[6][6]   xform)
+
     cdef void evsgp4_c(SpiceDouble            et,
                        ConstSpiceDouble[8]    geophs,
                        ConstSpiceDouble[10]   elems,
@@ -206,6 +604,12 @@ cdef extern from "SpiceUsr.h" nogil:
                        SpiceDouble      * et,
                        SpiceBoolean     * visibl)
 
+    cdef void frinfo_c(SpiceInt       frcode,
+                       SpiceInt     * cent,
+                       SpiceInt     * frclss,
+                       SpiceInt     * clssid,
+                       SpiceBoolean * found)
+
 
     cdef void furnsh_c(ConstSpiceChar * file)
 
@@ -228,6 +632,152 @@ cdef extern from "SpiceUsr.h" nogil:
                        SpiceInt         msglen,
                        SpiceChar      * msg)
 
+    cdef void gfdist_c(ConstSpiceChar * target,
+                       ConstSpiceChar * abcorr,
+                       ConstSpiceChar * obsrvr,
+                       ConstSpiceChar * relate,
+                       SpiceDouble      refval,
+                       SpiceDouble      adjust,
+                       SpiceDouble      step,
+                       SpiceInt         nintvls,
+                       SpiceCell      * cnfine,
+                       SpiceCell      * result)
+
+    cdef void gfilum_c(ConstSpiceChar    * method,
+                       ConstSpiceChar    * angtyp,
+                       ConstSpiceChar    * target,
+                       ConstSpiceChar    * illmn,
+                       ConstSpiceChar    * fixref,
+                       ConstSpiceChar    * abcorr,
+                       ConstSpiceChar    * obsrvr,
+                       ConstSpiceDouble[3] spoint,
+                       ConstSpiceChar    * relate,
+                       SpiceDouble         refval,
+                       SpiceDouble         adjust,
+                       SpiceDouble         step,
+                       SpiceInt            nintvls,
+                       SpiceCell         * cnfine,
+                       SpiceCell         * result)
+
+    cdef void gfoclt_c(ConstSpiceChar * occtyp,
+                       ConstSpiceChar * front,
+                       ConstSpiceChar * fshape,
+                       ConstSpiceChar * fframe,
+                       ConstSpiceChar * back,
+                       ConstSpiceChar * bshape,
+                       ConstSpiceChar * bframe,
+                       ConstSpiceChar * abcorr,
+                       ConstSpiceChar * obsrvr,
+                       SpiceDouble      step,
+                       SpiceCell      * cnfine,
+                       SpiceCell      * result)
+
+    cdef void gfpa_c(ConstSpiceChar * target,
+                     ConstSpiceChar * illmn,
+                     ConstSpiceChar * abcorr,
+                     ConstSpiceChar * obsrvr,
+                     ConstSpiceChar * relate,
+                     SpiceDouble      refval,
+                     SpiceDouble      adjust,
+                     SpiceDouble      step,
+                     SpiceInt         nintvls,
+                     SpiceCell      * cnfine,
+                     SpiceCell      * result)
+
+    cdef void gfposc_c(ConstSpiceChar * target,
+                       ConstSpiceChar * frame,
+                       ConstSpiceChar * abcorr,
+                       ConstSpiceChar * obsrvr,
+                       ConstSpiceChar * crdsys,
+                       ConstSpiceChar * coord,
+                       ConstSpiceChar * relate,
+                       SpiceDouble      refval,
+                       SpiceDouble      adjust,
+                       SpiceDouble      step,
+                       SpiceInt         nintvls,
+                       SpiceCell      * cnfine,
+                       SpiceCell      * result)
+
+    cdef void gfrfov_c(ConstSpiceChar    * inst,
+                       ConstSpiceDouble[3] raydir,
+                       ConstSpiceChar    * rframe,
+                       ConstSpiceChar    * abcorr,
+                       ConstSpiceChar    * obsrvr,
+                       SpiceDouble         step,
+                       SpiceCell         * cnfine,
+                       SpiceCell         * result)
+
+    cdef void gfrr_c(ConstSpiceChar * target,
+                     ConstSpiceChar * abcorr,
+                     ConstSpiceChar * obsrvr,
+                     ConstSpiceChar * relate,
+                     SpiceDouble      refval,
+                     SpiceDouble      adjust,
+                     SpiceDouble      step,
+                     SpiceInt         nintvls,
+                     SpiceCell      * cnfine,
+                     SpiceCell      * result)
+
+    cdef void gfsep_c(ConstSpiceChar * targ1,
+                      ConstSpiceChar * shape1,
+                      ConstSpiceChar * frame1,
+                      ConstSpiceChar * targ2,
+                      ConstSpiceChar * shape2,
+                      ConstSpiceChar * frame2,
+                      ConstSpiceChar * abcorr,
+                      ConstSpiceChar * obsrvr,
+                      ConstSpiceChar * relate,
+                      SpiceDouble      refval,
+                      SpiceDouble      adjust,
+                      SpiceDouble      step,
+                      SpiceInt         nintvls,
+                      SpiceCell      * cnfine,
+                      SpiceCell      * result)
+
+    cdef void gfsntc_c(ConstSpiceChar    * target,
+                       ConstSpiceChar    * fixref,
+                       ConstSpiceChar    * method,
+                       ConstSpiceChar    * abcorr,
+                       ConstSpiceChar    * obsrvr,
+                       ConstSpiceChar    * dref,
+                       ConstSpiceDouble[3] dvec,
+                       ConstSpiceChar    * crdsys,
+                       ConstSpiceChar    * coord,
+                       ConstSpiceChar    * relate,
+                       SpiceDouble         refval,
+                       SpiceDouble         adjust,
+                       SpiceDouble         step,
+                       SpiceInt            nintvls,
+                       SpiceCell         * cnfine,
+                       SpiceCell         * result)
+
+    cdef void gfstol_c(SpiceDouble value)
+
+    cdef void gfsubc_c(ConstSpiceChar * target,
+                       ConstSpiceChar * fixref,
+                       ConstSpiceChar * method,
+                       ConstSpiceChar * abcorr,
+                       ConstSpiceChar * obsrvr,
+                       ConstSpiceChar * crdsys,
+                       ConstSpiceChar * coord,
+                       ConstSpiceChar * relate,
+                       SpiceDouble      refval,
+                       SpiceDouble      adjust,
+                       SpiceDouble      step,
+                       SpiceInt         nintvls,
+                       SpiceCell      * cnfine,
+                       SpiceCell      * result)
+
+    cdef void gftfov_c(ConstSpiceChar * inst,
+                       ConstSpiceChar * target,
+                       ConstSpiceChar * tshape,
+                       ConstSpiceChar * tframe,
+                       ConstSpiceChar * abcorr,
+                       ConstSpiceChar * obsrvr,
+                       SpiceDouble      step,
+                       SpiceCell      * cnfine,
+                       SpiceCell      * result)
+
     #H
 
     cdef SpiceDouble halfpi_c()
@@ -277,6 +827,15 @@ cdef extern from "SpiceUsr.h" nogil:
                        SpiceDouble         * incdnc,
                        SpiceDouble         * emissn)
 
+    cdef void inrypl_c(ConstSpiceDouble[3] vertex,
+                       ConstSpiceDouble[3] dir,
+                       ConstSpicePlane   * plane,
+                       SpiceInt          * nxpts,
+                       SpiceDouble[3]      xpt)
+
+    cdef void invert_c(ConstSpiceDouble[3][3] m1,
+                       SpiceDouble[3][3]      mout)
+
 
     #J
 
@@ -313,6 +872,14 @@ cdef extern from "SpiceUsr.h" nogil:
                        SpiceDouble *  colat,
                        SpiceDouble *  slon)
 
+    cdef void latsrf_c(ConstSpiceChar      * method,
+                       ConstSpiceChar      * target,
+                       SpiceDouble           et,
+                       ConstSpiceChar      * fixref,
+                       SpiceInt              npts,
+                       ConstSpiceDouble    (*lonlat)[2],
+                       SpiceDouble         (*srfpts)[3])
+
     cdef void limbpt_c(ConstSpiceChar      * method,
                        ConstSpiceChar      * target,
                        SpiceDouble           et,
@@ -335,10 +902,72 @@ cdef extern from "SpiceUsr.h" nogil:
                              SpiceDouble      et,
                              ConstSpiceChar * abcorr)
 
+    cdef void ltime_c(SpiceDouble      etobs,
+                      SpiceInt         obs,
+                      ConstSpiceChar * dir,
+                      SpiceInt         targ,
+                      SpiceDouble    * ettarg,
+                      SpiceDouble    * elapsd)
+
     #M
 
+    cdef void m2eul_c(ConstSpiceDouble[3][3] r,
+                      SpiceInt               axis3,
+                      SpiceInt               axis2,
+                      SpiceInt               axis1,
+                      SpiceDouble          * angle3,
+                      SpiceDouble          * angle2,
+                      SpiceDouble          * angle1)
+
+    cdef void m2q_c(ConstSpiceDouble[3][3] r,
+                    SpiceDouble[4]         q)
+
+    cdef void mtxm_c(ConstSpiceDouble[3][3] m1,
+                     ConstSpiceDouble[3][3] m2,
+                     SpiceDouble[3][3]      mout)
+
+    cdef void mtxv_c(ConstSpiceDouble[3][3] m1,
+                     ConstSpiceDouble[3]    vin,
+                     SpiceDouble[3]         vout)
+
+    cdef void mxm_c(ConstSpiceDouble[3][3] m1,
+                    ConstSpiceDouble[3][3] m2,
+                    SpiceDouble[3][3]      mout)
+
+    cdef void mxmt_c(ConstSpiceDouble[3][3] m1,
+                     ConstSpiceDouble[3][3] m2,
+                     SpiceDouble[3][3]      mout)
+
+    cdef void mxv_c(ConstSpiceDouble[3][3] m1,
+                    ConstSpiceDouble[3]    vin,
+                    SpiceDouble[3]         vout)
+
+    cdef void mxvg_c(const void * m1,
+                     const void * v2,
+                     SpiceInt     nrow1,
+                     SpiceInt     nc1r2,
+                     void       * vout)
+
     #N
 
+    cdef void namfrm_c(ConstSpiceChar * frname,
+                       SpiceInt       * frcode)
+
+    cdef void nearpt_c(ConstSpiceDouble[3] positn,
+                       SpiceDouble         a,
+                       SpiceDouble         b,
+                       SpiceDouble         c,
+                       SpiceDouble[3]      npoint,
+                       SpiceDouble       * alt)
+
+    cdef void npedln_c(SpiceDouble         a,
+                       SpiceDouble         b,
+                       SpiceDouble         c,
+                       ConstSpiceDouble[3] linept,
+                       ConstSpiceDouble[3] linedr,
+                       SpiceDouble[3]      pnear,
+                       SpiceDouble       * dist)
+
     #O
 
     cdef void occult_c(ConstSpiceChar * targ1,
@@ -375,21 +1004,61 @@ cdef extern from "SpiceUsr.h" nogil:
 
     cdef SpiceDouble pi_c()
 
+    cdef SpiceDouble pltar_c(SpiceInt              nv,
+                             ConstSpiceDouble    (*vrtces)[3],
+                             SpiceInt              np,
+                             ConstSpiceInt       (*plates)[3])
+
+    cdef void pltexp_c(ConstSpiceDouble[3][3] iverts,
+                       SpiceDouble            delta,
+                       SpiceDouble[3][3]      overts)
+
+    cdef void pltnp_c(ConstSpiceDouble[3] point,
+                      ConstSpiceDouble[3] v1,
+                      ConstSpiceDouble[3] v2,
+                      ConstSpiceDouble[3] v3,
+                      SpiceDouble[3]      pnear,
+                      SpiceDouble       * dist)
+
+    cdef void pltnrm_c(ConstSpiceDouble[3] v1,
+                       ConstSpiceDouble[3] v2,
+                       ConstSpiceDouble[3] v3,
+                       SpiceDouble[3]      normal)
+
     cdef void pxform_c(ConstSpiceChar *  fromstring,
                        ConstSpiceChar *  tostring,
                        SpiceDouble       et,
                        SpiceDouble[3][3] xform)
 
     #Q
+    cdef void q2m_c(ConstSpiceDouble[4] q,
+                    SpiceDouble[3][3]   r)
+
     cdef void qcktrc_c(SpiceInt    tracelen,
                        SpiceChar * trace)
 
+    cdef void qdq2av_c(ConstSpiceDouble[4] q,
+                       ConstSpiceDouble[4] dq,
+                       SpiceDouble[3]      av)
+
+    cdef void qxq_c(ConstSpiceDouble[4] q1,
+                    ConstSpiceDouble[4] q2,
+                    SpiceDouble[4]      qout)
+
     #R
     cdef void radrec_c(SpiceDouble range,
                        SpiceDouble ra,
                        SpiceDouble dec,
                        SpiceDouble[3] rectan)
 
+    cdef void rav2xf_c(ConstSpiceDouble[3][3] rot,
+                       ConstSpiceDouble[3]    av,
+                       SpiceDouble[6][6]      xform)
+
+    cdef void raxisa_c(ConstSpiceDouble[3][3] matrix,
+                       SpiceDouble[3]         axis,
+                       SpiceDouble          * angle)
+
     cdef void recazl_c(ConstSpiceDouble[3] rectan,
                        SpiceBoolean        azccw,
                        SpiceBoolean        elplsz,
@@ -434,6 +1103,20 @@ cdef extern from "SpiceUsr.h" nogil:
 
     cdef void reset_c()
 
+    cdef void rotate_c(SpiceDouble       angle,
+                       SpiceInt          iaxis,
+                       SpiceDouble[3][3] mout)
+
+    cdef void rotmat_c(ConstSpiceDouble[3][3] m1,
+                       SpiceDouble            angle,
+                       SpiceInt               iaxis,
+                       SpiceDouble[3][3]      mout)
+
+    cdef void rotvec_c(ConstSpiceDouble[3] v1,
+                       SpiceDouble         angle,
+                       SpiceInt            iaxis,
+                       SpiceDouble[3]      vout)
+
     cdef SpiceDouble rpd_c()
 
     #S
@@ -532,6 +1215,34 @@ cdef extern from "SpiceUsr.h" nogil:
                        SpiceDouble[6]       state,
                        SpiceInt           * center)
 
+    cdef void spkaps_c(SpiceInt               targ,
+                       SpiceDouble            et,
+                       ConstSpiceChar       * ref,
+                       ConstSpiceChar       * abcorr,
+                       ConstSpiceDouble[6]    stobs,
+                       ConstSpiceDouble[3]    accobs,
+                       SpiceDouble[6]         starg,
+                       SpiceDouble          * lt,
+                       SpiceDouble          * dlt)
+
+    cdef void spkltc_c(SpiceInt               targ,
+                       SpiceDouble            et,
+                       ConstSpiceChar       * ref,
+                       ConstSpiceChar       * abcorr,
+                       ConstSpiceDouble[6]    stobs,
+                       SpiceDouble[6]         starg,
+                       SpiceDouble          * lt,
+                       SpiceDouble          * dlt)
+
+    cdef void spkacs_c(SpiceInt               targ,
+                       SpiceDouble            et,
+                       ConstSpiceChar       * ref,
+                       ConstSpiceChar       * abcorr,
+                       SpiceInt               obs,
+                       SpiceDouble[6]         starg,
+                       SpiceDouble          * lt,
+                       SpiceDouble          * dlt)
+
     cdef void spkssb_c(SpiceInt           targ,
                        SpiceDouble        et,
                        ConstSpiceChar   * ref,
@@ -610,6 +1321,14 @@ cdef extern from "SpiceUsr.h" nogil:
                        SpiceDouble[3]        srfvec,
                        SpiceBoolean        * found)
 
+    cdef void srfnrm_c(ConstSpiceChar      * method,
+                       ConstSpiceChar      * target,
+                       SpiceDouble           et,
+                       ConstSpiceChar      * fixref,
+                       SpiceInt              npts,
+                       ConstSpiceDouble    (*srfpts)[3],
+                       SpiceDouble         (*normls)[3])
+
     cdef void srfrec_c(SpiceInt      body,
                        SpiceDouble   lon,
                        SpiceDouble   lat,
@@ -635,9 +1354,31 @@ cdef extern from "SpiceUsr.h" nogil:
                        SpiceDouble    * trgepc,
                        SpiceDouble[3]   srfvec)
 
+    cdef void stelab_c(ConstSpiceDouble[3] pobj,
+                       ConstSpiceDouble[3] vobs,
+                       SpiceDouble[3]      appobj)
+
+    cdef void stlabx_c(ConstSpiceDouble[3] pobj,
+                       ConstSpiceDouble[3] vobs,
+                       SpiceDouble[3]      corpos)
+
     cdef void str2et_c(ConstSpiceChar * date,
                        SpiceDouble * et)
 
+    cdef void surfnm_c(SpiceDouble         a,
+                       SpiceDouble         b,
+                       SpiceDouble         c,
+                       ConstSpiceDouble[3] point,
+                       SpiceDouble[3]      normal)
+
+    cdef void surfpt_c(ConstSpiceDouble[3] positn,
+                       ConstSpiceDouble[3] u,
+                       SpiceDouble         a,
+                       SpiceDouble         b,
+                       SpiceDouble         c,
+                       SpiceDouble[3]      point,
+                       SpiceBoolean      * found)
+
     cdef void sxform_c(ConstSpiceChar *  fromstring,
                        ConstSpiceChar *  tostring,
                        SpiceDouble       et,
@@ -687,6 +1428,8 @@ cdef extern from "SpiceUsr.h" nogil:
                        ConstSpiceChar   * output)
 
 
+    cdef SpiceDouble trace_c(ConstSpiceDouble[3][3] matrix)
+
     cdef SpiceDouble trgsep_c(SpiceDouble      et,
                               ConstSpiceChar * targ1,
                               ConstSpiceChar * shape1,
@@ -700,23 +1443,1374 @@ cdef extern from "SpiceUsr.h" nogil:
     cdef SpiceDouble twopi_c()
 
 
+    cdef void twovec_c(ConstSpiceDouble[3] axdef,
+                       SpiceInt            indexa,
+                       ConstSpiceDouble[3] plndef,
+                       SpiceInt            indexp,
+                       SpiceDouble[3][3]   mout)
+
+    cdef void twovxf_c(ConstSpiceDouble[6] axdef,
+                       SpiceInt            indexa,
+                       ConstSpiceDouble[6] plndef,
+                       SpiceInt            indexp,
+                       SpiceDouble[6][6]   xform)
+
     cdef SpiceDouble tyear_c()
 
     # U
 
+    cdef void ucrss_c(ConstSpiceDouble[3] v1,
+                      ConstSpiceDouble[3] v2,
+                      SpiceDouble[3]      vout)
+
     cdef SpiceDouble unitim_c(SpiceDouble      epoch,
                               ConstSpiceChar * insys,
                               ConstSpiceChar * outsys)
 
     cdef void unload_c(ConstSpiceChar * file)
 
+    cdef void unorm_c(ConstSpiceDouble[3] v1,
+                      SpiceDouble[3]      vout,
+                      SpiceDouble       * vmag)
+
     cdef void utc2et_c(ConstSpiceChar * utcstr, 
                        SpiceDouble * et)
 
+    # V
+
+    cdef void vadd_c(ConstSpiceDouble[3] v1,
+                     ConstSpiceDouble[3] v2,
+                     SpiceDouble[3]      vout)
+
+    cdef void vcrss_c(ConstSpiceDouble[3] v1,
+                      ConstSpiceDouble[3] v2,
+                      SpiceDouble[3]      vout)
+
+    cdef SpiceDouble vdist_c(ConstSpiceDouble[3] v1,
+                             ConstSpiceDouble[3] v2)
+
+    cdef SpiceDouble vdot_c(ConstSpiceDouble[3] v1,
+                            ConstSpiceDouble[3] v2)
+
+    cdef void vhat_c(ConstSpiceDouble[3] v1,
+                     SpiceDouble[3]      vout)
+
+    cdef void vlcom_c(SpiceDouble         a,
+                      ConstSpiceDouble[3] v1,
+                      SpiceDouble         b,
+                      ConstSpiceDouble[3] v2,
+                      SpiceDouble[3]      sum)
+
+    cdef void vlcom3_c(SpiceDouble         a,
+                       ConstSpiceDouble[3] v1,
+                       SpiceDouble         b,
+                       ConstSpiceDouble[3] v2,
+                       SpiceDouble         c,
+                       ConstSpiceDouble[3] v3,
+                       SpiceDouble[3]      sum)
+
+    cdef void vminus_c(ConstSpiceDouble[3] v1,
+                       SpiceDouble[3]      vout)
+
+    cdef SpiceDouble vnorm_c(ConstSpiceDouble[3] v1)
+
+    cdef void vpack_c(SpiceDouble    x,
+                      SpiceDouble    y,
+                      SpiceDouble    z,
+                      SpiceDouble[3] v)
+
+    cdef void vperp_c(ConstSpiceDouble[3] a,
+                      ConstSpiceDouble[3] b,
+                      SpiceDouble[3]      p)
+
+    cdef void vproj_c(ConstSpiceDouble[3] a,
+                      ConstSpiceDouble[3] b,
+                      SpiceDouble[3]      p)
+
+    cdef SpiceDouble vrel_c(ConstSpiceDouble[3] v1,
+                            ConstSpiceDouble[3] v2)
+
+    cdef void vrotv_c(ConstSpiceDouble[3] v,
+                      ConstSpiceDouble[3] axis,
+                      SpiceDouble         theta,
+                      SpiceDouble[3]      r)
+
+    cdef void vscl_c(SpiceDouble         s,
+                     ConstSpiceDouble[3] v1,
+                     SpiceDouble[3]      vout)
+
+    cdef SpiceDouble vsep_c(ConstSpiceDouble[3] v1,
+                            ConstSpiceDouble[3] v2)
+
+    cdef void vsub_c(ConstSpiceDouble[3] v1,
+                     ConstSpiceDouble[3] v2,
+                     SpiceDouble[3]      vout)
+
+    cdef SpiceDouble vtmv_c(ConstSpiceDouble[3]    v1,
+                            ConstSpiceDouble[3][3] matrix,
+                            ConstSpiceDouble[3]    v2)
+
+    cdef void vupack_c(ConstSpiceDouble[3] v,
+                       SpiceDouble       * x,
+                       SpiceDouble       * y,
+                       SpiceDouble       * z)
+
+    cdef SpiceBoolean vzero_c(ConstSpiceDouble[3] v)
+
+    # W
+
+    cdef SpiceInt wncard_c(SpiceCell * window)
+
+    cdef void wncomd_c(SpiceDouble left,
+                       SpiceDouble right,
+                       SpiceCell * window,
+                       SpiceCell * result)
+
+    cdef void wncond_c(SpiceDouble left,
+                       SpiceDouble right,
+                       SpiceCell * window)
+
+    cdef void wndifd_c(SpiceCell * a,
+                       SpiceCell * b,
+                       SpiceCell * c)
+
+    cdef SpiceBoolean wnelmd_c(SpiceDouble point,
+                               SpiceCell * window)
+
+    cdef void wnexpd_c(SpiceDouble left,
+                       SpiceDouble right,
+                       SpiceCell * window)
+
+    cdef void wnextd_c(SpiceChar   side,
+                       SpiceCell * window)
+
+    cdef void wnfetd_c(SpiceCell   * window,
+                       SpiceInt      n,
+                       SpiceDouble * left,
+                       SpiceDouble * right)
+
+    cdef void wnfild_c(SpiceDouble smlgap,
+                       SpiceCell * window)
+
+    cdef void wnfltd_c(SpiceDouble smlint,
+                       SpiceCell * window)
+
+    cdef SpiceBoolean wnincd_c(SpiceDouble left,
+                               SpiceDouble right,
+                               SpiceCell * window)
+
+    cdef void wninsd_c(SpiceDouble left,
+                       SpiceDouble right,
+                       SpiceCell * window)
+
+    cdef void wnintd_c(SpiceCell * a,
+                       SpiceCell * b,
+                       SpiceCell * c)
+
+    cdef SpiceBoolean wnreld_c(SpiceCell      * a,
+                               ConstSpiceChar * op,
+                               SpiceCell      * b)
+
+    cdef void wnsumd_c(SpiceCell   * window,
+                       SpiceDouble * meas,
+                       SpiceDouble * avg,
+                       SpiceDouble * stddev,
+                       SpiceInt    * idxsml,
+                       SpiceInt    * idxlon)
+
+    cdef void wnunid_c(SpiceCell * a,
+                       SpiceCell * b,
+                       SpiceCell * c)
+
+    cdef void wnvald_c(SpiceInt    size,
+                       SpiceInt    n,
+                       SpiceCell * window)
+
     # X 
 
+    cdef void xf2eul_c(ConstSpiceDouble[6][6] xform,
+                       SpiceInt               axisa,
+                       SpiceInt               axisb,
+                       SpiceInt               axisc,
+                       SpiceDouble[6]         eulang,
+                       SpiceBoolean         * unique)
+
+    cdef void xf2rav_c(ConstSpiceDouble[6][6] xform,
+                       SpiceDouble[3][3]      rot,
+                       SpiceDouble[3]         av)
+
     cdef void xfmsta_c(ConstSpiceDouble[6]  istate,
                        ConstSpiceChar     * icosys,
                        ConstSpiceChar     * ocosys,
                        ConstSpiceChar     * body,
-                       SpiceDouble[6]       ostate)
\ No newline at end of file
+                       SpiceDouble[6]       ostate)
+
+    cdef void xpose_c(ConstSpiceDouble[3][3] m1,
+                      SpiceDouble[3][3]      mout)
+
+
+# CSPICE functions called only through ctypes. They are declared with the types
+# ctypes passes, strings are SpiceChar * and string arrays void *, replace a
+# declaration with the prototype from SpiceZpr.h when moving the function into
+# cyice. utils/cspice_signatures.py is generated from all declarations in this
+# file, run python -m spiceypy.utils.gen_signatures after changing them.
+cdef extern from "SpiceUsr.h" nogil:
+    ctypedef struct SpiceEKAttDsc:
+        pass
+
+    ctypedef struct SpiceEKSegSum:
+        pass
+
+    # gf search callbacks, named as in utils/callbacks.py
+    ctypedef void (*UDFUNS)(SpiceDouble et, SpiceDouble * value)
+    ctypedef void (*UDFUNB)(UDFUNS udfuns, SpiceDouble et, SpiceBoolean * xbool)
+    ctypedef void (*UDSTEP)(SpiceDouble et, SpiceDouble * step)
+    ctypedef void (*UDREFN)(SpiceDouble t1,
+                            SpiceDouble t2,
+                            SpiceBoolean s1,
+                            SpiceBoolean s2,
+                            SpiceDouble * t)
+    ctypedef void (*UDREPI)(SpiceCell * cnfine,
+                            ConstSpiceChar * srcpre,
+                            ConstSpiceChar * srcsuf)
+    ctypedef void (*UDREPU)(SpiceDouble ivbeg, SpiceDouble ivend, SpiceDouble et)
+    ctypedef void (*UDREPF)()
+    ctypedef SpiceBoolean (*UDBAIL)()
+    # A
+    cdef void appndc_c(SpiceChar *, SpiceCell *)
+    cdef void appndd_c(SpiceDouble, SpiceCell *)
+    cdef void appndi_c(SpiceInt, SpiceCell *)
+
+    # B
+    cdef SpiceBoolean badkpv_c(SpiceChar *,
+                               SpiceChar *,
+                               SpiceChar *,
+                               SpiceInt,
+                               SpiceInt,
+                               SpiceChar)
+    cdef void bltfrm_c(SpiceInt, SpiceCell *)
+    cdef void bodc2n_c(SpiceInt, SpiceInt, SpiceChar *, SpiceInt *)
+    cdef void bodc2s_c(SpiceInt, SpiceInt, SpiceChar *)
+    cdef void boddef_c(SpiceChar *, SpiceInt)
+    cdef void bodeul_(SpiceInt *,
+                      SpiceDouble *,
+                      SpiceDouble *,
+                      SpiceDouble *,
+                      SpiceDouble *,
+                      SpiceDouble *)
+    cdef void bodvar_c(SpiceInt, SpiceChar *, SpiceInt *, void *)
+    cdef void bodvcd_c(SpiceInt, SpiceChar *, SpiceInt, SpiceInt *, void *)
+    cdef void bodvrd_c(SpiceChar *, SpiceChar *, SpiceInt, SpiceInt *, void *)
+    cdef SpiceDouble brcktd_c(SpiceDouble, SpiceDouble, SpiceDouble)
+    cdef SpiceInt brckti_c(SpiceInt, SpiceInt, SpiceInt)
+    cdef SpiceInt bschoc_c(SpiceChar *, SpiceInt, SpiceInt, SpiceChar *, SpiceInt *)
+    cdef SpiceInt bschoi_c(SpiceInt, SpiceInt, SpiceInt *, SpiceInt *)
+    cdef SpiceInt bsrchc_c(SpiceChar *, SpiceInt, SpiceInt, SpiceChar *)
+    cdef SpiceInt bsrchd_c(SpiceDouble, SpiceInt, SpiceDouble *)
+    cdef SpiceInt bsrchi_c(SpiceInt, SpiceInt, SpiceInt *)
+
+    # C
+    cdef SpiceInt card_c(SpiceCell *)
+    cdef void ccifrm_c(SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceInt *,
+                       SpiceChar *,
+                       SpiceInt *,
+                       SpiceInt *)
+    cdef void cgv2el_c(SpiceDouble[3], SpiceDouble[3], SpiceDouble[3], SpiceEllipse *)
+    cdef void chbder_c(SpiceDouble *,
+                       SpiceInt,
+                       SpiceDouble[2],
+                       SpiceDouble,
+                       SpiceInt,
+                       SpiceDouble *,
+                       SpiceDouble *)
+    cdef void chbigr_c(SpiceInt,
+                       SpiceDouble *,
+                       SpiceDouble[2],
+                       SpiceDouble,
+                       SpiceDouble *,
+                       SpiceDouble *)
+    cdef void chbint_c(SpiceDouble *,
+                       SpiceInt,
+                       SpiceDouble[2],
+                       SpiceDouble,
+                       SpiceDouble *,
+                       SpiceDouble *)
+    cdef void chbval_c(SpiceDouble *,
+                       SpiceInt,
+                       SpiceDouble[2],
+                       SpiceDouble,
+                       SpiceDouble *)
+    cdef void chkin_c(SpiceChar *)
+    cdef void chkout_c(SpiceChar *)
+    cdef void cidfrm_c(SpiceInt, SpiceInt, SpiceInt *, SpiceChar *, SpiceInt *)
+    cdef void ckcls_c(SpiceInt)
+    cdef void ckcov_c(SpiceChar *,
+                      SpiceInt,
+                      SpiceInt,
+                      SpiceChar *,
+                      SpiceDouble,
+                      SpiceChar *,
+                      SpiceCell *)
+    cdef void ckfrot_c(SpiceInt, SpiceDouble, SpiceDouble[3][3], SpiceInt *, SpiceInt *)
+    cdef void ckfxfm_c(SpiceInt, SpiceDouble, SpiceDouble[6][6], SpiceInt *, SpiceInt *)
+    cdef void ckgr02_c(SpiceInt, SpiceDouble[5], SpiceInt, SpiceDouble[10])
+    cdef void ckgr03_c(SpiceInt, SpiceDouble[5], SpiceInt, SpiceDouble[8])
+    cdef void cklpf_c(SpiceChar *, SpiceInt *)
+    cdef void ckmeta_c(SpiceInt, SpiceChar *, SpiceInt *)
+    cdef void cknr02_c(SpiceInt, SpiceDouble[5], SpiceInt *)
+    cdef void cknr03_c(SpiceInt, SpiceDouble[5], SpiceInt *)
+    cdef void ckobj_c(SpiceChar *, SpiceCell *)
+    cdef void ckopn_c(SpiceChar *, SpiceChar *, SpiceInt, SpiceInt *)
+    cdef void ckupf_c(SpiceInt)
+    cdef void ckw01_c(SpiceInt,
+                      SpiceDouble,
+                      SpiceDouble,
+                      SpiceInt,
+                      SpiceChar *,
+                      SpiceInt,
+                      SpiceChar *,
+                      SpiceInt,
+                      SpiceDouble *,
+                      SpiceDouble (*)[4],
+                      SpiceDouble (*)[3])
+    cdef void ckw02_c(SpiceInt,
+                      SpiceDouble,
+                      SpiceDouble,
+                      SpiceInt,
+                      SpiceChar *,
+                      SpiceChar *,
+                      SpiceInt,
+                      SpiceDouble *,
+                      SpiceDouble *,
+                      SpiceDouble (*)[4],
+                      SpiceDouble (*)[3],
+                      SpiceDouble *)
+    cdef void ckw03_c(SpiceInt,
+                      SpiceDouble,
+                      SpiceDouble,
+                      SpiceInt,
+                      SpiceChar *,
+                      SpiceInt,
+                      SpiceChar *,
+                      SpiceInt,
+                      SpiceDouble *,
+                      SpiceDouble (*)[4],
+                      SpiceDouble (*)[3],
+                      SpiceInt,
+                      SpiceDouble *)
+    cdef void ckw05_c(SpiceInt,
+                      SpiceInt,
+                      SpiceInt,
+                      SpiceDouble,
+                      SpiceDouble,
+                      SpiceInt,
+                      SpiceChar *,
+                      SpiceInt,
+                      SpiceChar *,
+                      SpiceInt,
+                      SpiceDouble *,
+                      void *,
+                      SpiceDouble,
+                      SpiceInt,
+                      SpiceDouble *)
+    cdef void clpool_c()
+    cdef void cltext_(SpiceChar *, SpiceInt)
+    cdef void cmprss_c(SpiceChar, SpiceInt, SpiceChar *, SpiceInt, SpiceChar *)
+    cdef void cnmfrm_c(SpiceChar *, SpiceInt, SpiceInt *, SpiceChar *, SpiceInt *)
+    cdef void copy_c(SpiceCell *, SpiceCell *)
+    cdef SpiceInt cpos_c(SpiceChar *, SpiceChar *, SpiceInt)
+    cdef SpiceInt cposr_c(SpiceChar *, SpiceChar *, SpiceInt)
+    cdef void cvpool_c(SpiceChar *, SpiceInt *)
+
+    # D
+    cdef void dafac_c(SpiceInt, SpiceInt, SpiceInt, void *)
+    cdef void dafbbs_c(SpiceInt)
+    cdef void dafbfs_c(SpiceInt)
+    cdef void dafcls_c(SpiceInt)
+    cdef void dafcs_c(SpiceInt)
+    cdef void dafdc_c(SpiceInt)
+    cdef void dafec_c(SpiceInt, SpiceInt, SpiceInt, SpiceInt *, void *, SpiceInt *)
+    cdef void daffna_c(SpiceInt *)
+    cdef void daffpa_c(SpiceInt *)
+    cdef void dafgda_c(SpiceInt, SpiceInt, SpiceInt, SpiceDouble *)
+    cdef void dafgh_c(SpiceInt *)
+    cdef void dafgn_c(SpiceInt, SpiceChar *)
+    cdef void dafgs_c(SpiceDouble *)
+    cdef void dafgsr_c(SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceDouble *,
+                       SpiceInt *)
+    cdef void dafhsf_c(SpiceInt, SpiceInt *, SpiceInt *)
+    cdef void dafopr_c(SpiceChar *, SpiceInt *)
+    cdef void dafopw_c(SpiceChar *, SpiceInt *)
+    cdef void dafps_c(SpiceInt, SpiceInt, SpiceDouble *, SpiceInt *, SpiceDouble *)
+    cdef void dafrda_c(SpiceInt, SpiceInt, SpiceInt, SpiceDouble *)
+    cdef void dafrfr_c(SpiceInt,
+                       SpiceInt,
+                       SpiceInt *,
+                       SpiceInt *,
+                       SpiceChar *,
+                       SpiceInt *,
+                       SpiceInt *,
+                       SpiceInt *)
+    cdef void dafrs_c(SpiceDouble *)
+    cdef void dafus_c(SpiceDouble *, SpiceInt, SpiceInt, SpiceDouble *, SpiceInt *)
+    cdef void dasac_c(SpiceInt, SpiceInt, SpiceInt, void *)
+    cdef void dasadc_c(SpiceInt, SpiceInt, SpiceInt, SpiceInt, SpiceInt, void *)
+    cdef void dasadd_c(SpiceInt, SpiceInt, SpiceDouble *)
+    cdef void dasadi_c(SpiceInt, SpiceInt, SpiceInt *)
+    cdef void dascls_c(SpiceInt)
+    cdef void dasdc_c(SpiceInt)
+    cdef void dasec_c(SpiceInt, SpiceInt, SpiceInt, SpiceInt *, void *, SpiceInt *)
+    cdef void dashfn_c(SpiceInt, SpiceInt, SpiceChar *)
+    cdef void dashfs_c(SpiceInt,
+                       SpiceInt *,
+                       SpiceInt *,
+                       SpiceInt *,
+                       SpiceInt *,
+                       SpiceInt *,
+                       SpiceInt[3],
+                       SpiceInt[3],
+                       SpiceInt[3])
+    cdef void daslla_c(SpiceInt, SpiceInt *, SpiceInt *, SpiceInt *)
+    cdef void dasllc_c(SpiceInt)
+    cdef void dasonw_c(SpiceChar *, SpiceChar *, SpiceChar *, SpiceInt, SpiceInt *)
+    cdef void dasopr_c(SpiceChar *, SpiceInt *)
+    cdef void dasops_c(SpiceInt *)
+    cdef void dasopw_c(SpiceChar *, SpiceInt *)
+    cdef void dasrdc_c(SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       void *)
+    cdef void dasrdd_c(SpiceInt, SpiceInt, SpiceInt, SpiceDouble *)
+    cdef void dasrdi_c(SpiceInt, SpiceInt, SpiceInt, SpiceInt *)
+    cdef void dasrfr_c(SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceChar *,
+                       SpiceChar *,
+                       SpiceInt *,
+                       SpiceInt *,
+                       SpiceInt *,
+                       SpiceInt *)
+    cdef void dasudc_c(SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       void *)
+    cdef void dasudd_c(SpiceInt, SpiceInt, SpiceInt, SpiceDouble *)
+    cdef void dasudi_c(SpiceInt, SpiceInt, SpiceInt, SpiceInt *)
+    cdef void daswbr_c(SpiceInt)
+    cdef void diags2_c(SpiceDouble[2][2], SpiceDouble[2][2], SpiceDouble[2][2])
+    cdef void diff_c(SpiceCell *, SpiceCell *, SpiceCell *)
+    cdef void dlabbs_c(SpiceInt, SpiceDLADescr *, SpiceInt *)
+    cdef void dlabfs_c(SpiceInt, SpiceDLADescr *, SpiceInt *)
+    cdef void dlabns_c(SpiceInt)
+    cdef void dlaens_c(SpiceInt)
+    cdef void dlafns_c(SpiceInt, SpiceDLADescr *, SpiceDLADescr *, SpiceInt *)
+    cdef void dlafps_c(SpiceInt, SpiceDLADescr *, SpiceDLADescr *, SpiceInt *)
+    cdef void dlaopn_c(SpiceChar *, SpiceChar *, SpiceChar *, SpiceInt, SpiceInt *)
+    cdef void dnearp_c(SpiceDouble[6],
+                       SpiceDouble,
+                       SpiceDouble,
+                       SpiceDouble,
+                       SpiceDouble[6],
+                       SpiceDouble[2],
+                       SpiceInt *)
+    cdef void dp2hx_c(SpiceDouble, SpiceInt, SpiceChar *, SpiceInt *)
+    cdef SpiceDouble dpmax_c()
+    cdef SpiceDouble dpmin_c()
+    cdef void dskgtl_c(SpiceInt, SpiceDouble *)
+    cdef void dskn02_c(SpiceInt, SpiceDLADescr *, SpiceInt, SpiceDouble *)
+    cdef void dskobj_c(SpiceChar *, SpiceCell *)
+    cdef void dsksrf_c(SpiceChar *, SpiceInt, SpiceCell *)
+    cdef void dskstl_c(SpiceInt, SpiceDouble)
+    cdef void dskz02_c(SpiceInt, SpiceDLADescr *, SpiceInt *, SpiceInt *)
+    cdef void dtpool_c(SpiceChar *, SpiceInt *, SpiceInt *, SpiceChar *)
+    cdef void dvpool_c(SpiceChar *)
+
+    # E
+    cdef void edterm_c(SpiceChar *,
+                       SpiceChar *,
+                       SpiceChar *,
+                       SpiceDouble,
+                       SpiceChar *,
+                       SpiceChar *,
+                       SpiceChar *,
+                       SpiceInt,
+                       SpiceDouble *,
+                       SpiceDouble[3],
+                       void *)
+    cdef void ekacec_c(SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceChar *,
+                       SpiceInt,
+                       SpiceInt,
+                       void *,
+                       SpiceInt)
+    cdef void ekaced_c(SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceChar *,
+                       SpiceInt,
+                       SpiceDouble *,
+                       SpiceInt)
+    cdef void ekacei_c(SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceChar *,
+                       SpiceInt,
+                       SpiceInt *,
+                       SpiceInt)
+    cdef void ekaclc_c(SpiceInt,
+                       SpiceInt,
+                       SpiceChar *,
+                       SpiceInt,
+                       void *,
+                       SpiceInt *,
+                       SpiceInt *,
+                       SpiceInt *,
+                       SpiceInt *)
+    cdef void ekacld_c(SpiceInt,
+                       SpiceInt,
+                       SpiceChar *,
+                       SpiceDouble *,
+                       SpiceInt *,
+                       SpiceInt *,
+                       SpiceInt *,
+                       SpiceInt *)
+    cdef void ekacli_c(SpiceInt,
+                       SpiceInt,
+                       SpiceChar *,
+                       SpiceInt *,
+                       SpiceInt *,
+                       SpiceInt *,
+                       SpiceInt *,
+                       SpiceInt *)
+    cdef void ekbseg_c(SpiceInt,
+                       SpiceChar *,
+                       SpiceInt,
+                       SpiceInt,
+                       void *,
+                       SpiceInt,
+                       void *,
+                       SpiceInt *)
+    cdef void ekcii_c(SpiceChar *, SpiceInt, SpiceInt, SpiceChar *, SpiceEKAttDsc *)
+    cdef void ekffld_c(SpiceInt, SpiceInt, SpiceInt *)
+    cdef void ekifld_c(SpiceInt,
+                       SpiceChar *,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       void *,
+                       SpiceInt,
+                       void *,
+                       SpiceInt *,
+                       SpiceInt *)
+    cdef void ekpsel_c(SpiceChar *,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceInt *,
+                       SpiceInt *,
+                       SpiceInt *,
+                       SpiceInt *,
+                       SpiceInt *,
+                       void *,
+                       void *,
+                       SpiceInt *,
+                       SpiceChar *)
+    cdef void ekrcec_c(SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceChar *,
+                       SpiceInt,
+                       SpiceInt *,
+                       void *,
+                       SpiceInt *)
+    cdef void ekrced_c(SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceChar *,
+                       SpiceInt *,
+                       SpiceDouble *,
+                       SpiceInt *)
+    cdef void ekrcei_c(SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceChar *,
+                       SpiceInt *,
+                       SpiceInt *,
+                       SpiceInt *)
+    cdef void ekssum_c(SpiceInt, SpiceInt, SpiceEKSegSum *)
+    cdef void ekucec_c(SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceChar *,
+                       SpiceInt,
+                       SpiceInt,
+                       void *,
+                       SpiceInt)
+    cdef void ekuced_c(SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceChar *,
+                       SpiceInt,
+                       SpiceDouble *,
+                       SpiceInt)
+    cdef void ekucei_c(SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceChar *,
+                       SpiceInt,
+                       SpiceInt *,
+                       SpiceInt)
+    cdef void el2cgv_c(SpiceEllipse *, SpiceDouble[3], SpiceDouble[3], SpiceDouble[3])
+    cdef SpiceBoolean elemc_c(SpiceChar *, SpiceCell *)
+    cdef SpiceBoolean elemd_c(SpiceDouble, SpiceCell *)
+    cdef SpiceBoolean elemi_c(SpiceInt, SpiceCell *)
+    cdef void eqncpv_c(SpiceDouble,
+                       SpiceDouble,
+                       SpiceDouble[9],
+                       SpiceDouble,
+                       SpiceDouble,
+                       SpiceDouble[6])
+    cdef SpiceBoolean eqstr_c(SpiceChar *, SpiceChar *)
+    cdef void erract_c(SpiceChar *, SpiceInt, SpiceChar *)
+    cdef void errch_c(SpiceChar *, SpiceChar *)
+    cdef void errdev_c(SpiceChar *, SpiceInt, SpiceChar *)
+    cdef void errdp_c(SpiceChar *, SpiceDouble)
+    cdef void errint_c(SpiceChar *, SpiceInt)
+    cdef void errprt_c(SpiceChar *, SpiceInt, SpiceChar *)
+    cdef SpiceInt esrchc_c(SpiceChar *, SpiceInt, SpiceInt, void *)
+    cdef void ev2lin_(SpiceDouble *, SpiceDouble *, SpiceDouble *, SpiceDouble *)
+    cdef SpiceBoolean exists_c(SpiceChar *)
+    cdef void expool_c(SpiceChar *, SpiceInt *)
+
+    # F
+    cdef void fn2lun_(SpiceChar *, SpiceInt *, SpiceInt)
+    cdef void frame_c(SpiceDouble[3], SpiceDouble[3], SpiceDouble[3])
+    cdef void frmnam_c(SpiceInt, SpiceInt, SpiceChar *)
+    cdef void ftncls_c(SpiceInt)
+
+    # G
+    cdef void gcpool_c(SpiceChar *,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceInt *,
+                       void *,
+                       SpiceInt *)
+    cdef void gdpool_c(SpiceChar *,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceInt *,
+                       SpiceDouble *,
+                       SpiceInt *)
+    cdef void getcml_c(SpiceInt, SpiceChar *)
+    cdef void getfat_c(SpiceChar *, SpiceInt, SpiceInt, SpiceChar *, SpiceChar *)
+    cdef void getfov_c(SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceChar *,
+                       SpiceChar *,
+                       SpiceDouble[3],
+                       SpiceInt *,
+                       SpiceDouble (*)[3])
+    cdef void getfvn_c(SpiceChar *,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceChar *,
+                       SpiceChar *,
+                       SpiceDouble[3],
+                       SpiceInt *,
+                       SpiceDouble (*)[3])
+    cdef SpiceBoolean gfbail_c()
+    cdef void gfclrh_c()
+    cdef void gfevnt_c(UDSTEP,
+                       UDREFN,
+                       SpiceChar *,
+                       SpiceInt,
+                       SpiceInt,
+                       void *,
+                       void *,
+                       SpiceDouble *,
+                       SpiceInt *,
+                       SpiceInt *,
+                       SpiceChar *,
+                       SpiceDouble,
+                       SpiceDouble,
+                       SpiceDouble,
+                       SpiceInt,
+                       UDREPI,
+                       UDREPU,
+                       UDREPF,
+                       SpiceInt,
+                       SpiceInt,
+                       UDBAIL,
+                       SpiceCell *,
+                       SpiceCell *)
+    cdef void gffove_c(SpiceChar *,
+                       SpiceChar *,
+                       SpiceDouble[3],
+                       SpiceChar *,
+                       SpiceChar *,
+                       SpiceChar *,
+                       SpiceChar *,
+                       SpiceDouble,
+                       UDSTEP,
+                       UDREFN,
+                       SpiceInt,
+                       UDREPI,
+                       UDREPU,
+                       UDREPF,
+                       SpiceInt,
+                       UDBAIL,
+                       SpiceCell *,
+                       SpiceCell *)
+    cdef void gfinth_c(SpiceInt)
+    cdef void gfocce_c(SpiceChar *,
+                       SpiceChar *,
+                       SpiceChar *,
+                       SpiceChar *,
+                       SpiceChar *,
+                       SpiceChar *,
+                       SpiceChar *,
+                       SpiceChar *,
+                       SpiceChar *,
+                       SpiceDouble,
+                       UDSTEP,
+                       UDREFN,
+                       SpiceInt,
+                       UDREPI,
+                       UDREPU,
+                       UDREPF,
+                       SpiceInt,
+                       UDBAIL,
+                       SpiceCell *,
+                       SpiceCell *)
+    cdef void gfrefn_c(SpiceDouble, SpiceDouble, SpiceInt, SpiceInt, SpiceDouble *)
+    cdef void gfrepf_c()
+    cdef void gfrepi_c(SpiceCell *, SpiceChar *, SpiceChar *)
+    cdef void gfrepu_c(SpiceDouble, SpiceDouble, SpiceDouble)
+    cdef void gfsstp_c(SpiceDouble)
+    cdef void gfstep_c(SpiceDouble, SpiceDouble *)
+    cdef void gfudb_c(UDFUNS, UDFUNB, SpiceDouble, SpiceCell *, SpiceCell *)
+    cdef void gfuds_c(UDFUNS,
+                      UDFUNB,
+                      SpiceChar *,
+                      SpiceDouble,
+                      SpiceDouble,
+                      SpiceDouble,
+                      SpiceInt,
+                      SpiceCell *,
+                      SpiceCell *)
+    cdef void gipool_c(SpiceChar *,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceInt *,
+                       SpiceInt *,
+                       SpiceInt *)
+    cdef void gnpool_c(SpiceChar *,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceInt *,
+                       void *,
+                       SpiceInt *)
+
+    # H
+    cdef void hrmesp_c(SpiceInt,
+                       SpiceDouble,
+                       SpiceDouble,
+                       SpiceDouble *,
+                       SpiceDouble,
+                       SpiceDouble *,
+                       SpiceDouble *)
+    cdef void hrmint_c(SpiceInt,
+                       SpiceDouble *,
+                       SpiceDouble *,
+                       SpiceDouble,
+                       SpiceDouble *,
+                       SpiceDouble *,
+                       SpiceDouble *)
+    cdef void hx2dp_c(SpiceChar *, SpiceInt, SpiceDouble *, SpiceInt *, SpiceChar *)
+
+    # I
+    cdef void ident_c(SpiceDouble[3][3])
+    cdef void illum_c(SpiceChar *,
+                      SpiceDouble,
+                      SpiceChar *,
+                      SpiceChar *,
+                      SpiceDouble[3],
+                      SpiceDouble *,
+                      SpiceDouble *,
+                      SpiceDouble *)
+    cdef void inedpl_c(SpiceDouble,
+                       SpiceDouble,
+                       SpiceDouble,
+                       SpicePlane *,
+                       SpiceEllipse *,
+                       SpiceInt *)
+    cdef void inelpl_c(SpiceEllipse *,
+                       SpicePlane *,
+                       SpiceInt *,
+                       SpiceDouble[3],
+                       SpiceDouble[3])
+    cdef void insrtc_c(SpiceChar *, SpiceCell *)
+    cdef void insrtd_c(SpiceDouble, SpiceCell *)
+    cdef void insrti_c(SpiceInt, SpiceCell *)
+    cdef void inter_c(SpiceCell *, SpiceCell *, SpiceCell *)
+    cdef SpiceInt intmax_c()
+    cdef SpiceInt intmin_c()
+    cdef void invort_c(SpiceDouble[3][3], SpiceDouble[3][3])
+    cdef void invstm_c(SpiceDouble[6][6], SpiceDouble[6][6])
+    cdef void irfnam_(SpiceInt *, SpiceChar *, SpiceInt)
+    cdef void irfnum_(SpiceChar *, SpiceInt *, SpiceInt)
+    cdef void irfrot_(SpiceInt *, SpiceInt *, SpiceDouble[3][3])
+    cdef void irftrn_(SpiceChar *, SpiceChar *, SpiceDouble[3][3], SpiceInt, SpiceInt)
+    cdef SpiceBoolean isordv_c(SpiceInt *, SpiceInt)
+    cdef SpiceInt isrchc_c(SpiceChar *, SpiceInt, SpiceInt, void *)
+    cdef SpiceInt isrchd_c(SpiceDouble, SpiceInt, SpiceDouble *)
+    cdef SpiceInt isrchi_c(SpiceInt, SpiceInt, SpiceInt *)
+    cdef SpiceBoolean isrot_c(SpiceDouble[3][3], SpiceDouble, SpiceDouble)
+    cdef SpiceBoolean iswhsp_c(SpiceChar *)
+
+    # K
+    cdef void kclear_c()
+    cdef void kdata_c(SpiceInt,
+                      SpiceChar *,
+                      SpiceInt,
+                      SpiceInt,
+                      SpiceInt,
+                      SpiceChar *,
+                      SpiceChar *,
+                      SpiceChar *,
+                      SpiceInt *,
+                      SpiceInt *)
+    cdef SpiceDouble kepleq_(SpiceDouble *, SpiceDouble *, SpiceDouble *)
+    cdef void kinfo_c(SpiceChar *,
+                      SpiceInt,
+                      SpiceInt,
+                      SpiceChar *,
+                      SpiceChar *,
+                      SpiceInt *,
+                      SpiceInt *)
+    cdef void kplfrm_c(SpiceInt, SpiceCell *)
+    cdef SpiceDouble kpsolv_(SpiceDouble *)
+    cdef void ktotal_c(SpiceChar *, SpiceInt *)
+    cdef void kxtrct_c(SpiceChar *,
+                       SpiceInt,
+                       void *,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceChar *,
+                       SpiceInt *,
+                       SpiceChar *)
+
+    # L
+    cdef SpiceInt lastnb_c(SpiceChar *)
+    cdef void lcase_c(SpiceChar *, SpiceInt, SpiceChar *)
+    cdef void ldpool_c(SpiceChar *)
+    cdef SpiceDouble lgresp_c(SpiceInt,
+                              SpiceDouble,
+                              SpiceDouble,
+                              SpiceDouble *,
+                              SpiceDouble)
+    cdef void lgrind_c(SpiceInt,
+                       SpiceDouble *,
+                       SpiceDouble *,
+                       SpiceDouble *,
+                       SpiceDouble,
+                       SpiceDouble *,
+                       SpiceDouble *)
+    cdef SpiceDouble lgrint_c(SpiceInt, SpiceDouble *, SpiceDouble *, SpiceDouble)
+    cdef void lmpool_c(void *, SpiceInt, SpiceInt)
+    cdef void lparse_c(SpiceChar *, SpiceChar *, SpiceInt, SpiceInt, SpiceInt *, void *)
+    cdef void lparsm_c(SpiceChar *, SpiceChar *, SpiceInt, SpiceInt, SpiceInt *, void *)
+    cdef void lparss_c(SpiceChar *, SpiceChar *, SpiceCell *)
+    cdef SpiceInt lstlec_c(SpiceChar *, SpiceInt, SpiceInt, void *)
+    cdef SpiceInt lstled_c(SpiceDouble, SpiceInt, SpiceDouble *)
+    cdef SpiceInt lstlei_c(SpiceInt, SpiceInt, SpiceInt *)
+    cdef SpiceInt lstltc_c(SpiceChar *, SpiceInt, SpiceInt, void *)
+    cdef SpiceInt lstltd_c(SpiceDouble, SpiceInt, SpiceDouble *)
+    cdef SpiceInt lstlti_c(SpiceInt, SpiceInt, SpiceInt *)
+    cdef void lx4dec_c(SpiceChar *, SpiceInt, SpiceInt *, SpiceInt *)
+    cdef void lx4num_c(SpiceChar *, SpiceInt, SpiceInt *, SpiceInt *)
+    cdef void lx4sgn_c(SpiceChar *, SpiceInt, SpiceInt *, SpiceInt *)
+    cdef void lx4uns_c(SpiceChar *, SpiceInt, SpiceInt *, SpiceInt *)
+    cdef void lxqstr_c(SpiceChar *, SpiceChar, SpiceInt, SpiceInt *, SpiceInt *)
+
+    # M
+    cdef SpiceBoolean matchi_c(SpiceChar *, SpiceChar *, SpiceChar, SpiceChar)
+    cdef SpiceBoolean matchw_c(SpiceChar *, SpiceChar *, SpiceChar, SpiceChar)
+    cdef SpiceDouble maxd_c(SpiceInt, ...)
+    cdef void mequ_c(SpiceDouble[3][3], SpiceDouble[3][3])
+    cdef void mequg_c(void *, SpiceInt, SpiceInt, void *)
+    cdef void mtxmg_c(void *, void *, SpiceInt, SpiceInt, SpiceInt, void *)
+    cdef void mtxvg_c(void *, void *, SpiceInt, SpiceInt, void *)
+    cdef void mxmg_c(void *, void *, SpiceInt, SpiceInt, SpiceInt, void *)
+    cdef void mxmtg_c(void *, void *, SpiceInt, SpiceInt, SpiceInt, void *)
+
+    # N
+    cdef SpiceInt ncpos_c(SpiceChar *, SpiceChar *, SpiceInt)
+    cdef SpiceInt ncposr_c(SpiceChar *, SpiceChar *, SpiceInt)
+    cdef void npelpt_c(SpiceDouble[3], SpiceEllipse *, SpiceDouble[3], SpiceDouble *)
+    cdef void nplnpt_c(SpiceDouble[3],
+                       SpiceDouble[3],
+                       SpiceDouble[3],
+                       SpiceDouble[3],
+                       SpiceDouble *)
+    cdef void nvc2pl_c(SpiceDouble[3], SpiceDouble, SpicePlane *)
+    cdef void nvp2pl_c(SpiceDouble[3], SpiceDouble[3], SpicePlane *)
+
+    # O
+    cdef SpiceInt ordc_c(SpiceChar *, SpiceCell *)
+    cdef SpiceInt ordd_c(SpiceDouble, SpiceCell *)
+    cdef void orderc_c(SpiceInt, void *, SpiceInt, SpiceInt *)
+    cdef void orderd_c(SpiceDouble *, SpiceInt, SpiceInt *)
+    cdef void orderi_c(SpiceInt *, SpiceInt, SpiceInt *)
+    cdef SpiceInt ordi_c(SpiceInt, SpiceCell *)
+    cdef void oscltx_c(SpiceDouble[6], SpiceDouble, SpiceDouble, SpiceDouble *)
+
+    # P
+    cdef void pckcls_c(SpiceInt)
+    cdef void pckcov_c(SpiceChar *, SpiceInt, SpiceCell *)
+    cdef void pckfrm_c(SpiceChar *, SpiceCell *)
+    cdef void pcklof_c(SpiceChar *, SpiceInt *)
+    cdef void pckopn_c(SpiceChar *, SpiceChar *, SpiceInt, SpiceInt *)
+    cdef void pckuof_c(SpiceInt)
+    cdef void pckw02_c(SpiceInt,
+                       SpiceInt,
+                       SpiceChar *,
+                       SpiceDouble,
+                       SpiceDouble,
+                       SpiceChar *,
+                       SpiceDouble,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceDouble *,
+                       SpiceDouble)
+    cdef void pcpool_c(SpiceChar *, SpiceInt, SpiceInt, void *)
+    cdef void pdpool_c(SpiceChar *, SpiceInt, SpiceDouble *)
+    cdef void pipool_c(SpiceChar *, SpiceInt, SpiceInt *)
+    cdef void pjelpl_c(SpiceEllipse *, SpicePlane *, SpiceEllipse *)
+    cdef void pl2nvc_c(SpicePlane *, SpiceDouble[3], SpiceDouble *)
+    cdef void pl2nvp_c(SpicePlane *, SpiceDouble[3], SpiceDouble[3])
+    cdef void pl2psv_c(SpicePlane *, SpiceDouble[3], SpiceDouble[3], SpiceDouble[3])
+    cdef SpiceDouble pltvol_c(SpiceInt, void *, SpiceInt, void *)
+    cdef void polyds_c(SpiceDouble *, SpiceInt, SpiceInt, SpiceDouble, SpiceDouble *)
+    cdef SpiceInt pos_c(SpiceChar *, SpiceChar *, SpiceInt)
+    cdef SpiceInt posr_c(SpiceChar *, SpiceChar *, SpiceInt)
+    cdef void prop2b_c(SpiceDouble, SpiceDouble[6], SpiceDouble, SpiceDouble[6])
+    cdef void prsdp_c(SpiceChar *, SpiceDouble *)
+    cdef void prsint_c(SpiceChar *, SpiceInt *)
+    cdef void psv2pl_c(SpiceDouble[3], SpiceDouble[3], SpiceDouble[3], SpicePlane *)
+    cdef void putcml_c(SpiceInt, SpiceChar *)
+    cdef void pxfrm2_c(SpiceChar *,
+                       SpiceChar *,
+                       SpiceDouble,
+                       SpiceDouble,
+                       SpiceDouble[3][3])
+
+    # Q
+    cdef void qderiv_c(SpiceInt,
+                       SpiceDouble *,
+                       SpiceDouble *,
+                       SpiceDouble,
+                       SpiceDouble *)
+
+    # R
+    cdef void rdtext_c(SpiceChar *, SpiceInt, SpiceChar *, SpiceInt *)
+    cdef void removc_c(SpiceChar *, SpiceCell *)
+    cdef void removd_c(SpiceDouble, SpiceCell *)
+    cdef void removi_c(SpiceInt, SpiceCell *)
+    cdef void reordc_c(SpiceInt *, SpiceInt, SpiceInt, void *)
+    cdef void reordd_c(SpiceInt *, SpiceInt, SpiceDouble *)
+    cdef void reordi_c(SpiceInt *, SpiceInt, SpiceInt *)
+    cdef void reordl_c(SpiceInt *, SpiceInt, SpiceInt *)
+    cdef void repmc_c(SpiceChar *, SpiceChar *, SpiceChar *, SpiceInt, SpiceChar *)
+    cdef void repmct_c(SpiceChar *,
+                       SpiceChar *,
+                       SpiceInt,
+                       SpiceChar,
+                       SpiceInt,
+                       SpiceChar *)
+    cdef void repmd_c(SpiceChar *,
+                      SpiceChar *,
+                      SpiceDouble,
+                      SpiceInt,
+                      SpiceInt,
+                      SpiceChar *)
+    cdef void repmf_c(SpiceChar *,
+                      SpiceChar *,
+                      SpiceDouble,
+                      SpiceInt,
+                      SpiceChar,
+                      SpiceInt,
+                      SpiceChar *)
+    cdef void repmi_c(SpiceChar *, SpiceChar *, SpiceInt, SpiceInt, SpiceChar *)
+    cdef void repmot_c(SpiceChar *,
+                       SpiceChar *,
+                       SpiceInt,
+                       SpiceChar,
+                       SpiceInt,
+                       SpiceChar *)
+    cdef SpiceBoolean return_c()
+    cdef void rquad_c(SpiceDouble,
+                      SpiceDouble,
+                      SpiceDouble,
+                      SpiceDouble[2],
+                      SpiceDouble[2])
+
+    # S
+    cdef void saelgv_c(SpiceDouble[3], SpiceDouble[3], SpiceDouble[3], SpiceDouble[3])
+    cdef void scard_c(SpiceInt, SpiceCell *)
+    cdef void sce2t_c(SpiceInt, SpiceDouble, SpiceDouble *)
+    cdef void scfmt_c(SpiceInt, SpiceDouble, SpiceInt, SpiceChar *)
+    cdef void scpart_c(SpiceInt, SpiceInt *, SpiceDouble *, SpiceDouble *)
+    cdef void sctiks_c(SpiceInt, SpiceChar *, SpiceDouble *)
+    cdef void sdiff_c(SpiceCell *, SpiceCell *, SpiceCell *)
+    cdef SpiceBoolean set_c(SpiceCell *, SpiceChar *, SpiceCell *)
+    cdef void setmsg_c(SpiceChar *)
+    cdef void shellc_c(SpiceInt, SpiceInt, void *)
+    cdef void shelld_c(SpiceInt, SpiceDouble *)
+    cdef void shelli_c(SpiceInt, SpiceInt *)
+    cdef void sigerr_c(SpiceChar *)
+    cdef SpiceInt size_c(SpiceCell *)
+    cdef void spk14a_c(SpiceInt, SpiceInt, SpiceDouble *, SpiceDouble *)
+    cdef void spk14b_c(SpiceInt,
+                       SpiceChar *,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceChar *,
+                       SpiceDouble,
+                       SpiceDouble,
+                       SpiceInt)
+    cdef void spk14e_c(SpiceInt)
+    cdef void spkapp_c(SpiceInt,
+                       SpiceDouble,
+                       SpiceChar *,
+                       SpiceDouble[6],
+                       SpiceChar *,
+                       SpiceDouble[6],
+                       SpiceDouble *)
+    cdef void spkcls_c(SpiceInt)
+    cdef void spkcov_c(SpiceChar *, SpiceInt, SpiceCell *)
+    cdef void spklef_c(SpiceChar *, SpiceInt *)
+    cdef void spkobj_c(SpiceChar *, SpiceCell *)
+    cdef void spkopa_c(SpiceChar *, SpiceInt *)
+    cdef void spkopn_c(SpiceChar *, SpiceChar *, SpiceInt, SpiceInt *)
+    cdef void spkpds_c(SpiceInt,
+                       SpiceInt,
+                       SpiceChar *,
+                       SpiceInt,
+                       SpiceDouble,
+                       SpiceDouble,
+                       SpiceDouble[5])
+    cdef void spksfs_c(SpiceInt,
+                       SpiceDouble,
+                       SpiceInt,
+                       SpiceInt *,
+                       SpiceDouble[5],
+                       SpiceChar *,
+                       SpiceInt *)
+    cdef void spksub_c(SpiceInt,
+                       SpiceDouble[5],
+                       SpiceChar *,
+                       SpiceDouble,
+                       SpiceDouble,
+                       SpiceInt)
+    cdef void spkuds_c(SpiceDouble[5],
+                       SpiceInt *,
+                       SpiceInt *,
+                       SpiceInt *,
+                       SpiceInt *,
+                       SpiceDouble *,
+                       SpiceDouble *,
+                       SpiceInt *,
+                       SpiceInt *)
+    cdef void spkuef_c(SpiceInt)
+    cdef void spkw02_c(SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceChar *,
+                       SpiceDouble,
+                       SpiceDouble,
+                       SpiceChar *,
+                       SpiceDouble,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceDouble *,
+                       SpiceDouble)
+    cdef void spkw03_c(SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceChar *,
+                       SpiceDouble,
+                       SpiceDouble,
+                       SpiceChar *,
+                       SpiceDouble,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceDouble *,
+                       SpiceDouble)
+    cdef void spkw05_c(SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceChar *,
+                       SpiceDouble,
+                       SpiceDouble,
+                       SpiceChar *,
+                       SpiceDouble,
+                       SpiceInt,
+                       SpiceDouble (*)[6],
+                       SpiceDouble *)
+    cdef void spkw08_c(SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceChar *,
+                       SpiceDouble,
+                       SpiceDouble,
+                       SpiceChar *,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceDouble (*)[6],
+                       SpiceDouble,
+                       SpiceDouble)
+    cdef void spkw09_c(SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceChar *,
+                       SpiceDouble,
+                       SpiceDouble,
+                       SpiceChar *,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceDouble (*)[6],
+                       SpiceDouble *)
+    cdef void spkw10_c(SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceChar *,
+                       SpiceDouble,
+                       SpiceDouble,
+                       SpiceChar *,
+                       SpiceDouble[8],
+                       SpiceInt,
+                       SpiceDouble *,
+                       SpiceDouble *)
+    cdef void spkw12_c(SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceChar *,
+                       SpiceDouble,
+                       SpiceDouble,
+                       SpiceChar *,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceDouble (*)[6],
+                       SpiceDouble,
+                       SpiceDouble)
+    cdef void spkw13_c(SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceChar *,
+                       SpiceDouble,
+                       SpiceDouble,
+                       SpiceChar *,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceDouble (*)[6],
+                       SpiceDouble *)
+    cdef void spkw15_c(SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceChar *,
+                       SpiceDouble,
+                       SpiceDouble,
+                       SpiceChar *,
+                       SpiceDouble,
+                       SpiceDouble[3],
+                       SpiceDouble[3],
+                       SpiceDouble,
+                       SpiceDouble,
+                       SpiceDouble,
+                       SpiceDouble[3],
+                       SpiceDouble,
+                       SpiceDouble,
+                       SpiceDouble)
+    cdef void spkw17_c(SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceChar *,
+                       SpiceDouble,
+                       SpiceDouble,
+                       SpiceChar *,
+                       SpiceDouble,
+                       SpiceDouble[9],
+                       SpiceDouble,
+                       SpiceDouble)
+    cdef void spkw18_c(SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceChar *,
+                       SpiceDouble,
+                       SpiceDouble,
+                       SpiceChar *,
+                       SpiceInt,
+                       SpiceInt,
+                       void *,
+                       SpiceDouble *)
+    cdef void spkw20_c(SpiceInt,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceChar *,
+                       SpiceDouble,
+                       SpiceDouble,
+                       SpiceChar *,
+                       SpiceDouble,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceDouble *,
+                       SpiceDouble,
+                       SpiceDouble,
+                       SpiceDouble,
+                       SpiceDouble)
+    cdef void srfc2s_c(SpiceInt, SpiceInt, SpiceInt, SpiceChar *, SpiceInt *)
+    cdef void srfcss_c(SpiceInt, SpiceChar *, SpiceInt, SpiceChar *, SpiceInt *)
+    cdef void srfs2c_c(SpiceChar *, SpiceChar *, SpiceInt *, SpiceInt *)
+    cdef void srfscc_c(SpiceChar *, SpiceInt, SpiceInt *, SpiceInt *)
+    cdef void srfxpt_c(SpiceChar *,
+                       SpiceChar *,
+                       SpiceDouble,
+                       SpiceChar *,
+                       SpiceChar *,
+                       SpiceChar *,
+                       SpiceDouble[3],
+                       SpiceDouble[3],
+                       SpiceDouble *,
+                       SpiceDouble *,
+                       SpiceDouble[3],
+                       SpiceInt *)
+    cdef void ssize_c(SpiceInt, SpiceCell *)
+    cdef void stpool_c(SpiceChar *,
+                       SpiceInt,
+                       SpiceChar *,
+                       SpiceInt,
+                       SpiceChar *,
+                       SpiceInt *,
+                       SpiceInt *)
+    cdef void subpt_c(SpiceChar *,
+                      SpiceChar *,
+                      SpiceDouble,
+                      SpiceChar *,
+                      SpiceChar *,
+                      SpiceDouble[3],
+                      SpiceDouble *)
+    cdef void subsol_c(SpiceChar *,
+                       SpiceChar *,
+                       SpiceDouble,
+                       SpiceChar *,
+                       SpiceChar *,
+                       SpiceDouble[3])
+    cdef SpiceDouble sumad_c(SpiceDouble *, SpiceInt)
+    cdef SpiceInt sumai_c(SpiceInt *, SpiceInt)
+    cdef void surfpv_c(SpiceDouble[6],
+                       SpiceDouble[6],
+                       SpiceDouble,
+                       SpiceDouble,
+                       SpiceDouble,
+                       SpiceDouble[6],
+                       SpiceInt *)
+    cdef void swpool_c(SpiceChar *, SpiceInt, SpiceInt, void *)
+    cdef void szpool_c(SpiceChar *, SpiceInt *, SpiceInt *)
+
+    # T
+    cdef void timdef_c(SpiceChar *, SpiceChar *, SpiceInt, SpiceChar *)
+    cdef void tipbod_c(SpiceChar *, SpiceInt, SpiceDouble, SpiceDouble[3][3])
+    cdef void tisbod_c(SpiceChar *, SpiceInt, SpiceDouble, SpiceDouble[6][6])
+    cdef void tkfram_c(SpiceInt, SpiceDouble[3][3], SpiceInt *, SpiceInt *)
+    cdef ConstSpiceChar * tkvrsn_c(SpiceChar *)
+    cdef void tparch_c(SpiceChar *)
+    cdef void tparse_c(SpiceChar *, SpiceInt, SpiceDouble *, SpiceChar *)
+    cdef void tpictr_c(SpiceChar *,
+                       SpiceInt,
+                       SpiceInt,
+                       SpiceChar *,
+                       SpiceInt *,
+                       SpiceChar *)
+    cdef void trcdep_c(SpiceInt *)
+    cdef void trcnam_c(SpiceInt, SpiceInt, SpiceChar *)
+    cdef void trcoff_c()
+    cdef void tsetyr_c(SpiceInt)
+    cdef void txtopn_(SpiceChar *, SpiceInt *, SpiceInt)
+
+    # U
+    cdef void ucase_c(SpiceChar *, SpiceInt, SpiceChar *)
+    cdef void uddc_c(UDFUNS, SpiceDouble, SpiceDouble, SpiceInt *)
+    cdef void uddf_c(UDFUNS, SpiceDouble, SpiceDouble, SpiceDouble *)
+    cdef void udf_c(SpiceDouble, SpiceDouble *)
+    cdef void union_c(SpiceCell *, SpiceCell *, SpiceCell *)
+    cdef void unormg_c(SpiceDouble *, SpiceInt, SpiceDouble *, SpiceDouble *)
+
+    # V
+    cdef void vaddg_c(SpiceDouble *, SpiceDouble *, SpiceInt, SpiceDouble *)
+    cdef void valid_c(SpiceInt, SpiceInt, SpiceCell *)
+    cdef SpiceDouble vdistg_c(SpiceDouble *, SpiceDouble *, SpiceInt)
+    cdef SpiceDouble vdotg_c(SpiceDouble *, SpiceDouble *, SpiceInt)
+    cdef void vequ_c(SpiceDouble[3], SpiceDouble[3])
+    cdef void vequg_c(SpiceDouble *, SpiceInt, SpiceDouble *)
+    cdef void vhatg_c(SpiceDouble *, SpiceInt, SpiceDouble *)
+    cdef void vlcomg_c(SpiceInt,
+                       SpiceDouble,
+                       SpiceDouble *,
+                       SpiceDouble,
+                       SpiceDouble *,
+                       SpiceDouble *)
+    cdef void vminug_c(SpiceDouble *, SpiceInt, SpiceDouble *)
+    cdef SpiceDouble vnormg_c(SpiceDouble *, SpiceInt)
+    cdef void vprjp_c(SpiceDouble[3], SpicePlane *, SpiceDouble[3])
+    cdef void vprjpi_c(SpiceDouble[3],
+                       SpicePlane *,
+                       SpicePlane *,
+                       SpiceDouble[3],
+                       SpiceInt *)
+    cdef void vprojg_c(SpiceDouble *, SpiceDouble *, SpiceInt, SpiceDouble *)
+    cdef SpiceDouble vrelg_c(SpiceDouble *, SpiceDouble *, SpiceInt)
+    cdef void vsclg_c(SpiceDouble, SpiceDouble *, SpiceInt, SpiceDouble *)
+    cdef SpiceDouble vsepg_c(SpiceDouble *, SpiceDouble *, SpiceInt)
+    cdef void vsubg_c(SpiceDouble *, SpiceDouble *, SpiceInt, SpiceDouble *)
+    cdef SpiceDouble vtmvg_c(SpiceDouble *, void *, SpiceDouble *, SpiceInt, SpiceInt)
+    cdef SpiceBoolean vzerog_c(SpiceDouble *, SpiceInt)
+
+    # W
+    cdef void writln_(SpiceChar *, SpiceInt *, SpiceInt)
+
+    # X
+    cdef void xpose6_c(SpiceDouble[6][6], SpiceDouble[6][6])
+    cdef void xposeg_c(void *, SpiceInt, SpiceInt, void *)
+
+    # Z
+    cdef void zzdynrot_(SpiceInt *,
+                        SpiceInt *,
+                        SpiceDouble *,
+                        SpiceDouble[3][3],
+                        SpiceInt *)
+    cdef void zzgetcml_c(SpiceInt, SpiceChar *, SpiceInt)
+    cdef void zzgfsavh_c(SpiceInt)
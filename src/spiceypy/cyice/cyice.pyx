@@ -10,6 +10,7 @@
 # cython: warn.multiple_declarators = True
 # cython: show_performance_hints = True
 # cython: always_allow_keywords = False
+# cython: freethreading_compatible = True
 
 """
 The MIT License (MIT)
@@ -37,15 +38,18 @@ SOFTWARE.
 
 from libc.stdlib cimport malloc, free
 from libc.string cimport strlen, memcpy
-from cython      cimport boundscheck, wraparound
-from cpython.float      cimport PyFloat_Check
+from cython      cimport boundscheck, wraparound, final
+from cpython.float      cimport PyFloat_Check, PyFloat_FromDouble
 from cpython.long       cimport PyLong_Check
 from cpython.unicode    cimport PyUnicode_DecodeUTF8, PyUnicode_Check, PyUnicode_AsASCIIString
 from cpython.bool       cimport PyBool_Check, PyBool_FromLong
-from cpython.tuple      cimport PyTuple_GET_SIZE
+from cpython.tuple      cimport PyTuple_GET_SIZE, PyTuple_New, PyTuple_SET_ITEM
+from cpython.ref        cimport Py_INCREF
 
 import functools
-from typing import Annotated, Literal
+import os
+from time import perf_counter
+from typing import Annotated, Literal, NamedTuple, Sequence
 
 import numpy as np
 cimport numpy as np
@@ -61,6 +65,21 @@ DEF EXPLAINLEN = 128
 DEF LONGLEN = 2048
 DEF TRACELEN = 256
 
+# type 2 DSK spatial index layout and segment item keywords, from dsk02.h
+DEF DSK02_SPADSZ = 10
+DEF DSK02_MAXCGR = 100000
+DEF DSK02_IXIFIX = DSK02_MAXCGR + 7
+DEF DSK02_KWVXPT = 10
+DEF DSK02_KWVXPL = 11
+DEF DSK02_KWVTPT = 12
+DEF DSK02_KWVTPL = 13
+DEF DSK02_KWCGPT = 14
+DEF DSK02_KWVTBD = 16
+DEF DSK02_KWVXOR = 17
+DEF DSK02_KWVXSZ = 18
+# retries of dskmi2 with doubled sizes before write_dsk_type2 gives up
+DEF DSK02_RETRIES = 8
+
 ctypedef fused double_arr_t:
     np.double_t[:]
     np.double_t[::1]
@@ -87,6 +106,7 @@ IntArray    = np.typing.NDArray[np.int32]
 DoubleArray = np.typing.NDArray[np.double]
 String_N    = Annotated[StringArray, Literal["N"]]
 Found_N     = Annotated[BoolArray, Literal["N"]]
+Bool_N      = Annotated[BoolArray, Literal["N"]]
 Int_N       = Annotated[IntArray, Literal["N"]]
 Double_N    = Annotated[DoubleArray, Literal["N"]]
 Vector      = Annotated[DoubleArray, Literal[3]]
@@ -97,6 +117,8 @@ Latitudinal_N    = Annotated[DoubleArray, Literal["N", 3]]
 Planetographic_N = Annotated[DoubleArray, Literal["N", 3]]
 Rectangular_N    = Annotated[DoubleArray, Literal["N", 3]]
 Spherical_N      = Annotated[DoubleArray, Literal["N", 3]]
+LonLat_N         = Annotated[DoubleArray, Literal["N", 2]]
+Plates_N         = Annotated[IntArray, Literal["N", 3]]
 State       = Annotated[DoubleArray, Literal[6]]
 State_N     = Annotated[DoubleArray, Literal["N", 6]]
 Matrix      = Annotated[DoubleArray, Literal[3, 3]]
@@ -105,20 +127,73 @@ Matrix_6    = Annotated[DoubleArray, Literal[6, 6]]
 Matrix_N    = Annotated[DoubleArray, Literal["N", 3, 3]]
 Matrix_N_3  = Annotated[DoubleArray, Literal["N", 3, 3]]
 Matrix_N_6  = Annotated[DoubleArray, Literal["N", 6, 6]]
+# a window as the endpoints of its intervals, left and right endpoint of each in turn
+Window      = Annotated[DoubleArray, Literal["N"]]
+
+# DLA and DSK descriptors as numpy records, with the layout of the CSPICE structs
+DLADSC_DTYPE = np.dtype(
+    [(name, np.int32) for name in ("bwdptr", "fwdptr", "ibase", "isize", "dbase", "dsize", "cbase", "csize")]
+)
+DSKDSC_DTYPE = np.dtype(
+    [(name, np.int32) for name in ("surfce", "center", "dclass", "dtype", "frmcde", "corsys")]
+    + [("corpar", np.double, (10,))]
+    + [(name, np.double) for name in ("co1min", "co1max", "co2min", "co2max", "co3min", "co3max", "start", "stop")],
+    align=True,
+)
+DSKB02_DTYPE = np.dtype(
+    [("nv", np.int32), ("np", np.int32), ("nvxtot", np.int32), ("vtxbds", np.double, (3, 2)),
+     ("voxsiz", np.double), ("voxori", np.double, (3,)), ("vgrext", np.int32, (3,)),
+     ("cgscal", np.int32), ("vtxnpl", np.int32), ("voxnpt", np.int32), ("voxnpl", np.int32)],
+    align=True,
+)
+Record      = np.void
+# one segment written by write_dsk_type2, its index sizes and build times
+DSK02Segment = NamedTuple(
+    "DSK02Segment",
+    [("first_plate", int), ("nv", int), ("np", int), ("mncor3", float), ("mxcor3", float),
+     ("worksz", int), ("voxpsz", int), ("voxlsz", int), ("spxisz", int),
+     ("index_time", float), ("bounds_time", float), ("write_time", float)],
+)
+DLADescr_N  = Annotated[np.typing.NDArray[np.void], Literal["N"]]
+DSKDescr_N  = Annotated[np.typing.NDArray[np.void], Literal["N"]]
 
 from . cimport cyice
 from spiceypy import config
 from spiceypy.utils.exceptions import dynamically_instantiate_spiceyerror, NotFoundError, SpiceyError
+from spiceypy.utils.locking import spice_lock
 
 
 # support functions
 
 
-cpdef void check_for_spice_error():
+@final
+cdef class _CspiceLock:
+    # with statement form of spiceypy.utils.locking.spice_lock, the cyice
+    # functions hold it from their first CSPICE call until the error status
+    # of the call has been checked, like the ctypes wrappers do
+    cdef object acquire
+    cdef object release
+
+    def __cinit__(self, object lock):
+        self.acquire = lock.acquire
+        self.release = lock.release
+
+    def __enter__(self):
+        self.acquire()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+
+cdef _CspiceLock _cspice = _CspiceLock(spice_lock)
+
+
+cpdef void check_for_spice_error(object index = None, object epoch = None):
     """
     Internal decorator function to check spice error system for failed calls
 
-    :param f: function
+    :param index: index of the failing element of a vectorized call, if known
+    :param epoch: epoch of the failing element of a vectorized call, if known
     :raise SpiceyError:
     """
     cdef char[SHORTLEN]   shortmsg
@@ -130,16 +205,17 @@ cpdef void check_for_spice_error():
     cdef object py_longmsg
     cdef object py_traceback
     if failed_c():
-        with nogil:
-            getmsg_c("SHORT", SHORTLEN, shortmsg)
-            getmsg_c("EXPLAIN", EXPLAINLEN, explain)
-            getmsg_c("LONG", LONGLEN, longmsg)
-            qcktrc_c(TRACELEN, traceback)
-            reset_c()
-            shortmsg[SHORTLEN - 1] = b'\0'
-            explain[EXPLAINLEN - 1] = b'\0'
-            longmsg[LONGLEN - 1] = b'\0'
-            traceback[TRACELEN - 1] = b'\0'
+        with _cspice:
+            with nogil:
+                getmsg_c("SHORT", SHORTLEN, shortmsg)
+                getmsg_c("EXPLAIN", EXPLAINLEN, explain)
+                getmsg_c("LONG", LONGLEN, longmsg)
+                qcktrc_c(TRACELEN, traceback)
+                reset_c()
+                shortmsg[SHORTLEN - 1] = b'\0'
+                explain[EXPLAINLEN - 1] = b'\0'
+                longmsg[LONGLEN - 1] = b'\0'
+                traceback[TRACELEN - 1] = b'\0'
         py_shortmsg  = PyUnicode_DecodeUTF8(shortmsg, strlen(shortmsg), 'replace')
         py_explain   = PyUnicode_DecodeUTF8(explain, strlen(explain), 'replace')
         py_longmsg   = PyUnicode_DecodeUTF8(longmsg, strlen(longmsg), 'replace')
@@ -148,7 +224,9 @@ cpdef void check_for_spice_error():
           py_shortmsg,
           py_explain,
           py_longmsg,
-          py_traceback
+          py_traceback,
+          index=index,
+          epoch=epoch
         )
 
 
@@ -171,6 +249,138 @@ cdef inline int _check_same_len(Py_ssize_t a, Py_ssize_t b, str an, str bn) exce
     return 0
 
 
+cdef inline tuple _check_out(object out, Py_ssize_t nout):
+    # Normalize the out argument of the _v wrappers to a tuple holding one
+    # preallocated array per returned array, or None when nothing was given.
+    if out is None:
+        return None
+    if not isinstance(out, tuple):
+        out = (out,)
+    if PyTuple_GET_SIZE(out) != nout:
+        raise ValueError(f"out must hold {nout} arrays, got {PyTuple_GET_SIZE(out)}")
+    return out
+
+
+cdef np.ndarray _output(tuple out, Py_ssize_t k, tuple shape, object dtype):
+    # Return the k-th preallocated output array after checking that it can stand in
+    # for the array the _v wrapper would otherwise create, the nogil loops write
+    # straight into it with boundscheck disabled.
+    cdef object arr
+    if out is None:
+        return np.empty(shape, dtype=dtype, order='C')
+    arr = out[k]
+    if not isinstance(arr, np.ndarray):
+        raise TypeError(f"out[{k}] must be a numpy array, got {type(arr).__name__}")
+    if arr.shape != shape:
+        raise ValueError(f"out[{k}] has shape {arr.shape} but {shape} is required")
+    if arr.dtype != dtype:
+        raise TypeError(f"out[{k}] has dtype {arr.dtype} but {np.dtype(dtype)} is required")
+    if not arr.flags.c_contiguous:
+        raise ValueError(f"out[{k}] must be C contiguous")
+    if not arr.flags.writeable:
+        raise ValueError(f"out[{k}] must be writeable")
+    return arr
+
+
+cdef np.ndarray _scalar_output(object out, bint astuple, Py_ssize_t k, Py_ssize_t nout, Py_ssize_t rows, Py_ssize_t cols):
+    # Array a _s wrapper writes its k-th of nout returned arrays into: the
+    # caller's array when out is given (a single array may be given without
+    # a tuple), None when the result is returned as tuples of floats and a
+    # new array otherwise. cols is 0 for vectors. Only C level checks are
+    # made here as these wrappers are called once per epoch.
+    cdef np.npy_intp[2] dims
+    cdef object arr, required
+    cdef np.ndarray res
+    if out is None:
+        if astuple:
+            return None
+        dims[0] = rows
+        dims[1] = cols
+        return np.PyArray_EMPTY(1 if cols == 0 else 2, dims, np.NPY_DOUBLE, 0)
+    if astuple:
+        raise ValueError("out and astuple cannot be used together")
+    arr = out
+    if nout > 1 or isinstance(out, tuple):
+        if not isinstance(out, tuple) or PyTuple_GET_SIZE(out) != nout:
+            raise ValueError(f"out must hold {nout} arrays")
+        arr = out[k]
+    if not isinstance(arr, np.ndarray):
+        raise TypeError(f"out must be a numpy array, got {type(arr).__name__}")
+    res = arr
+    if np.PyArray_TYPE(res) != np.NPY_DOUBLE or not np.PyArray_ISCARRAY(res):
+        raise ValueError("out must be a writeable C contiguous float64 array")
+    if (res.ndim != (1 if cols == 0 else 2) or res.shape[0] != rows
+            or (cols != 0 and res.shape[1] != cols)):
+        required = (rows,)
+        if cols:
+            required = (rows, cols)
+        raise ValueError(f"out has shape {arr.shape} but {required} is required")
+    return res
+
+
+cdef inline double* _output_data(np.ndarray arr, double* values) noexcept:
+    # where a _s wrapper writes an output, values being a C array used
+    # when the result is returned as tuples
+    if arr is None:
+        return values
+    return <double*> np.PyArray_DATA(arr)
+
+
+cdef tuple _float_tuple(const double* values, Py_ssize_t k):
+    cdef tuple res = PyTuple_New(k)
+    cdef object item
+    cdef Py_ssize_t i
+    for i in range(k):
+        item = PyFloat_FromDouble(values[i])
+        # PyTuple_SET_ITEM steals the reference
+        Py_INCREF(item)
+        PyTuple_SET_ITEM(res, i, item)
+    return res
+
+
+cdef object _scalar_result(np.ndarray arr, const double* values, Py_ssize_t rows, Py_ssize_t cols):
+    # output of a _s wrapper: the array it was written to, or a tuple of
+    # floats, a tuple of row tuples for matrices
+    cdef tuple res
+    cdef object row
+    cdef Py_ssize_t i
+    if arr is not None:
+        return arr
+    if cols == 0:
+        return _float_tuple(values, rows)
+    res = PyTuple_New(rows)
+    for i in range(rows):
+        row = _float_tuple(&values[i * cols], cols)
+        Py_INCREF(row)
+        PyTuple_SET_ITEM(res, i, row)
+    return res
+
+
+cdef np.ndarray _body_codes(object bodies):
+    # Flat int32 array of the NAIF ID codes of bodies, given as names or codes.
+    cdef object arr = np.asarray(bodies)
+    cdef np.ndarray codes
+    cdef object name
+    cdef Py_ssize_t i
+    cdef SpiceInt code = 0
+    cdef SpiceBoolean found = 0
+    if arr.dtype.kind in "iu":
+        return np.ascontiguousarray(arr, dtype=np.int32).reshape(-1)
+    if arr.dtype.kind not in "US":
+        raise TypeError(f"expected body names or NAIF ID codes, got {arr.dtype}")
+    codes = np.empty(arr.size, dtype=np.int32)
+    with _cspice:
+        for i, name in enumerate(arr.reshape(-1).tolist()):
+            if isinstance(name, bytes):
+                name = name.decode("ascii")
+            bods2c_c(name, &code, &found)
+            check_for_spice_error()
+            if not found:
+                raise NotFoundError(f"Spice returns not found for body name: {name}", found=False)
+            codes[i] = code
+    return codes
+
+
 @boundscheck(False)
 @wraparound(False)
 cdef inline char[:, ::1] make_char_array(np.ndarray input_array, int max_len):
@@ -189,6 +399,381 @@ cdef inline char[:, ::1] make_char_array(np.ndarray input_array, int max_len):
     return output
 
 
+cdef inline Py_ssize_t _shape_size(tuple shape):
+    # number of elements of a broadcast shape, 1 for the empty shape of scalars
+    cdef Py_ssize_t dim, size = 1
+    for dim in shape:
+        size *= dim
+    return size
+
+
+cdef inline tuple _outer_shape(object value, Py_ssize_t core = 1):
+    # shape of an array of vectors (or matrices, core = 2) without the
+    # dimensions of each vector
+    cdef tuple shape = np.shape(value)
+    return shape[:max(len(shape) - core, 0)]
+
+
+cdef inline bint _batched(object value, Py_ssize_t core):
+    # whether an argument holds several values of core dimensions, used by
+    # the dispatching wrappers to choose between the _s and _v versions
+    if PyFloat_Check(value) or PyLong_Check(value) or PyUnicode_Check(value):
+        return False
+    return np.ndim(value) > core
+
+
+cdef np.ndarray _core_array(object value, tuple shape, str name):
+    # single vector or matrix argument of a _s wrapper as a C contiguous array,
+    # the wrappers pass a pointer to its first element to CSPICE
+    cdef object arr = np.ascontiguousarray(value, dtype=np.double)
+    if arr.shape != shape:
+        raise ValueError(f"{name} must have shape {shape}, got {arr.shape}")
+    return arr
+
+
+cdef np.ndarray _dladsc_array(object dladsc):
+    # a DLA descriptor given as a spiceypy SpiceDLADescr, a DLADSC_DTYPE record
+    # or its 8 integers, as a C contiguous array of the integers
+    cdef object arr
+    if hasattr(dladsc, "_fields_"):
+        arr = np.frombuffer(dladsc, dtype=np.int32)
+    else:
+        arr = np.asarray(dladsc)
+        if arr.dtype == DLADSC_DTYPE:
+            arr = arr.reshape(1).view(np.int32)
+    arr = np.ascontiguousarray(arr, dtype=np.int32)
+    if arr.shape != (8,):
+        raise ValueError(f"dladsc must be a single DLA descriptor, got shape {arr.shape}")
+    return arr
+
+
+cdef np.ndarray _packed(object value, tuple shape, Py_ssize_t k, str name, object dtype=np.double):
+    # (n, k) C contiguous array of the rows of value broadcast to shape, for
+    # CSPICE functions taking arrays of vectors. Contiguous input of that
+    # shape and dtype is used as is, without a copy.
+    cdef object arr = np.asarray(value, dtype=dtype)
+    if arr.ndim < 1 or arr.shape[arr.ndim - 1] != k:
+        raise ValueError(f"{name} must be an array of {k}-vectors, got shape {arr.shape}")
+    if arr.shape[:arr.ndim - 1] != shape:
+        arr = np.broadcast_to(arr, shape + (k,))
+    return np.ascontiguousarray(arr).reshape(-1, k)
+
+
+cdef object _struct_values(object value):
+    # planes and ellipses given as spiceypy Plane or Ellipse structures, or
+    # sequences of them, as arrays of the doubles of the CSPICE structs
+    if hasattr(value, "_fields_"):
+        return np.frombuffer(value, dtype=np.double)
+    if isinstance(value, (list, tuple)) and value and hasattr(value[0], "_fields_"):
+        return np.array([np.frombuffer(v, dtype=np.double) for v in value])
+    return value
+
+
+cdef inline Py_ssize_t _window_size(object size, Py_ssize_t needed) except -1:
+    # number of endpoints the windows returned by a wrapper can hold: the size
+    # asked for, 2000 like the spiceypy default result cells, and never less
+    # than needed, the endpoints the wrapper knows the windows may have to hold
+    if size is None:
+        return max(2000, needed)
+    if size < 0:
+        raise ValueError(f"size must not be negative, got {size}")
+    return max(size, needed)
+
+
+cdef inline char _char(str value, str name) except? 0:
+    # single character argument passed by value, the side of wnextd
+    if len(value) != 1 or not value.isascii():
+        raise ValueError(f"{name} must be a single ASCII character, got {value!r}")
+    return ord(value)
+
+
+cdef np.ndarray _strings(np.ndarray buffer, tuple shape):
+    # strings written by a _v wrapper, one null terminated string per row of
+    # buffer, as an array of shape
+    cdef Py_ssize_t length = buffer.shape[1]
+    cdef object res = buffer.view(np.dtype(("S", length))).reshape(shape)
+    return np.char.rstrip(res).astype(np.dtype(("U", length)))
+
+
+cdef tuple _broadcast_values(object arr, tuple shape, Py_ssize_t trailing, Py_ssize_t core):
+    # Flatten arr against the broadcast shape, keeping its last core dimensions,
+    # and return (values, step). Single values are kept as is with a step of 0
+    # so scalar arguments are never repeated in memory; trailing appends unit
+    # axes to arr's batch shape for arguments that form the outer loop.
+    cdef tuple batch = arr.shape[:arr.ndim - core]
+    cdef tuple core_shape = arr.shape[arr.ndim - core:]
+    if _shape_size(batch) == 1:
+        return arr.reshape((1,) + core_shape), 0
+    if trailing:
+        arr = arr.reshape(batch + (1,) * trailing + core_shape)
+    arr = np.broadcast_to(arr, shape + core_shape)
+    return np.ascontiguousarray(arr).reshape((-1,) + core_shape), 1
+
+
+cdef class _BroadcastArg:
+    """
+    Argument of a vectorized function broadcast against the other arguments.
+
+    Element i of the flattened broadcast shape reads entry i * step of the
+    stored values, step being 0 when the argument holds a single value.
+    """
+    cdef Py_ssize_t step
+
+    cdef object item(self, Py_ssize_t i):
+        # python value of element i, used when reporting errors
+        return None
+
+
+@final
+cdef class _DblArg(_BroadcastArg):
+    cdef const np.double_t[::1] values
+
+    def __cinit__(self, object value, tuple shape, Py_ssize_t trailing = 0):
+        self.values, self.step = _broadcast_values(np.asarray(value, dtype=np.double), shape, trailing, 0)
+
+    cdef inline double at(self, Py_ssize_t i) noexcept nogil:
+        return self.values[i * self.step]
+
+    cdef object item(self, Py_ssize_t i):
+        return self.values[i * self.step]
+
+
+@final
+cdef class _IntArg(_BroadcastArg):
+    cdef const np.int32_t[::1] values
+
+    def __cinit__(self, object value, tuple shape, Py_ssize_t trailing = 0):
+        self.values, self.step = _broadcast_values(np.asarray(value, dtype=np.int32), shape, trailing, 0)
+
+    cdef inline SpiceInt at(self, Py_ssize_t i) noexcept nogil:
+        return self.values[i * self.step]
+
+    cdef object item(self, Py_ssize_t i):
+        return self.values[i * self.step]
+
+
+@final
+cdef class _VecArg(_BroadcastArg):
+    cdef const np.double_t[:, ::1] values
+
+    def __cinit__(self, object value, tuple shape, Py_ssize_t k, Py_ssize_t trailing = 0):
+        cdef object arr = np.asarray(value, dtype=np.double)
+        if arr.ndim < 1 or arr.shape[arr.ndim - 1] != k:
+            raise ValueError(f"expected an array of {k}-vectors, got shape {arr.shape}")
+        self.values, self.step = _broadcast_values(arr, shape, trailing, 1)
+
+    cdef inline double* at(self, Py_ssize_t i) noexcept nogil:
+        return <double*> &self.values[i * self.step, 0]
+
+
+@final
+cdef class _MatArg(_BroadcastArg):
+    cdef const np.double_t[:, :, ::1] values
+
+    def __cinit__(self, object value, tuple shape, Py_ssize_t k, Py_ssize_t trailing = 0):
+        cdef object arr = np.asarray(value, dtype=np.double)
+        if arr.ndim < 2 or arr.shape[arr.ndim - 2:] != (k, k):
+            raise ValueError(f"expected an array of {k}x{k} matrices, got shape {arr.shape}")
+        self.values, self.step = _broadcast_values(arr, shape, trailing, 2)
+
+    cdef inline double* at(self, Py_ssize_t i) noexcept nogil:
+        return <double*> &self.values[i * self.step, 0, 0]
+
+
+@final
+cdef class _StrArg(_BroadcastArg):
+    cdef const np.uint8_t[:, ::1] table
+    cdef const np.intp_t[::1] index
+
+    def __cinit__(self, object value, tuple shape, Py_ssize_t trailing = 0):
+        cdef object arr, uniq, inverse
+        cdef Py_ssize_t k, width
+        if PyUnicode_Check(value):
+            # common case of a single name, no numpy round trip needed
+            self.table = np.frombuffer(PyUnicode_AsASCIIString(value) + b"\0", dtype=np.uint8).reshape(1, -1)
+            self.index = np.zeros(1, dtype=np.intp)
+            self.step = 0
+            return
+        arr = np.asarray(value)
+        if arr.dtype.kind not in "US":
+            raise TypeError(f"expected a string or an array of strings, got {arr.dtype}")
+        # store each distinct string once and broadcast indices into the table
+        uniq, inverse = np.unique(arr, return_inverse=True)
+        if arr.dtype.kind == "U":
+            uniq = np.char.encode(uniq, "ascii")
+        k, width = uniq.shape[0], uniq.dtype.itemsize
+        table = np.zeros((k, width + 1), dtype=np.uint8)
+        table[:, :width] = uniq.view(np.uint8).reshape(k, width)
+        self.table = table
+        self.index, self.step = _broadcast_values(inverse.reshape(arr.shape).astype(np.intp), shape, trailing, 0)
+
+    cdef inline const char* at(self, Py_ssize_t i) noexcept nogil:
+        return <const char*> &self.table[self.index[i * self.step], 0]
+
+    cdef object item(self, Py_ssize_t i):
+        return bytes(self.table[self.index[i * self.step]]).rstrip(b"\0").decode("ascii")
+
+
+@final
+cdef class _Window:
+    """
+    Double precision window passed to CSPICE as a SpiceCell.
+
+    The cell refers to buffer, the control area of the cell followed by
+    room for capacity endpoints. CSPICE copies the size and cardinality
+    set here into the control area the first time it sees the cell, as
+    init is false, and copies them back into the cell when it changes
+    the window.
+    """
+    cdef SpiceCell cell
+    cdef np.ndarray buffer
+
+    def __cinit__(self, object values, Py_ssize_t capacity, str name):
+        cdef object arr = None
+        cdef Py_ssize_t card = 0
+        if values is not None:
+            if hasattr(values, "_fields_"):
+                # a spiceypy SpiceCell, read through its getters
+                if not values.is_double():
+                    raise TypeError(f"{name} must be a double precision cell")
+                values = values[:]
+            arr = np.asarray(values, dtype=np.double)
+            if arr.ndim != 1 or arr.shape[0] % 2:
+                raise ValueError(f"{name} must hold pairs of interval endpoints, got shape {arr.shape}")
+            card = arr.shape[0]
+        capacity = max(capacity, card)
+        self.buffer = np.zeros(SPICE_CELL_CTRLSZ + capacity, dtype=np.double)
+        if card:
+            self.buffer[SPICE_CELL_CTRLSZ:SPICE_CELL_CTRLSZ + card] = arr
+        self.cell.dtype = SPICE_DP
+        self.cell.length = 0
+        self.cell.size = capacity
+        self.cell.card = card
+        self.cell.isSet = SPICETRUE
+        self.cell.adjust = SPICEFALSE
+        self.cell.init = SPICEFALSE
+        self.cell.base = np.PyArray_DATA(self.buffer)
+        self.cell.data = <double*> self.cell.base + SPICE_CELL_CTRLSZ
+
+    cdef np.ndarray values(self):
+        # endpoints of the window, a copy so that the buffer can be released
+        return self.buffer[SPICE_CELL_CTRLSZ:SPICE_CELL_CTRLSZ + self.cell.card].copy()
+
+
+@final
+cdef class _ErrorCapture:
+    """
+    Per element error bookkeeping for the vectorized functions.
+
+    With errors="raise" (the default) the loop stops at the first element
+    for which failed_c is true and the raised SpiceyError carries the index
+    and epoch of that element.
+    With errors="mask" each element is checked with failed_c, the short
+    message is recorded and the error state is reset so that the
+    remaining elements are still computed. The failed rows are then
+    filled (NaN for floats, 0/False for integers and booleans, empty
+    strings for strings) and the failed mask and short messages are
+    appended to the returned values.
+    """
+    cdef readonly bint mask
+    cdef readonly Py_ssize_t index
+    cdef tuple shape
+    cdef np.ndarray p_failed
+    cdef np.ndarray p_msgs
+    cdef np.uint8_t[::1] c_failed
+    cdef np.uint8_t[:, ::1] c_msgs
+
+    def __cinit__(self, str errors, tuple shape):
+        cdef Py_ssize_t size = 1, dim
+        if errors == "raise":
+            self.mask = False
+            size = 0
+        elif errors == "mask":
+            self.mask = True
+            for dim in shape:
+                size *= dim
+        else:
+            raise ValueError(f"errors must be 'raise' or 'mask', got {errors!r}")
+        self.index = -1
+        self.shape = shape
+        self.p_failed = np.zeros(size, dtype=np.uint8)
+        self.c_failed = self.p_failed
+        self.p_msgs = np.zeros((size, SHORTLEN), dtype=np.uint8)
+        self.c_msgs = self.p_msgs
+
+    @boundscheck(False)
+    @wraparound(False)
+    cdef inline bint capture(self, Py_ssize_t i) noexcept nogil:
+        # i is the flat (C order) index of the element just computed,
+        # returns True when the loop should stop
+        if not failed_c():
+            return False
+        if self.mask:
+            self.c_failed[i] = 1
+            getmsg_c("SHORT", SHORTLEN, <char *> &self.c_msgs[i, 0])
+            reset_c()
+            return False
+        self.index = i
+        return True
+
+    @boundscheck(False)
+    @wraparound(False)
+    cdef bint capture_many(self, Py_ssize_t start, Py_ssize_t count, Py_ssize_t stride) noexcept nogil:
+        # like capture, for an error raised by work shared between count
+        # elements starting at flat index start and spaced by stride
+        cdef Py_ssize_t k, i
+        if not failed_c():
+            return False
+        if self.mask:
+            for k in range(count):
+                i = start + k * stride
+                self.c_failed[i] = 1
+                getmsg_c("SHORT", SHORTLEN, <char *> &self.c_msgs[i, 0])
+            reset_c()
+            return False
+        self.index = start
+        return True
+
+    cdef int check(self, object epochs, Py_ssize_t axis = 0) except -1:
+        # raise any pending SPICE error, attaching the element the loop stopped on
+        cdef object index, epoch = None
+        if self.index < 0:
+            check_for_spice_error()
+            return 0
+        # epochs run along the given axis of the loop, the first by default
+        index = tuple(map(int, np.unravel_index(self.index, self.shape)))
+        if isinstance(epochs, _BroadcastArg):
+            epoch = (<_BroadcastArg> epochs).item(self.index)
+        elif epochs is not None:
+            epoch = epochs[index[axis]]
+            if isinstance(epoch, bytes):
+                epoch = epoch.decode("ascii")
+        if len(index) == 1:
+            index = index[0]
+        check_for_spice_error(index, epoch)
+        return 0
+
+    cdef object finish(self, object res):
+        cdef np.ndarray failed, messages, out
+        cdef tuple outputs
+        if not self.mask:
+            return res
+        failed = self.p_failed.view(np.bool_).reshape(self.shape)
+        outputs = res if isinstance(res, tuple) else (res,)
+        if failed.any():
+            for out in outputs:
+                if out.dtype.kind in "fc":
+                    out[failed] = np.nan
+                elif out.dtype.kind in "biu":
+                    out[failed] = 0
+                elif out.dtype.kind in "SU":
+                    out[failed] = ""
+        # getmsg_c leaves blank padding after the terminating null
+        messages = self.p_msgs.view(np.dtype(("S", SHORTLEN))).reshape(self.shape)
+        messages = np.char.rstrip(messages, b" \x00").astype(np.dtype(("U", SHORTLEN)))
+        return outputs + (failed, messages)
+
+
 @wraparound(False)
 @boundscheck(False)
 def cyice_found_exception_thrower(f):
@@ -204,12 +789,14 @@ def cyice_found_exception_thrower(f):
         cdef np.uint8_t[::1] found_arr
         cdef Py_ssize_t n, last
         cdef bint all_true = True
+        cdef bint masked = kwargs.get("errors") == "mask"
         # first check if the config to see if shortcut can be run. TODO move config to cyice?
         if not config.catch_false_founds:
             return py_res
         else:
             n = PyTuple_GET_SIZE(py_res)
-            last = n - 1
+            # with errors="mask" the failed mask and messages follow the found flag
+            last = n - 3 if masked else n - 1
             # get the last value which is the
             found = py_res[last]
             # if we have a scalar boolean
@@ -224,8 +811,12 @@ def cyice_found_exception_thrower(f):
                         found=found,
                     )
             else:
-                # else assume we have a numpy array, so cast it to np.uint8_t
-                found_arr = found
+                # else assume we have a numpy array, so flatten and cast it to np.uint8_t
+                if masked:
+                    # rows that failed are reported by the failed mask instead
+                    found_arr = np.logical_or(found, py_res[last + 1]).ravel().view(np.uint8)
+                else:
+                    found_arr = np.ravel(found).view(np.uint8)
                 # compute if all true using cython optimized version
                 all_true = _all(found_arr)
                 # and perform the bool test
@@ -237,7 +828,9 @@ def cyice_found_exception_thrower(f):
                     )
             # at this point we know all found flags were true, so get the length of the tuple
             # slice off the "found" flag
-            if last == 1:
+            if masked:
+                return py_res[0:last] + py_res[last + 1:n]
+            elif last == 1:
                 # return single value unwrapped
                 return py_res[0]
             else:
@@ -287,39 +880,45 @@ cpdef tuple[np.ndarray, float] azlcpo_s(
     cdef double c_lt = 0.0
     cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_state = np.empty(6, dtype=np.double, order='C')
     cdef np.double_t[::1] c_state = p_state
-    azlcpo_c(
-        method,
-        target,
-        et,
-        abcorr,
-        <SpiceBoolean> azccw, 
-        <SpiceBoolean> elplsz, 
-        &obspos[0],
-        obsctr,
-        obsref,
-        &c_state[0],
-        &c_lt
-    )
-    check_for_spice_error()
+    with _cspice:
+        azlcpo_c(
+            method,
+            target,
+            et,
+            abcorr,
+            <SpiceBoolean> azccw, 
+            <SpiceBoolean> elplsz, 
+            &obspos[0],
+            obsctr,
+            obsref,
+            &c_state[0],
+            &c_lt
+        )
+        check_for_spice_error()
     return p_state, c_lt
 
 
 @boundscheck(False)
 @wraparound(False)
-cpdef tuple[np.ndarray, np.ndarray] azlcpo_v(
-    const char* method,
-    const char* target,
-    double[::1] ets,
-    const char* abcorr,
+cpdef tuple azlcpo_v(
+    method,
+    target,
+    ets,
+    abcorr,
     SpiceBoolean azccw,
     SpiceBoolean elplsz,
-    double[:,::1] obspos,
-    const char* obsctr,
-    const char* obsref
+    obspos,
+    obsctr,
+    obsref,
+    str errors="raise",
+    object out=None
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.azlcpo`
 
+    All arguments except the output and error options broadcast against each other
+    following NumPy rules, string arguments may be arrays of names.
+
     Return the azimuth/elevation coordinates of a specified target
     relative to an "observer," where the observer has constant
     position in a specified reference frame. The observer's position
@@ -337,41 +936,55 @@ cpdef tuple[np.ndarray, np.ndarray] azlcpo_v(
     :param obspos: Observer positions relative to center of motion.
     :param obsctr: Center of motion of observer.
     :param obsref: Body fixed body centered frame of observer's center.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return: States of target with respect to observer, in azimuth/elevation coordinates. and One way light times between target and observer.
     """
-    cdef const np.double_t[::1] c_ets = np.ascontiguousarray(ets, dtype=np.double)
-    cdef const np.double_t[:,::1] c_obspos = np.ascontiguousarray(obspos, dtype=np.double)
-    cdef Py_ssize_t i, j, n, m = 0
-    n = c_ets.shape[0]
-    m = c_obspos.shape[0]
-    cdef double c_et_r = 0.0
-    cdef SpiceBoolean c_azccw  = <SpiceBoolean> azccw
-    cdef SpiceBoolean c_elplsz = <SpiceBoolean> elplsz
-    # allocate outputs
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_lts = np.empty((n,m), dtype=np.double, order='C')
-    cdef np.double_t[:,::1] c_lts = p_lts
-    cdef np.ndarray[np.double_t, ndim=3, mode='c'] p_states = np.empty((n,m,6), dtype=np.double, order='C')
-    cdef np.double_t[:,:,::1] c_states = p_states
-    # make the call
-    with nogil:
-        for i in range(n):
-            c_et_r = c_ets[i]
-            for j in range(m):
+    # broadcast the arguments against each other
+    cdef tuple epoch_shape = np.broadcast_shapes(
+        np.shape(method), np.shape(target), np.shape(ets), np.shape(abcorr), np.shape(obsctr), np.shape(obsref)
+    )
+    # the observer positions form the innermost axes of the result
+    cdef tuple point_shape = _outer_shape(obspos)
+    cdef tuple shape = epoch_shape + point_shape
+    cdef Py_ssize_t t = len(point_shape)
+    cdef Py_ssize_t i, n = _shape_size(shape)
+    # initialize c variables
+    cdef _StrArg c_method = _StrArg(method, shape, t)
+    cdef _StrArg c_target = _StrArg(target, shape, t)
+    cdef _DblArg c_ets    = _DblArg(ets, shape, t)
+    cdef _StrArg c_abcorr = _StrArg(abcorr, shape, t)
+    cdef _VecArg c_obspos = _VecArg(obspos, shape, 3)
+    cdef _StrArg c_obsctr = _StrArg(obsctr, shape, t)
+    cdef _StrArg c_obsref = _StrArg(obsref, shape, t)
+    cdef tuple c_out = _check_out(out, 2)
+    # initialize output arrays
+    cdef np.ndarray p_states = _output(c_out, 0, shape + (6,), np.double)
+    cdef np.double_t[:, ::1] c_states = p_states.reshape(n, 6)
+    cdef np.ndarray p_lts = _output(c_out, 1, shape, np.double)
+    cdef np.double_t[::1] c_lts = p_lts.reshape(n)
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, shape)
+    # main loop
+    with _cspice:
+        with nogil:
+            for i in range(n):
                 azlcpo_c(
-                    method,
-                    target,
-                    c_et_r,
-                    abcorr,
-                    c_azccw, 
-                    c_elplsz, 
-                    &c_obspos[j,0],
-                    obsctr,
-                    obsref,
-                    &c_states[i,j,0],
-                    &c_lts[i,j]
+                    c_method.at(i),
+                    c_target.at(i),
+                    c_ets.at(i),
+                    c_abcorr.at(i),
+                    azccw,
+                    elplsz,
+                    c_obspos.at(i),
+                    c_obsctr.at(i),
+                    c_obsref.at(i),
+                    &c_states[i, 0],
+                    &c_lts[i]
                 )
-    check_for_spice_error()
-    return p_states, p_lts
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        return c_errors.finish((p_states, p_lts))
 
 
 def azlcpo(
@@ -456,7 +1069,8 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] azlrec_v(
     double[::1] az, 
     double[::1] el,
     SpiceBoolean azccw,
-    SpiceBoolean elplsz
+    SpiceBoolean elplsz,
+    object out=None
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.azlrec`
@@ -471,6 +1085,7 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] azlrec_v(
     :param el: Elevation in radians.
     :param azccw: Flag indicating how azimuth is measured.
     :param elplsz: Flag indicating how elevation is measured.
+    :param out: Optional preallocated output arrays, one per returned array.
     :return: Rectangular coordinates of a point.
     """
     cdef SpiceBoolean c_azccw  = <SpiceBoolean> azccw 
@@ -479,8 +1094,9 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] azlrec_v(
     cdef Py_ssize_t i, n = c_inrange.shape[0]
     cdef const np.double_t[::1] c_az = np.ascontiguousarray(az, dtype=np.double)
     cdef const np.double_t[::1] c_el = np.ascontiguousarray(el, dtype=np.double)
+    cdef tuple c_out = _check_out(out, 1)
     # allocate output array
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_rec = np.empty((n,3), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_rec = _output(c_out, 0, (n, 3), np.double)
     cdef np.double_t[:,::1] c_rec = p_rec
     # TODO fix strides lookups below
     _check_same_len(n, c_az.shape[0], "inrange", "az")
@@ -582,16 +1198,17 @@ def ckgp_s(
     cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_cmat = np.empty((3, 3), dtype=np.double, order='C')
     cdef np.double_t[:, ::1] c_cmat = p_cmat
     # perform the call
-    ckgp_c(
-        inst,
-        sclkdp,
-        tol,
-        ref,
-        <SpiceDouble (*)[3]> &c_cmat[0, 0],
-        &c_clkout,
-        <SpiceBoolean *> &c_found
-    )
-    check_for_spice_error()
+    with _cspice:
+        ckgp_c(
+            inst,
+            sclkdp,
+            tol,
+            ref,
+            <SpiceDouble (*)[3]> &c_cmat[0, 0],
+            &c_clkout,
+            <SpiceBoolean *> &c_found
+        )
+        check_for_spice_error()
 
     return p_cmat, c_clkout, PyBool_FromLong(c_found)
 
@@ -603,7 +1220,10 @@ def ckgp_v(
     int inst,
     double[::1] sclkdps,
     double tol,
-    const char* c_ref
+    const char* c_ref,
+    *,
+    object out=None,
+    str errors="raise"
     )-> tuple[Matrix_N, Double_N, Found_N] | tuple[Matrix_N, Double_N]:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.ckgp`
@@ -616,6 +1236,8 @@ def ckgp_v(
     :param sclkdps: Encoded spacecraft clock times.
     :param tol: Time tolerance.
     :param ref: Reference frame.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return:
             C-matrix pointing data,
             Output encoded spacecraft clock time
@@ -624,28 +1246,35 @@ def ckgp_v(
     # initialize c variables
     cdef const np.double_t[::1] c_sclkdps = np.ascontiguousarray(sclkdps, dtype=np.double)
     cdef Py_ssize_t i, n = c_sclkdps.shape[0]
+    cdef tuple c_out = _check_out(out, 3)
     # initialize output arrays
-    cdef np.ndarray[np.double_t, ndim=3, mode='c'] p_cmat   = np.empty((n, 3, 3), dtype=np.double, order='C')
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_clkout = np.empty(n, dtype=np.double, order='C')
-    cdef np.ndarray[np.uint8_t, ndim=1, mode='c'] p_found   = np.empty(n, dtype=np.uint8, order='C')
+    cdef np.ndarray[np.double_t, ndim=3, mode='c'] p_cmat   = _output(c_out, 0, (n, 3, 3), np.double)
+    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_clkout = _output(c_out, 1, (n,), np.double)
+    cdef np.ndarray p_found = _output(c_out, 2, (n,), np.bool_)
     cdef np.double_t[:, :, ::1] c_cmat = p_cmat
     cdef np.double_t[::1] c_clkout   = p_clkout
-    cdef np.uint8_t[::1] c_found     = p_found
+    cdef np.uint8_t[::1] c_found     = p_found.view(np.uint8)
+    cdef SpiceBoolean c_found_i = 0
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
     # perform the call
-    with nogil:
-        for i in range(n):
-            ckgp_c(
-                inst,
-                c_sclkdps[i],
-                tol,
-                c_ref,
-                <SpiceDouble (*)[3]> &c_cmat[i, 0, 0],
-                &c_clkout[i],
-                <SpiceBoolean *> &c_found[i]
-            )
-    check_for_spice_error()
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                ckgp_c(
+                    inst,
+                    c_sclkdps[i],
+                    tol,
+                    c_ref,
+                    <SpiceDouble (*)[3]> &c_cmat[i, 0, 0],
+                    &c_clkout[i],
+                    &c_found_i
+                )
+                c_found[i] = c_found_i
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_sclkdps)
 
-    return p_cmat, p_clkout, p_found
+        return c_errors.finish((p_cmat, p_clkout, p_found))
 
 
 def ckgp(
@@ -712,17 +1341,18 @@ def ckgpav_s(
     cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_av   = np.empty(3, dtype=np.double, order='C')
     cdef np.double_t[::1]   c_av   = p_av
     # perform the call
-    ckgpav_c(
-        c_inst,
-        c_sclkdp,
-        c_tol,
-        c_ref,
-        <SpiceDouble (*)[3]> &c_cmat[0, 0],
-        &c_av[0],
-        &c_clkout,
-        <SpiceBoolean *> &c_found
-    )
-    check_for_spice_error()
+    with _cspice:
+        ckgpav_c(
+            c_inst,
+            c_sclkdp,
+            c_tol,
+            c_ref,
+            <SpiceDouble (*)[3]> &c_cmat[0, 0],
+            &c_av[0],
+            &c_clkout,
+            <SpiceBoolean *> &c_found
+        )
+        check_for_spice_error()
 
     return p_cmat, p_av, c_clkout, PyBool_FromLong(c_found)
 
@@ -734,7 +1364,10 @@ def ckgpav_v(
     int    inst,
     double[::1] sclkdps,
     double tol,
-    const char* c_ref
+    const char* c_ref,
+    *,
+    object out=None,
+    str errors="raise"
     ) -> tuple[Matrix_N, Vector_N, Double_N, Found_N] | tuple[Matrix_N, Vector_N, Double_N]:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.ckgpav`
@@ -748,6 +1381,8 @@ def ckgpav_v(
     :param sclkdp: Encoded spacecraft clock times.
     :param tol: Time tolerance.
     :param ref: Reference frame.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return:
             C-matrix pointing data,
             Angular velocity vector,
@@ -758,31 +1393,38 @@ def ckgpav_v(
     cdef double c_tol = tol
     cdef const np.double_t[::1] c_sclkdps = np.ascontiguousarray(sclkdps, dtype=np.double)
     cdef Py_ssize_t i, n = c_sclkdps.shape[0]
+    cdef tuple c_out = _check_out(out, 4)
     # initialize output arrays
-    cdef np.ndarray[np.double_t, ndim=3, mode='c'] p_cmat = np.empty((n, 3, 3), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=3, mode='c'] p_cmat = _output(c_out, 0, (n, 3, 3), np.double)
     cdef np.double_t[:, :, ::1] c_cmat = p_cmat
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_av   = np.empty((n, 3), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_av   = _output(c_out, 1, (n, 3), np.double)
     cdef np.double_t[:, ::1]   c_av = p_av
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_clkout = np.empty(n, dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_clkout = _output(c_out, 2, (n,), np.double)
     cdef np.double_t[::1] c_clkout = p_clkout
-    cdef np.ndarray[np.uint8_t, ndim=1, mode='c'] p_found = np.empty(n, dtype=np.uint8, order='C')
-    cdef np.uint8_t[::1] c_found = p_found
+    cdef np.ndarray p_found = _output(c_out, 3, (n,), np.bool_)
+    cdef np.uint8_t[::1] c_found = p_found.view(np.uint8)
+    cdef SpiceBoolean c_found_i = 0
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
     # perform the call
-    with nogil:
-        for i in range(n):
-            ckgpav_c(
-                c_inst,
-                c_sclkdps[i],
-                c_tol,
-                c_ref,
-                <SpiceDouble (*)[3]> &c_cmat[i, 0, 0],
-                &c_av[i, 0],
-                &c_clkout[i],
-                <SpiceBoolean *> &c_found[i]
-            )
-    check_for_spice_error()
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                ckgpav_c(
+                    c_inst,
+                    c_sclkdps[i],
+                    c_tol,
+                    c_ref,
+                    <SpiceDouble (*)[3]> &c_cmat[i, 0, 0],
+                    &c_av[i, 0],
+                    &c_clkout[i],
+                    &c_found_i
+                )
+                c_found[i] = c_found_i
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_sclkdps)
 
-    return p_cmat, p_av, p_clkout, p_found
+        return c_errors.finish((p_cmat, p_av, p_clkout, p_found))
 
 
 def ckgpav(
@@ -845,20 +1487,23 @@ cpdef np.ndarray[np.double_t, ndim=1, mode='c'] conics_s(
     cdef const np.double_t[::1] c_elts = np.ascontiguousarray(elts, dtype=np.double)
     cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_state = np.empty(6, dtype=np.double, order='C')
     cdef np.double_t[::1] c_state = p_state
-    conics_c(
-        &c_elts[0],
-        et,
-        &c_state[0],
-    )
-    check_for_spice_error()
+    with _cspice:
+        conics_c(
+            &c_elts[0],
+            et,
+            &c_state[0],
+        )
+        check_for_spice_error()
     return p_state
 
 
 @boundscheck(False)
 @wraparound(False)
-cpdef np.ndarray[np.double_t, ndim=2, mode='c'] conics_v(
+cpdef object conics_v(
     double[:,::1] elts,
     double[::1] ets,
+    str errors="raise",
+    object out=None
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.conics`
@@ -871,24 +1516,31 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] conics_v(
 
     :param elts: Conic elements, units are km, rad, rad/sec, km**3/sec**2. 1 per et
     :param ets: Input times in ephemeris seconds J2000.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return: State of orbiting body at et (x, y, z, dx/dt, dy/dt, dz/dt).
     """
     cdef const np.double_t[:,::1] c_elts = np.ascontiguousarray(elts, dtype=np.double)
     cdef Py_ssize_t i, n = c_elts.shape[0]
     cdef np.double_t[::1] c_ets = np.ascontiguousarray(ets, dtype=np.double)
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_states = np.empty((n,6), dtype=np.double, order='C')
+    cdef tuple c_out = _check_out(out, 1)
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_states = _output(c_out, 0, (n, 6), np.double)
     cdef np.double_t[:,::1] c_states = p_states
     # main loop
     _check_same_len(n, c_ets.shape[0], "elts", "ets")
-    with nogil:
-        for i in range(n):
-            conics_c(
-                &c_elts[i,0],
-                c_ets[i],
-                &c_states[i,0],
-            )
-    check_for_spice_error()
-    return p_states
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                conics_c(
+                    &c_elts[i,0],
+                    c_ets[i],
+                    &c_states[i,0],
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        return c_errors.finish(p_states)
 
 
 def conics(
@@ -935,13 +1587,14 @@ def convrt_s(
     cdef double c_out = 0.0
     cdef const char* c_inunit = inunit
     cdef const char* c_outunit = outunit
-    convrt_c(
-        c_x,
-        c_inunit,
-        c_outunit,
-        &c_out
-    )
-    check_for_spice_error()
+    with _cspice:
+        convrt_c(
+            c_x,
+            c_inunit,
+            c_outunit,
+            &c_out
+        )
+        check_for_spice_error()
     return c_out
 
 
@@ -950,7 +1603,10 @@ def convrt_s(
 def convrt_v(
     double[::1] x,
     str inunit,
-    str outunit
+    str outunit,
+    *,
+    object out=None,
+    str errors="raise"
     ) -> Double_N:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.convrt`
@@ -964,25 +1620,32 @@ def convrt_v(
     :param x: Numbers representing a measurement in some units.
     :param inunit: The units in which x is measured.
     :param outunit: Desired units for the measurement.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return: The measurment in the desired units.
     """
     cdef const np.double_t[::1] c_x = np.ascontiguousarray(x, dtype=np.double)
     cdef Py_ssize_t i, n = c_x.shape[0]
     cdef const char* c_inunit = inunit
     cdef const char* c_outunit = outunit
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_outs = np.empty(n, dtype=np.double, order='C')
+    cdef tuple c_out = _check_out(out, 1)
+    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_outs = _output(c_out, 0, (n,), np.double)
     cdef np.double_t[::1] c_outs = p_outs
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
     # main loop
-    with nogil:
-        for i in range(n):
-            convrt_c(
-                c_x[i],
-                c_inunit,
-                c_outunit,
-                &c_outs[i]
-            )
-    check_for_spice_error()
-    return p_outs
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                convrt_c(
+                    c_x[i],
+                    c_inunit,
+                    c_outunit,
+                    &c_outs[i]
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(None)
+        return c_errors.finish(p_outs)
 
 
 def convrt(
@@ -1008,7 +1671,7 @@ def convrt(
         return convrt_v(x, inunit, outunit)
 
 
-cpdef tuple[float, float, float] cyllat_s(
+cpdef tuple[double, double, double] cyllat_s(
     r: float, 
     clon: float, 
     z: float
@@ -1044,7 +1707,8 @@ cpdef tuple[float, float, float] cyllat_s(
 cpdef np.ndarray[np.double_t, ndim=2, mode='c'] cyllat_v(
     const double[::1] r, 
     const double[::1] clon, 
-    const double[::1] z
+    const double[::1] z,
+    object out=None
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.cyllat`
@@ -1056,14 +1720,16 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] cyllat_v(
     :param r: Distance of point from z axis.
     :param clon: Cylindrical angle of point from XZ plane (radians).
     :param z: Height of point above XY plane.
+    :param out: Optional preallocated output arrays, one per returned array.
     :return: Distance, Longitude (radians), and Latitude of point (radians).
     """
     cdef const np.double_t[::1] c_r = np.ascontiguousarray(r, dtype=np.double)
     cdef Py_ssize_t i, n = c_r.shape[0]
     cdef const np.double_t[::1] c_clon = np.ascontiguousarray(clon, dtype=np.double)
     cdef const np.double_t[::1] c_z = np.ascontiguousarray(z, dtype=np.double)
+    cdef tuple c_out = _check_out(out, 1)
     # allocate output array
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_lat = np.empty((n,3), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_lat = _output(c_out, 0, (n, 3), np.double)
     cdef np.double_t[:,::1] c_lat = p_lat
     # TODO fix strides lookups below
     _check_same_len(n, c_clon.shape[0], "r", "clon")
@@ -1136,7 +1802,8 @@ cpdef np.ndarray[np.double_t, ndim=1, mode='c'] cylrec_s(
 cpdef np.ndarray[np.double_t, ndim=2, mode='c'] cylrec_v(
     const double[::1] r, 
     const double[::1] lon, 
-    const double[::1] z
+    const double[::1] z,
+    object out=None
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.cylrec`
@@ -1148,14 +1815,16 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] cylrec_v(
     :param r: Distance of a point from z axis.
     :param lon: Angle (radians) of a point from xZ plane.
     :param z: Height of a point above xY plane.
+    :param out: Optional preallocated output arrays, one per returned array.
     :return: Rectangular coordinates of the point.
     """
     cdef const np.double_t[::1] c_r = np.ascontiguousarray(r, dtype=np.double)
     cdef Py_ssize_t i, n = c_r.shape[0]
     cdef const np.double_t[::1] c_lon = np.ascontiguousarray(lon, dtype=np.double)
     cdef const np.double_t[::1] c_z   = np.ascontiguousarray(z, dtype=np.double)
+    cdef tuple c_out = _check_out(out, 1)
     # allocate output array
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_rec = np.empty((n,3), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_rec = _output(c_out, 0, (n, 3), np.double)
     cdef np.double_t[:,::1] c_rec = p_rec
     # TODO fix strides lookups below
     _check_same_len(n, c_lon.shape[0], "r", "lon")
@@ -1192,7 +1861,7 @@ def cylrec(
         return cylrec_v(r, lon, z)
 
 
-cpdef tuple[float, float, float] cylsph_s(
+cpdef tuple[double, double, double] cylsph_s(
     r: float, 
     clon: float, 
     z: float
@@ -1231,7 +1900,8 @@ cpdef tuple[float, float, float] cylsph_s(
 cpdef np.ndarray[np.double_t, ndim=2, mode='c'] cylsph_v(
     const double[::1] r, 
     const double[::1] clon, 
-    const double[::1] z
+    const double[::1] z,
+    object out=None
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.cylsph`
@@ -1243,6 +1913,7 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] cylsph_v(
     :param r: Rectangular coordinates of the point.
     :param lonc: Angle (radians) of point from XZ plane.
     :param z: Height of point above XY plane.
+    :param out: Optional preallocated output arrays, one per returned array.
     :return:
             Distance of point from origin,
             Polar angle (co-latitude in radians) of point,
@@ -1252,8 +1923,9 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] cylsph_v(
     cdef Py_ssize_t i, n = c_r.shape[0]
     cdef const np.double_t[::1] c_clon = np.ascontiguousarray(clon, dtype=np.double)
     cdef const np.double_t[::1] c_z = np.ascontiguousarray(z, dtype=np.double)
+    cdef tuple c_out = _check_out(out, 1)
     # allocate output array
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_sph = np.empty((n,3), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_sph = _output(c_out, 0, (n, 3), np.double)
     cdef np.double_t[:,::1] c_sph = p_sph
     # TODO fix strides lookups below
     _check_same_len(n, c_clon.shape[0], "r", "clon")
@@ -1316,12 +1988,13 @@ def deltet_s(
     cdef double c_epoch = epoch
     cdef double c_delta = 0.0
     cdef const char* c_eptype = eptype
-    deltet_c(
-        c_epoch,
-        c_eptype,
-        &c_delta
-    )
-    check_for_spice_error()
+    with _cspice:
+        deltet_c(
+            c_epoch,
+            c_eptype,
+            &c_delta
+        )
+        check_for_spice_error()
     return c_delta
 
 
@@ -1330,7 +2003,10 @@ def deltet_s(
 @wraparound(False)
 def deltet_v(
     double[::1] epochs,
-    str eptype
+    str eptype,
+    *,
+    object out=None,
+    str errors="raise"
     ) -> Double_N:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.deltet`
@@ -1341,25 +2017,32 @@ def deltet_v(
 
     :param epochs: Input epoch (seconds past J2000).
     :param eptype: Type of input epoch ("UTC" or "ET").
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return: Delta ET (ET-UTC) at input epoch.
     """
     cdef const np.double_t[::1] c_epochs = np.ascontiguousarray(epochs, dtype=np.double)
     cdef Py_ssize_t i, n = c_epochs.shape[0]
     cdef const char* c_eptype = eptype
+    cdef tuple c_out = _check_out(out, 1)
     # allocate output array
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_deltas = np.empty(n, dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_deltas = _output(c_out, 0, (n,), np.double)
     cdef np.double_t[::1] c_deltas = p_deltas
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
     # perform the loop
-    with nogil:
-        for i in range(n):
-            deltet_c(
-                c_epochs[i],
-                c_eptype,
-                &c_deltas[i]
-            )
-    check_for_spice_error()
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                deltet_c(
+                    c_epochs[i],
+                    c_eptype,
+                    &c_deltas[i]
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_epochs)
 
-    return p_deltas
+        return c_errors.finish(p_deltas)
 
 
 def deltet(
@@ -1392,6 +2075,821 @@ def dpr() -> float:
     return dpr_c()
 
 
+@boundscheck(False)
+@wraparound(False)
+def dsk02_export(
+    int handle,
+    dladsc,
+    *,
+    object out=None
+    ) -> tuple[Vector_N, Plates_N, Record, DoubleArray, IntArray, Record]:
+    """
+    Read a complete type 2 DSK segment into numpy arrays: its vertices,
+    plates, bookkeeping parameters, spatial index and DSK descriptor.
+
+    Each item is read with a single CSPICE call straight into its array,
+    without holding the GIL. The spatial index arrays have the layout made
+    by dskmi2, so they can be passed back to dskw02. Preallocated arrays may
+    be given with out, their sizes follow from the record returned by
+    :py:meth:`dskb02`: vertices (nv, 3) float64, plates (np, 3) int32,
+    a DSKB02_DTYPE record, spaixd (10,) float64, spaixi
+    (100007 + voxnpt + voxnpl + nv + vtxnpl,) int32 and a DSKDSC_DTYPE record.
+
+    https://naif.jpl.nasa.gov/pub/naif/misc/toolkit_docs_N0067/C/cspice/dskb02_c.html
+
+    :param handle: DSK file handle.
+    :param dladsc: DLA descriptor of the segment.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :return: Vertices, 1-based plates, DSKB02_DTYPE record, double and integer spatial index arrays, DSKDSC_DTYPE record
+    """
+    cdef const np.int32_t[::1] c_dladsc = _dladsc_array(dladsc)
+    cdef ConstSpiceDLADescr * p_dladsc = <ConstSpiceDLADescr *> &c_dladsc[0]
+    cdef tuple c_out = _check_out(out, 6)
+    cdef np.ndarray p_params = _output(c_out, 2, (), DSKB02_DTYPE)
+    _dskb02(handle, p_dladsc, p_params)
+    cdef SpiceInt nv = p_params["nv"], np_ = p_params["np"], vtxnpl = p_params["vtxnpl"]
+    cdef SpiceInt voxnpt = p_params["voxnpt"], voxnpl = p_params["voxnpl"]
+    cdef SpiceInt ncgr = p_params["vgrext"][0] // p_params["cgscal"]
+    ncgr = ncgr * ncgr * ncgr
+    # initialize output arrays
+    cdef np.ndarray p_vrtces = _output(c_out, 0, (nv, 3), np.double)
+    cdef np.ndarray p_plates = _output(c_out, 1, (np_, 3), np.int32)
+    cdef np.ndarray p_spaixd = _output(c_out, 3, (DSK02_SPADSZ,), np.double)
+    cdef np.ndarray p_spaixi = _output(c_out, 4, (DSK02_IXIFIX + voxnpt + voxnpl + nv + vtxnpl,), np.int32)
+    cdef np.ndarray p_dskdsc = _output(c_out, 5, (), DSKDSC_DTYPE)
+    cdef SpiceDouble * c_vrtces = <SpiceDouble *> np.PyArray_DATA(p_vrtces)
+    cdef SpiceInt * c_plates = <SpiceInt *> np.PyArray_DATA(p_plates)
+    cdef SpiceDouble * c_spaixd = <SpiceDouble *> np.PyArray_DATA(p_spaixd)
+    cdef SpiceInt * c_spaixi = <SpiceInt *> np.PyArray_DATA(p_spaixi)
+    cdef SpiceInt i, n = 0
+    # the fixed part of the integer index holds the sizes and the coarse grid
+    c_spaixi[0] = p_params["vgrext"][0]
+    c_spaixi[1] = p_params["vgrext"][1]
+    c_spaixi[2] = p_params["vgrext"][2]
+    c_spaixi[3] = p_params["cgscal"]
+    c_spaixi[4] = voxnpt
+    c_spaixi[5] = voxnpl
+    c_spaixi[6] = vtxnpl
+    with _cspice:
+        with nogil:
+            dskv02_c(handle, p_dladsc, 1, nv, &n, <SpiceDouble (*)[3]> c_vrtces)
+            dskp02_c(handle, p_dladsc, 1, np_, &n, <SpiceInt (*)[3]> c_plates)
+            dskd02_c(handle, p_dladsc, DSK02_KWVTBD, 0, 6, &n, c_spaixd)
+            dskd02_c(handle, p_dladsc, DSK02_KWVXOR, 0, 3, &n, c_spaixd + 6)
+            dskd02_c(handle, p_dladsc, DSK02_KWVXSZ, 0, 1, &n, c_spaixd + 9)
+            dski02_c(handle, p_dladsc, DSK02_KWCGPT, 0, ncgr, &n, c_spaixi + 7)
+            for i in range(7 + ncgr, DSK02_IXIFIX):
+                c_spaixi[i] = 0
+            i = DSK02_IXIFIX
+            dski02_c(handle, p_dladsc, DSK02_KWVXPT, 0, voxnpt, &n, c_spaixi + i)
+            i += voxnpt
+            dski02_c(handle, p_dladsc, DSK02_KWVXPL, 0, voxnpl, &n, c_spaixi + i)
+            i += voxnpl
+            dski02_c(handle, p_dladsc, DSK02_KWVTPT, 0, nv, &n, c_spaixi + i)
+            i += nv
+            # segments written without a vertex-plate map have an empty list
+            if vtxnpl > 0:
+                dski02_c(handle, p_dladsc, DSK02_KWVTPL, 0, vtxnpl, &n, c_spaixi + i)
+            dskgd_c(handle, p_dladsc, <SpiceDSKDescr *> np.PyArray_DATA(p_dskdsc))
+        check_for_spice_error()
+    return p_vrtces, p_plates, p_params[()], p_spaixd, p_spaixi, p_dskdsc[()]
+
+
+cdef void _dskb02(int handle, ConstSpiceDLADescr * dladsc, np.ndarray params):
+    # fill a DSKB02_DTYPE record with the bookkeeping data of a segment
+    cdef SpiceInt nv = 0, np_ = 0, nvxtot = 0, cgscal = 0, vtxnpl = 0, voxnpt = 0, voxnpl = 0
+    cdef SpiceDouble voxsiz = 0.0
+    cdef np.ndarray[np.double_t, ndim=2, mode="c"] vtxbds = np.zeros((3, 2), dtype=np.double)
+    cdef np.ndarray[np.double_t, ndim=1, mode="c"] voxori = np.zeros(3, dtype=np.double)
+    cdef np.ndarray[np.int32_t, ndim=1, mode="c"] vgrext = np.zeros(3, dtype=np.int32)
+    with _cspice:
+        dskb02_c(
+            handle,
+            dladsc,
+            &nv,
+            &np_,
+            &nvxtot,
+            <SpiceDouble (*)[2]> vtxbds.data,
+            &voxsiz,
+            <SpiceDouble *> voxori.data,
+            <SpiceInt *> vgrext.data,
+            &cgscal,
+            &vtxnpl,
+            &voxnpt,
+            &voxnpl
+        )
+        check_for_spice_error()
+    params[()] = (nv, np_, nvxtot, vtxbds, voxsiz, voxori, vgrext, cgscal, vtxnpl, voxnpt, voxnpl)
+
+
+def dskb02(
+    int handle,
+    dladsc
+    ) -> Record:
+    """
+    Return bookkeeping data from a DSK type 2 segment.
+
+    https://naif.jpl.nasa.gov/pub/naif/misc/toolkit_docs_N0067/C/cspice/dskb02_c.html
+
+    :param handle: DSK file handle
+    :param dladsc: DLA descriptor
+    :return: DSKB02_DTYPE record of the bookkeeping data of the segment: nv, np, nvxtot, vtxbds, voxsiz, voxori, vgrext, cgscal, vtxnpl, voxnpt, voxnpl
+    """
+    cdef const np.int32_t[::1] c_dladsc = _dladsc_array(dladsc)
+    cdef np.ndarray p_params = np.zeros((), dtype=DSKB02_DTYPE)
+    _dskb02(handle, <ConstSpiceDLADescr *> &c_dladsc[0], p_params)
+    return p_params[()]
+
+
+cdef tuple _dskmi2(
+    const np.double_t[:, ::1] vrtces,
+    const np.int32_t[:, ::1] plates,
+    double finscl,
+    int corscl,
+    SpiceInt worksz,
+    SpiceInt voxpsz,
+    SpiceInt voxlsz,
+    bint makvtl,
+    SpiceInt spxisz
+    ):
+    # spatial index of a mesh, the integer array cut to the part dskmi2 filled.
+    # The arrays start zeroed, as dskmi2 reads parts of them it has not set.
+    cdef SpiceInt nv = vrtces.shape[0], np_ = plates.shape[0]
+    cdef np.ndarray p_work = np.zeros((worksz, 2), dtype=np.int32)
+    cdef np.ndarray p_spaixd = np.zeros(DSK02_SPADSZ, dtype=np.double)
+    cdef np.ndarray p_spaixi = np.zeros(spxisz, dtype=np.int32)
+    cdef SpiceInt * c_spaixi = <SpiceInt *> np.PyArray_DATA(p_spaixi)
+    cdef Py_ssize_t used
+    with _cspice:
+        with nogil:
+            dskmi2_c(
+                nv,
+                <ConstSpiceDouble (*)[3]> &vrtces[0, 0] if nv else NULL,
+                np_,
+                <ConstSpiceInt (*)[3]> &plates[0, 0] if np_ else NULL,
+                finscl,
+                corscl,
+                worksz,
+                voxpsz,
+                voxlsz,
+                makvtl,
+                spxisz,
+                <SpiceInt (*)[2]> np.PyArray_DATA(p_work),
+                <SpiceDouble *> np.PyArray_DATA(p_spaixd),
+                c_spaixi
+            )
+        check_for_spice_error()
+    used = DSK02_IXIFIX + c_spaixi[4] + c_spaixi[5] + nv + c_spaixi[6]
+    return p_spaixd, p_spaixi[:used].copy()
+
+
+cdef tuple _dskrb2(
+    const np.double_t[:, ::1] vrtces,
+    const np.int32_t[:, ::1] plates,
+    int corsys,
+    const np.double_t[::1] corpar
+    ):
+    cdef SpiceInt nv = vrtces.shape[0], np_ = plates.shape[0]
+    cdef SpiceDouble mncor3 = 0.0, mxcor3 = 0.0
+    with _cspice:
+        with nogil:
+            dskrb2_c(
+                nv,
+                <ConstSpiceDouble (*)[3]> &vrtces[0, 0] if nv else NULL,
+                np_,
+                <ConstSpiceInt (*)[3]> &plates[0, 0] if np_ else NULL,
+                corsys,
+                &corpar[0],
+                &mncor3,
+                &mxcor3
+            )
+        check_for_spice_error()
+    return mncor3, mxcor3
+
+
+cdef void _dskw02(
+    int handle,
+    int center,
+    int surfid,
+    int dclass,
+    const char* frame,
+    int corsys,
+    const np.double_t[::1] corpar,
+    const np.double_t[::1] bounds,
+    double first,
+    double last,
+    const np.double_t[:, ::1] vrtces,
+    const np.int32_t[:, ::1] plates,
+    const np.double_t[::1] spaixd,
+    const np.int32_t[::1] spaixi
+    ):
+    # bounds holds mncor1, mxcor1, mncor2, mxcor2, mncor3 and mxcor3
+    cdef SpiceInt nv = vrtces.shape[0], np_ = plates.shape[0]
+    with _cspice:
+        with nogil:
+            dskw02_c(
+                handle,
+                center,
+                surfid,
+                dclass,
+                frame,
+                corsys,
+                &corpar[0],
+                bounds[0],
+                bounds[1],
+                bounds[2],
+                bounds[3],
+                bounds[4],
+                bounds[5],
+                first,
+                last,
+                nv,
+                <ConstSpiceDouble (*)[3]> &vrtces[0, 0] if nv else NULL,
+                np_,
+                <ConstSpiceInt (*)[3]> &plates[0, 0] if np_ else NULL,
+                &spaixd[0],
+                <ConstSpiceInt *> &spaixi[0]
+            )
+        check_for_spice_error()
+
+
+def dskmi2(
+    vrtces,
+    plates,
+    double finscl,
+    int corscl,
+    int worksz,
+    int voxpsz,
+    int voxlsz,
+    bint makvtl,
+    int spxisz
+    ) -> tuple[DoubleArray, IntArray]:
+    """
+    Make spatial index for a DSK type 2 segment. The index is returned
+    as a pair of arrays, one of type int and one of type
+    float. These arrays are suitable for use with the DSK type 2
+    writer dskw02.
+
+    The (NV, 3) vertices and (NP, 3) plates are passed to CSPICE without a
+    copy when they are C contiguous float64 and int32 arrays. The integer
+    array is returned without the unused part of its spxisz elements.
+
+    https://naif.jpl.nasa.gov/pub/naif/misc/toolkit_docs_N0067/C/cspice/dskmi2_c.html
+
+    :param vrtces: Vertices
+    :param plates: Plates, 1-based indices of their vertices
+    :param finscl: Fine voxel scale
+    :param corscl: Coarse voxel scale
+    :param worksz: Workspace size
+    :param voxpsz: Voxel plate pointer array size
+    :param voxlsz: Voxel plate list array size
+    :param makvtl: Vertex plate list flag
+    :param spxisz: Spatial index integer component size
+    :return: double precision and integer components of the spatial index of the segment.
+    """
+    cdef const np.double_t[:, ::1] c_vrtces = _packed(vrtces, _outer_shape(vrtces), 3, "vrtces")
+    cdef const np.int32_t[:, ::1] c_plates = _packed(plates, _outer_shape(plates), 3, "plates", np.int32)
+    return _dskmi2(c_vrtces, c_plates, finscl, corscl, worksz, voxpsz, voxlsz, makvtl, spxisz)
+
+
+def dskrb2(
+    vrtces,
+    plates,
+    int corsys,
+    corpar
+    ) -> tuple[float, float]:
+    """
+    Determine range bounds for a set of triangular plates to
+    be stored in a type 2 DSK segment.
+
+    https://naif.jpl.nasa.gov/pub/naif/misc/toolkit_docs_N0067/C/cspice/dskrb2_c.html
+
+    :param vrtces: Vertices
+    :param plates: Plates, 1-based indices of their vertices
+    :param corsys: DSK coordinate system code
+    :param corpar: DSK coordinate system parameters
+    :return: Lower and Upper bound on range of third coordinate
+    """
+    cdef const np.double_t[:, ::1] c_vrtces = _packed(vrtces, _outer_shape(vrtces), 3, "vrtces")
+    cdef const np.int32_t[:, ::1] c_plates = _packed(plates, _outer_shape(plates), 3, "plates", np.int32)
+    return _dskrb2(c_vrtces, c_plates, corsys, _core_array(corpar, (10,), "corpar"))
+
+
+def dskw02(
+    int handle,
+    int center,
+    int surfid,
+    int dclass,
+    str frame,
+    int corsys,
+    corpar,
+    double mncor1,
+    double mxcor1,
+    double mncor2,
+    double mxcor2,
+    double mncor3,
+    double mxcor3,
+    double first,
+    double last,
+    vrtces,
+    plates,
+    spaixd,
+    spaixi
+    ) -> None:
+    """
+    Write a type 2 segment to a DSK file.
+
+    The mesh and the spatial index are passed to CSPICE without a copy when
+    they are C contiguous float64 and int32 arrays, such as those returned
+    by :py:meth:`dskmi2` and :py:meth:`dsk02_export`.
+
+    https://naif.jpl.nasa.gov/pub/naif/misc/toolkit_docs_N0067/C/cspice/dskw02_c.html
+
+    :param handle: Handle assigned to the opened DSK file
+    :param center: Central body ID code
+    :param surfid: Surface ID code
+    :param dclass: Data class
+    :param frame: Reference frame
+    :param corsys: Coordinate system code
+    :param corpar: Coordinate system parameters
+    :param mncor1: Minimum value of first coordinate
+    :param mxcor1: Maximum value of first coordinate
+    :param mncor2: Minimum value of second coordinate
+    :param mxcor2: Maximum value of second coordinate
+    :param mncor3: Minimum value of third coordinate
+    :param mxcor3: Maximum value of third coordinate
+    :param first: Coverage start time
+    :param last: Coverage stop time
+    :param vrtces: Vertices
+    :param plates: Plates, 1-based indices of their vertices
+    :param spaixd: Double precision component of spatial index
+    :param spaixi: Integer component of spatial index
+    """
+    cdef const np.double_t[:, ::1] c_vrtces = _packed(vrtces, _outer_shape(vrtces), 3, "vrtces")
+    cdef const np.int32_t[:, ::1] c_plates = _packed(plates, _outer_shape(plates), 3, "plates", np.int32)
+    cdef const np.double_t[::1] c_spaixd = _core_array(spaixd, (DSK02_SPADSZ,), "spaixd")
+    cdef const np.int32_t[::1] c_spaixi = np.ascontiguousarray(spaixi, dtype=np.int32).reshape(-1)
+    cdef np.ndarray p_bounds = np.array([mncor1, mxcor1, mncor2, mxcor2, mncor3, mxcor3])
+    if c_spaixi.shape[0] < DSK02_IXIFIX:
+        raise ValueError(f"spaixi must hold at least {DSK02_IXIFIX} integers, got {c_spaixi.shape[0]}")
+    _dskw02(
+        handle, center, surfid, dclass, frame, corsys, _core_array(corpar, (10,), "corpar"),
+        p_bounds, first, last, c_vrtces, c_plates, c_spaixd, c_spaixi
+    )
+
+
+@boundscheck(False)
+@wraparound(False)
+def dskx02_s(
+    int handle,
+    dladsc,
+    vertex,
+    raydir
+    ) -> tuple[int, Vector, bool]:
+    """
+    Scalar version of :py:meth:`~spiceypy.cyice.cyice.dskx02`
+
+    Determine the plate ID and body-fixed coordinates of the
+    intersection of a specified ray with the surface defined by a
+    type 2 DSK plate model.
+
+    https://naif.jpl.nasa.gov/pub/naif/misc/toolkit_docs_N0067/C/cspice/dskx02_c.html
+
+    :param handle: Handle of DSK kernel containing plate model.
+    :param dladsc: DLA descriptor of plate model segment.
+    :param vertex: Ray's vertex in the  body fixed frame.
+    :param raydir: Ray direction in the body fixed frame.
+    :return: ID code of the plate intersected by the ray, Intercept, and Flag indicating whether intercept exists.
+    """
+    cdef const np.int32_t[::1] c_dladsc = _dladsc_array(dladsc)
+    cdef const np.double_t[::1] c_vertex = _core_array(vertex, (3,), "vertex")
+    cdef const np.double_t[::1] c_raydir = _core_array(raydir, (3,), "raydir")
+    cdef SpiceInt c_plid = 0
+    cdef np.ndarray[np.double_t, ndim=1, mode="c"] p_xpt = np.zeros(3, dtype=np.double)
+    cdef SpiceBoolean c_found = SPICEFALSE
+    with _cspice:
+        dskx02_c(
+            handle,
+            <ConstSpiceDLADescr *> &c_dladsc[0],
+            &c_vertex[0],
+            &c_raydir[0],
+            &c_plid,
+            <SpiceDouble *> p_xpt.data,
+            &c_found
+        )
+        check_for_spice_error()
+    return c_plid, p_xpt, PyBool_FromLong(c_found)
+
+
+@boundscheck(False)
+@wraparound(False)
+def dskx02_v(
+    int handle,
+    dladsc,
+    vertex,
+    raydir,
+    *,
+    object out=None,
+    str errors="raise"
+    ) -> tuple[Int_N, Vector_N, Found_N]:
+    """
+    Vectorized version of :py:meth:`~spiceypy.cyice.cyice.dskx02`
+
+    The ray vertices and directions broadcast against each other following
+    NumPy rules, all rays are intersected with the one given segment.
+
+    https://naif.jpl.nasa.gov/pub/naif/misc/toolkit_docs_N0067/C/cspice/dskx02_c.html
+
+    :param handle: Handle of DSK kernel containing plate model.
+    :param dladsc: DLA descriptor of plate model segment.
+    :param vertex: Ray vertices in the body fixed frame.
+    :param raydir: Ray directions in the body fixed frame.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
+    :return: ID codes of the plates intersected by the rays, Intercepts, and Flags indicating whether intercepts exist.
+    """
+    # broadcast the arguments against each other
+    cdef tuple shape = np.broadcast_shapes(_outer_shape(vertex), _outer_shape(raydir))
+    cdef Py_ssize_t i, n = _shape_size(shape)
+    # initialize c variables
+    cdef const np.int32_t[::1] c_dladsc = _dladsc_array(dladsc)
+    cdef _VecArg c_vertex = _VecArg(vertex, shape, 3)
+    cdef _VecArg c_raydir = _VecArg(raydir, shape, 3)
+    cdef tuple c_out = _check_out(out, 3)
+    # initialize output arrays
+    cdef np.ndarray p_plid = _output(c_out, 0, shape, np.int32)
+    cdef np.int32_t[::1] c_plid = p_plid.reshape(n)
+    cdef np.ndarray p_xpt = _output(c_out, 1, shape + (3,), np.double)
+    cdef np.double_t[:, ::1] c_xpt = p_xpt.reshape(n, 3)
+    cdef np.ndarray p_found = _output(c_out, 2, shape, np.bool_)
+    cdef np.uint8_t[::1] c_found = p_found.reshape(n).view(np.uint8)
+    cdef SpiceBoolean c_found_i = SPICEFALSE
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, shape)
+    # main loop
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                dskx02_c(
+                    handle,
+                    <ConstSpiceDLADescr *> &c_dladsc[0],
+                    c_vertex.at(i),
+                    c_raydir.at(i),
+                    <SpiceInt *> &c_plid[i],
+                    &c_xpt[i, 0],
+                    &c_found_i
+                )
+                c_found[i] = c_found_i
+                if not c_found_i:
+                    c_plid[i] = 0
+                    c_xpt[i, 0] = c_xpt[i, 1] = c_xpt[i, 2] = 0.0
+                if c_errors.capture(i):
+                    break
+        c_errors.check(None)
+        return c_errors.finish((p_plid, p_xpt, p_found))
+
+
+def dskx02(
+    handle: int,
+    dladsc: object,
+    vertex: Vector | Vector_N,
+    raydir: Vector | Vector_N
+    ) -> tuple[int, Vector, bool] | tuple[Int_N, Vector_N, Found_N]:
+    """
+    Determine the plate ID and body-fixed coordinates of the
+    intersection of a specified ray with the surface defined by a
+    type 2 DSK plate model.
+
+    https://naif.jpl.nasa.gov/pub/naif/misc/toolkit_docs_N0067/C/cspice/dskx02_c.html
+
+    :param handle: Handle of DSK kernel containing plate model.
+    :param dladsc: DLA descriptor of plate model segment.
+    :param vertex: Ray's vertex in the  body fixed frame.
+    :param raydir: Ray direction in the body fixed frame.
+    :return: ID code of the plate intersected by the ray, Intercept, and Flag indicating whether intercept exists.
+    """
+    if _batched(vertex, 1) or _batched(raydir, 1):
+        return dskx02_v(handle, dladsc, vertex, raydir)
+    else:
+        return dskx02_s(handle, dladsc, vertex, raydir)
+
+
+@boundscheck(False)
+@wraparound(False)
+@cyice_found_exception_thrower
+def dskxsi_s(
+    bint pri,
+    str target,
+    srflst,
+    double et,
+    str fixref,
+    vertex,
+    raydir
+    ) -> tuple[Vector, int, Record, Record, np.ndarray, np.ndarray, bool]:
+    """
+    Scalar version of :py:meth:`~spiceypy.cyice.cyice.dskxsi`
+
+    Compute a ray-surface intercept using data provided by
+    multiple loaded DSK segments. Return information about
+    the source of the data defining the surface on which the
+    intercept was found: DSK handle, DLA and DSK descriptors,
+    and DSK data type-dependent parameters.
+
+    https://naif.jpl.nasa.gov/pub/naif/misc/toolkit_docs_N0067/C/cspice/dskxsi_c.html
+
+    :param pri: Data prioritization flag.
+    :param target: Target body name.
+    :param srflst: Surface ID list.
+    :param et: Epoch, expressed as seconds past J2000 TDB.
+    :param fixref: Name of target body-fixed reference frame.
+    :param vertex: Vertex of ray.
+    :param raydir: Direction vector of ray.
+    :return: Intercept point, Handle of segment contributing surface data, DLADSC record, DSKDSC record, Double precision component of source info, Integer component of source info
+    """
+    cdef const np.int32_t[::1] c_srflst = np.ascontiguousarray(srflst, dtype=np.int32).reshape(-1)
+    cdef SpiceInt c_nsurf = c_srflst.shape[0]
+    cdef const char* c_target = target
+    cdef const char* c_fixref = fixref
+    cdef const np.double_t[::1] c_vertex = _core_array(vertex, (3,), "vertex")
+    cdef const np.double_t[::1] c_raydir = _core_array(raydir, (3,), "raydir")
+    cdef np.ndarray[np.double_t, ndim=1, mode="c"] p_xpt = np.zeros(3, dtype=np.double)
+    cdef SpiceInt c_handle = 0
+    cdef np.ndarray p_dladsc = np.zeros((), dtype=DLADSC_DTYPE)
+    cdef np.ndarray p_dskdsc = np.zeros((), dtype=DSKDSC_DTYPE)
+    cdef np.ndarray[np.double_t, ndim=1, mode="c"] p_dc = np.zeros(1, dtype=np.double)
+    cdef np.ndarray[np.int32_t, ndim=1, mode="c"] p_ic = np.zeros(1, dtype=np.int32)
+    cdef SpiceBoolean c_found = SPICEFALSE
+    with _cspice:
+        dskxsi_c(
+            pri,
+            c_target,
+            c_nsurf,
+            <ConstSpiceInt *> &c_srflst[0] if c_nsurf else NULL,
+            et,
+            c_fixref,
+            &c_vertex[0],
+            &c_raydir[0],
+            1,
+            1,
+            <SpiceDouble *> p_xpt.data,
+            &c_handle,
+            <SpiceDLADescr *> np.PyArray_DATA(p_dladsc),
+            <SpiceDSKDescr *> np.PyArray_DATA(p_dskdsc),
+            <SpiceDouble *> p_dc.data,
+            <SpiceInt *> p_ic.data,
+            &c_found
+        )
+        check_for_spice_error()
+    return p_xpt, c_handle, p_dladsc[()], p_dskdsc[()], p_dc, p_ic, PyBool_FromLong(c_found)
+
+
+@boundscheck(False)
+@wraparound(False)
+@cyice_found_exception_thrower
+def dskxsi_v(
+    bint pri,
+    target,
+    srflst,
+    ets,
+    fixref,
+    vertex,
+    raydir,
+    *,
+    object out=None,
+    str errors="raise"
+    ) -> tuple[Vector_N, Int_N, DLADescr_N, DSKDescr_N, np.ndarray, np.ndarray, Found_N]:
+    """
+    Vectorized version of :py:meth:`~spiceypy.cyice.cyice.dskxsi`
+
+    All arguments except pri, srflst and the output and error options broadcast
+    against each other following NumPy rules, string arguments may be arrays of names.
+
+    Compute a ray-surface intercept using data provided by
+    multiple loaded DSK segments. Return information about
+    the source of the data defining the surface on which the
+    intercept was found: DSK handle, DLA and DSK descriptors,
+    and DSK data type-dependent parameters.
+
+    https://naif.jpl.nasa.gov/pub/naif/misc/toolkit_docs_N0067/C/cspice/dskxsi_c.html
+
+    :param pri: Data prioritization flag.
+    :param target: Target body name.
+    :param srflst: Surface ID list.
+    :param ets: Epochs, expressed as seconds past J2000 TDB.
+    :param fixref: Name of target body-fixed reference frame.
+    :param vertex: Vertices of rays.
+    :param raydir: Direction vectors of rays.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
+    :return: Intercept points, Handles of segments contributing surface data, DLADSC_DTYPE records, DSKDSC_DTYPE records, Double precision components of source info, Integer components of source info (the plate IDs for type 2 segments)
+    """
+    # broadcast the arguments against each other
+    cdef tuple shape = np.broadcast_shapes(
+        np.shape(target), np.shape(ets), np.shape(fixref), _outer_shape(vertex), _outer_shape(raydir)
+    )
+    cdef Py_ssize_t i, n = _shape_size(shape)
+    # initialize c variables
+    cdef const np.int32_t[::1] c_srflst = np.ascontiguousarray(srflst, dtype=np.int32).reshape(-1)
+    cdef SpiceInt c_nsurf = c_srflst.shape[0]
+    cdef ConstSpiceInt* c_srflst_p = <ConstSpiceInt *> &c_srflst[0] if c_nsurf else NULL
+    cdef _StrArg c_target = _StrArg(target, shape)
+    cdef _DblArg c_ets    = _DblArg(ets, shape)
+    cdef _StrArg c_fixref = _StrArg(fixref, shape)
+    cdef _VecArg c_vertex = _VecArg(vertex, shape, 3)
+    cdef _VecArg c_raydir = _VecArg(raydir, shape, 3)
+    cdef tuple c_out = _check_out(out, 7)
+    # initialize output arrays
+    cdef np.ndarray p_xpt = _output(c_out, 0, shape + (3,), np.double)
+    cdef np.double_t[:, ::1] c_xpt = p_xpt.reshape(n, 3)
+    cdef np.ndarray p_handle = _output(c_out, 1, shape, np.int32)
+    cdef np.int32_t[::1] c_handle = p_handle.reshape(n)
+    cdef np.ndarray p_dladsc = _output(c_out, 2, shape, DLADSC_DTYPE)
+    cdef SpiceDLADescr* c_dladsc = <SpiceDLADescr *> np.PyArray_DATA(p_dladsc)
+    cdef np.ndarray p_dskdsc = _output(c_out, 3, shape, DSKDSC_DTYPE)
+    cdef SpiceDSKDescr* c_dskdsc = <SpiceDSKDescr *> np.PyArray_DATA(p_dskdsc)
+    cdef np.ndarray p_dc = _output(c_out, 4, shape + (1,), np.double)
+    cdef np.double_t[:, ::1] c_dc = p_dc.reshape(n, 1)
+    cdef np.ndarray p_ic = _output(c_out, 5, shape + (1,), np.int32)
+    cdef np.int32_t[:, ::1] c_ic = p_ic.reshape(n, 1)
+    cdef np.ndarray p_found = _output(c_out, 6, shape, np.bool_)
+    cdef np.uint8_t[::1] c_found = p_found.reshape(n).view(np.uint8)
+    cdef SpiceBoolean c_found_i = SPICEFALSE
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, shape)
+    # main loop
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                dskxsi_c(
+                    pri,
+                    c_target.at(i),
+                    c_nsurf,
+                    c_srflst_p,
+                    c_ets.at(i),
+                    c_fixref.at(i),
+                    c_vertex.at(i),
+                    c_raydir.at(i),
+                    1,
+                    1,
+                    &c_xpt[i, 0],
+                    <SpiceInt *> &c_handle[i],
+                    &c_dladsc[i],
+                    &c_dskdsc[i],
+                    &c_dc[i, 0],
+                    <SpiceInt *> &c_ic[i, 0],
+                    &c_found_i
+                )
+                c_found[i] = c_found_i
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        return c_errors.finish((p_xpt, p_handle, p_dladsc, p_dskdsc, p_dc, p_ic, p_found))
+
+
+def dskxsi(
+    pri: bool,
+    target: str | String_N,
+    srflst: Sequence[int],
+    et: float | Double_N,
+    fixref: str | String_N,
+    vertex: Vector | Vector_N,
+    raydir: Vector | Vector_N
+    ) -> tuple[Vector, int, Record, Record, np.ndarray, np.ndarray, bool] | tuple[Vector_N, Int_N, DLADescr_N, DSKDescr_N, np.ndarray, np.ndarray, Found_N]:
+    """
+    Compute a ray-surface intercept using data provided by
+    multiple loaded DSK segments. Return information about
+    the source of the data defining the surface on which the
+    intercept was found: DSK handle, DLA and DSK descriptors,
+    and DSK data type-dependent parameters.
+
+    https://naif.jpl.nasa.gov/pub/naif/misc/toolkit_docs_N0067/C/cspice/dskxsi_c.html
+
+    :param pri: Data prioritization flag.
+    :param target: Target body name.
+    :param srflst: Surface ID list.
+    :param et: Epoch, expressed as seconds past J2000 TDB.
+    :param fixref: Name of target body-fixed reference frame.
+    :param vertex: Vertex of ray.
+    :param raydir: Direction vector of ray.
+    :return: Intercept point, Handle of segment contributing surface data, DLADSC record, DSKDSC record, Double precision component of source info, Integer component of source info
+    """
+    if (_batched(target, 0) or _batched(et, 0) or _batched(fixref, 0)
+            or _batched(vertex, 1) or _batched(raydir, 1)):
+        return dskxsi_v(pri, target, srflst, et, fixref, vertex, raydir)
+    else:
+        return dskxsi_s(pri, target, srflst, et, fixref, vertex, raydir)
+
+
+@boundscheck(False)
+@wraparound(False)
+def dskxv_v(
+    bint pri,
+    str target,
+    srflst,
+    double et,
+    str fixref,
+    vtxarr,
+    dirarr,
+    *,
+    object out=None,
+    str errors="raise"
+    ) -> tuple[Vector_N, Found_N]:
+    """
+    Vectorized version of :py:meth:`~spiceypy.cyice.cyice.dskxv`
+
+    The ray vertices and directions broadcast against each other following
+    NumPy rules, for example one vertex for the (H, W, 3) directions of the
+    pixels of an image. CSPICE computes all intercepts in one call, contiguous
+    float64 inputs are not copied.
+
+    Compute ray-surface intercepts for a set of rays, using data
+    provided by multiple loaded DSK segments.
+
+    https://naif.jpl.nasa.gov/pub/naif/misc/toolkit_docs_N0067/C/cspice/dskxv_c.html
+
+    :param pri: Data prioritization flag.
+    :param target: Target body name.
+    :param srflst: Surface ID list.
+    :param et: Epoch, expressed as seconds past J2000 TDB.
+    :param fixref: Name of target body-fixed reference frame.
+    :param vtxarr: Array of vertices of rays.
+    :param dirarr: Array of direction vectors of rays.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask". An error
+        fails all rays as they are computed together.
+    :return: Intercept point array and Found flag array.
+    """
+    # broadcast the rays against each other
+    cdef tuple shape = np.broadcast_shapes(_outer_shape(vtxarr), _outer_shape(dirarr))
+    cdef Py_ssize_t i, n = _shape_size(shape)
+    # initialize c variables
+    cdef const np.int32_t[::1] c_srflst = np.ascontiguousarray(srflst, dtype=np.int32).reshape(-1)
+    cdef SpiceInt c_nsurf = c_srflst.shape[0]
+    cdef ConstSpiceInt* c_srflst_p = <ConstSpiceInt *> &c_srflst[0] if c_nsurf else NULL
+    cdef const char* c_target = target
+    cdef const char* c_fixref = fixref
+    cdef const np.double_t[:, ::1] c_vtxarr = _packed(vtxarr, shape, 3, "vtxarr")
+    cdef const np.double_t[:, ::1] c_dirarr = _packed(dirarr, shape, 3, "dirarr")
+    cdef tuple c_out = _check_out(out, 2)
+    # initialize output arrays, CSPICE writes 4 byte found flags
+    cdef np.ndarray p_xptarr = _output(c_out, 0, shape + (3,), np.double)
+    cdef np.double_t[:, ::1] c_xptarr = p_xptarr.reshape(n, 3)
+    cdef np.ndarray p_fndarr = _output(c_out, 1, shape, np.bool_)
+    cdef np.uint8_t[::1] c_fndarr = p_fndarr.reshape(n).view(np.uint8)
+    cdef np.int32_t[::1] c_fnd = np.zeros(n, dtype=np.int32)
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, shape)
+    if n == 0:
+        return c_errors.finish((p_xptarr, p_fndarr))
+    with _cspice:
+        with nogil:
+            dskxv_c(
+                pri,
+                c_target,
+                c_nsurf,
+                c_srflst_p,
+                et,
+                c_fixref,
+                <SpiceInt> n,
+                <ConstSpiceDouble (*)[3]> &c_vtxarr[0, 0],
+                <ConstSpiceDouble (*)[3]> &c_dirarr[0, 0],
+                <SpiceDouble (*)[3]> &c_xptarr[0, 0],
+                <SpiceBoolean *> &c_fnd[0]
+            )
+            c_errors.capture_many(0, n, 1)
+            # CSPICE leaves the intercepts of missed rays unset, zero them
+            for i in range(n):
+                c_fndarr[i] = c_fnd[i] != 0
+                if not c_fndarr[i]:
+                    c_xptarr[i, 0] = c_xptarr[i, 1] = c_xptarr[i, 2] = 0.0
+        c_errors.check(None)
+        return c_errors.finish((p_xptarr, p_fndarr))
+
+
+def dskxv(
+    pri: bool,
+    target: str,
+    srflst: Sequence[int],
+    et: float,
+    fixref: str,
+    vtxarr: Vector_N,
+    dirarr: Vector_N
+    ) -> tuple[Vector_N, Found_N]:
+    """
+    Compute ray-surface intercepts for a set of rays, using data
+    provided by multiple loaded DSK segments.
+
+    https://naif.jpl.nasa.gov/pub/naif/misc/toolkit_docs_N0067/C/cspice/dskxv_c.html
+
+    :param pri: Data prioritization flag.
+    :param target: Target body name.
+    :param srflst: Surface ID list.
+    :param et: Epoch, expressed as seconds past J2000 TDB.
+    :param fixref: Name of target body-fixed reference frame.
+    :param vtxarr: Array of vertices of rays.
+    :param dirarr: Array of direction vectors of rays.
+    :return: Intercept point array and Found flag array.
+    """
+    return dskxv_v(pri, target, srflst, et, fixref, vtxarr, dirarr)
+
+
 # E
 
 
@@ -1431,20 +2929,21 @@ def et2lst_s(
     cdef char[TIMELEN] time
     cdef char[TIMELEN] ampm
     cdef const char* c_typein = typein
-    et2lst_c(
-        c_et,
-        c_body,
-        c_lon,
-        c_typein,
-        TIMELEN,
-        TIMELEN,
-        &c_hr,
-        &c_mn,
-        &c_sc,
-        time,
-        ampm
-    )
-    check_for_spice_error()
+    with _cspice:
+        et2lst_c(
+            c_et,
+            c_body,
+            c_lon,
+            c_typein,
+            TIMELEN,
+            TIMELEN,
+            &c_hr,
+            &c_mn,
+            &c_sc,
+            time,
+            ampm
+        )
+        check_for_spice_error()
     p_time = PyUnicode_DecodeUTF8(time, strlen(time), "strict")
     p_ampm = PyUnicode_DecodeUTF8(ampm, strlen(ampm), "strict")
     return c_hr, c_mn, c_sc, p_time, p_ampm
@@ -1456,7 +2955,9 @@ def et2lst_v(
     double[::1] ets,
     int body,
     double lon,
-    str typein
+    str typein,
+    *,
+    str errors="raise"
     ) -> tuple[Int_N, Int_N, Int_N, String_N, String_N]:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.et2lst`
@@ -1472,6 +2973,7 @@ def et2lst_v(
     :param typein: Type of longitude "PLANETOCENTRIC", etc.
     :param timlen: Available room in output time string.
     :param ampmlen: Available room in output ampm string.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return:
             Local hour on a "24 hour" clock,
             Minutes past the hour,
@@ -1499,29 +3001,33 @@ def et2lst_v(
     cdef np.uint8_t[:, ::1] c_ampms = p_ampms
     cdef char* _c_times = <char*> &c_times[0, 0]
     cdef char* _c_ampms = <char*> &c_ampms[0, 0]
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
     # main loop
-    with nogil:
-        for i in range(n):
-            et2lst_c(
-                c_ets[i],
-                c_body,
-                c_lon,
-                c_typein,
-                TIMELEN,
-                TIMELEN,
-                &c_hrs[i],
-                &c_mns[i],
-                &c_scs[i],
-                _c_times + i*TIMELEN,
-                _c_ampms + i*TIMELEN
-            )
-    check_for_spice_error()
-    # return values
-    py_times = p_times.view(p_np_s_dtype).reshape(n)
-    py_times = np.char.rstrip(py_times).astype(p_np_u_dtype)
-    py_ampms = p_ampms.view(p_np_s_dtype).reshape(n)
-    py_ampms = np.char.rstrip(py_ampms).astype(p_np_u_dtype)
-    return p_hrs, p_mns, p_scs, py_times, py_ampms
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                et2lst_c(
+                    c_ets[i],
+                    c_body,
+                    c_lon,
+                    c_typein,
+                    TIMELEN,
+                    TIMELEN,
+                    &c_hrs[i],
+                    &c_mns[i],
+                    &c_scs[i],
+                    _c_times + i*TIMELEN,
+                    _c_ampms + i*TIMELEN
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        # return values
+        py_times = p_times.view(p_np_s_dtype).reshape(n)
+        py_times = np.char.rstrip(py_times).astype(p_np_u_dtype)
+        py_ampms = p_ampms.view(p_np_s_dtype).reshape(n)
+        py_ampms = np.char.rstrip(py_ampms).astype(p_np_u_dtype)
+        return c_errors.finish((p_hrs, p_mns, p_scs, py_times, py_ampms))
 
 
 def et2lst(
@@ -1578,14 +3084,15 @@ def et2utc_s(
     cdef int c_prec = prec
     cdef char[TIMELEN] c_buffer
     cdef const char* c_format_str = format_str
-    et2utc_c(
-        c_et,
-        c_format_str,
-        c_prec,
-        TIMELEN,
-        &c_buffer[0]
-    )
-    check_for_spice_error()
+    with _cspice:
+        et2utc_c(
+            c_et,
+            c_format_str,
+            c_prec,
+            TIMELEN,
+            &c_buffer[0]
+        )
+        check_for_spice_error()
     return PyUnicode_DecodeUTF8(c_buffer, strlen(c_buffer), "strict")
 
 
@@ -1594,7 +3101,9 @@ def et2utc_s(
 def et2utc_v(
     double[::1] ets,
     str format_str,
-    int prec
+    int prec,
+    *,
+    str errors="raise"
     ) -> String_N:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.et2utc`
@@ -1608,6 +3117,7 @@ def et2utc_v(
     :param format_str: Format of output epoch.
     :param prec: Digits of precision in fractional seconds or days.
     :param lenout: The length of the output string plus 1.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return: Output time string in UTC
     """
     cdef int c_prec = prec
@@ -1621,21 +3131,25 @@ def et2utc_v(
     cdef np.ndarray[np.uint8_t, ndim=2, mode='c'] p_utcstr = np.zeros((n, TIMELEN), dtype=np.uint8, order='C')
     cdef np.uint8_t[:, ::1] c_utcstr = p_utcstr
     cdef char* base = <char*> &c_utcstr[0, 0]
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
     # main loop
-    with nogil:
-        for i in range(n):
-            et2utc_c(
-                c_ets[i],
-                c_format_str,
-                c_prec,
-                TIMELEN,
-                base + i*TIMELEN,
-            )
-    check_for_spice_error()
-    # return values
-    py_utcstr = p_utcstr.view(p_np_s_dtype).reshape(n)
-    py_utcstr = np.char.rstrip(py_utcstr).astype(p_np_u_dtype)
-    return py_utcstr
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                et2utc_c(
+                    c_ets[i],
+                    c_format_str,
+                    c_prec,
+                    TIMELEN,
+                    base + i*TIMELEN,
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        # return values
+        py_utcstr = p_utcstr.view(p_np_s_dtype).reshape(n)
+        py_utcstr = np.char.rstrip(py_utcstr).astype(p_np_u_dtype)
+        return c_errors.finish(py_utcstr)
 
 
 def et2utc(
@@ -1678,12 +3192,13 @@ def etcal_s(
     """
     cdef double c_et = et
     cdef char[TIMELEN] c_buffer
-    etcal_c(
-        c_et,
-        TIMELEN,
-        &c_buffer[0]
-    )
-    check_for_spice_error()
+    with _cspice:
+        etcal_c(
+            c_et,
+            TIMELEN,
+            &c_buffer[0]
+        )
+        check_for_spice_error()
     # Convert the C char* to a Python string
     p_cal = PyUnicode_DecodeUTF8(c_buffer, strlen(c_buffer), "strict")
     return p_cal
@@ -1692,7 +3207,9 @@ def etcal_s(
 @boundscheck(False)
 @wraparound(False)
 def etcal_v(
-    double[::1] ets
+    double[::1] ets,
+    *,
+    str errors="raise"
     ) -> String_N:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.etcal`
@@ -1704,6 +3221,7 @@ def etcal_v(
     https://naif.jpl.nasa.gov/pub/naif/misc/toolkit_docs_N0067/C/cspice/etcal_c.html
 
     :param ets: Ephemeris times measured in seconds past J2000 TDB.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return: A standard calendar representation of et.
     """
     cdef const np.double_t[::1] c_ets = np.ascontiguousarray(ets, dtype=np.double)
@@ -1714,18 +3232,22 @@ def etcal_v(
     cdef np.ndarray[np.uint8_t, ndim=2, mode='c'] p_results = np.empty((n, 25), dtype=np.uint8, order='C')
     cdef np.uint8_t[:, ::1] c_results = p_results
     cdef char* base = <char*> &c_results[0, 0]
-    with nogil:
-        for i in range(n):
-            etcal_c(
-                c_ets[i],
-                25,
-                base + i*25
-            )
-    check_for_spice_error()
-    # return values
-    py_results = p_results.view(p_np_s_dtype).reshape(n)
-    py_results = np.char.rstrip(py_results).astype(p_np_u_dtype)
-    return py_results
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                etcal_c(
+                    c_ets[i],
+                    25,
+                    base + i*25
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        # return values
+        py_results = p_results.view(p_np_s_dtype).reshape(n)
+        py_results = np.char.rstrip(py_results).astype(p_np_u_dtype)
+        return c_errors.finish(py_results)
 
 
 def etcal(
@@ -1774,12 +3296,13 @@ cpdef np.ndarray[np.double_t, ndim=1, mode='c'] evsgp4_s(
     cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_state = np.empty(6, dtype=np.double, order='C')
     cdef np.double_t[::1] c_state = p_state
     # call 
-    evsgp4_c(
-        et,
-        &c_geophs[0],
-        &c_elems[0],
-        &c_state[0]
-    )
+    with _cspice:
+        evsgp4_c(
+            et,
+            &c_geophs[0],
+            &c_elems[0],
+            &c_state[0]
+        )
     # return state
     return p_state
 
@@ -1789,7 +3312,8 @@ cpdef np.ndarray[np.double_t, ndim=1, mode='c'] evsgp4_s(
 cpdef np.ndarray[np.double_t, ndim=2, mode='c'] evsgp4_v(
     double[::1] ets,
     double[::1] geophs,
-    double[:,::1] elems
+    double[:,::1] elems,
+    object out=None
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.evsgp4`
@@ -1805,6 +3329,7 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] evsgp4_v(
     :param ets: Epochs in seconds past ephemeris epoch J2000.
     :param geophs: Geophysical constants
     :param elems: Two-line element data
+    :param out: Optional preallocated output arrays, one per returned array.
     :return: Evaluated state
     """
     cdef const np.double_t[::1] c_ets = np.ascontiguousarray(ets, dtype=np.double)
@@ -1812,19 +3337,21 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] evsgp4_v(
     cdef const np.double_t[::1] c_geophs = np.ascontiguousarray(geophs, dtype=np.double)
     cdef const double* c_geophs_ptr = &c_geophs[0]
     cdef const np.double_t[:,::1] c_elems  = np.ascontiguousarray(elems, dtype=np.double)
+    cdef tuple c_out = _check_out(out, 1)
     # initialize output arrays
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_states = np.empty((n,6), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_states = _output(c_out, 0, (n, 6), np.double)
     cdef np.double_t[:,::1] c_states = p_states
     # call 
     _check_same_len(n, c_elems.shape[0], "ets", "elems")
-    with nogil:
-        for i in range(n):
-            evsgp4_c(
-                c_ets[i],
-                c_geophs_ptr,
-                &c_elems[i, 0],
-                &c_states[i, 0]
-            )
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                evsgp4_c(
+                    c_ets[i],
+                    c_geophs_ptr,
+                    &c_elems[i, 0],
+                    &c_states[i, 0]
+                )
     # return states
     return p_states
 
@@ -1862,7 +3389,8 @@ cpdef SpiceBoolean failed() noexcept:
 
     :return: a boolean
     """
-    return failed_c()
+    with _cspice:
+        return failed_c()
 
 
 @boundscheck(False)
@@ -1900,16 +3428,17 @@ def fovray_s(
     cdef const char* c_abcorr   = abcorr
     cdef const char* c_observer = observer
     # perform the call
-    fovray_c(
-        c_inst,
-        &raydir[0],
-        c_rframe,
-        c_abcorr,
-        c_observer,
-        &c_et,
-        <SpiceBoolean *> &c_visibl
-    )
-    check_for_spice_error()
+    with _cspice:
+        fovray_c(
+            c_inst,
+            &raydir[0],
+            c_rframe,
+            c_abcorr,
+            c_observer,
+            &c_et,
+            <SpiceBoolean *> &c_visibl
+        )
+        check_for_spice_error()
     # return
     return PyBool_FromLong(c_visibl)
 
@@ -1922,7 +3451,10 @@ def fovray_v(
     str rframe,
     str abcorr,
     str observer,
-    double[::1] ets
+    double[::1] ets,
+    *,
+    object out=None,
+    str errors="raise"
 ) -> BoolArray:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.fovray`
@@ -1938,6 +3470,8 @@ def fovray_v(
     :param abcorr: Aberration correction flag.
     :param observer: Name or ID code string of the observer.
     :param ets: Times of the observation (seconds past J2000).
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return: Visibility flags
     """
     # initialize c variables
@@ -1948,24 +3482,31 @@ def fovray_v(
     cdef const char* c_rframe   = rframe
     cdef const char* c_abcorr   = abcorr
     cdef const char* c_observer = observer
+    cdef tuple c_out = _check_out(out, 1)
     # initialize output arrays
-    cdef np.ndarray[np.int32_t, ndim=1, mode='c'] p_visibl = np.empty(n, dtype=np.int32, order='C')
-    cdef np.int32_t[::1] c_visibl = p_visibl
+    cdef np.ndarray p_visibl = _output(c_out, 0, (n,), np.bool_)
+    cdef np.uint8_t[::1] c_visibl = p_visibl.view(np.uint8)
+    cdef SpiceBoolean c_visibl_i = 0
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
     # perform the call
-    with nogil:
-        for i in range(n):
-            fovray_c(
-                c_inst,
-                &raydir[0],
-                c_rframe,
-                c_abcorr,
-                c_observer,
-                <SpiceDouble *> &c_ets[i],  # I got a warning converting const double * to SpiceDouble related to discard qualifiers without the cast here
-                <SpiceBoolean *> &c_visibl[i]
-            )
-    check_for_spice_error()
-    # return
-    return p_visibl.astype(np.bool_)
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                fovray_c(
+                    c_inst,
+                    &raydir[0],
+                    c_rframe,
+                    c_abcorr,
+                    c_observer,
+                    <SpiceDouble *> &c_ets[i],  # I got a warning converting const double * to SpiceDouble related to discard qualifiers without the cast here
+                    &c_visibl_i
+                )
+                c_visibl[i] = c_visibl_i
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        # return
+        return c_errors.finish(p_visibl)
 
 
 def fovray(
@@ -2033,17 +3574,18 @@ def fovtrg_s(
     cdef const char* c_abcorr   = abcorr
     cdef const char* c_observer = observer
     # perform the call
-    fovtrg_c(
-        c_inst,
-        c_target,
-        c_tshape,
-        c_tframe,
-        c_abcorr,
-        c_observer,
-        &c_et,
-        <SpiceBoolean *> &c_visibl
-    )
-    check_for_spice_error()
+    with _cspice:
+        fovtrg_c(
+            c_inst,
+            c_target,
+            c_tshape,
+            c_tframe,
+            c_abcorr,
+            c_observer,
+            &c_et,
+            <SpiceBoolean *> &c_visibl
+        )
+        check_for_spice_error()
     # return
     return PyBool_FromLong(c_visibl)
 
@@ -2057,7 +3599,10 @@ def fovtrg_v(
     str tframe,
     str abcorr,
     str observer,
-    np.double_t[::1] ets
+    np.double_t[::1] ets,
+    *,
+    object out=None,
+    str errors="raise"
     ) -> BoolArray:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.fovtrg`
@@ -2074,6 +3619,8 @@ def fovtrg_v(
     :param abcorr: Aberration correction flag.
     :param observer: Name or ID code string of the observer.
     :param ets: Times of the observation (seconds past J2000).
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return: Visibility flags
     """
     # initialize c variables
@@ -2086,25 +3633,32 @@ def fovtrg_v(
     cdef const char* c_tframe   = tframe
     cdef const char* c_abcorr   = abcorr
     cdef const char* c_observer = observer
+    cdef tuple c_out = _check_out(out, 1)
     # initialize output arrays
-    cdef np.ndarray[np.int32_t, ndim=1, mode='c'] p_visibl = np.empty(n, dtype=np.int32, order='C')
-    cdef np.int32_t[::1] c_visibl = p_visibl
+    cdef np.ndarray p_visibl = _output(c_out, 0, (n,), np.bool_)
+    cdef np.uint8_t[::1] c_visibl = p_visibl.view(np.uint8)
+    cdef SpiceBoolean c_visibl_i = 0
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
     # perform the call
-    with nogil:
-        for i in range(n):
-            fovtrg_c(
-                c_inst,
-                c_target,
-                c_tshape,
-                c_tframe,
-                c_abcorr,
-                c_observer,
-                <SpiceDouble *> &c_ets[i],  # I got a warning converting const double * to SpiceDouble related to discard qualifiers without the cast here
-                <SpiceBoolean *> &c_visibl[i]
-            )
-    check_for_spice_error()
-    # return
-    return p_visibl.astype(np.bool_)
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                fovtrg_c(
+                    c_inst,
+                    c_target,
+                    c_tshape,
+                    c_tframe,
+                    c_abcorr,
+                    c_observer,
+                    <SpiceDouble *> &c_ets[i],  # I got a warning converting const double * to SpiceDouble related to discard qualifiers without the cast here
+                    &c_visibl_i
+                )
+                c_visibl[i] = c_visibl_i
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        # return
+        return c_errors.finish(p_visibl)
 
 
 def fovtrg(
@@ -2150,8 +3704,9 @@ def furnsh(
     cdef const char* c_path = path
     if c_path == NULL:
         raise UnicodeError("Failed to encode file path in furnsh")
-    furnsh_c(c_path)
-    check_for_spice_error()
+    with _cspice:
+        furnsh_c(c_path)
+        check_for_spice_error()
 
 
 # G
@@ -2179,14 +3734,15 @@ cpdef np.ndarray[np.double_t, ndim=1, mode='c'] georec_s(
     """
     cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_rec = np.empty(3, dtype=np.double, order='C')
     cdef np.double_t[::1] c_rec = p_rec
-    georec_c(
-        lon,
-        lat,
-        alt,
-        re,
-        f,
-        &c_rec[0]
-    )
+    with _cspice:
+        georec_c(
+            lon,
+            lat,
+            alt,
+            re,
+            f,
+            &c_rec[0]
+        )
     return p_rec
 
 
@@ -2198,6 +3754,7 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] georec_v(
     const double[::1] alt,
     double re,
     double f,
+    object out=None
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.georec`
@@ -2211,28 +3768,31 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] georec_v(
     :param alt: Altitude of point above the reference spheroid.
     :param re: Equatorial radius of the reference spheroid.
     :param f: Flattening coefficient.
+    :param out: Optional preallocated output arrays, one per returned array.
     :return: Rectangular coordinates of point.
     """
     cdef const np.double_t[::1] c_lon = np.ascontiguousarray(lon, dtype=np.double)
     cdef Py_ssize_t i, n = c_lon.shape[0]
     cdef const np.double_t[::1] c_lat = np.ascontiguousarray(lat, dtype=np.double)
     cdef const np.double_t[::1] c_alt = np.ascontiguousarray(alt, dtype=np.double)
+    cdef tuple c_out = _check_out(out, 1)
     # allocate output array
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_rec = np.empty((n,3), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_rec = _output(c_out, 0, (n, 3), np.double)
     cdef np.double_t[:,::1] c_rec = p_rec
     # TODO fix strides lookups below
     _check_same_len(n, c_lat.shape[0], "lon", "lat")
     _check_same_len(n, c_alt.shape[0], "lon", "alt")
-    with nogil:
-        for i in range(n):
-            georec_c(
-                c_lon[i],
-                c_lat[i],
-                c_alt[i],
-                re,
-                f,  
-                &c_rec[i, 0]
-            )
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                georec_c(
+                    c_lon[i],
+                    c_lat[i],
+                    c_alt[i],
+                    re,
+                    f,  
+                    &c_rec[i, 0]
+                )
     return p_rec
 
 
@@ -2288,14 +3848,15 @@ cpdef tuple[float, np.ndarray] getelm_s(
     cdef const char[:,::1] c_lines = make_char_array(lines, TLELEN)
     cdef const char* c_lines_ptr = &c_lines[0,0]
     # now call getelm
-    getelm_c(
-        frstyr,
-        TLELEN,
-        c_lines_ptr,
-        &c_epoch,
-        &c_elems[0]
-    )
-    check_for_spice_error()
+    with _cspice:
+        getelm_c(
+            frstyr,
+            TLELEN,
+            c_lines_ptr,
+            &c_epoch,
+            &c_elems[0]
+        )
+        check_for_spice_error()
     return c_epoch, p_elems
 
 
@@ -2303,7 +3864,9 @@ cpdef tuple[float, np.ndarray] getelm_s(
 @wraparound(False)
 cpdef tuple[np.ndarray, np.ndarray] getelm_v(
     int[::1] frstyr,  
-    np.ndarray lines
+    np.ndarray lines,
+    str errors="raise",
+    object out=None
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.getelm`
@@ -2316,6 +3879,8 @@ cpdef tuple[np.ndarray, np.ndarray] getelm_v(
 
     :param frstyr: Year of earliest representable two-line elements.
     :param lines: A array of pairs of "lines" containing two-line elements, shape is (2*n_pairs,70).
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return:
             The epoch of the elements in seconds past J2000,
             The elements converted to SPICE units (see naif docs for units).
@@ -2323,26 +3888,31 @@ cpdef tuple[np.ndarray, np.ndarray] getelm_v(
     # allocate outputs
     cdef const np.uint32_t[::1] c_frstyr = np.ascontiguousarray(frstyr, dtype=np.uint32)
     cdef Py_ssize_t i, n = c_frstyr.shape[0]
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_epochs = np.empty(n, dtype=np.double, order='C')
+    cdef tuple c_out = _check_out(out, 2)
+    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_epochs = _output(c_out, 0, (n,), np.double)
     cdef np.double_t[::1] c_epochs = p_epochs
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_elems = np.empty((n,10), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_elems = _output(c_out, 1, (n, 10), np.double)
     cdef np.double_t[:,::1] c_elems = p_elems
     # get the char memory view
     cdef char[:,::1] c_lines 
     cdef char* c_lines_ptr 
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
     # now call getelm in loop
-    for i in range(n):
-        c_lines = make_char_array(lines[i], TLELEN)
-        c_lines_ptr = &c_lines[0, 0]
-        getelm_c(
-            c_frstyr[i],
-            TLELEN,
-            c_lines_ptr,
-            &c_epochs[i],
-            &c_elems[i, 0]
-        )
-    check_for_spice_error()
-    return p_epochs, p_elems
+    with _cspice:
+        for i in range(n):
+            c_lines = make_char_array(lines[i], TLELEN)
+            c_lines_ptr = &c_lines[0, 0]
+            getelm_c(
+                c_frstyr[i],
+                TLELEN,
+                c_lines_ptr,
+                &c_epochs[i],
+                &c_elems[i, 0]
+            )
+            if c_errors.capture(i):
+                break
+        c_errors.check(None)
+        return c_errors.finish((p_epochs, p_elems))
 
 
 def getelm(
@@ -2392,17 +3962,18 @@ cpdef str getmsg(
     cdef char* c_msgstr = <char*> malloc((lenout) * sizeof(char))
     if c_msgstr == NULL:
         raise MemoryError("Unable to allocate memory for traceback string in getmsg.")
-    try:
-        getmsg_c(
-            c_option,
-            c_lenout,
-            c_msgstr
-        )
-        length = strlen(c_msgstr)
-        p_msgstr = PyUnicode_DecodeUTF8(c_msgstr, length, "replace")
-        return p_msgstr
-    finally:
-        free(c_msgstr)
+    with _cspice:
+        try:
+            getmsg_c(
+                c_option,
+                c_lenout,
+                c_msgstr
+            )
+            length = strlen(c_msgstr)
+            p_msgstr = PyUnicode_DecodeUTF8(c_msgstr, length, "replace")
+            return p_msgstr
+        finally:
+            free(c_msgstr)
 
 # H
 
@@ -2475,42 +4046,48 @@ cpdef tuple[float, np.ndarray, float, float, float, bool, bool] illumf_s(
     cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_srfvec = np.empty(3, dtype=np.double, order='C')
     cdef np.double_t[::1] c_srfvec = p_srfvec
     # make the call
-    illumf_c(
-        method, 
-        target,
-        ilusrc,
-        et,
-        fixref,
-        abcorr,
-        obsrvr,
-        &c_spoint[0],
-        &trgepc,
-        &c_srfvec[0],
-        &phase,
-        &incdnc,
-        &emissn,
-        <SpiceBoolean *> &c_visibl,
-        <SpiceBoolean *> &c_lit
-    )
-    check_for_spice_error()
+    with _cspice:
+        illumf_c(
+            method, 
+            target,
+            ilusrc,
+            et,
+            fixref,
+            abcorr,
+            obsrvr,
+            &c_spoint[0],
+            &trgepc,
+            &c_srfvec[0],
+            &phase,
+            &incdnc,
+            &emissn,
+            <SpiceBoolean *> &c_visibl,
+            <SpiceBoolean *> &c_lit
+        )
+        check_for_spice_error()
     return trgepc, p_srfvec, phase, incdnc, emissn, PyBool_FromLong(c_visibl), PyBool_FromLong(c_lit) 
 
 
 @boundscheck(False)
 @wraparound(False)
-cpdef tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray] illumf_v(
-    const char* method,
-    const char* target,
-    const char* ilusrc,
-    double[::1] ets,
-    const char* fixref,
-    const char* abcorr,
-    const char* obsrvr,
-    double[:,::1] spoints,
+cpdef tuple illumf_v(
+    method,
+    target,
+    ilusrc,
+    ets,
+    fixref,
+    abcorr,
+    obsrvr,
+    spoints,
+    str errors="raise",
+    object out=None
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.illumf`
 
+    All arguments except the output and error options broadcast against each other
+    following NumPy rules, string arguments may be arrays of names.
+
     Compute the illumination angles---phase, incidence, and
     emission---at a specified point on a target body. Return logical
     flags indicating whether the surface point is visible from
@@ -2532,6 +4109,8 @@ cpdef tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarr
     :param abcorr: Desired aberration correction.
     :param obsrvr: Name of observing body.
     :param spoints: Body-fixed coordinates of target surface points.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return: 
         Target surface point epoch in seconds past J2000 TDB, 
         Vector from observer to target surface point in km,
@@ -2541,51 +4120,69 @@ cpdef tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarr
         Visibility flag, 
         Illumination flag
     """
-    cdef const np.double_t[::1] c_ets = np.ascontiguousarray(ets, dtype=np.double)
-    cdef const np.double_t[:,::1] c_spoints = np.ascontiguousarray(spoints, dtype=np.double)
-    cdef Py_ssize_t i, j, n, m = 0
-    n = c_ets.shape[0]
-    m = c_spoints.shape[0]
-    cdef double c_et_r = 0.0
-    #allocate outputs
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_trgepc = np.empty((n,m), dtype=np.double, order='C')
-    cdef np.double_t[:,::1] c_trgepc = p_trgepc
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_phase  = np.empty((n,m), dtype=np.double, order='C')
-    cdef np.double_t[:,::1] c_phase = p_phase
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_incdnc = np.empty((n,m), dtype=np.double, order='C')
-    cdef np.double_t[:,::1] c_incdnc = p_incdnc
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_emissn = np.empty((n,m), dtype=np.double, order='C')
-    cdef np.double_t[:,::1] c_emissn = p_emissn
-    cdef np.ndarray[np.int32_t, ndim=2, mode='c'] p_visibl = np.empty((n,m), dtype=np.int32, order='C')
-    cdef np.int32_t[:,::1] c_visibl = p_visibl
-    cdef np.ndarray[np.int32_t, ndim=2, mode='c'] p_lit    = np.empty((n,m), dtype=np.int32, order='C')
-    cdef np.int32_t[:,::1] c_lit = p_lit
-    cdef np.ndarray[np.double_t, ndim=3, mode='c'] p_srfvec = np.empty((n,m,3), dtype=np.double, order='C')
-    cdef np.double_t[:,:,::1] c_srfvec = p_srfvec
-    # make the call
-    with nogil:
-        for i in range(n):
-            c_et_r = c_ets[i]
-            for j in range(m):
+    # broadcast the arguments against each other
+    cdef tuple epoch_shape = np.broadcast_shapes(
+        np.shape(method), np.shape(target), np.shape(ilusrc), np.shape(ets), np.shape(fixref), np.shape(abcorr), np.shape(obsrvr)
+    )
+    # the surface points form the innermost axes of the result
+    cdef tuple point_shape = _outer_shape(spoints)
+    cdef tuple shape = epoch_shape + point_shape
+    cdef Py_ssize_t t = len(point_shape)
+    cdef Py_ssize_t i, n = _shape_size(shape)
+    # initialize c variables
+    cdef _StrArg c_method  = _StrArg(method, shape, t)
+    cdef _StrArg c_target  = _StrArg(target, shape, t)
+    cdef _StrArg c_ilusrc  = _StrArg(ilusrc, shape, t)
+    cdef _DblArg c_ets     = _DblArg(ets, shape, t)
+    cdef _StrArg c_fixref  = _StrArg(fixref, shape, t)
+    cdef _StrArg c_abcorr  = _StrArg(abcorr, shape, t)
+    cdef _StrArg c_obsrvr  = _StrArg(obsrvr, shape, t)
+    cdef _VecArg c_spoints = _VecArg(spoints, shape, 3)
+    cdef tuple c_out = _check_out(out, 7)
+    # initialize output arrays
+    cdef np.ndarray p_trgepc = _output(c_out, 0, shape, np.double)
+    cdef np.double_t[::1] c_trgepc = p_trgepc.reshape(n)
+    cdef np.ndarray p_srfvec = _output(c_out, 1, shape + (3,), np.double)
+    cdef np.double_t[:, ::1] c_srfvec = p_srfvec.reshape(n, 3)
+    cdef np.ndarray p_phase = _output(c_out, 2, shape, np.double)
+    cdef np.double_t[::1] c_phase = p_phase.reshape(n)
+    cdef np.ndarray p_incdnc = _output(c_out, 3, shape, np.double)
+    cdef np.double_t[::1] c_incdnc = p_incdnc.reshape(n)
+    cdef np.ndarray p_emissn = _output(c_out, 4, shape, np.double)
+    cdef np.double_t[::1] c_emissn = p_emissn.reshape(n)
+    cdef np.ndarray p_visibl = _output(c_out, 5, shape, np.bool_)
+    cdef np.uint8_t[::1] c_visibl = p_visibl.reshape(n).view(np.uint8)
+    cdef np.ndarray p_lit = _output(c_out, 6, shape, np.bool_)
+    cdef np.uint8_t[::1] c_lit = p_lit.reshape(n).view(np.uint8)
+    cdef SpiceBoolean c_visibl_i = 0, c_lit_i = 0
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, shape)
+    # main loop
+    with _cspice:
+        with nogil:
+            for i in range(n):
                 illumf_c(
-                    method, 
-                    target,
-                    ilusrc,
-                    c_et_r,
-                    fixref,
-                    abcorr,
-                    obsrvr,
-                    &c_spoints[j,0],
-                    &c_trgepc[i,j],
-                    &c_srfvec[i,j,0],
-                    &c_phase[i,j],
-                    &c_incdnc[i,j],
-                    &c_emissn[i,j],
-                    <SpiceBoolean *> &c_visibl[i,j],
-                    <SpiceBoolean *> &c_lit[i,j]
+                    c_method.at(i),
+                    c_target.at(i),
+                    c_ilusrc.at(i),
+                    c_ets.at(i),
+                    c_fixref.at(i),
+                    c_abcorr.at(i),
+                    c_obsrvr.at(i),
+                    c_spoints.at(i),
+                    &c_trgepc[i],
+                    &c_srfvec[i, 0],
+                    &c_phase[i],
+                    &c_incdnc[i],
+                    &c_emissn[i],
+                    &c_visibl_i,
+                    &c_lit_i
                 )
-    check_for_spice_error()
-    return p_trgepc, p_srfvec, p_phase, p_incdnc, p_emissn, p_visibl.astype(np.bool_), p_lit.astype(np.bool_) 
+                c_visibl[i] = c_visibl_i
+                c_lit[i] = c_lit_i
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        return c_errors.finish((p_trgepc, p_srfvec, p_phase, p_incdnc, p_emissn, p_visibl, p_lit))
 
 
 def illumf(
@@ -2686,40 +4283,46 @@ cpdef tuple[float, np.ndarray, float, float, float] illumg_s(
     cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_srfvec = np.empty(3, dtype=np.double, order='C')
     cdef np.double_t[::1] c_srfvec = p_srfvec
     # make the call
-    illumg_c(
-        method, 
-        target,
-        ilusrc,
-        et,
-        fixref,
-        abcorr,
-        obsrvr,
-        &c_spoint[0],
-        &trgepc,
-        &c_srfvec[0],
-        &phase,
-        &incdnc,
-        &emissn
-    )
-    check_for_spice_error()
+    with _cspice:
+        illumg_c(
+            method, 
+            target,
+            ilusrc,
+            et,
+            fixref,
+            abcorr,
+            obsrvr,
+            &c_spoint[0],
+            &trgepc,
+            &c_srfvec[0],
+            &phase,
+            &incdnc,
+            &emissn
+        )
+        check_for_spice_error()
     return trgepc, p_srfvec, phase, incdnc, emissn 
 
 
 @boundscheck(False)
 @wraparound(False)
-cpdef tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray] illumg_v(
-    const char* method,
-    const char* target,
-    const char* ilusrc,
-    double[::1] ets,
-    const char* fixref,
-    const char* abcorr,
-    const char* obsrvr,
-    double[:,::1] spoint,
+cpdef tuple illumg_v(
+    method,
+    target,
+    ilusrc,
+    ets,
+    fixref,
+    abcorr,
+    obsrvr,
+    spoint,
+    str errors="raise",
+    object out=None
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.illumg`
 
+    All arguments except the output and error options broadcast against each other
+    following NumPy rules, string arguments may be arrays of names.
+
     Find the illumination angles (phase, incidence, and
     emission) at a specified surface point of a target body.
 
@@ -2739,6 +4342,8 @@ cpdef tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray] illumg_v
     :param abcorr: Desired aberration correction.
     :param obsrvr: Name of observing body.
     :param spoint: Body-fixed coordinates of a target surface point.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return: 
         Target surface point epoch in seconds past J2000 TDB, 
         Vector from observer to target surface point in km,
@@ -2746,45 +4351,60 @@ cpdef tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray] illumg_v
         Source incidence angle at the surface point in radians, 
         Emission angle at the surface point in radians,
     """
-    cdef const np.double_t[::1] c_ets = np.ascontiguousarray(ets, dtype=np.double)
-    cdef const np.double_t[:,::1] c_spoint = np.ascontiguousarray(spoint, dtype=np.double)
-    cdef Py_ssize_t i, j, n, m = 0
-    n = c_ets.shape[0]
-    m = c_spoint.shape[0]
-    cdef double c_et_r = 0.0
-    #allocate outputs
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_trgepc = np.empty((n,m), dtype=np.double, order='C')
-    cdef np.double_t[:,::1] c_trgepc = p_trgepc
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_phase  = np.empty((n,m), dtype=np.double, order='C')
-    cdef np.double_t[:,::1] c_phase = p_phase
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_incdnc = np.empty((n,m), dtype=np.double, order='C')
-    cdef np.double_t[:,::1] c_incdnc = p_incdnc
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_emissn = np.empty((n,m), dtype=np.double, order='C')
-    cdef np.double_t[:,::1] c_emissn = p_emissn
-    cdef np.ndarray[np.double_t, ndim=3, mode='c'] p_srfvec = np.empty((n,m,3), dtype=np.double, order='C')
-    cdef np.double_t[:,:,::1] c_srfvec = p_srfvec
-    # make the call
-    with nogil:
-        for i in range(n):
-            c_et_r = c_ets[i]
-            for j in range(m):
+    # broadcast the arguments against each other
+    cdef tuple epoch_shape = np.broadcast_shapes(
+        np.shape(method), np.shape(target), np.shape(ilusrc), np.shape(ets), np.shape(fixref), np.shape(abcorr), np.shape(obsrvr)
+    )
+    # the surface points form the innermost axes of the result
+    cdef tuple point_shape = _outer_shape(spoint)
+    cdef tuple shape = epoch_shape + point_shape
+    cdef Py_ssize_t t = len(point_shape)
+    cdef Py_ssize_t i, n = _shape_size(shape)
+    # initialize c variables
+    cdef _StrArg c_method = _StrArg(method, shape, t)
+    cdef _StrArg c_target = _StrArg(target, shape, t)
+    cdef _StrArg c_ilusrc = _StrArg(ilusrc, shape, t)
+    cdef _DblArg c_ets    = _DblArg(ets, shape, t)
+    cdef _StrArg c_fixref = _StrArg(fixref, shape, t)
+    cdef _StrArg c_abcorr = _StrArg(abcorr, shape, t)
+    cdef _StrArg c_obsrvr = _StrArg(obsrvr, shape, t)
+    cdef _VecArg c_spoint = _VecArg(spoint, shape, 3)
+    cdef tuple c_out = _check_out(out, 5)
+    # initialize output arrays
+    cdef np.ndarray p_trgepc = _output(c_out, 0, shape, np.double)
+    cdef np.double_t[::1] c_trgepc = p_trgepc.reshape(n)
+    cdef np.ndarray p_srfvec = _output(c_out, 1, shape + (3,), np.double)
+    cdef np.double_t[:, ::1] c_srfvec = p_srfvec.reshape(n, 3)
+    cdef np.ndarray p_phase = _output(c_out, 2, shape, np.double)
+    cdef np.double_t[::1] c_phase = p_phase.reshape(n)
+    cdef np.ndarray p_incdnc = _output(c_out, 3, shape, np.double)
+    cdef np.double_t[::1] c_incdnc = p_incdnc.reshape(n)
+    cdef np.ndarray p_emissn = _output(c_out, 4, shape, np.double)
+    cdef np.double_t[::1] c_emissn = p_emissn.reshape(n)
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, shape)
+    # main loop
+    with _cspice:
+        with nogil:
+            for i in range(n):
                 illumg_c(
-                    method, 
-                    target,
-                    ilusrc,
-                    c_et_r,
-                    fixref,
-                    abcorr,
-                    obsrvr,
-                    &c_spoint[j,0],
-                    &c_trgepc[i,j],
-                    &c_srfvec[i,j,0],
-                    &c_phase[i,j],
-                    &c_incdnc[i,j],
-                    &c_emissn[i,j]
+                    c_method.at(i),
+                    c_target.at(i),
+                    c_ilusrc.at(i),
+                    c_ets.at(i),
+                    c_fixref.at(i),
+                    c_abcorr.at(i),
+                    c_obsrvr.at(i),
+                    c_spoint.at(i),
+                    &c_trgepc[i],
+                    &c_srfvec[i, 0],
+                    &c_phase[i],
+                    &c_incdnc[i],
+                    &c_emissn[i]
                 )
-    check_for_spice_error()
-    return p_trgepc, p_srfvec, p_phase, p_incdnc, p_emissn 
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        return c_errors.finish((p_trgepc, p_srfvec, p_phase, p_incdnc, p_emissn))
 
 
 def illumg(
@@ -2871,38 +4491,44 @@ cpdef tuple[float, np.ndarray, float, float, float] ilumin_s(
     cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_srfvec = np.empty(3, dtype=np.double, order='C')
     cdef np.double_t[::1] c_srfvec = p_srfvec
     # make the call
-    ilumin_c(
-        method, 
-        target,
-        et,
-        fixref,
-        abcorr,
-        obsrvr,
-        &c_spoint[0],
-        &trgepc,
-        &c_srfvec[0],
-        &phase,
-        &incdnc,
-        &emissn
-    )
-    check_for_spice_error()
+    with _cspice:
+        ilumin_c(
+            method, 
+            target,
+            et,
+            fixref,
+            abcorr,
+            obsrvr,
+            &c_spoint[0],
+            &trgepc,
+            &c_srfvec[0],
+            &phase,
+            &incdnc,
+            &emissn
+        )
+        check_for_spice_error()
     return trgepc, p_srfvec, phase, incdnc, emissn 
 
 
 @boundscheck(False)
 @wraparound(False)
-cpdef tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray] ilumin_v(
-    const char* method,
-    const char* target,
-    double[::1] ets,
-    const char* fixref,
-    const char* abcorr,
-    const char* obsrvr,
-    double[:,::1] spoint,
+cpdef tuple ilumin_v(
+    method,
+    target,
+    ets,
+    fixref,
+    abcorr,
+    obsrvr,
+    spoint,
+    str errors="raise",
+    object out=None
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.ilumin`
 
+    All arguments except the output and error options broadcast against each other
+    following NumPy rules, string arguments may be arrays of names.
+
     Find the illumination angles (phase, solar incidence, and
     emission) at a specified surface point of a target body.
 
@@ -2917,48 +4543,64 @@ cpdef tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray] ilumin_v
     :param abcorr: Desired aberration correction.
     :param obsrvr: Name of observing body.
     :param spoint: Body-fixed coordinates of a target surface point.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return: Target surface point epoch, Vector from observer to target
      surface point, Phase angle, Solar incidence angle, and Emission
      angle at the surface point.
     """
-    cdef const np.double_t[::1] c_ets = np.ascontiguousarray(ets, dtype=np.double)
-    cdef const np.double_t[:,::1] c_spoint = np.ascontiguousarray(spoint, dtype=np.double)
-    cdef Py_ssize_t i, j, n, m = 0
-    n = c_ets.shape[0]
-    m = c_spoint.shape[0]
-    cdef double c_et_r = 0.0
-    #allocate outputs
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_trgepc = np.empty((n,m), dtype=np.double, order='C')
-    cdef np.double_t[:,::1] c_trgepc = p_trgepc
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_phase  = np.empty((n,m), dtype=np.double, order='C')
-    cdef np.double_t[:,::1] c_phase = p_phase
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_incdnc = np.empty((n,m), dtype=np.double, order='C')
-    cdef np.double_t[:,::1] c_incdnc = p_incdnc
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_emissn = np.empty((n,m), dtype=np.double, order='C')
-    cdef np.double_t[:,::1] c_emissn = p_emissn
-    cdef np.ndarray[np.double_t, ndim=3, mode='c'] p_srfvec = np.empty((n,m,3), dtype=np.double, order='C')
-    cdef np.double_t[:,:,::1] c_srfvec = p_srfvec
-    # make the call
-    with nogil:
-        for i in range(n):
-            c_et_r = c_ets[i]
-            for j in range(m):
+    # broadcast the arguments against each other
+    cdef tuple epoch_shape = np.broadcast_shapes(
+        np.shape(method), np.shape(target), np.shape(ets), np.shape(fixref), np.shape(abcorr), np.shape(obsrvr)
+    )
+    # the surface points form the innermost axes of the result
+    cdef tuple point_shape = _outer_shape(spoint)
+    cdef tuple shape = epoch_shape + point_shape
+    cdef Py_ssize_t t = len(point_shape)
+    cdef Py_ssize_t i, n = _shape_size(shape)
+    # initialize c variables
+    cdef _StrArg c_method = _StrArg(method, shape, t)
+    cdef _StrArg c_target = _StrArg(target, shape, t)
+    cdef _DblArg c_ets    = _DblArg(ets, shape, t)
+    cdef _StrArg c_fixref = _StrArg(fixref, shape, t)
+    cdef _StrArg c_abcorr = _StrArg(abcorr, shape, t)
+    cdef _StrArg c_obsrvr = _StrArg(obsrvr, shape, t)
+    cdef _VecArg c_spoint = _VecArg(spoint, shape, 3)
+    cdef tuple c_out = _check_out(out, 5)
+    # initialize output arrays
+    cdef np.ndarray p_trgepc = _output(c_out, 0, shape, np.double)
+    cdef np.double_t[::1] c_trgepc = p_trgepc.reshape(n)
+    cdef np.ndarray p_srfvec = _output(c_out, 1, shape + (3,), np.double)
+    cdef np.double_t[:, ::1] c_srfvec = p_srfvec.reshape(n, 3)
+    cdef np.ndarray p_phase = _output(c_out, 2, shape, np.double)
+    cdef np.double_t[::1] c_phase = p_phase.reshape(n)
+    cdef np.ndarray p_incdnc = _output(c_out, 3, shape, np.double)
+    cdef np.double_t[::1] c_incdnc = p_incdnc.reshape(n)
+    cdef np.ndarray p_emissn = _output(c_out, 4, shape, np.double)
+    cdef np.double_t[::1] c_emissn = p_emissn.reshape(n)
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, shape)
+    # main loop
+    with _cspice:
+        with nogil:
+            for i in range(n):
                 ilumin_c(
-                    method, 
-                    target,
-                    c_et_r,
-                    fixref,
-                    abcorr,
-                    obsrvr,
-                    &c_spoint[j,0],
-                    &c_trgepc[i,j],
-                    &c_srfvec[i,j,0],
-                    &c_phase[i,j],
-                    &c_incdnc[i,j],
-                    &c_emissn[i,j]
+                    c_method.at(i),
+                    c_target.at(i),
+                    c_ets.at(i),
+                    c_fixref.at(i),
+                    c_abcorr.at(i),
+                    c_obsrvr.at(i),
+                    c_spoint.at(i),
+                    &c_trgepc[i],
+                    &c_srfvec[i, 0],
+                    &c_phase[i],
+                    &c_incdnc[i],
+                    &c_emissn[i]
                 )
-    check_for_spice_error()
-    return p_trgepc, p_srfvec, p_phase, p_incdnc, p_emissn 
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        return c_errors.finish((p_trgepc, p_srfvec, p_phase, p_incdnc, p_emissn))
 
 
 def ilumin(
@@ -3058,7 +4700,7 @@ def jyear() -> float:
 
 # L
 
-cpdef tuple[float, float, float] latcyl_s(
+cpdef tuple[double, double, double] latcyl_s(
     radius: float, 
     lon: float, 
     lat: float
@@ -3094,7 +4736,8 @@ cpdef tuple[float, float, float] latcyl_s(
 cpdef np.ndarray[np.double_t, ndim=2, mode='c'] latcyl_v(
     const double[::1] radius, 
     const double[::1] lon, 
-    const double[::1] lat
+    const double[::1] lat,
+    object out=None
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.latcyl`
@@ -3106,14 +4749,16 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] latcyl_v(
     :param radius: Distance of a point from the origin.
     :param lon: Angle of the point from the XZ plane in radians.
     :param lat: Angle of the point from the XY plane in radians.
+    :param out: Optional preallocated output arrays, one per returned array.
     :return: (r, lonc, z)
     """
     cdef const np.double_t[::1] c_radius = np.ascontiguousarray(radius, dtype=np.double)
     cdef Py_ssize_t i, n = c_radius.shape[0]
     cdef const np.double_t[::1] c_lon = np.ascontiguousarray(lon, dtype=np.double)
     cdef const np.double_t[::1] c_lat = np.ascontiguousarray(lat, dtype=np.double)
+    cdef tuple c_out = _check_out(out, 1)
     # allocate output array
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_cyl = np.empty((n,3), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_cyl = _output(c_out, 0, (n, 3), np.double)
     cdef np.double_t[:,::1] c_cyl = p_cyl
     # TODO fix strides lookups below
     _check_same_len(n, c_lon.shape[0], "radius", "lon")
@@ -3186,7 +4831,8 @@ cpdef np.ndarray[np.double_t, ndim=1, mode='c'] latrec_s(
 cpdef np.ndarray[np.double_t, ndim=2, mode='c'] latrec_v(
     const double[::1] radius, 
     const double[::1] longitude, 
-    const double[::1] latitude
+    const double[::1] latitude,
+    object out=None
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.latrec`
@@ -3198,14 +4844,16 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] latrec_v(
     :param radius: Distance of a point from the origin.
     :param longitude: Angle of the point from the XZ plane in radians.
     :param latitude: Angle of the point from the XY plane in radians.
+    :param out: Optional preallocated output arrays, one per returned array.
     :return: (r, lonc, z)
     """
     cdef const np.double_t[::1] c_radius = np.ascontiguousarray(radius, dtype=np.double)
     cdef Py_ssize_t i, n = c_radius.shape[0]
     cdef const np.double_t[::1] c_longitude = np.ascontiguousarray(longitude, dtype=np.double)
     cdef const np.double_t[::1] c_latitude = np.ascontiguousarray(latitude, dtype=np.double)
+    cdef tuple c_out = _check_out(out, 1)
     # allocate output array
-    cdef np.ndarray p_rec = np.empty((n,3), dtype=np.double, order='C')
+    cdef np.ndarray p_rec = _output(c_out, 0, (n, 3), np.double)
     cdef np.double_t[:,::1] c_rec = p_rec
     # TODO fix strides lookups below
     _check_same_len(n, c_longitude.shape[0], "radius", "longitude")
@@ -3242,7 +4890,7 @@ def latrec(
         return latrec_v(radius, longitude, latitude)
 
 
-cpdef tuple[float, float, float] latsph_s(
+cpdef tuple[double, double, double] latsph_s(
     radius: float, 
     lon: float, 
     lat: float
@@ -3278,7 +4926,8 @@ cpdef tuple[float, float, float] latsph_s(
 cpdef np.ndarray[np.double_t, ndim=2, mode='c'] latsph_v(
     const double[::1] radius, 
     const double[::1] lon, 
-    const double[::1] lat
+    const double[::1] lat,
+    object out=None
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.latsph`
@@ -3290,14 +4939,16 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] latsph_v(
     :param radius: Distance of a point from the origin.
     :param lon: Angle of the point from the XZ plane in radians.
     :param lat: Angle of the point from the XY plane in radians.
+    :param out: Optional preallocated output arrays, one per returned array.
     :return: (rho colat, lons)
     """
     cdef const np.double_t[::1] c_radius = np.ascontiguousarray(radius, dtype=np.double)
     cdef Py_ssize_t i, n = c_radius.shape[0]
     cdef const np.double_t[::1] c_lon = np.ascontiguousarray(lon, dtype=np.double)
     cdef const np.double_t[::1] c_lat = np.ascontiguousarray(lat, dtype=np.double)
+    cdef tuple c_out = _check_out(out, 1)
     # allocate output array
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_sph = np.empty((n,3), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_sph = _output(c_out, 0, (n, 3), np.double)
     cdef np.double_t[:,::1] c_sph = p_sph
     # TODO fix strides lookups below
     _check_same_len(n, c_lon.shape[0], "radius", "lon")
@@ -3336,6 +4987,100 @@ def latsph(
         return latsph_v(radius, lon, lat)
 
 
+@boundscheck(False)
+@wraparound(False)
+def latsrf_v(
+    str method,
+    str target,
+    double et,
+    str fixref,
+    lonlat,
+    *,
+    object out=None,
+    str errors="raise"
+    ) -> Vector_N:
+    """
+    Vectorized version of :py:meth:`~spiceypy.cyice.cyice.latsrf`
+
+    lonlat may have any number of leading dimensions, for example (H, W, 2)
+    for a longitude/latitude grid, the surface points have the same leading
+    dimensions. CSPICE maps all coordinate pairs in one call, contiguous
+    float64 input is not copied.
+
+    Map array of planetocentric longitude/latitude coordinate pairs
+    to surface points on a specified target body.
+
+    The surface of the target body may be represented by a triaxial
+    ellipsoid or by topographic data provided by DSK files.
+
+    https://naif.jpl.nasa.gov/pub/naif/misc/toolkit_docs_N0067/C/cspice/latsrf_c.html
+
+    :param method: Computation method.
+    :param target: Name of target body.
+    :param et: Epoch in TDB seconds past J2000 TDB.
+    :param fixref: Body-fixed, body-centered target body frame.
+    :param lonlat: Array of longitude/latitude coordinate pairs.
+    :param out: Optional preallocated output array.
+    :param errors: Error handling mode, "raise" (default) or "mask". An error
+        fails all points as they are computed together.
+    :return: Array of surface points.
+    """
+    cdef tuple shape = _outer_shape(lonlat)
+    cdef Py_ssize_t n = _shape_size(shape)
+    # initialize c variables
+    cdef const char* c_method = method
+    cdef const char* c_target = target
+    cdef const char* c_fixref = fixref
+    cdef const np.double_t[:, ::1] c_lonlat = _packed(lonlat, shape, 2, "lonlat")
+    cdef tuple c_out = _check_out(out, 1)
+    # initialize output arrays
+    cdef np.ndarray p_srfpts = _output(c_out, 0, shape + (3,), np.double)
+    cdef np.double_t[:, ::1] c_srfpts = p_srfpts.reshape(n, 3)
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, shape)
+    if n == 0:
+        return c_errors.finish(p_srfpts)
+    with _cspice:
+        with nogil:
+            latsrf_c(
+                c_method,
+                c_target,
+                et,
+                c_fixref,
+                <SpiceInt> n,
+                <ConstSpiceDouble (*)[2]> &c_lonlat[0, 0],
+                <SpiceDouble (*)[3]> &c_srfpts[0, 0]
+            )
+            c_errors.capture_many(0, n, 1)
+        c_errors.check(None)
+        return c_errors.finish(p_srfpts)
+
+
+def latsrf(
+    method: str,
+    target: str,
+    et: float,
+    fixref: str,
+    lonlat: LonLat_N
+    ) -> Vector_N:
+    """
+    Map array of planetocentric longitude/latitude coordinate pairs
+    to surface points on a specified target body.
+
+    The surface of the target body may be represented by a triaxial
+    ellipsoid or by topographic data provided by DSK files.
+
+    https://naif.jpl.nasa.gov/pub/naif/misc/toolkit_docs_N0067/C/cspice/latsrf_c.html
+
+    :param method: Computation method.
+    :param target: Name of target body.
+    :param et: Epoch in TDB seconds past J2000 TDB.
+    :param fixref: Body-fixed, body-centered target body frame.
+    :param lonlat: Array of longitude/latitude coordinate pairs.
+    :return: Array of surface points.
+    """
+    return latsrf_v(method, target, et, fixref, lonlat)
+
+
 @boundscheck(False)
 @wraparound(False)
 cpdef tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] limbpt_s(
@@ -3398,27 +5143,28 @@ cpdef tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] limbpt_s(
     cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_tangts = np.empty((c_maxn, 3), dtype=np.double, order='C')
     cdef np.double_t[:,::1] c_tangts = p_tangts
     # call the c function
-    with nogil:
-        limbpt_c(
-            method,
-            target,
-            et,
-            fixref,
-            abcorr,
-            corloc,
-            obsrvr,
-            &c_refvec[0],
-            rolstp,
-            ncuts,
-            schstp,
-            soltol,
-            maxn,
-            &c_npts[0],
-            <SpiceDouble (*)[3]> &c_points[0, 0],
-            &c_epochs[0],
-            <SpiceDouble (*)[3]> &c_tangts[0, 0]
-        )
-    check_for_spice_error()
+    with _cspice:
+        with nogil:
+            limbpt_c(
+                method,
+                target,
+                et,
+                fixref,
+                abcorr,
+                corloc,
+                obsrvr,
+                &c_refvec[0],
+                rolstp,
+                ncuts,
+                schstp,
+                soltol,
+                maxn,
+                &c_npts[0],
+                <SpiceDouble (*)[3]> &c_points[0, 0],
+                &c_epochs[0],
+                <SpiceDouble (*)[3]> &c_tangts[0, 0]
+            )
+        check_for_spice_error()
     # return the results
     return p_npts, p_points, p_epochs, p_tangts
 
@@ -3438,7 +5184,9 @@ cpdef tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] limbpt_v(
     int ncuts,
     double schstp,
     double soltol,
-    int maxn
+    int maxn,
+    str errors="raise",
+    object out=None
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.limbpt`
@@ -3466,6 +5214,8 @@ cpdef tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] limbpt_v(
     :param schstp: Angular step size for searching.
     :param soltol: Solution convergence tolerance.
     :param maxn: Maximum number of entries in output arrays.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return: 
         Counts of limb points corresponding to cuts
         Limb points in km, 
@@ -3478,40 +5228,45 @@ cpdef tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] limbpt_v(
     cdef Py_ssize_t c_maxn = maxn
     cdef const np.double_t[::1] c_refvec = np.ascontiguousarray(refvec, dtype=np.double)
     cdef const SpiceDouble* c_refvec_ptr = &c_refvec[0]
+    cdef tuple c_out = _check_out(out, 4)
     # allocate outputs
-    cdef np.ndarray[np.int32_t, ndim=2, mode='c'] p_npts = np.empty((n, c_maxn), dtype=np.int32, order='C')
+    cdef np.ndarray[np.int32_t, ndim=2, mode='c'] p_npts = _output(c_out, 0, (n, c_maxn), np.int32)
     cdef int[:,::1] c_npts = p_npts
-    cdef np.ndarray[np.double_t, ndim=3, mode='c'] p_points = np.empty((n, c_maxn, 3), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=3, mode='c'] p_points = _output(c_out, 1, (n, c_maxn, 3), np.double)
     cdef np.double_t[:,:,::1] c_points = p_points
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_epochs = np.empty((n, c_maxn), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_epochs = _output(c_out, 2, (n, c_maxn), np.double)
     cdef np.double_t[:,::1] c_epochs = p_epochs
-    cdef np.ndarray[np.double_t, ndim=3, mode='c'] p_tangts = np.empty((n, c_maxn, 3), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=3, mode='c'] p_tangts = _output(c_out, 3, (n, c_maxn, 3), np.double)
     cdef np.double_t[:,:,::1] c_tangts = p_tangts
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
     # call the c function
-    with nogil:
-        for i in range(n):
-            limbpt_c(
-                method,
-                target,
-                c_ets[i],
-                fixref,
-                abcorr,
-                corloc,
-                obsrvr,
-                c_refvec_ptr,
-                rolstp,
-                ncuts,
-                schstp,
-                soltol,
-                maxn,
-                &c_npts[i, 0],
-                <SpiceDouble (*)[3]> &c_points[i, 0, 0],
-                &c_epochs[i, 0],
-                <SpiceDouble (*)[3]> &c_tangts[i, 0, 0]
-            )
-    check_for_spice_error()
-    # return the results
-    return p_npts, p_points, p_epochs, p_tangts
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                limbpt_c(
+                    method,
+                    target,
+                    c_ets[i],
+                    fixref,
+                    abcorr,
+                    corloc,
+                    obsrvr,
+                    c_refvec_ptr,
+                    rolstp,
+                    ncuts,
+                    schstp,
+                    soltol,
+                    maxn,
+                    &c_npts[i, 0],
+                    <SpiceDouble (*)[3]> &c_points[i, 0, 0],
+                    &c_epochs[i, 0],
+                    <SpiceDouble (*)[3]> &c_tangts[i, 0, 0]
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        # return the results
+        return c_errors.finish((p_npts, p_points, p_epochs, p_tangts))
 
 
 def limbpt(
@@ -3587,12 +5342,13 @@ def lspcn_s(
     cdef double c_et = et
     cdef const char* c_body   = body
     cdef const char* c_abcorr = abcorr
-    l_s = lspcn_c(
-        c_body,
-        c_et,
-        c_abcorr
-    )
-    check_for_spice_error()
+    with _cspice:
+        l_s = lspcn_c(
+            c_body,
+            c_et,
+            c_abcorr
+        )
+        check_for_spice_error()
     return l_s
 
 
@@ -3601,7 +5357,10 @@ def lspcn_s(
 def lspcn_v(
     str body,
     double[::1] ets,
-    str abcorr
+    str abcorr,
+    *,
+    object out=None,
+    str errors="raise"
     ) -> Double_N:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.lspcn`
@@ -3614,23 +5373,30 @@ def lspcn_v(
     :param body: Name of central body.
     :param ets: Epochs in seconds past J2000 TDB.
     :param abcorr: Aberration correction.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return: planetocentric longitudes of the sun in radians
     """
     cdef const np.double_t[::1] c_ets = np.ascontiguousarray(ets, dtype=np.double)
     cdef Py_ssize_t i, n = c_ets.shape[0]
     cdef const char* c_body   = body
     cdef const char* c_abcorr = abcorr
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_l_s_s = np.empty(n, dtype=np.double, order='C')
+    cdef tuple c_out = _check_out(out, 1)
+    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_l_s_s = _output(c_out, 0, (n,), np.double)
     cdef np.double_t[::1] c_l_s_s = p_l_s_s
-    with nogil:
-        for i in range(n):
-            c_l_s_s[i] = lspcn_c(
-                c_body,
-                c_ets[i],
-                c_abcorr
-            )
-    check_for_spice_error()
-    return p_l_s_s
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                c_l_s_s[i] = lspcn_c(
+                    c_body,
+                    c_ets[i],
+                    c_abcorr
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        return c_errors.finish(p_l_s_s)
 
 
 def lspcn(
@@ -3692,25 +5458,26 @@ cpdef int occult_s(
     :return: Occultation identification code.
     """
     cdef int c_ocltid = 0
-    occult_c(
-        target1,
-        shape1,
-        frame1,
-        target2,
-        shape2,
-        frame2,
-        abcorr,
-        observer,
-        et,
-        &c_ocltid
-    )
-    check_for_spice_error()
+    with _cspice:
+        occult_c(
+            target1,
+            shape1,
+            frame1,
+            target2,
+            shape2,
+            frame2,
+            abcorr,
+            observer,
+            et,
+            &c_ocltid
+        )
+        check_for_spice_error()
     return c_ocltid
 
 
 @boundscheck(False)
 @wraparound(False)
-cpdef np.ndarray[np.int32_t, ndim=1, mode='c'] occult_v(
+cpdef object occult_v(
     const char* target1,
     const char* shape1,
     const char* frame1,
@@ -3720,6 +5487,8 @@ cpdef np.ndarray[np.int32_t, ndim=1, mode='c'] occult_v(
     const char* abcorr,
     const char* observer,
     double[::1] ets,
+    str errors="raise",
+    object out=None
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.occult`
@@ -3739,29 +5508,36 @@ cpdef np.ndarray[np.int32_t, ndim=1, mode='c'] occult_v(
     :param abcorr: Aberration correction flag.
     :param observer: Name or ID of the observer.
     :param ets: Time of the observation (seconds past J2000).
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return: Occultation identification code.
     """
     cdef const np.double_t[::1] c_ets = np.ascontiguousarray(ets, dtype=np.double)
     cdef Py_ssize_t i, n = c_ets.shape[0]
+    cdef tuple c_out = _check_out(out, 1)
     # allocate output array
-    cdef np.ndarray[np.int32_t, ndim=1, mode='c'] p_ocltids = np.empty(n, dtype=np.int32, order='C')
+    cdef np.ndarray[np.int32_t, ndim=1, mode='c'] p_ocltids = _output(c_out, 0, (n,), np.int32)
     cdef SpiceInt[::1] c_ocltids = p_ocltids
-    with nogil:
-        for i in range(n):
-            occult_c(
-                target1,
-                shape1,
-                frame1,
-                target2,
-                shape2,
-                frame2,
-                abcorr,
-                observer,
-                c_ets[i],
-                &c_ocltids[i]
-            )
-    check_for_spice_error()
-    return p_ocltids
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                occult_c(
+                    target1,
+                    shape1,
+                    frame1,
+                    target2,
+                    shape2,
+                    frame2,
+                    abcorr,
+                    observer,
+                    c_ets[i],
+                    &c_ocltids[i]
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        return c_errors.finish(p_ocltids)
 
 
 def occult(
@@ -3825,22 +5601,25 @@ cpdef np.ndarray[np.double_t, ndim=1, mode='c'] oscelt_s(
         raise ValueError(f'in oscelt_s, state vector had shape {c_state.shape[0]}, not 6 as expected')
     cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_elts = np.empty(8, dtype=np.double, order='C')
     cdef np.double_t[::1] c_elts = p_elts
-    oscelt_c(
-        &c_state[0],
-        et,
-        mu,
-        &c_elts[0]
-    )
-    check_for_spice_error()
+    with _cspice:
+        oscelt_c(
+            &c_state[0],
+            et,
+            mu,
+            &c_elts[0]
+        )
+        check_for_spice_error()
     return p_elts
 
 
 @boundscheck(False)
 @wraparound(False)
-cpdef np.ndarray[np.double_t, ndim=2, mode='c'] oscelt_v(
+cpdef object oscelt_v(
     const double[:,::1] state,
     double[::1] et,
     double mu,
+    str errors="raise",
+    object out=None
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.oscelt`
@@ -3854,6 +5633,8 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] oscelt_v(
     :param state: State of body at epoch of elements.
     :param et: Epoch of elements in ephemeris seconds past J2000.
     :param mu: Gravitational parameter (GM) of primary body in km**3/sec**2 units.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return: Equivalent conic elements in  km, rad, rad/sec units.
     """
     cdef const np.double_t[:,::1] c_state = np.ascontiguousarray(state, dtype=np.double)
@@ -3863,18 +5644,23 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] oscelt_v(
     cdef Py_ssize_t i, n = c_state.shape[0]
     if c_et.shape[0] != n:
         raise ValueError(f'in oscelt_v, state and et vectors did not have the same length, state: {c_state.shape[0]} et: {c_et.shape[1]}')
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_elts = np.empty((n,8), dtype=np.double, order='C')
+    cdef tuple c_out = _check_out(out, 1)
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_elts = _output(c_out, 0, (n, 8), np.double)
     cdef np.double_t[:,::1] c_elts = p_elts
-    with nogil:
-        for i in range(n):
-            oscelt_c(
-            &c_state[i, 0],
-            et[i],
-            mu,
-            &c_elts[i, 0]
-        )
-    check_for_spice_error()
-    return p_elts
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                oscelt_c(
+                &c_state[i, 0],
+                et[i],
+                mu,
+                &c_elts[i, 0]
+            )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(et)
+        return c_errors.finish(p_elts)
 
 
 cpdef oscelt(
@@ -3930,15 +5716,16 @@ cpdef np.ndarray[np.double_t, ndim=1, mode='c'] pgrrec_s(
     """
     cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_rec = np.empty(3, dtype=np.double, order='C')
     cdef np.double_t[::1] c_rec = p_rec
-    pgrrec_c(
-        body,
-        lon,
-        lat,
-        alt,
-        re,
-        f,
-        &c_rec[0]
-    )
+    with _cspice:
+        pgrrec_c(
+            body,
+            lon,
+            lat,
+            alt,
+            re,
+            f,
+            &c_rec[0]
+        )
     return p_rec
 
 
@@ -3951,6 +5738,7 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] pgrrec_v(
     const double[::1] alt,
     double re,
     double f,
+    object out=None
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.pgrrec`
@@ -3965,29 +5753,32 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] pgrrec_v(
     :param alt: Altitude of each point above reference spheroid.
     :param re: Equatorial radius of the reference spheroid.
     :param f: Flattening coefficient.
+    :param out: Optional preallocated output arrays, one per returned array.
     :return: Rectangular coordinates of the point.
     """
     cdef const np.double_t[::1] c_lon = np.ascontiguousarray(lon, dtype=np.double)
     cdef Py_ssize_t i, n = c_lon.shape[0]
     cdef const np.double_t[::1] c_lat = np.ascontiguousarray(lat, dtype=np.double)
     cdef const np.double_t[::1] c_alt = np.ascontiguousarray(alt, dtype=np.double)
+    cdef tuple c_out = _check_out(out, 1)
     # allocate output array
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_rec = np.empty((n,3), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_rec = _output(c_out, 0, (n, 3), np.double)
     cdef np.double_t[:,::1] c_rec = p_rec
     # TODO fix strides lookups below
     _check_same_len(n, c_lat.shape[0], "lon", "lat")
     _check_same_len(n, c_alt.shape[0], "lon", "alt")
-    with nogil:
-        for i in range(n):
-            pgrrec_c(
-                body,
-                c_lon[i],
-                c_lat[i],
-                c_alt[i],
-                re,
-                f,  
-                &c_rec[i, 0]
-            )
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                pgrrec_c(
+                    body,
+                    c_lon[i],
+                    c_lat[i],
+                    c_alt[i],
+                    re,
+                    f,  
+                    &c_rec[i, 0]
+                )
     return p_rec
 
 
@@ -4042,25 +5833,28 @@ cpdef double phaseq_s(
     :return: Value of phase angle in radians.
     """
     cdef double c_phase = 0.0
-    c_phase = phaseq_c(
-        et,
-        target,
-        illmn,
-        obsrvr,
-        abcorr
-    ) 
-    check_for_spice_error()
+    with _cspice:
+        c_phase = phaseq_c(
+            et,
+            target,
+            illmn,
+            obsrvr,
+            abcorr
+        ) 
+        check_for_spice_error()
     return c_phase
 
 
 @boundscheck(False)
 @wraparound(False)
-cpdef np.ndarray[np.double_t, ndim=1, mode='c'] phaseq_v(
+cpdef object phaseq_v(
     double[::1] et,
     const char* target,
     const char* illmn,
     const char* obsrvr,
-    const char* abcorr
+    const char* abcorr,
+    str errors="raise",
+    object out=None
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.phaseq`
@@ -4075,25 +5869,32 @@ cpdef np.ndarray[np.double_t, ndim=1, mode='c'] phaseq_v(
     :param illmn: Illuminating body name.
     :param obsrvr: Observer body.
     :param abcorr: Aberration correction flag.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return: Value of phase angle in radians.
     """
     cdef const np.double_t[::1] c_et = np.ascontiguousarray(et, dtype=np.double)
     cdef Py_ssize_t i, n = c_et.shape[0]
+    cdef tuple c_out = _check_out(out, 1)
     # initialize output arrays
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_phase = np.empty(n, dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_phase = _output(c_out, 0, (n,), np.double)
     cdef np.double_t[::1] c_phase = p_phase
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
     # perform the call
-    with nogil:
-        for i in range(n):
-            c_phase[i] = phaseq_c(
-                c_et[i],
-                target,
-                illmn,
-                obsrvr,
-                abcorr
-            ) 
-    check_for_spice_error()
-    return p_phase
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                c_phase[i] = phaseq_c(
+                    c_et[i],
+                    target,
+                    illmn,
+                    obsrvr,
+                    abcorr
+                ) 
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_et)
+        return c_errors.finish(p_phase)
 
 
 def phaseq(
@@ -4134,12 +5935,51 @@ def pi() -> float:
     return pi_c()
 
 
+@boundscheck(False)
+@wraparound(False)
+def pltar(
+    vrtces,
+    plates
+    ) -> float:
+    """
+    Compute the total area of a collection of triangular plates.
+
+    The (NV, 3) vertices and (NP, 3) plates are passed to CSPICE without a
+    copy when they are C contiguous float64 and int32 arrays, such as the
+    mesh read from a type 2 DSK segment.
+
+    https://naif.jpl.nasa.gov/pub/naif/misc/toolkit_docs_N0067/C/cspice/pltar_c.html
+
+    :param vrtces: Array of vertices.
+    :param plates: Array of plates, 1-based indices of their vertices.
+    :return: total area of the set of plates
+    """
+    cdef const np.double_t[:, ::1] c_vrtces = _packed(vrtces, _outer_shape(vrtces), 3, "vrtces")
+    cdef const np.int32_t[:, ::1] c_plates = _packed(plates, _outer_shape(plates), 3, "plates", np.int32)
+    cdef SpiceInt c_nv = c_vrtces.shape[0]
+    cdef SpiceInt c_np = c_plates.shape[0]
+    cdef SpiceDouble c_area = 0.0
+    with _cspice:
+        with nogil:
+            c_area = pltar_c(
+                c_nv,
+                <ConstSpiceDouble (*)[3]> &c_vrtces[0, 0] if c_nv else NULL,
+                c_np,
+                <ConstSpiceInt (*)[3]> &c_plates[0, 0] if c_np else NULL
+            )
+        check_for_spice_error()
+    return c_area
+
+
 @boundscheck(False)
 @wraparound(False)
 def pxform_s(
     str fromstr,
     str tostr,
-    double et
+    double et,
+    *,
+    object out=None,
+    bint astuple=False
     ) -> Matrix_3:
     """
     Scalar version of :py:meth:`~spiceypy.cyice.cyice.pxform`
@@ -4153,6 +5993,8 @@ def pxform_s(
     :param fromstr Name of the frame to transform from.
     :param tostr: Name of the frame to transform to.
     :param et: Epoch of the rotation matrix.
+    :param out: Optional preallocated array the rotation matrix is written to.
+    :param astuple: Return the rotation matrix as nested tuples of floats instead of an array.
     :return: A rotation matrix.
     """
     # initialize c variables
@@ -4160,28 +6002,36 @@ def pxform_s(
     cdef const char* c_fromstr = fromstr
     cdef const char* c_tostr = tostr
     # initialize output
-    cdef np.ndarray[np.double_t, ndim=2, mode="c"] p_xrot = np.empty((3, 3), dtype=np.double, order='C')
-    cdef np.double_t[:, ::1] c_xrot = p_xrot
-    pxform_c(
-        c_fromstr,
-        c_tostr,
-        c_et,
-        <SpiceDouble (*)[3]> &c_xrot[0, 0]
-    )
-    check_for_spice_error()
-    return p_xrot
+    cdef double[9] t_xrot
+    cdef np.ndarray p_xrot = _scalar_output(out, astuple, 0, 1, 3, 3)
+    cdef double* c_xrot = _output_data(p_xrot, t_xrot)
+    with _cspice:
+        pxform_c(
+            c_fromstr,
+            c_tostr,
+            c_et,
+            <SpiceDouble (*)[3]> c_xrot
+        )
+        check_for_spice_error()
+    return _scalar_result(p_xrot, c_xrot, 3, 3)
 
 
 @boundscheck(False)
 @wraparound(False)
 def pxform_v(
-    str fromstr,
-    str tostr,
-    double[::1] ets
+    fromstr,
+    tostr,
+    ets,
+    *,
+    object out=None,
+    str errors="raise"
     ) -> Matrix_N_3:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.pxform`
 
+    All arguments except the output and error options broadcast against each other
+    following NumPy rules, string arguments may be arrays of names.
+
     Return the matrix that transforms position vectors from one
     specified frame to another at a specified epoch.
 
@@ -4191,27 +6041,38 @@ def pxform_v(
     :param fromstr: Name of the frame to transform from.
     :param tostr: Name of the frame to transform to.
     :param ets: Epochs of the rotation matricies.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return: rotation matricies.
     """
-    cdef const np.double_t[::1] c_ets = np.ascontiguousarray(ets, dtype=np.double)
-    cdef Py_ssize_t i, n = c_ets.shape[0]
-    cdef const char* c_fromstr = fromstr
-    cdef const char* c_tostr = tostr
-    # initialize output
-    cdef np.ndarray[np.double_t, ndim=3, mode="c"] p_xrot = np.empty((n, 3, 3), dtype=np.double, order='C')
-    cdef np.double_t[:, :, ::1] c_xrot = p_xrot
-    # pointer to element
-    cdef SpiceDouble* base = &c_xrot[0, 0, 0]
-    with nogil:
-        for i in range(n):
-            pxform_c(
-                c_fromstr,
-                c_tostr,
-                c_ets[i],
-                <SpiceDouble (*)[3]> (base + i*9)
-            )
-    check_for_spice_error()
-    return p_xrot
+    # broadcast the arguments against each other
+    cdef tuple shape = np.broadcast_shapes(
+        np.shape(fromstr), np.shape(tostr), np.shape(ets)
+    )
+    cdef Py_ssize_t i, n = _shape_size(shape)
+    # initialize c variables
+    cdef _StrArg c_fromstr = _StrArg(fromstr, shape)
+    cdef _StrArg c_tostr   = _StrArg(tostr, shape)
+    cdef _DblArg c_ets     = _DblArg(ets, shape)
+    cdef tuple c_out = _check_out(out, 1)
+    # initialize output arrays
+    cdef np.ndarray p_xrot = _output(c_out, 0, shape + (3, 3), np.double)
+    cdef np.double_t[:, :, ::1] c_xrot = p_xrot.reshape(n, 3, 3)
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, shape)
+    # main loop
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                pxform_c(
+                    c_fromstr.at(i),
+                    c_tostr.at(i),
+                    c_ets.at(i),
+                    <SpiceDouble (*)[3]> &c_xrot[i, 0, 0]
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        return c_errors.finish(p_xrot)
 
 
 def pxform(
@@ -4257,16 +6118,17 @@ cpdef str qcktrc(
     cdef char* c_tracestr = <char*> malloc((tracelen) * sizeof(char))
     if c_tracestr == NULL:
         raise MemoryError("Unable to allocate memory for traceback string in qcktrc.")
-    try:
-        qcktrc_c(
-            c_tracelen,
-            c_tracestr
-        )
-        length = strlen(c_tracestr)
-        p_tracestr = PyUnicode_DecodeUTF8(c_tracestr, length, "strict")
-        return p_tracestr
-    finally:
-        free(c_tracestr)
+    with _cspice:
+        try:
+            qcktrc_c(
+                c_tracelen,
+                c_tracestr
+            )
+            length = strlen(c_tracestr)
+            p_tracestr = PyUnicode_DecodeUTF8(c_tracestr, length, "strict")
+            return p_tracestr
+        finally:
+            free(c_tracestr)
 
 # R
 @boundscheck(False)
@@ -4305,7 +6167,8 @@ cpdef np.ndarray[np.double_t, ndim=1, mode='c'] radrec_s(
 cpdef np.ndarray[np.double_t, ndim=2, mode='c'] radrec_v(
     const double[::1] inrange, 
     const double[::1] ra, 
-    const double[::1] dec
+    const double[::1] dec,
+    object out=None
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.radrec`
@@ -4318,14 +6181,16 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] radrec_v(
     :param inrange: Distance of a point from the origin.
     :param ra: Right ascension of point in radians.
     :param dec: Declination of point in radians.
+    :param out: Optional preallocated output arrays, one per returned array.
     :return: Rectangular coordinates of the point.
     """
     cdef const np.double_t[::1] c_range = np.ascontiguousarray(inrange, dtype=np.double)
     cdef Py_ssize_t i, n = c_range.shape[0]
     cdef const np.double_t[::1] c_ra = np.ascontiguousarray(ra, dtype=np.double)
     cdef const np.double_t[::1] c_dec = np.ascontiguousarray(dec, dtype=np.double)
+    cdef tuple c_out = _check_out(out, 1)
     # allocate output array
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_rec = np.empty((n,3), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_rec = _output(c_out, 0, (n, 3), np.double)
     cdef np.double_t[:,::1] c_rec = p_rec
     # TODO fix strides lookups below
     _check_same_len(n, c_ra.shape[0], "inrange", "ra")
@@ -4364,7 +6229,7 @@ def radrec(
 
 
 @boundscheck(False)
-cpdef tuple[float, float, float] recazl_s(
+cpdef tuple[double, double, double] recazl_s(
     double[::1] rectan,
     SpiceBoolean azccw,
     SpiceBoolean elplsz
@@ -4405,7 +6270,8 @@ cpdef tuple[float, float, float] recazl_s(
 cpdef np.ndarray[np.double_t, ndim=2, mode='c'] recazl_v(
     const double[:,::1] rectan, 
     const SpiceBoolean azccw, 
-    const SpiceBoolean elplsz
+    const SpiceBoolean elplsz,
+    object out=None
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.recazl`
@@ -4418,6 +6284,7 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] recazl_v(
     :param rectan: Rectangular coordinates of points.
     :param azccw: Flag indicating how Azimuth is measured.
     :param elplsz: Flag indicating how Elevation is measured.
+    :param out: Optional preallocated output arrays, one per returned array.
     :return:
             Distance of the point from the origin,
             Azimuth in radians,
@@ -4426,8 +6293,9 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] recazl_v(
     cdef Py_ssize_t i, n = rectan.shape[0]
     cdef SpiceBoolean c_azccw  = <SpiceBoolean> azccw 
     cdef SpiceBoolean c_elplsz = <SpiceBoolean> elplsz
+    cdef tuple c_out = _check_out(out, 1)
     # allocate output array
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_azl = np.empty((n,3), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_azl = _output(c_out, 0, (n, 3), np.double)
     cdef np.double_t[:,::1] c_azl = p_azl
     # TODO fix strides lookups below
     with nogil:
@@ -4472,7 +6340,7 @@ def recazl(
 
 
 @boundscheck(False)
-cpdef tuple[float, float, float] reccyl_s(
+cpdef tuple[double, double, double] reccyl_s(
     double[::1] rectan
     ):
     """
@@ -4504,7 +6372,8 @@ cpdef tuple[float, float, float] reccyl_s(
 @boundscheck(False)
 @wraparound(False)
 cpdef np.ndarray[np.double_t, ndim=2, mode='c'] reccyl_v(
-    const double[:,::1] rectan
+    const double[:,::1] rectan,
+    object out=None
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.reccyl`
@@ -4514,14 +6383,16 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] reccyl_v(
     https://naif.jpl.nasa.gov/pub/naif/misc/toolkit_docs_N0067/C/cspice/reccyl_c.html
 
     :param rectan: Rectangular coordinates of a point.
+    :param out: Optional preallocated output arrays, one per returned array.
     :return:
             Distance from z axis,
             Angle (radians) from xZ plane,
             Height above xY plane.
     """
     cdef Py_ssize_t i, n = rectan.shape[0]
+    cdef tuple c_out = _check_out(out, 1)
     # allocate output array
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_cyl = np.empty((n,3), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_cyl = _output(c_out, 0, (n, 3), np.double)
     cdef np.double_t[:,::1] c_cyl = p_cyl
     # TODO fix strides lookups below
     with nogil:
@@ -4559,7 +6430,7 @@ def reccyl(
 
 
 @boundscheck(False)
-cpdef tuple[float, float, float] recgeo_s(
+cpdef tuple[double, double, double] recgeo_s(
     double[::1] rectan,
     double re,
     double f,
@@ -4583,14 +6454,15 @@ cpdef tuple[float, float, float] recgeo_s(
     cdef double lon = 0.0
     cdef double lat = 0.0
     cdef double alt = 0.0
-    recgeo_c(
-        c_rectan, 
-        re,
-        f,
-        &lon,
-        &lat,
-        &alt
-    )
+    with _cspice:
+        recgeo_c(
+            c_rectan, 
+            re,
+            f,
+            &lon,
+            &lat,
+            &alt
+        )
     return lon, lat, alt
 
 
@@ -4600,6 +6472,7 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] recgeo_v(
     const double[:,::1] rectan,
     double re,
     double f,
+    object out=None
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.recgeo`
@@ -4611,26 +6484,29 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] recgeo_v(
     :param rectan: Rectangular coordinates of a point.
     :param re: Equatorial radius of the reference spheroid.
     :param f: Flattening coefficient.
+    :param out: Optional preallocated output arrays, one per returned array.
     :return:
             Geodetic longitude (radians),
             Geodetic latitude (radians),
             Altitude above reference spheroid
     """
     cdef Py_ssize_t i, n = rectan.shape[0]
+    cdef tuple c_out = _check_out(out, 1)
     # allocate output array
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_geo = np.empty((n,3), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_geo = _output(c_out, 0, (n, 3), np.double)
     cdef np.double_t[:,::1] c_geo = p_geo
     # TODO fix strides lookups below
-    with nogil:
-        for i in range(n):
-            recgeo_c(
-                &rectan[i, 0],
-                re,
-                f,  
-                &c_geo[i, 0],
-                &c_geo[i, 1],
-                &c_geo[i, 2]
-            )
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                recgeo_c(
+                    &rectan[i, 0],
+                    re,
+                    f,  
+                    &c_geo[i, 0],
+                    &c_geo[i, 1],
+                    &c_geo[i, 2]
+                )
     return p_geo
 
 
@@ -4662,7 +6538,7 @@ def recgeo(
 
 
 @boundscheck(False)
-cpdef tuple[float, float, float] reclat_s(
+cpdef tuple[double, double, double] reclat_s(
     double[::1] rectan
     ):
     """
@@ -4691,7 +6567,8 @@ cpdef tuple[float, float, float] reclat_s(
 @boundscheck(False)
 @wraparound(False)
 cpdef np.ndarray[np.double_t, ndim=2, mode='c'] reclat_v(
-    const double[:,::1] rectan
+    const double[:,::1] rectan,
+    object out=None
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.reclat`
@@ -4701,11 +6578,13 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] reclat_v(
     https://naif.jpl.nasa.gov/pub/naif/misc/toolkit_docs_N0067/C/cspice/reclat_c.html
 
     :param rectan: Rectangular coordinates of a point.
+    :param out: Optional preallocated output arrays, one per returned array.
     :return: Distance from the origin, Longitude in radians, Latitude in radians
     """
     cdef Py_ssize_t i, n = rectan.shape[0]
+    cdef tuple c_out = _check_out(out, 1)
     # allocate output array
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_lat = np.empty((n,3), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_lat = _output(c_out, 0, (n, 3), np.double)
     cdef np.double_t[:,::1] c_lat = p_lat
     # TODO fix strides lookups below
     with nogil:
@@ -4740,7 +6619,7 @@ def reclat(
 
 
 @boundscheck(False)
-cpdef tuple[float, float, float] recpgr_s(
+cpdef tuple[double, double, double] recpgr_s(
     const char* body,
     double[::1] rectan,
     double re,
@@ -4766,15 +6645,16 @@ cpdef tuple[float, float, float] recpgr_s(
     cdef double lon = 0.0
     cdef double lat = 0.0
     cdef double alt = 0.0
-    recpgr_c(
-        body,
-        c_rectan, 
-        re,
-        f,
-        &lon,
-        &lat,
-        &alt
-    )
+    with _cspice:
+        recpgr_c(
+            body,
+            c_rectan, 
+            re,
+            f,
+            &lon,
+            &lat,
+            &alt
+        )
     return lon, lat, alt
 
 
@@ -4785,6 +6665,7 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] recpgr_v(
     double[:,::1] rectan,
     double re,
     double f,
+    object out=None
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.recpgr`
@@ -4797,27 +6678,30 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] recpgr_v(
     :param rectan: Rectangular coordinates of a point.
     :param re: Equatorial radius of the reference spheroid.
     :param f: Flattening coefficient.
+    :param out: Optional preallocated output arrays, one per returned array.
     :return:
             Planetographic longitude (radians),
             Planetographic latitude (radians),
             Altitude above reference spheroid
     """
     cdef Py_ssize_t i, n = rectan.shape[0]
+    cdef tuple c_out = _check_out(out, 1)
     # allocate output array
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_pgr = np.empty((n,3), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_pgr = _output(c_out, 0, (n, 3), np.double)
     cdef np.double_t[:,::1] c_pgr = p_pgr
     # TODO fix strides lookups below
-    with nogil:
-        for i in range(n):
-            recpgr_c(
-                body,
-                &rectan[i, 0],
-                re,
-                f,  
-                &c_pgr[i, 0],
-                &c_pgr[i, 1],
-                &c_pgr[i, 2]
-            )
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                recpgr_c(
+                    body,
+                    &rectan[i, 0],
+                    re,
+                    f,  
+                    &c_pgr[i, 0],
+                    &c_pgr[i, 1],
+                    &c_pgr[i, 2]
+                )
     return p_pgr
 
 
@@ -4851,7 +6735,7 @@ def recpgr(
 
 
 @boundscheck(False)
-cpdef tuple[float, float, float] recrad_s(
+cpdef tuple[double, double, double] recrad_s(
     double[::1] rectan
     ):
     """
@@ -4883,7 +6767,8 @@ cpdef tuple[float, float, float] recrad_s(
 @boundscheck(False)
 @wraparound(False)
 cpdef np.ndarray[np.double_t, ndim=2, mode='c'] recrad_v(
-    const double[:,::1] rectan
+    const double[:,::1] rectan,
+    object out=None
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.recrad`
@@ -4893,14 +6778,16 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] recrad_v(
     https://naif.jpl.nasa.gov/pub/naif/misc/toolkit_docs_N0067/C/cspice/recrad_c.html
 
     :param rectan: Rectangular coordinates of a point.
+    :param out: Optional preallocated output arrays, one per returned array.
     :return:
             Distance of the point from the origin,
             Right ascension in radians,
             Declination in radians
     """
     cdef Py_ssize_t i, n = rectan.shape[0]
+    cdef tuple c_out = _check_out(out, 1)
     # allocate output array
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_rad = np.empty((n,3), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_rad = _output(c_out, 0, (n, 3), np.double)
     cdef np.double_t[:,::1] c_rad = p_rad
     # TODO fix strides lookups below
     with nogil:
@@ -4938,7 +6825,7 @@ def recrad(
 
 
 @boundscheck(False)
-cpdef tuple[float, float, float] recsph_s(
+cpdef tuple[double, double, double] recsph_s(
     double[::1] rectan
     ):
     """
@@ -4970,7 +6857,8 @@ cpdef tuple[float, float, float] recsph_s(
 @boundscheck(False)
 @wraparound(False)
 cpdef np.ndarray[np.double_t, ndim=2, mode='c'] recsph_v(
-    const double[:,::1] rectan
+    const double[:,::1] rectan,
+    object out=None
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.recsph`
@@ -4980,14 +6868,16 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] recsph_v(
     https://naif.jpl.nasa.gov/pub/naif/misc/toolkit_docs_N0067/C/cspice/recrad_c.html
 
     :param rectan: Rectangular coordinates of a point.
+    :param out: Optional preallocated output arrays, one per returned array.
     :return:
             Distance from the origin,
             Angle from the positive Z-axis,
             Longitude in radians.
     """
     cdef Py_ssize_t i, n = rectan.shape[0]
+    cdef tuple c_out = _check_out(out, 1)
     # allocate output array
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_sph = np.empty((n,3), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_sph = _output(c_out, 0, (n, 3), np.double)
     cdef np.double_t[:,::1] c_sph = p_sph
     # TODO fix strides lookups below
     with nogil:
@@ -5033,7 +6923,8 @@ cpdef void reset() noexcept:
     https://naif.jpl.nasa.gov/pub/naif/misc/toolkit_docs_N0067/C/cspice/reset_c.html
 
     """
-    reset_c()
+    with _cspice:
+        reset_c()
 
 
 def rpd() -> float:
@@ -5067,13 +6958,14 @@ def scdecd_s(
     cdef int c_sc = sc
     cdef double c_sclkdp = sclkdp
     cdef char[_default_len_out] c_buffer
-    scdecd_c(
-        c_sc,
-        c_sclkdp,
-        _default_len_out,
-        &c_buffer[0]
-    )
-    check_for_spice_error()
+    with _cspice:
+        scdecd_c(
+            c_sc,
+            c_sclkdp,
+            _default_len_out,
+            &c_buffer[0]
+        )
+        check_for_spice_error()
     p_clkout = PyUnicode_DecodeUTF8(c_buffer, strlen(c_buffer), "strict")
     return p_clkout
 
@@ -5082,7 +6974,9 @@ def scdecd_s(
 @wraparound(False)
 def scdecd_v(
     int sc,
-    double[::1] sclkdps
+    double[::1] sclkdps,
+    *,
+    str errors="raise"
     ) -> String_N:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.scdecd`
@@ -5094,6 +6988,7 @@ def scdecd_v(
 
     :param sc: NAIF spacecraft identification code.
     :param sclkdps: Encoded representations of a spacecraft clock count.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return: Character representation of a clock count.
     """
     cdef int c_sc = sc
@@ -5105,19 +7000,23 @@ def scdecd_v(
     cdef np.ndarray[np.uint8_t, ndim=2, mode='c'] p_sclkchs = np.zeros((n, _default_len_out), dtype=np.uint8, order='C')
     cdef np.uint8_t[:, ::1] c_sclkchs = p_sclkchs
     cdef char* base = <char*> &c_sclkchs[0, 0]
-    with nogil:
-        for i in range(n):
-            scdecd_c(
-                c_sc,
-                c_sclkdps[i],
-                _default_len_out,
-                base + i*_default_len_out
-            )
-    check_for_spice_error()
-    # return values
-    py_sclkchs = p_sclkchs.view(p_np_s_dtype).reshape(n)
-    py_sclkchs = np.char.rstrip(py_sclkchs).astype(p_np_u_dtype)
-    return py_sclkchs
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                scdecd_c(
+                    c_sc,
+                    c_sclkdps[i],
+                    _default_len_out,
+                    base + i*_default_len_out
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_sclkdps)
+        # return values
+        py_sclkchs = p_sclkchs.view(p_np_s_dtype).reshape(n)
+        py_sclkchs = np.char.rstrip(py_sclkchs).astype(p_np_u_dtype)
+        return c_errors.finish(py_sclkchs)
 
 
 def scdecd(
@@ -5159,12 +7058,13 @@ def scencd_s(
     cdef int c_sc = sc
     cdef double c_sclkdp = 0.0
     cdef const char* c_sclkch = sclkch
-    scencd_c(
-        c_sc,
-        c_sclkch,
-        &c_sclkdp
-    )
-    check_for_spice_error()
+    with _cspice:
+        scencd_c(
+            c_sc,
+            c_sclkch,
+            &c_sclkdp
+        )
+        check_for_spice_error()
     return c_sclkdp
 
 
@@ -5172,7 +7072,10 @@ def scencd_s(
 @wraparound(False)
 def scencd_v(
     int sc,
-    np.ndarray sclkchs
+    np.ndarray sclkchs,
+    *,
+    object out=None,
+    str errors="raise"
     ) -> Double_N:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.scencd`
@@ -5184,25 +7087,32 @@ def scencd_v(
 
     :param sc: NAIF spacecraft identification code.
     :param sclkchs: Character representations of a spacecraft clock.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return: Encoded representations of the clock count.
     """
     cdef int c_sc = sc
     cdef Py_ssize_t i, n = sclkchs.shape[0]
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_sclkdps = np.empty(n, dtype=np.double, order='C')
+    cdef tuple c_out = _check_out(out, 1)
+    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_sclkdps = _output(c_out, 0, (n,), np.double)
     cdef np.double_t[::1] c_sclkdps = p_sclkdps
     cdef const char* c_sclkchs_ptr
     # TODO possibly this is faster than calling encode via numpy, but it calls a lot of python methods, so see if there is room to improve this
     cdef bytes encoded
-    for i in range(n):
-        encoded = sclkchs[i].encode('ascii')
-        c_sclkchs_ptr = encoded
-        scencd_c(
-            c_sc,
-            c_sclkchs_ptr,
-            &c_sclkdps[i]
-        )
-    check_for_spice_error()
-    return p_sclkdps
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
+    with _cspice:
+        for i in range(n):
+            encoded = sclkchs[i].encode('ascii')
+            c_sclkchs_ptr = encoded
+            scencd_c(
+                c_sc,
+                c_sclkchs_ptr,
+                &c_sclkdps[i]
+            )
+            if c_errors.capture(i):
+                break
+        c_errors.check(sclkchs)
+        return c_errors.finish(p_sclkdps)
 
 
 def scencd(
@@ -5247,12 +7157,13 @@ def sce2c_s(
     cdef int c_sc = sc
     cdef double c_et = et
     cdef double c_sclkdp = 0.0
-    sce2c_c(
-        c_sc,
-        c_et,
-        &c_sclkdp
-    )
-    check_for_spice_error()
+    with _cspice:
+        sce2c_c(
+            c_sc,
+            c_et,
+            &c_sclkdp
+        )
+        check_for_spice_error()
     return c_sclkdp
 
 
@@ -5260,7 +7171,10 @@ def sce2c_s(
 @wraparound(False)
 def sce2c_v(
     int sc,
-    double[::1] ets
+    double[::1] ets,
+    *,
+    object out=None,
+    str errors="raise"
 ) -> Double_N:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.sce2c`
@@ -5273,6 +7187,8 @@ def sce2c_v(
 
     :param sc: NAIF spacecraft ID code.
     :param ets: Ephemeris times, seconds past J2000 TDB.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return:
             SCLK, encoded as ticks since spacecraft clock start.
             sclkdp need not be integral.
@@ -5280,17 +7196,22 @@ def sce2c_v(
     cdef int c_sc = sc
     cdef const np.double_t[::1] c_ets = np.ascontiguousarray(ets, dtype=np.double)
     cdef Py_ssize_t i, n = c_ets.shape[0]
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_sclkdps = np.empty(n, dtype=np.double, order='C')
+    cdef tuple c_out = _check_out(out, 1)
+    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_sclkdps = _output(c_out, 0, (n,), np.double)
     cdef np.double_t[::1] c_sclkdps = p_sclkdps
-    with nogil:
-        for i in range(n):
-            sce2c_c(
-                c_sc,
-                c_ets[i],
-                &c_sclkdps[i]
-            )
-    check_for_spice_error()
-    return p_sclkdps
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                sce2c_c(
+                    c_sc,
+                    c_ets[i],
+                    &c_sclkdps[i]
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        return c_errors.finish(p_sclkdps)
 
 
 def sce2c(
@@ -5335,13 +7256,14 @@ def sce2s_s(
     cdef int c_sc = sc
     cdef double c_et = et
     cdef char[_default_len_out] c_buffer
-    sce2s_c(
-        c_sc,
-        c_et,
-        _default_len_out,
-        &c_buffer[0]
-    )
-    check_for_spice_error()
+    with _cspice:
+        sce2s_c(
+            c_sc,
+            c_et,
+            _default_len_out,
+            &c_buffer[0]
+        )
+        check_for_spice_error()
     p_sclks = PyUnicode_DecodeUTF8(c_buffer, strlen(c_buffer), "strict")
     return p_sclks
 
@@ -5350,7 +7272,9 @@ def sce2s_s(
 @wraparound(False)
 def sce2s_v(
     int sc,
-    double[::1] ets
+    double[::1] ets,
+    *,
+    str errors="raise"
     ) -> String_N:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.sce2s`
@@ -5363,6 +7287,7 @@ def sce2s_v(
     :param sc: NAIF spacecraft clock ID code.
     :param ets: Ephemeris times, specified as seconds past J2000 TDB.
     :param lenout: Maximum length of output string.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return: An SCLK string.
     """
     cdef int c_sc = sc
@@ -5374,19 +7299,23 @@ def sce2s_v(
     cdef np.ndarray[np.uint8_t, ndim=2, mode='c'] p_sclkchs = np.zeros((n, _default_len_out), dtype=np.uint8, order='C')
     cdef np.uint8_t[:, ::1] c_sclkchs = p_sclkchs
     cdef char* base = <char*> &c_sclkchs[0, 0]
-    with nogil:
-        for i in range(n):
-            sce2s_c(
-                c_sc,
-                c_ets[i],
-                _default_len_out,
-                base + i*_default_len_out
-            )
-    check_for_spice_error()
-    # return values
-    py_sclkchs = p_sclkchs.view(p_np_s_dtype).reshape(n)
-    py_sclkchs = np.char.rstrip(py_sclkchs).astype(p_np_u_dtype)
-    return py_sclkchs
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                sce2s_c(
+                    c_sc,
+                    c_ets[i],
+                    _default_len_out,
+                    base + i*_default_len_out
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        # return values
+        py_sclkchs = p_sclkchs.view(p_np_s_dtype).reshape(n)
+        py_sclkchs = np.char.rstrip(py_sclkchs).astype(p_np_u_dtype)
+        return c_errors.finish(py_sclkchs)
 
 
 def sce2s(
@@ -5427,12 +7356,13 @@ def scs2e_s(
     cdef int c_sc = sc
     cdef double c_et = 0.0
     cdef const char* c_sclkch = sclkch
-    scs2e_c(
-        c_sc,
-        c_sclkch,
-        &c_et
-    )
-    check_for_spice_error()
+    with _cspice:
+        scs2e_c(
+            c_sc,
+            c_sclkch,
+            &c_et
+        )
+        check_for_spice_error()
     return c_et
 
 
@@ -5440,7 +7370,10 @@ def scs2e_s(
 @wraparound(False)
 def scs2e_v(
     int sc,
-    np.ndarray sclkchs
+    np.ndarray sclkchs,
+    *,
+    object out=None,
+    str errors="raise"
     ) -> Double_N:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.scs2e`
@@ -5451,25 +7384,32 @@ def scs2e_v(
 
     :param sc: NAIF integer code for a spacecraft.
     :param sclkchs: SCLK strings.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return: Ephemeris time, seconds past J2000.
     """
     cdef int c_sc = sc
     cdef Py_ssize_t i, n = sclkchs.shape[0]
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_ets = np.empty(n, dtype=np.double, order='C')
+    cdef tuple c_out = _check_out(out, 1)
+    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_ets = _output(c_out, 0, (n,), np.double)
     cdef np.double_t[::1] c_ets = p_ets
     cdef const char* c_sclkchs
     # coerce unicode to a byte-string array
     if sclkchs.dtype.kind == 'U':
         sclkchs = np.char.encode(sclkchs, 'ascii')
-    for i in range(n):
-        c_sclkchs = sclkchs[i]
-        scs2e_c(
-            c_sc,
-            c_sclkchs,
-            &c_ets[i]
-        )
-    check_for_spice_error()
-    return p_ets
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
+    with _cspice:
+        for i in range(n):
+            c_sclkchs = sclkchs[i]
+            scs2e_c(
+                c_sc,
+                c_sclkchs,
+                &c_ets[i]
+            )
+            if c_errors.capture(i):
+                break
+        c_errors.check(sclkchs)
+        return c_errors.finish(p_ets)
 
 
 def scs2e(
@@ -5510,12 +7450,13 @@ def sct2e_s(
     cdef double c_sclkdp = sclkdp
     cdef int c_sc = sc
     cdef double et = 0.0
-    sct2e_c(
-        c_sc,
-        c_sclkdp,
-        &et
-    )
-    check_for_spice_error()
+    with _cspice:
+        sct2e_c(
+            c_sc,
+            c_sclkdp,
+            &et
+        )
+        check_for_spice_error()
     return et
 
 
@@ -5523,7 +7464,10 @@ def sct2e_s(
 @wraparound(False)
 def sct2e_v(
     int sc,
-    double[::1] sclkdps
+    double[::1] sclkdps,
+    *,
+    object out=None,
+    str errors="raise"
     ) -> Double_N:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.sct2e`
@@ -5535,22 +7479,29 @@ def sct2e_v(
 
     :param sc: NAIF spacecraft ID code.
     :param sclkdps: SCLKs, encoded as ticks since spacecraft clock start.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return: Ephemeris time, seconds past J2000.
     """
     cdef int c_sc = sc
     cdef const np.double_t[::1] c_sclkdps = np.ascontiguousarray(sclkdps, dtype=np.double)
     cdef Py_ssize_t i, n = c_sclkdps.shape[0]
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_ets = np.empty(n, dtype=np.double, order='C')
+    cdef tuple c_out = _check_out(out, 1)
+    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_ets = _output(c_out, 0, (n,), np.double)
     cdef np.double_t[::1] c_ets = p_ets
-    with nogil:
-        for i in range(n):
-            sct2e_c(
-                c_sc,
-                c_sclkdps[i],
-                &c_ets[i]
-            )
-    check_for_spice_error()
-    return p_ets
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                sct2e_c(
+                    c_sc,
+                    c_sclkdps[i],
+                    &c_ets[i]
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_sclkdps)
+        return c_errors.finish(p_ets)
 
 
 def sct2e(
@@ -5584,7 +7535,7 @@ def spd() -> float:
     return spd_c()
 
 
-cpdef tuple[float, float, float] sphcyl_s(
+cpdef tuple[double, double, double] sphcyl_s(
     radius: float, 
     colat: float, 
     slon: float
@@ -5623,7 +7574,8 @@ cpdef tuple[float, float, float] sphcyl_s(
 cpdef np.ndarray[np.double_t, ndim=2, mode='c'] sphcyl_v(
     const double[::1] radius, 
     const double[::1] colat, 
-    const double[::1] slon
+    const double[::1] slon,
+    object out=None
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.sphcyl`
@@ -5635,6 +7587,7 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] sphcyl_v(
     :param radius: Distance of point from origin.
     :param colat: Polar angle (co-latitude in radians) of point.
     :param slon: Azimuthal angle (longitude) of point (radians).
+    :param out: Optional preallocated output arrays, one per returned array.
     :return:
             Distance of point from z axis,
             angle (radians) of point from XZ plane,
@@ -5644,8 +7597,9 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] sphcyl_v(
     cdef Py_ssize_t i, n = c_radius.shape[0]
     cdef const np.double_t[::1] c_colat = np.ascontiguousarray(colat, dtype=np.double)
     cdef const np.double_t[::1] c_slon = np.ascontiguousarray(slon, dtype=np.double)
+    cdef tuple c_out = _check_out(out, 1)
     # allocate output array
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_cyl = np.empty((n,3), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_cyl = _output(c_out, 0, (n, 3), np.double)
     cdef np.double_t[:,::1] c_cyl = p_cyl
     # TODO fix strides lookups below
     _check_same_len(n, c_colat.shape[0], "radius", "colat")
@@ -5687,7 +7641,7 @@ def sphcyl(
         return sphcyl_v(radius, colat, slon)
 
 
-cpdef tuple[float, float, float] sphlat_s(
+cpdef tuple[double, double, double] sphlat_s(
     r: float, 
     colat: float, 
     lons: float
@@ -5726,7 +7680,8 @@ cpdef tuple[float, float, float] sphlat_s(
 cpdef np.ndarray[np.double_t, ndim=2, mode='c'] sphlat_v(
     const double[::1] r, 
     const double[::1] colat, 
-    const double[::1] lons
+    const double[::1] lons,
+    object out=None
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.sphlat`
@@ -5738,6 +7693,7 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] sphlat_v(
     :param r: Distance of the point from the origin.
     :param colat: Angle of the point from positive z axis (radians).
     :param lons: Angle of the point from the XZ plane (radians).
+    :param out: Optional preallocated output arrays, one per returned array.
     :return:
             Distance of a point from the origin,
             Angle of the point from the XZ plane in radians,
@@ -5747,8 +7703,9 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] sphlat_v(
     cdef Py_ssize_t i, n = c_r.shape[0]
     cdef const np.double_t[::1] c_colat = np.ascontiguousarray(colat, dtype=np.double)
     cdef const np.double_t[::1] c_lons = np.ascontiguousarray(lons, dtype=np.double)
+    cdef tuple c_out = _check_out(out, 1)
     # allocate output array
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_lat = np.empty((n,3), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_lat = _output(c_out, 0, (n, 3), np.double)
     cdef np.double_t[:,::1] c_lat = p_lat
     # TODO fix strides lookups below
     _check_same_len(n, c_colat.shape[0], "r", "colat")
@@ -5824,7 +7781,8 @@ cpdef np.ndarray[np.double_t, ndim=1, mode='c'] sphrec_s(
 cpdef np.ndarray[np.double_t, ndim=2, mode='c'] sphrec_v(
     const double[::1] r, 
     const double[::1] colat, 
-    const double[::1] lons
+    const double[::1] lons,
+    object out=None
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.sphrec`
@@ -5836,14 +7794,16 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] sphrec_v(
     :param r: Distance of a point from the origin.
     :param colat: Angle of the point from the positive Z-axis.
     :param slon: Angle of the point from the XZ plane in radians.
+    :param out: Optional preallocated output arrays, one per returned array.
     :return: Rectangular coordinates of the point.
     """
     cdef const np.double_t[::1] c_r = np.ascontiguousarray(r, dtype=np.double)
     cdef Py_ssize_t i, n = c_r.shape[0]
     cdef const np.double_t[::1] c_colat = np.ascontiguousarray(colat, dtype=np.double)
     cdef const np.double_t[::1] c_lons = np.ascontiguousarray(lons, dtype=np.double)
+    cdef tuple c_out = _check_out(out, 1)
     # allocate output array
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_rec = np.empty((n,3), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_rec = _output(c_out, 0, (n, 3), np.double)
     cdef np.double_t[:,::1] c_rec = p_rec
     # TODO fix strides lookups below
     _check_same_len(n, c_colat.shape[0], "r", "colat")
@@ -5917,31 +7877,38 @@ def spkapo_s(
     # initialize output arrays
     cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_ptarg = np.empty(3, dtype=np.double, order='C')
     cdef np.double_t[::1] c_ptarg = p_ptarg
-    spkapo_c(
-        c_targ,
-        c_et,
-        c_ref,
-        c_sobs,
-        c_abcorr,
-        &c_ptarg[0],
-        &c_lt
-    )
-    check_for_spice_error()
+    with _cspice:
+        spkapo_c(
+            c_targ,
+            c_et,
+            c_ref,
+            c_sobs,
+            c_abcorr,
+            &c_ptarg[0],
+            &c_lt
+        )
+        check_for_spice_error()
     return p_ptarg, c_lt
 
 
 @boundscheck(False)
 @wraparound(False)
 def spkapo_v(
-    int targ,
-    double[::1] ets,
-    str ref,
-    double[::1] sobs,
-    str abcorr
+    targ,
+    ets,
+    ref,
+    sobs,
+    abcorr,
+    *,
+    object out=None,
+    str errors="raise"
     ) -> tuple[Vector_N, Double_N]:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.spkapo`
 
+    All arguments except the output and error options broadcast against each other
+    following NumPy rules, string arguments may be arrays of names.
+
     Return the position of a target body relative to an observer,
     optionally corrected for light time and stellar aberration.
 
@@ -5950,46 +7917,56 @@ def spkapo_v(
     :param targ: Target body.
     :param ets: Observer epochs in seconds past J2000 TDB..
     :param ref: Inertial reference frame of observer's state.
-    :param sobs: State of observer wrt. solar system barycenter.
+    :param sobs: States of observer wrt. solar system barycenter.
     :param abcorr: Aberration correction flag.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return:
             Position of target in km,
             One way light time between observer and target in seconds.
     """
+    # broadcast the arguments against each other
+    cdef tuple shape = np.broadcast_shapes(
+        np.shape(targ), np.shape(ets), np.shape(ref), _outer_shape(sobs), np.shape(abcorr)
+    )
+    cdef Py_ssize_t i, n = _shape_size(shape)
     # initialize c variables
-    cdef int c_targ = targ
-    cdef const np.double_t[::1] c_ets = np.ascontiguousarray(ets, dtype=np.double)
-    cdef Py_ssize_t i, n = c_ets.shape[0]
-    cdef const np.double_t[::1] c_sobs = np.ascontiguousarray(sobs, dtype=np.double)
-    # convert the strings to pointers once
-    cdef const char* c_ref    = ref
-    cdef const char* c_abcorr = abcorr
+    cdef _IntArg c_targ   = _IntArg(targ, shape)
+    cdef _DblArg c_ets    = _DblArg(ets, shape)
+    cdef _StrArg c_ref    = _StrArg(ref, shape)
+    cdef _VecArg c_sobs   = _VecArg(sobs, shape, 6)
+    cdef _StrArg c_abcorr = _StrArg(abcorr, shape)
+    cdef tuple c_out = _check_out(out, 2)
     # initialize output arrays
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_ptargs = np.empty((n, 3), dtype=np.double, order='C')
-    cdef np.double_t[:, ::1] c_ptargs = p_ptargs
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_lts = np.empty(n, dtype=np.double, order='C')
-    cdef np.double_t[::1] c_lts = p_lts
-    # perform the call
-    with nogil:
-        for i in range(n):
-            spkapo_c(
-                c_targ,
-                c_ets[i],
-                c_ref,
-                &c_sobs[0],
-                c_abcorr,
-                &c_ptargs[i, 0],
-                &c_lts[i]
-            )
-    check_for_spice_error()
-    return p_ptargs, p_lts
+    cdef np.ndarray p_ptargs = _output(c_out, 0, shape + (3,), np.double)
+    cdef np.double_t[:, ::1] c_ptargs = p_ptargs.reshape(n, 3)
+    cdef np.ndarray p_lts = _output(c_out, 1, shape, np.double)
+    cdef np.double_t[::1] c_lts = p_lts.reshape(n)
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, shape)
+    # main loop
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                spkapo_c(
+                    c_targ.at(i),
+                    c_ets.at(i),
+                    c_ref.at(i),
+                    c_sobs.at(i),
+                    c_abcorr.at(i),
+                    &c_ptargs[i, 0],
+                    &c_lts[i]
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        return c_errors.finish((p_ptargs, p_lts))
 
 
 def spkapo(
     targ: int,
     et: float | float[::1],
     ref: str,
-    sobs: float[::1],
+    sobs: float[::1] | float[:, ::1],
     abcorr: str
     ) -> tuple[Vector, float] | tuple[Vector_N, Double_N]:
     """
@@ -6007,7 +7984,7 @@ def spkapo(
             Position of target in km,
             One way light time between observer and target in seconds.
     """
-    if PyFloat_Check(et):
+    if PyFloat_Check(et) and not _batched(sobs, 1):
         return spkapo_s(targ, et, ref, sobs, abcorr)
     else:
         return spkapo_v(targ, et, ref, sobs, abcorr)
@@ -6062,19 +8039,20 @@ def spkcpo_s(
     cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_state = np.empty(6, dtype=np.double, order='C')
     cdef np.double_t[::1] c_state = p_state
     # perform the call
-    spkcpo_c(
-        c_target,
-        c_et,
-        c_outref,
-        c_refloc,
-        c_abcorr,
-        c_obspos,
-        c_obsctr,
-        c_obsref,
-        &c_state[0],
-        &c_lt
-    )
-    check_for_spice_error()
+    with _cspice:
+        spkcpo_c(
+            c_target,
+            c_et,
+            c_outref,
+            c_refloc,
+            c_abcorr,
+            c_obspos,
+            c_obsctr,
+            c_obsref,
+            &c_state[0],
+            &c_lt
+        )
+        check_for_spice_error()
     # return output
     return p_state, c_lt
 
@@ -6089,7 +8067,10 @@ def spkcpo_v(
     str abcorr,
     double[::1] obspos,
     str obsctr,
-    str obsref) -> tuple[State_N, Double_N]:
+    str obsref,
+    *,
+    object out=None,
+    str errors="raise") -> tuple[State_N, Double_N]:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.spkcpo`
 
@@ -6108,6 +8089,8 @@ def spkcpo_v(
     :param obspos: Observer position relative to center of motion.
     :param obsctr: Center of motion of observer.
     :param obsref: Frame of observer position.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return:
             State of target with respect to observer in km and km/sec,
             One way light time between target and observer.
@@ -6122,29 +8105,34 @@ def spkcpo_v(
     cdef const char* c_abcorr   = abcorr
     cdef const char* c_obsctr   = obsctr
     cdef const char* c_obsref   = obsref
+    cdef tuple c_out = _check_out(out, 2)
     # initialize output arrays
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_states = np.empty((n, 6), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_states = _output(c_out, 0, (n, 6), np.double)
     cdef np.double_t[:, ::1] c_states = p_states
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_lts = np.empty(n, dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_lts = _output(c_out, 1, (n,), np.double)
     cdef np.double_t[::1] c_lts = p_lts
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
     # perform the call
-    with nogil:
-        for i in range(n):
-            spkcpo_c(
-                c_target,
-                c_ets[i],
-                c_outref,
-                c_refloc,
-                c_abcorr,
-                &c_obspos[0],
-                c_obsctr,
-                c_obsref,
-                &c_states[i, 0],
-                &c_lts[i]
-            )
-    check_for_spice_error()
-    # return output
-    return p_states, p_lts
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                spkcpo_c(
+                    c_target,
+                    c_ets[i],
+                    c_outref,
+                    c_refloc,
+                    c_abcorr,
+                    &c_obspos[0],
+                    c_obsctr,
+                    c_obsref,
+                    &c_states[i, 0],
+                    &c_lts[i]
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        # return output
+        return c_errors.finish((p_states, p_lts))
 
 
 def spkcpo(
@@ -6233,19 +8221,20 @@ def spkcpt_s(
     cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_state = np.empty(6, dtype=np.double, order='C')
     cdef np.double_t[::1] c_state = p_state
     # perform the call
-    spkcpt_c(
-        c_trgpos,
-        c_trgctr,
-        c_trgref,
-        c_et,
-        c_outref,
-        c_refloc,
-        c_abcorr,
-        c_obsrvr,
-        &c_state[0],
-        &c_lt
-    )
-    check_for_spice_error()
+    with _cspice:
+        spkcpt_c(
+            c_trgpos,
+            c_trgctr,
+            c_trgref,
+            c_et,
+            c_outref,
+            c_refloc,
+            c_abcorr,
+            c_obsrvr,
+            &c_state[0],
+            &c_lt
+        )
+        check_for_spice_error()
     # return output
     return p_state, c_lt
 
@@ -6260,7 +8249,10 @@ def spkcpt_v(
     str outref,
     str refloc,
     str abcorr,
-    str obsrvr
+    str obsrvr,
+    *,
+    object out=None,
+    str errors="raise"
     ) -> tuple[State_N, Double_N]:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.spkcpt`
@@ -6280,6 +8272,8 @@ def spkcpt_v(
     :param refloc: Output reference frame evaluation locus.
     :param abcorr: Aberration correction.
     :param obsrvr: Name of observing ephemeris object.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return:
             State of target with respect to observer in km and km/sec,
             One way light time between target and observer.
@@ -6296,29 +8290,34 @@ def spkcpt_v(
     cdef const char* c_obsrvr   = obsrvr
     # convert input c arrays
     cdef const double* c_trgpos = &trgpos[0]
+    cdef tuple c_out = _check_out(out, 2)
     # initialize output arrays
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_states = np.empty((n, 6), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_states = _output(c_out, 0, (n, 6), np.double)
     cdef np.double_t[:, ::1] c_states = p_states
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_lts = np.empty(n, dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_lts = _output(c_out, 1, (n,), np.double)
     cdef np.double_t[::1] c_lts = p_lts
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
     # perform the call
-    with nogil:
-        for i in range(n):
-            spkcpt_c(
-                c_trgpos,
-                c_trgctr,
-                c_trgref,
-                c_ets[i],
-                c_outref,
-                c_refloc,
-                c_abcorr,
-                c_obsrvr,
-                &c_states[i, 0],
-                &c_lts[i]
-            )
-    check_for_spice_error()
-    # return output
-    return p_states, p_lts
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                spkcpt_c(
+                    c_trgpos,
+                    c_trgctr,
+                    c_trgref,
+                    c_ets[i],
+                    c_outref,
+                    c_refloc,
+                    c_abcorr,
+                    c_obsrvr,
+                    &c_states[i, 0],
+                    &c_lts[i]
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        # return output
+        return c_errors.finish((p_states, p_lts))
 
 
 def spkcpt(
@@ -6409,20 +8408,21 @@ def spkcvo_s(
     cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_state = np.empty(6, dtype=np.double, order='C')
     cdef np.double_t[::1] c_state = p_state
     # perform the call
-    spkcvo_c(
-        c_target,
-        c_et,
-        c_outref,
-        c_refloc,
-        c_abcorr,
-        c_obssta,
-        c_obsepc,
-        c_obsctr,
-        c_obsref,
-        &c_state[0],
-        &c_lt
-    )
-    check_for_spice_error()
+    with _cspice:
+        spkcvo_c(
+            c_target,
+            c_et,
+            c_outref,
+            c_refloc,
+            c_abcorr,
+            c_obssta,
+            c_obsepc,
+            c_obsctr,
+            c_obsref,
+            &c_state[0],
+            &c_lt
+        )
+        check_for_spice_error()
     # return output
     return p_state, c_lt
 
@@ -6438,7 +8438,10 @@ def spkcvo_v(
     double[::1] obssta,
     double obsepc,
     str obsctr,
-    str obsref)-> tuple[State_N, Double_N]:
+    str obsref,
+    *,
+    object out=None,
+    str errors="raise")-> tuple[State_N, Double_N]:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.spkcvo`
 
@@ -6458,6 +8461,8 @@ def spkcvo_v(
     :param obsepc: Epoch of observer state.
     :param obsctr: Center of motion of observer.
     :param obsref: Frame of observer state.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return:
             State of target with respect to observer in km and km/sec,
             One way light time between target and observer.
@@ -6475,30 +8480,35 @@ def spkcvo_v(
     cdef const char* c_obsref   = obsref
     # convert input c arrays
     cdef const double* c_obssta = &obssta[0]
+    cdef tuple c_out = _check_out(out, 2)
     # initialize output arrays
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_states = np.empty((n, 6), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_states = _output(c_out, 0, (n, 6), np.double)
     cdef np.double_t[:, ::1] c_states = p_states
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_lts = np.empty(n, dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_lts = _output(c_out, 1, (n,), np.double)
     cdef np.double_t[::1] c_lts = p_lts
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
     # perform the call
-    with nogil:
-        for i in range(n):
-            spkcvo_c(
-                c_target,
-                c_ets[i],
-                c_outref,
-                c_refloc,
-                c_abcorr,
-                c_obssta,
-                c_obsepc,
-                c_obsctr,
-                c_obsref,
-                &c_states[i, 0],
-                &c_lts[i]
-            )
-    check_for_spice_error()
-    # return output
-    return p_states, p_lts
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                spkcvo_c(
+                    c_target,
+                    c_ets[i],
+                    c_outref,
+                    c_refloc,
+                    c_abcorr,
+                    c_obssta,
+                    c_obsepc,
+                    c_obsctr,
+                    c_obsref,
+                    &c_states[i, 0],
+                    &c_lts[i]
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        # return output
+        return c_errors.finish((p_states, p_lts))
 
 
 def spkcvo(
@@ -6591,20 +8601,21 @@ def spkcvt_s(
     cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_state = np.empty(6, dtype=np.double, order='C')
     cdef np.double_t[::1] c_state = p_state
     # perform the call
-    spkcvt_c(
-        c_trgsta,
-        c_trgepc,
-        c_trgctr,
-        c_trgref,
-        c_et,
-        c_outref,
-        c_refloc,
-        c_abcorr,
-        c_obsrvr,
-        &c_state[0],
-        &c_lt
-    )
-    check_for_spice_error()
+    with _cspice:
+        spkcvt_c(
+            c_trgsta,
+            c_trgepc,
+            c_trgctr,
+            c_trgref,
+            c_et,
+            c_outref,
+            c_refloc,
+            c_abcorr,
+            c_obsrvr,
+            &c_state[0],
+            &c_lt
+        )
+        check_for_spice_error()
     # return output
     return p_state, c_lt
 
@@ -6620,7 +8631,10 @@ def spkcvt_v(
     str outref,
     str refloc,
     str abcorr,
-    str obsrvr)-> tuple[State_N, Double_N]:
+    str obsrvr,
+    *,
+    object out=None,
+    str errors="raise")-> tuple[State_N, Double_N]:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.spkcvt`
 
@@ -6640,6 +8654,8 @@ def spkcvt_v(
     :param refloc: Output reference frame evaluation locus.
     :param abcorr: Aberration correction.
     :param obsrvr: Name of observing ephemeris object.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return:
             State of target with respect to observer in km and km/sec,
             One way light time between target and observer.
@@ -6657,30 +8673,35 @@ def spkcvt_v(
     cdef const char* c_obsrvr   = obsrvr
     # convert input c arrays
     cdef const double* c_trgsta = &trgsta[0]
+    cdef tuple c_out = _check_out(out, 2)
     # initialize output arrays
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_states = np.empty((n, 6), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_states = _output(c_out, 0, (n, 6), np.double)
     cdef np.double_t[:, ::1] c_states = p_states
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_lts = np.empty(n, dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_lts = _output(c_out, 1, (n,), np.double)
     cdef np.double_t[::1] c_lts = p_lts
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
     # perform the call
-    with nogil:
-        for i in range(n):
-            spkcvt_c(
-                c_trgsta,
-                c_trgepc,
-                c_trgctr,
-                c_trgref,
-                c_ets[i],
-                c_outref,
-                c_refloc,
-                c_abcorr,
-                c_obsrvr,
-                &c_states[i, 0],
-                &c_lts[i]
-            )
-    check_for_spice_error()
-    # return output
-    return p_states, p_lts
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                spkcvt_c(
+                    c_trgsta,
+                    c_trgepc,
+                    c_trgctr,
+                    c_trgref,
+                    c_ets[i],
+                    c_outref,
+                    c_refloc,
+                    c_abcorr,
+                    c_obsrvr,
+                    &c_states[i, 0],
+                    &c_lts[i]
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        # return output
+        return c_errors.finish((p_states, p_lts))
 
 
 def spkcvt(
@@ -6728,7 +8749,10 @@ def spkez_s(
     double et,
     str ref,
     str abcorr,
-    int obs
+    int obs,
+    *,
+    object out=None,
+    bint astuple=False
     )-> tuple[State, float]:
     """
     Scalar version of :py:meth:`~spiceypy.cyice.cyice.spkez`
@@ -6744,6 +8768,8 @@ def spkez_s(
     :param ref: Reference frame of output state vector.
     :param abcorr: Aberration correction flag.
     :param obs: Observing body.
+    :param out: Optional preallocated array the state is written to.
+    :param astuple: Return the state as a tuple of floats instead of an array.
     :return:
             State of target in km and km/sec,
             One way light time between observer and target in seconds.
@@ -6757,32 +8783,41 @@ def spkez_s(
     cdef const char* c_abcorr = abcorr
     # allocate output variables
     cdef double c_lt = 0.0
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_state = np.empty(6, dtype=np.double, order='C')
-    cdef np.double_t[::1] c_state = p_state
-    spkez_c(
-        c_targ,
-        c_et,
-        c_ref,
-        c_abcorr,
-        c_obs,
-        &c_state[0],
-        &c_lt
-    )
-    check_for_spice_error()
-    return p_state, c_lt
+    cdef double[6] t_state
+    cdef np.ndarray p_state = _scalar_output(out, astuple, 0, 1, 6, 0)
+    cdef double* c_state = _output_data(p_state, t_state)
+    with _cspice:
+        spkez_c(
+            c_targ,
+            c_et,
+            c_ref,
+            c_abcorr,
+            c_obs,
+            c_state,
+            &c_lt
+        )
+        check_for_spice_error()
+    return _scalar_result(p_state, c_state, 6, 0), c_lt
 
 
 @boundscheck(False)
 @wraparound(False)
 def spkez_v(
-    int targ,
-    double[::1] et,
-    str ref,
-    str abcorr,
-    int obs)-> tuple[State_N, Double_N]:
+    targ,
+    et,
+    ref,
+    abcorr,
+    obs,
+    *,
+    object out=None,
+    str errors="raise"
+    ) -> tuple[State_N, Double_N]:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.spkez`
 
+    All arguments except the output and error options broadcast against each other
+    following NumPy rules, string arguments may be arrays of names.
+
     Return the state (position and velocity) of a target body
     relative to an observing body, optionally corrected for light
     time (planetary aberration) and stellar aberration.
@@ -6794,38 +8829,47 @@ def spkez_v(
     :param ref: Reference frame of output state vector.
     :param abcorr: Aberration correction flag.
     :param obs: Observing body.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return:
             State of target in km and km/sec,
             One way light time between observer and target in seconds.
     """
+    # broadcast the arguments against each other
+    cdef tuple shape = np.broadcast_shapes(
+        np.shape(targ), np.shape(et), np.shape(ref), np.shape(abcorr), np.shape(obs)
+    )
+    cdef Py_ssize_t i, n = _shape_size(shape)
     # initialize c variables
-    cdef const np.double_t[::1] c_ets = np.ascontiguousarray(et, dtype=np.double)
-    cdef Py_ssize_t i, n = c_ets.shape[0]
-    # convert the strings to pointers once
-    cdef int c_targ        = targ
-    cdef const char* c_ref    = ref
-    cdef const char* c_abcorr = abcorr
-    cdef int c_obs = obs
+    cdef _IntArg c_targ   = _IntArg(targ, shape)
+    cdef _DblArg c_et     = _DblArg(et, shape)
+    cdef _StrArg c_ref    = _StrArg(ref, shape)
+    cdef _StrArg c_abcorr = _StrArg(abcorr, shape)
+    cdef _IntArg c_obs    = _IntArg(obs, shape)
+    cdef tuple c_out = _check_out(out, 2)
     # initialize output arrays
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_states = np.empty((n, 6), dtype=np.double, order='C')
-    cdef np.double_t[:, ::1] c_states = p_states
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_lts = np.empty(n, dtype=np.double, order='C')
-    cdef np.double_t[::1] c_lts = p_lts
+    cdef np.ndarray p_states = _output(c_out, 0, shape + (6,), np.double)
+    cdef np.double_t[:, ::1] c_states = p_states.reshape(n, 6)
+    cdef np.ndarray p_lts = _output(c_out, 1, shape, np.double)
+    cdef np.double_t[::1] c_lts = p_lts.reshape(n)
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, shape)
     # main loop
-    with nogil:
-        for i in range(n):
-            spkez_c(
-                c_targ,
-                c_ets[i],
-                c_ref,
-                c_abcorr,
-                c_obs,
-                &c_states[i, 0],
-                &c_lts[i]
-            )
-    check_for_spice_error()
-
-    return p_states, p_lts
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                spkez_c(
+                    c_targ.at(i),
+                    c_et.at(i),
+                    c_ref.at(i),
+                    c_abcorr.at(i),
+                    c_obs.at(i),
+                    &c_states[i, 0],
+                    &c_lts[i]
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_et)
+        return c_errors.finish((p_states, p_lts))
 
 
 def spkez(
@@ -6864,7 +8908,10 @@ def spkezp_s(
     double et,
     str ref,
     str abcorr,
-    int obs
+    int obs,
+    *,
+    object out=None,
+    bint astuple=False
     ) -> tuple[Vector, float]:
     """
     Scalar version of :py:meth:`~spiceypy.cyice.cyice.spkezp`
@@ -6880,6 +8927,8 @@ def spkezp_s(
     :param ref: Reference frame of output position vector.
     :param abcorr: Aberration correction flag.
     :param obs: Observing body NAIF ID code.
+    :param out: Optional preallocated array the position is written to.
+    :param astuple: Return the position as a tuple of floats instead of an array.
     :return:
             Position of target in km,
             One way light time between observer and target in seconds.
@@ -6893,33 +8942,41 @@ def spkezp_s(
     cdef const char* c_ref    = ref
     cdef const char* c_abcorr = abcorr
     # initialize output arrays
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_ptarg = np.empty(3, dtype=np.double, order='C')
-    cdef np.double_t[::1] c_ptarg = p_ptarg
-    spkezp_c(
-        c_targ,
-        c_et,
-        c_ref,
-        c_abcorr,
-        c_obs,
-        &c_ptarg[0],
-        &c_lt
-    )
-    check_for_spice_error()
-    return p_ptarg, c_lt
+    cdef double[3] t_ptarg
+    cdef np.ndarray p_ptarg = _scalar_output(out, astuple, 0, 1, 3, 0)
+    cdef double* c_ptarg = _output_data(p_ptarg, t_ptarg)
+    with _cspice:
+        spkezp_c(
+            c_targ,
+            c_et,
+            c_ref,
+            c_abcorr,
+            c_obs,
+            c_ptarg,
+            &c_lt
+        )
+        check_for_spice_error()
+    return _scalar_result(p_ptarg, c_ptarg, 3, 0), c_lt
 
 
 @boundscheck(False)
 @wraparound(False)
 def spkezp_v(
-    int targ,
-    double[::1] et,
-    str ref,
-    str abcorr,
-    int obs
-    )-> tuple[Vector_N, Double_N]:
+    targ,
+    et,
+    ref,
+    abcorr,
+    obs,
+    *,
+    object out=None,
+    str errors="raise"
+    ) -> tuple[Vector_N, Double_N]:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.spkezp`
 
+    All arguments except the output and error options broadcast against each other
+    following NumPy rules, string arguments may be arrays of names.
+
     Return the position of a target body relative to an observing
     body, optionally corrected for light time (planetary aberration)
     and stellar aberration.
@@ -6931,37 +8988,47 @@ def spkezp_v(
     :param ref: Reference frame of output position vector.
     :param abcorr: Aberration correction flag.
     :param obs: Observing body NAIF ID code.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return:
             Position of target in km,
             One way light time between observer and target in seconds.
     """
-    cdef const np.double_t[::1] c_ets = np.ascontiguousarray(et, dtype=np.double)
-    cdef Py_ssize_t i, n = c_ets.shape[0]
-    # convert the strings to pointers once
-    cdef const char* c_ref    = ref
-    cdef const char* c_abcorr = abcorr
-    cdef int c_targ = targ
-    cdef int c_obs  = obs
+    # broadcast the arguments against each other
+    cdef tuple shape = np.broadcast_shapes(
+        np.shape(targ), np.shape(et), np.shape(ref), np.shape(abcorr), np.shape(obs)
+    )
+    cdef Py_ssize_t i, n = _shape_size(shape)
+    # initialize c variables
+    cdef _IntArg c_targ   = _IntArg(targ, shape)
+    cdef _DblArg c_et     = _DblArg(et, shape)
+    cdef _StrArg c_ref    = _StrArg(ref, shape)
+    cdef _StrArg c_abcorr = _StrArg(abcorr, shape)
+    cdef _IntArg c_obs    = _IntArg(obs, shape)
+    cdef tuple c_out = _check_out(out, 2)
     # initialize output arrays
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_ptargs = np.empty((n, 3), dtype=np.double, order='C')
-    cdef np.double_t[:, ::1] c_ptargs = p_ptargs
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_lts = np.empty(n, dtype=np.double, order='C')
-    cdef np.double_t[::1] c_lts = p_lts
+    cdef np.ndarray p_ptargs = _output(c_out, 0, shape + (3,), np.double)
+    cdef np.double_t[:, ::1] c_ptargs = p_ptargs.reshape(n, 3)
+    cdef np.ndarray p_lts = _output(c_out, 1, shape, np.double)
+    cdef np.double_t[::1] c_lts = p_lts.reshape(n)
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, shape)
     # main loop
-    with nogil:
-        for i in range(n):
-            spkezp_c(
-                c_targ,
-                c_ets[i],
-                c_ref,
-                c_abcorr,
-                c_obs,
-                &c_ptargs[i, 0],
-                &c_lts[i]
-            )
-    check_for_spice_error()
-
-    return p_ptargs, p_lts
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                spkezp_c(
+                    c_targ.at(i),
+                    c_et.at(i),
+                    c_ref.at(i),
+                    c_abcorr.at(i),
+                    c_obs.at(i),
+                    &c_ptargs[i, 0],
+                    &c_lts[i]
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_et)
+        return c_errors.finish((p_ptargs, p_lts))
 
 
 def spkezp(
@@ -7000,7 +9067,10 @@ def spkezr_s(
     double et,
     str ref,
     str abcorr,
-    str obs
+    str obs,
+    *,
+    object out=None,
+    bint astuple=False
     )-> tuple[State, float]:
     """
     Scalar version of :py:meth:`~spiceypy.cyice.cyice.spkezr`
@@ -7016,6 +9086,8 @@ def spkezr_s(
     :param ref: Reference frame of output state vector.
     :param abcorr: Aberration correction flag.
     :param obs: Observing body name.
+    :param out: Optional preallocated array the state is written to.
+    :param astuple: Return the state as a tuple of floats instead of an array.
     :return:
             State of target in km and km/sec,
             One way light time between observer and target in seconds.
@@ -7028,32 +9100,41 @@ def spkezr_s(
     cdef const char* c_abcorr   = abcorr
     cdef const char* c_observer = obs
     # initialize output arrays
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_state = np.empty(6, dtype=np.double, order='C')
-    cdef np.double_t[::1] c_state = p_state
-    spkezr_c(
-        c_target,
-        c_epoch,
-        c_frame,
-        c_abcorr,
-        c_observer,
-        &c_state[0],
-        &c_lt
-    )
-    check_for_spice_error()
-    return p_state, c_lt
+    cdef double[6] t_state
+    cdef np.ndarray p_state = _scalar_output(out, astuple, 0, 1, 6, 0)
+    cdef double* c_state = _output_data(p_state, t_state)
+    with _cspice:
+        spkezr_c(
+            c_target,
+            c_epoch,
+            c_frame,
+            c_abcorr,
+            c_observer,
+            c_state,
+            &c_lt
+        )
+        check_for_spice_error()
+    return _scalar_result(p_state, c_state, 6, 0), c_lt
 
 
 @boundscheck(False)
 @wraparound(False)
 def spkezr_v(
-    str targ,
-    double[::1] et,
-    str ref,
-    str abcorr,
-    str obs)-> tuple[State_N, Double_N]:
+    targ,
+    et,
+    ref,
+    abcorr,
+    obs,
+    *,
+    object out=None,
+    str errors="raise"
+    ) -> tuple[State_N, Double_N]:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.spkezr`
 
+    All arguments except the output and error options broadcast against each other
+    following NumPy rules, string arguments may be arrays of names.
+
     Return the state (position and velocity) of a target body
     relative to an observing body, optionally corrected for light
     time (planetary aberration) and stellar aberration.
@@ -7065,38 +9146,47 @@ def spkezr_v(
     :param ref: Reference frame of output state vector.
     :param abcorr: Aberration correction flag.
     :param obs: Observing body name.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return:
             State of target in km and km/sec,
             One way light time between observer and target in seconds.
     """
+    # broadcast the arguments against each other
+    cdef tuple shape = np.broadcast_shapes(
+        np.shape(targ), np.shape(et), np.shape(ref), np.shape(abcorr), np.shape(obs)
+    )
+    cdef Py_ssize_t i, n = _shape_size(shape)
     # initialize c variables
-    cdef const np.double_t[::1] c_epochs = np.ascontiguousarray(et, dtype=np.double)
-    cdef Py_ssize_t i, n = c_epochs.shape[0]
-    # convert the strings to pointers once
-    cdef const char* c_target   = targ
-    cdef const char* c_frame    = ref
-    cdef const char* c_abcorr   = abcorr
-    cdef const char* c_observer = obs
+    cdef _StrArg c_targ   = _StrArg(targ, shape)
+    cdef _DblArg c_et     = _DblArg(et, shape)
+    cdef _StrArg c_ref    = _StrArg(ref, shape)
+    cdef _StrArg c_abcorr = _StrArg(abcorr, shape)
+    cdef _StrArg c_obs    = _StrArg(obs, shape)
+    cdef tuple c_out = _check_out(out, 2)
     # initialize output arrays
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_states = np.empty((n, 6), dtype=np.double, order='C')
-    cdef np.double_t[:, ::1] c_states = p_states
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_lts = np.empty(n, dtype=np.double, order='C')
-    cdef np.double_t[::1] c_lts = p_lts
+    cdef np.ndarray p_states = _output(c_out, 0, shape + (6,), np.double)
+    cdef np.double_t[:, ::1] c_states = p_states.reshape(n, 6)
+    cdef np.ndarray p_lts = _output(c_out, 1, shape, np.double)
+    cdef np.double_t[::1] c_lts = p_lts.reshape(n)
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, shape)
     # main loop
-    with nogil:
-        for i in range(n):
-            spkezr_c(
-                c_target,
-                c_epochs[i],
-                c_frame,
-                c_abcorr,
-                c_observer,
-                &c_states[i, 0],
-                &c_lts[i]
-            )
-    check_for_spice_error()
-
-    return p_states, p_lts
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                spkezr_c(
+                    c_targ.at(i),
+                    c_et.at(i),
+                    c_ref.at(i),
+                    c_abcorr.at(i),
+                    c_obs.at(i),
+                    &c_states[i, 0],
+                    &c_lts[i]
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_et)
+        return c_errors.finish((p_states, p_lts))
 
 
 def spkezr(
@@ -7128,13 +9218,144 @@ def spkezr(
         return spkezr_v(targ, et, ref, abcorr, obs)
 
 
+@boundscheck(False)
+@wraparound(False)
+def spkezr_targets(
+    targs,
+    ets,
+    str ref,
+    str abcorr,
+    obs,
+    *,
+    object out=None,
+    str errors="raise"
+    ) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return the states of many target bodies relative to one observing
+    body at many epochs, optionally corrected for light time and stellar
+    aberration, as spkezr would for every target and epoch pair.
+
+    The work that only depends on the observer and the epoch is done once
+    per epoch and shared by all targets: the observer's state and
+    acceleration relative to the solar system barycenter, the light time to
+    the center of a non-inertial output frame and the transformation to that
+    frame. Geometric states (abcorr "NONE") are computed with spkgeo so
+    that they match spkezr exactly, sharing only the frame transformation.
+
+    https://naif.jpl.nasa.gov/pub/naif/misc/toolkit_docs_N0067/C/cspice/spkezr_c.html
+
+    :param targs: Target body names or NAIF ID codes.
+    :param ets: Observer epochs in seconds past J2000 TDB.
+    :param ref: Reference frame of output state vectors.
+    :param abcorr: Aberration correction flag.
+    :param obs: Observing body name or NAIF ID code.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
+    :return:
+            States of the targets in km and km/sec with shape (n_targets, n_epochs, 6),
+            One way light times between observer and targets in seconds with shape (n_targets, n_epochs).
+    """
+    # initialize c variables
+    cdef const np.int32_t[::1] c_targs = _body_codes(targs)
+    cdef np.ndarray p_obs = _body_codes(obs)
+    if p_obs.shape[0] != 1:
+        raise ValueError(f"expected a single observer, got {p_obs.shape[0]}")
+    cdef SpiceInt c_obs = p_obs[0]
+    cdef const np.double_t[::1] c_ets = np.ascontiguousarray(ets, dtype=np.double)
+    cdef Py_ssize_t i, j, t, r, c, n = c_targs.shape[0], m = c_ets.shape[0]
+    cdef const char* c_ref = ref
+    cdef const char* c_abcorr = abcorr
+    cdef str corr = abcorr.replace(" ", "").upper()
+    cdef bint geometric = corr == "NONE"
+    cdef bint xmit = corr.startswith("X")
+    # inertial frames need no per epoch transformation, everything else is
+    # computed relative to J2000 and then transformed like spkezr does
+    cdef SpiceInt frcode = 0, center = 0, frclss = 0, clssid = 0
+    cdef SpiceBoolean found = 0
+    cdef bint inertial = False
+    cdef const char* c_work = "J2000"
+    cdef double et = 0.0, lt_center = 0.0, dlt_center = 0.0, dlt = 0.0, scale = 1.0
+    cdef double c_light = clight_c()
+    cdef double[6] stobs, stemp0, stemp1, starg
+    cdef double[3] accobs
+    cdef double[6][6] xform
+    cdef tuple c_out = _check_out(out, 2)
+    # initialize output arrays
+    cdef np.ndarray p_states = _output(c_out, 0, (n, m, 6), np.double)
+    cdef np.double_t[:, ::1] c_states = p_states.reshape(n * m, 6)
+    cdef np.ndarray p_lts = _output(c_out, 1, (n, m), np.double)
+    cdef np.double_t[::1] c_lts = p_lts.reshape(n * m)
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n, m))
+    with _cspice:
+        namfrm_c(c_ref, &frcode)
+        if frcode != 0:
+            frinfo_c(frcode, &center, &frclss, &clssid, &found)
+        check_for_spice_error()
+        inertial = found and frclss == 1
+        if inertial:
+            c_work = c_ref
+        # main loop, epochs outside so the observer work is shared by the targets
+        with nogil:
+            for j in range(m):
+                et = c_ets[j]
+                if not geometric:
+                    # observer state relative to the SSB and its acceleration from
+                    # the velocities one second apart, as in spkacs
+                    spkssb_c(c_obs, et, c_work, stobs)
+                    spkssb_c(c_obs, et - 1.0, c_work, stemp0)
+                    spkssb_c(c_obs, et + 1.0, c_work, stemp1)
+                    for c in range(3):
+                        accobs[c] = (stemp1[c + 3] - stemp0[c + 3]) / 2.0
+                if not inertial:
+                    # evaluate the frame at the light time corrected epoch of its center
+                    lt_center = 0.0
+                    dlt_center = 0.0
+                    if not geometric and center != c_obs:
+                        spkltc_c(center, et, "J2000", c_abcorr, stobs, stemp0, &lt_center, &dlt_center)
+                    if xmit:
+                        sxform_c("J2000", c_ref, et + lt_center, xform)
+                        scale = 1.0 + dlt_center
+                    else:
+                        sxform_c("J2000", c_ref, et - lt_center, xform)
+                        scale = 1.0 - dlt_center
+                    for r in range(3, 6):
+                        for c in range(3):
+                            xform[r][c] *= scale
+                if c_errors.capture_many(j, n, m):
+                    break
+                for t in range(n):
+                    i = t * m + j
+                    if geometric:
+                        if inertial:
+                            spkgeo_c(c_targs[t], et, c_ref, c_obs, &c_states[i, 0], &c_lts[i])
+                        else:
+                            spkgeo_c(c_targs[t], et, "J2000", c_obs, starg, &c_lts[i])
+                            mxvg_c(xform, starg, 6, 6, &c_states[i, 0])
+                            # spkgeo takes the light time from the transformed state
+                            c_lts[i] = vnorm_c(&c_states[i, 0]) / c_light
+                    elif inertial:
+                        spkaps_c(c_targs[t], et, c_ref, c_abcorr, stobs, accobs, &c_states[i, 0], &c_lts[i], &dlt)
+                    else:
+                        spkaps_c(c_targs[t], et, "J2000", c_abcorr, stobs, accobs, starg, &c_lts[i], &dlt)
+                        mxvg_c(xform, starg, 6, 6, &c_states[i, 0])
+                    if c_errors.capture(i):
+                        break
+                if c_errors.index >= 0:
+                    break
+        c_errors.check(np.asarray(c_ets), 1)
+        return c_errors.finish((p_states, p_lts))
+
+
 @boundscheck(False)
 @wraparound(False)
 def spkgeo_s(
     int targ,
     double et,
     str ref,
-    int obs
+    int obs,
+    *,
+    object out=None,
+    bint astuple=False
     )-> tuple[State, float]:
     """
     Scalar version of :py:meth:`~spiceypy.cyice.cyice.spkgeo`
@@ -7148,6 +9369,8 @@ def spkgeo_s(
     :param et: Target epoch.
     :param ref: Target reference frame.
     :param obs: Observing body.
+    :param out: Optional preallocated array the state is written to.
+    :param astuple: Return the state as a tuple of floats instead of an array.
     :return:
         State of target in km and km/sec,
         One way light time between observer and target in seconds.
@@ -7160,33 +9383,41 @@ def spkgeo_s(
     # convert the strings to pointers once
     cdef const char* c_ref   = ref
     # initialize output arrays
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_state = np.empty(6, dtype=np.double, order='C')
-    cdef np.double_t[::1] c_state = p_state
+    cdef double[6] t_state
+    cdef np.ndarray p_state = _scalar_output(out, astuple, 0, 1, 6, 0)
+    cdef double* c_state = _output_data(p_state, t_state)
     # perform the call
-    spkgeo_c(
-        c_targ,
-        c_et,
-        c_ref,
-        c_obs,
-        &c_state[0],
-        &c_lt
-    )
-    check_for_spice_error()
+    with _cspice:
+        spkgeo_c(
+            c_targ,
+            c_et,
+            c_ref,
+            c_obs,
+            c_state,
+            &c_lt
+        )
+        check_for_spice_error()
     # return output
-    return p_state, c_lt
+    return _scalar_result(p_state, c_state, 6, 0), c_lt
 
 
 @boundscheck(False)
 @wraparound(False)
 def spkgeo_v(
-    int targ,
-    double[::1] ets,
-    str ref,
-    int obs,
-    )-> tuple[State_N, Double_N]:
+    targ,
+    ets,
+    ref,
+    obs,
+    *,
+    object out=None,
+    str errors="raise"
+    ) -> tuple[State_N, Double_N]:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.spkgeo`
 
+    All arguments except the output and error options broadcast against each other
+    following NumPy rules, string arguments may be arrays of names.
+
     Compute the geometric state (position and velocity) of a target
     body relative to an observing body.
 
@@ -7196,36 +9427,45 @@ def spkgeo_v(
     :param ets: Target epochs.
     :param ref: Target reference frame.
     :param obs: Observing body.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return:
         State of target in km and km/sec,
         One way light time between observer and target in seconds.
     """
+    # broadcast the arguments against each other
+    cdef tuple shape = np.broadcast_shapes(
+        np.shape(targ), np.shape(ets), np.shape(ref), np.shape(obs)
+    )
+    cdef Py_ssize_t i, n = _shape_size(shape)
     # initialize c variables
-    cdef int c_targ = targ
-    cdef const np.double_t[::1] c_ets = np.ascontiguousarray(ets, dtype=np.double)
-    cdef Py_ssize_t i, n = c_ets.shape[0]
-    cdef int c_obs  = obs
-    # convert the strings to pointers once
-    cdef const char* c_ref   = ref
+    cdef _IntArg c_targ = _IntArg(targ, shape)
+    cdef _DblArg c_ets  = _DblArg(ets, shape)
+    cdef _StrArg c_ref  = _StrArg(ref, shape)
+    cdef _IntArg c_obs  = _IntArg(obs, shape)
+    cdef tuple c_out = _check_out(out, 2)
     # initialize output arrays
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_states = np.empty((n, 6), dtype=np.double, order='C')
-    cdef np.double_t[:, ::1] c_states = p_states
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_lts = np.empty(n, dtype=np.double, order='C')
-    cdef np.double_t[::1] c_lts = p_lts
-    # perform the call
-    with nogil:
-        for i in range(n):
-            spkgeo_c(
-                c_targ,
-                c_ets[i],
-                c_ref,
-                c_obs,
-                &c_states[i, 0],
-                &c_lts[i]
-            )
-    check_for_spice_error()
-    # return output
-    return p_states, p_lts
+    cdef np.ndarray p_states = _output(c_out, 0, shape + (6,), np.double)
+    cdef np.double_t[:, ::1] c_states = p_states.reshape(n, 6)
+    cdef np.ndarray p_lts = _output(c_out, 1, shape, np.double)
+    cdef np.double_t[::1] c_lts = p_lts.reshape(n)
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, shape)
+    # main loop
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                spkgeo_c(
+                    c_targ.at(i),
+                    c_ets.at(i),
+                    c_ref.at(i),
+                    c_obs.at(i),
+                    &c_states[i, 0],
+                    &c_lts[i]
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        return c_errors.finish((p_states, p_lts))
 
 
 def spkgeo(
@@ -7260,7 +9500,10 @@ def spkgps_s(
     int targ,
     double et,
     str ref,
-    int obs
+    int obs,
+    *,
+    object out=None,
+    bint astuple=False
     ) -> tuple[Vector, float]:
     """
     Scalar version of :py:meth:`~spiceypy.cyice.cyice.spkgps`
@@ -7274,6 +9517,8 @@ def spkgps_s(
     :param et: Target epoch.
     :param ref: Target reference frame.
     :param obs: Observing body.
+    :param out: Optional preallocated array the position is written to.
+    :param astuple: Return the position as a tuple of floats instead of an array.
     :return: Position of target in km, Light time.
     """
     # initialize c variables
@@ -7284,33 +9529,41 @@ def spkgps_s(
     # convert the strings to pointers once
     cdef const char* c_ref = ref
     # initialize output arrays
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_pos = np.empty(3, dtype=np.double, order='C')
-    cdef np.double_t[::1] c_pos = p_pos
+    cdef double[3] t_pos
+    cdef np.ndarray p_pos = _scalar_output(out, astuple, 0, 1, 3, 0)
+    cdef double* c_pos = _output_data(p_pos, t_pos)
     # perform the call
-    spkgps_c(
-        c_targ,
-        c_et,
-        c_ref,
-        c_obs,
-        &c_pos[0],
-        &c_lt
-    )
-    check_for_spice_error()
+    with _cspice:
+        spkgps_c(
+            c_targ,
+            c_et,
+            c_ref,
+            c_obs,
+            c_pos,
+            &c_lt
+        )
+        check_for_spice_error()
     # return output
-    return p_pos, c_lt
+    return _scalar_result(p_pos, c_pos, 3, 0), c_lt
 
 
 @boundscheck(False)
 @wraparound(False)
 def spkgps_v(
-    int targ,
-    double[::1] ets,
-    str ref,
-    int obs,
+    targ,
+    ets,
+    ref,
+    obs,
+    *,
+    object out=None,
+    str errors="raise"
     ) -> tuple[Vector_N, Double_N]:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.spkgps`
 
+    All arguments except the output and error options broadcast against each other
+    following NumPy rules, string arguments may be arrays of names.
+
     Compute the geometric position of a target body relative to an
     observing body.
 
@@ -7320,34 +9573,43 @@ def spkgps_v(
     :param ets: Target epochs.
     :param ref: Target reference frame.
     :param obs: Observing body.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return: Position of target in km, Light time.
     """
+    # broadcast the arguments against each other
+    cdef tuple shape = np.broadcast_shapes(
+        np.shape(targ), np.shape(ets), np.shape(ref), np.shape(obs)
+    )
+    cdef Py_ssize_t i, n = _shape_size(shape)
     # initialize c variables
-    cdef int c_targ = targ
-    cdef const np.double_t[::1] c_ets = np.ascontiguousarray(ets, dtype=np.double)
-    cdef Py_ssize_t i, n = c_ets.shape[0]
-    cdef int c_obs  = obs
-    # convert the strings to pointers once
-    cdef const char* c_ref = ref
+    cdef _IntArg c_targ = _IntArg(targ, shape)
+    cdef _DblArg c_ets  = _DblArg(ets, shape)
+    cdef _StrArg c_ref  = _StrArg(ref, shape)
+    cdef _IntArg c_obs  = _IntArg(obs, shape)
+    cdef tuple c_out = _check_out(out, 2)
     # initialize output arrays
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_pos = np.empty((n, 3), dtype=np.double, order='C')
-    cdef np.double_t[:, ::1] c_pos = p_pos
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_lts = np.empty(n, dtype=np.double, order='C')
-    cdef np.double_t[::1] c_lts = p_lts
-    # perform the call
-    with nogil:
-        for i in range(n):
-            spkgps_c(
-                c_targ,
-                c_ets[i],
-                c_ref,
-                c_obs,
-                &c_pos[i, 0],
-                &c_lts[i]
-            )
-    check_for_spice_error()
-    # return output
-    return p_pos, p_lts
+    cdef np.ndarray p_pos = _output(c_out, 0, shape + (3,), np.double)
+    cdef np.double_t[:, ::1] c_pos = p_pos.reshape(n, 3)
+    cdef np.ndarray p_lts = _output(c_out, 1, shape, np.double)
+    cdef np.double_t[::1] c_lts = p_lts.reshape(n)
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, shape)
+    # main loop
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                spkgps_c(
+                    c_targ.at(i),
+                    c_ets.at(i),
+                    c_ref.at(i),
+                    c_obs.at(i),
+                    &c_pos[i, 0],
+                    &c_lts[i]
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        return c_errors.finish((p_pos, p_lts))
 
 
 def spkgps(
@@ -7381,7 +9643,10 @@ def spkpos_s(
     double et,
     str ref,
     str abcorr,
-    str obs
+    str obs,
+    *,
+    object out=None,
+    bint astuple=False
     ) -> tuple[Vector, float]:
     """
     Scalar version of :py:meth:`~spiceypy.cyice.cyice.spkpos`
@@ -7397,6 +9662,8 @@ def spkpos_s(
     :param ref: Reference frame of output position vector.
     :param abcorr: Aberration correction flag.
     :param obs: Observing body name.
+    :param out: Optional preallocated array the position is written to.
+    :param astuple: Return the position as a tuple of floats instead of an array.
     :return:
             Position of target in km,
             One way light time between observer and target in seconds.
@@ -7410,33 +9677,41 @@ def spkpos_s(
     cdef const char* c_abcorr = abcorr
     cdef const char* c_obs    = obs
     # initialize output arrays
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_ptarg = np.empty(3, dtype=np.double, order='C')
-    cdef np.double_t[::1] c_ptarg = p_ptarg
-    spkpos_c(
-        c_targ,
-        c_et,
-        c_ref,
-        c_abcorr,
-        c_obs,
-        &c_ptarg[0],
-        &c_lt
-    )
-    check_for_spice_error()
-    return p_ptarg, c_lt
+    cdef double[3] t_ptarg
+    cdef np.ndarray p_ptarg = _scalar_output(out, astuple, 0, 1, 3, 0)
+    cdef double* c_ptarg = _output_data(p_ptarg, t_ptarg)
+    with _cspice:
+        spkpos_c(
+            c_targ,
+            c_et,
+            c_ref,
+            c_abcorr,
+            c_obs,
+            c_ptarg,
+            &c_lt
+        )
+        check_for_spice_error()
+    return _scalar_result(p_ptarg, c_ptarg, 3, 0), c_lt
 
 
 @boundscheck(False)
 @wraparound(False)
 def spkpos_v(
-    str targ,
-    double[::1] ets,
-    str ref,
-    str abcorr,
-    str obs
-    )-> tuple[Vector_N, Double_N]:
+    targ,
+    ets,
+    ref,
+    abcorr,
+    obs,
+    *,
+    object out=None,
+    str errors="raise"
+    ) -> tuple[Vector_N, Double_N]:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.spkpos`
 
+    All arguments except the output and error options broadcast against each other
+    following NumPy rules, string arguments may be arrays of names.
+
     Return the position of a target body relative to an observing
     body, optionally corrected for light time (planetary aberration)
     and stellar aberration.
@@ -7448,38 +9723,47 @@ def spkpos_v(
     :param ref: Reference frame of output position vector.
     :param abcorr: Aberration correction flag.
     :param obs: Observing body name.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return:
             Position of target in km,
             One way light time between observer and target in seconds.
     """
+    # broadcast the arguments against each other
+    cdef tuple shape = np.broadcast_shapes(
+        np.shape(targ), np.shape(ets), np.shape(ref), np.shape(abcorr), np.shape(obs)
+    )
+    cdef Py_ssize_t i, n = _shape_size(shape)
     # initialize c variables
-    cdef const np.double_t[::1] c_ets = np.ascontiguousarray(ets, dtype=np.double)
-    cdef Py_ssize_t i, n = c_ets.shape[0]
-    # convert the strings to pointers once
-    cdef const char* c_targ   = targ
-    cdef const char* c_ref    = ref
-    cdef const char* c_abcorr = abcorr
-    cdef const char* c_obs    = obs
+    cdef _StrArg c_targ   = _StrArg(targ, shape)
+    cdef _DblArg c_ets    = _DblArg(ets, shape)
+    cdef _StrArg c_ref    = _StrArg(ref, shape)
+    cdef _StrArg c_abcorr = _StrArg(abcorr, shape)
+    cdef _StrArg c_obs    = _StrArg(obs, shape)
+    cdef tuple c_out = _check_out(out, 2)
     # initialize output arrays
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_ptargs = np.empty((n, 3), dtype=np.double, order='C')
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_lts = np.empty(n, dtype=np.double, order='C')
-    cdef np.double_t[:, ::1] c_ptargs = p_ptargs
-    cdef np.double_t[::1]   c_lts = p_lts
+    cdef np.ndarray p_ptargs = _output(c_out, 0, shape + (3,), np.double)
+    cdef np.double_t[:, ::1] c_ptargs = p_ptargs.reshape(n, 3)
+    cdef np.ndarray p_lts = _output(c_out, 1, shape, np.double)
+    cdef np.double_t[::1] c_lts = p_lts.reshape(n)
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, shape)
     # main loop
-    with nogil:
-        for i in range(n):
-            spkpos_c(
-                c_targ,
-                c_ets[i],
-                c_ref,
-                c_abcorr,
-                c_obs,
-                &c_ptargs[i, 0],
-                &c_lts[i]
-            )
-    check_for_spice_error()
-
-    return p_ptargs, p_lts
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                spkpos_c(
+                    c_targ.at(i),
+                    c_ets.at(i),
+                    c_ref.at(i),
+                    c_abcorr.at(i),
+                    c_obs.at(i),
+                    &c_ptargs[i, 0],
+                    &c_lts[i]
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        return c_errors.finish((p_ptargs, p_lts))
 
 
 def spkpos(
@@ -7547,15 +9831,16 @@ def spkpvn_s(
     cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_state = np.empty(6, dtype=np.double, order='C')
     cdef np.double_t[::1] c_state = p_state
     # perform the call
-    spkpvn_c(
-        c_handle,
-        c_descr,
-        c_et,
-        &c_ref,
-        &c_state[0],
-        &c_center
-    )
-    check_for_spice_error()
+    with _cspice:
+        spkpvn_c(
+            c_handle,
+            c_descr,
+            c_et,
+            &c_ref,
+            &c_state[0],
+            &c_center
+        )
+        check_for_spice_error()
     # return output
     return c_ref, p_state, c_center
 
@@ -7565,7 +9850,10 @@ def spkpvn_s(
 def spkpvn_v(
     int handle,
     double[::1] descr,
-    double[::1] ets
+    double[::1] ets,
+    *,
+    object out=None,
+    str errors="raise"
     ) -> tuple[Int_N, State_N, Int_N]:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.spkpvn`
@@ -7579,6 +9867,8 @@ def spkpvn_v(
     :param handle: File handle.
     :param descr: Segment descriptor.
     :param ets: Evaluation epochs.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return:
             Segment reference frame ID code,
             Output state vector,
@@ -7590,27 +9880,32 @@ def spkpvn_v(
     cdef int c_handle = handle
     # convert input c arrays
     cdef const double* c_descr = &descr[0]
+    cdef tuple c_out = _check_out(out, 3)
     # initialize output arrays
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_states = np.empty((n, 6), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_states = _output(c_out, 1, (n, 6), np.double)
     cdef np.double_t[:, ::1] c_states = p_states
-    cdef np.ndarray[np.int32_t, ndim=1, mode='c'] p_refs = np.empty(n, dtype=np.int32, order='C')
+    cdef np.ndarray[np.int32_t, ndim=1, mode='c'] p_refs = _output(c_out, 0, (n,), np.int32)
     cdef np.int32_t[::1] c_refs = p_refs
-    cdef np.ndarray[np.int32_t, ndim=1, mode='c'] p_centers = np.empty(n, dtype=np.int32, order='C')
+    cdef np.ndarray[np.int32_t, ndim=1, mode='c'] p_centers = _output(c_out, 2, (n,), np.int32)
     cdef np.int32_t[::1] c_centers = p_centers
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
     # perform the call
-    with nogil:
-        for i in range(n):
-            spkpvn_c(
-                c_handle,
-                c_descr,
-                c_ets[i],
-                <SpiceInt *> &c_refs[i],
-                &c_states[i, 0],
-                <SpiceInt *> &c_centers[i]
-            )
-    check_for_spice_error()
-    # return output
-    return p_refs, p_states, p_centers
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                spkpvn_c(
+                    c_handle,
+                    c_descr,
+                    c_ets[i],
+                    <SpiceInt *> &c_refs[i],
+                    &c_states[i, 0],
+                    <SpiceInt *> &c_centers[i]
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        # return output
+        return c_errors.finish((p_refs, p_states, p_centers))
 
 
 def spkpvn(
@@ -7645,6 +9940,9 @@ def spkssb_s(
     int targ,
     double et,
     str ref,
+    *,
+    object out=None,
+    bint astuple=False
     ) -> State:
     """
     Scalar version of :py:meth:`~spiceypy.cyice.cyice.spkssb`
@@ -7657,6 +9955,8 @@ def spkssb_s(
     :param targ: Target body.
     :param et: Target epoch.
     :param ref: Target reference frame.
+    :param out: Optional preallocated array the state is written to.
+    :param astuple: Return the state as a tuple of floats instead of an array.
     :return: State of target.
     """
     # initialize c variables
@@ -7665,30 +9965,38 @@ def spkssb_s(
     # convert the strings to pointers once
     cdef const char* c_ref = ref
     # initialize output arrays
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_state = np.empty(6, dtype=np.double, order='C')
-    cdef np.double_t[::1] c_state = p_state
+    cdef double[6] t_state
+    cdef np.ndarray p_state = _scalar_output(out, astuple, 0, 1, 6, 0)
+    cdef double* c_state = _output_data(p_state, t_state)
     # perform the call
-    spkssb_c(
-        c_targ,
-        c_et,
-        c_ref,
-        &c_state[0],
-    )
-    check_for_spice_error()
+    with _cspice:
+        spkssb_c(
+            c_targ,
+            c_et,
+            c_ref,
+            c_state,
+        )
+        check_for_spice_error()
     # return output
-    return p_state
+    return _scalar_result(p_state, c_state, 6, 0)
 
 
 @boundscheck(False)
 @wraparound(False)
 def spkssb_v(
-    int targ,
-    double[::1] ets,
-    str ref,
+    targ,
+    ets,
+    ref,
+    *,
+    object out=None,
+    str errors="raise"
     ) -> State_N:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.spkssb`
 
+    All arguments except the output and error options broadcast against each other
+    following NumPy rules, string arguments may be arrays of names.
+
     Return the state (position and velocity) of a target body
     relative to the solar system barycenter.
 
@@ -7697,29 +10005,38 @@ def spkssb_v(
     :param targ: Target body.
     :param ets: Target epochs.
     :param ref: Target reference frame.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return: States of target.
     """
+    # broadcast the arguments against each other
+    cdef tuple shape = np.broadcast_shapes(
+        np.shape(targ), np.shape(ets), np.shape(ref)
+    )
+    cdef Py_ssize_t i, n = _shape_size(shape)
     # initialize c variables
-    cdef int c_targ = targ
-    cdef const np.double_t[::1] c_ets = np.ascontiguousarray(ets, dtype=np.double)
-    cdef Py_ssize_t i, n = c_ets.shape[0]
-    # convert the strings to pointers once
-    cdef const char* c_ref   = ref
+    cdef _IntArg c_targ = _IntArg(targ, shape)
+    cdef _DblArg c_ets  = _DblArg(ets, shape)
+    cdef _StrArg c_ref  = _StrArg(ref, shape)
+    cdef tuple c_out = _check_out(out, 1)
     # initialize output arrays
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_states = np.empty((n, 6), dtype=np.double, order='C')
-    cdef np.double_t[:, ::1] c_states = p_states
-    # perform the call
-    with nogil:
-        for i in range(n):
-            spkssb_c(
-                c_targ,
-                c_ets[i],
-                c_ref,
-                &c_states[i, 0],
-            )
-    check_for_spice_error()
-    # return output
-    return p_states
+    cdef np.ndarray p_states = _output(c_out, 0, shape + (6,), np.double)
+    cdef np.double_t[:, ::1] c_states = p_states.reshape(n, 6)
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, shape)
+    # main loop
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                spkssb_c(
+                    c_targ.at(i),
+                    c_ets.at(i),
+                    c_ref.at(i),
+                    &c_states[i, 0]
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        return c_errors.finish(p_states)
 
 
 def spkssb(
@@ -7761,18 +10078,22 @@ def str2et_s(
     """
     # initialize c variables
     cdef double c_et = 0.0
-    str2et_c(
-        time,
-        &c_et
-    )
-    check_for_spice_error()
+    with _cspice:
+        str2et_c(
+            time,
+            &c_et
+        )
+        check_for_spice_error()
     return c_et
 
 
 @boundscheck(False)
 @wraparound(False)
 def str2et_v(
-    np.ndarray times
+    np.ndarray times,
+    *,
+    object out=None,
+    str errors="raise"
     ) -> Double_N:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.str2et`
@@ -7784,26 +10105,33 @@ def str2et_v(
     https://naif.jpl.nasa.gov/pub/naif/misc/toolkit_docs_N0067/C/cspice/str2et_c.html
 
     :param times: Strings representing an epoch.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return: The equivalent values in seconds past J2000, TDB.
     """
     # initialize c variables
     cdef Py_ssize_t i, n = times.shape[0]
+    cdef tuple c_out = _check_out(out, 1)
     # initialize output
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_ets = np.empty(n, dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_ets = _output(c_out, 0, (n,), np.double)
     cdef np.double_t[::1] c_ets = p_ets
     cdef const char* c_time
     # coerce unicode to a byte-string array
     if times.dtype.kind == 'U':
         times = np.char.encode(times, 'ascii')
-    for i in range(n):
-        c_time = times[i]
-        str2et_c(
-            c_time,
-            &c_ets[i]
-        )
-    check_for_spice_error()
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
+    with _cspice:
+        for i in range(n):
+            c_time = times[i]
+            str2et_c(
+                c_time,
+                &c_ets[i]
+            )
+            if c_errors.capture(i):
+                break
+        c_errors.check(times)
 
-    return p_ets
+        return c_errors.finish(p_ets)
 
 
 def str2et(
@@ -7878,21 +10206,22 @@ def sincpt_s(
     cdef double c_trgepc = 0.0
     cdef SpiceBoolean c_found = SPICEFALSE
     # perform the call
-    sincpt_c(
-        c_method,
-        c_target,
-        c_et,
-        c_fixref,
-        c_abcorr,
-        c_obsrvr,
-        c_dref,
-        &dvec[0],
-        &c_spoint[0],
-        &c_trgepc,
-        &c_srfvec[0],
-        <SpiceBoolean *> &c_found
-    )
-    check_for_spice_error()
+    with _cspice:
+        sincpt_c(
+            c_method,
+            c_target,
+            c_et,
+            c_fixref,
+            c_abcorr,
+            c_obsrvr,
+            c_dref,
+            &dvec[0],
+            &c_spoint[0],
+            &c_trgepc,
+            &c_srfvec[0],
+            <SpiceBoolean *> &c_found
+        )
+        check_for_spice_error()
 
     return p_spoint, c_trgepc, p_srfvec, PyBool_FromLong(c_found)
 
@@ -7901,18 +10230,24 @@ def sincpt_s(
 @wraparound(False)
 @cyice_found_exception_thrower
 def sincpt_v(
-    str method,
-    str target,
-    double[::1] ets,
-    str fixref,
-    str abcorr,
-    str obsrvr,
-    str dref,
-    double[::1] dvec
+    method,
+    target,
+    ets,
+    fixref,
+    abcorr,
+    obsrvr,
+    dref,
+    dvec,
+    *,
+    object out=None,
+    str errors="raise"
     ) -> tuple[Vector_N, Double_N, Vector_N, Found_N]:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.sincpt`
 
+    All arguments except the output and error options broadcast against each other
+    following NumPy rules, string arguments may be arrays of names.
+
     Given an observer and a direction vector defining a ray, compute
     the surface intercept of the ray on a target body at a specified
     epoch, optionally corrected for light time and stellar
@@ -7928,50 +10263,62 @@ def sincpt_v(
     :param obsrvr: Name of observing body.
     :param dref: Reference frame of ray's direction vector.
     :param dvec: Ray's direction vector.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return:
             Surface intercept point on the target body in km,
             Intercept epoch,
             Vector from observer to intercept point in km.
     """
-    # get size of input array
-    cdef const np.double_t[::1] c_ets = np.ascontiguousarray(ets, dtype=np.double)
-    cdef Py_ssize_t i, n = c_ets.shape[0]
-    # convert strings
-    cdef const char* c_method = method
-    cdef const char* c_target = target
-    cdef const char* c_fixref = fixref
-    cdef const char* c_abcorr = abcorr
-    cdef const char* c_obsrvr = obsrvr
-    cdef const char* c_dref   = dref
-    # Allocate output floats and arrays with appropriate shapes.
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_spoint = np.empty((n, 3), dtype=np.double, order='C')
-    cdef np.double_t[:, ::1] c_spoint = p_spoint
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_srfvec = np.empty((n, 3), dtype=np.double, order='C')
-    cdef np.double_t[:, ::1] c_srfvec = p_srfvec
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_trgepc = np.empty(n, dtype=np.double, order='C')
-    cdef np.double_t[::1]   c_trgepc = p_trgepc
-    cdef np.ndarray[np.int32_t, ndim=1, mode='c'] p_found = np.empty(n, dtype=np.int32, order='C')
-    cdef np.int32_t[::1] c_found = p_found
-    # perform the call
-    with nogil:
-        for i in range(n):
-            sincpt_c(
-                c_method,
-                c_target,
-                c_ets[i],
-                c_fixref,
-                c_abcorr,
-                c_obsrvr,
-                c_dref,
-                &dvec[0],
-                &c_spoint[i, 0],
-                &c_trgepc[i],
-                &c_srfvec[i, 0],
-                <SpiceBoolean *> &c_found[i]
-            )
-    check_for_spice_error()
-
-    return p_spoint, p_trgepc, p_srfvec, p_found.astype(np.bool_)
+    # broadcast the arguments against each other
+    cdef tuple shape = np.broadcast_shapes(
+        np.shape(method), np.shape(target), np.shape(ets), np.shape(fixref), np.shape(abcorr), np.shape(obsrvr), np.shape(dref), _outer_shape(dvec)
+    )
+    cdef Py_ssize_t i, n = _shape_size(shape)
+    # initialize c variables
+    cdef _StrArg c_method = _StrArg(method, shape)
+    cdef _StrArg c_target = _StrArg(target, shape)
+    cdef _DblArg c_ets    = _DblArg(ets, shape)
+    cdef _StrArg c_fixref = _StrArg(fixref, shape)
+    cdef _StrArg c_abcorr = _StrArg(abcorr, shape)
+    cdef _StrArg c_obsrvr = _StrArg(obsrvr, shape)
+    cdef _StrArg c_dref   = _StrArg(dref, shape)
+    cdef _VecArg c_dvec   = _VecArg(dvec, shape, 3)
+    cdef tuple c_out = _check_out(out, 4)
+    # initialize output arrays
+    cdef np.ndarray p_spoint = _output(c_out, 0, shape + (3,), np.double)
+    cdef np.double_t[:, ::1] c_spoint = p_spoint.reshape(n, 3)
+    cdef np.ndarray p_trgepc = _output(c_out, 1, shape, np.double)
+    cdef np.double_t[::1] c_trgepc = p_trgepc.reshape(n)
+    cdef np.ndarray p_srfvec = _output(c_out, 2, shape + (3,), np.double)
+    cdef np.double_t[:, ::1] c_srfvec = p_srfvec.reshape(n, 3)
+    cdef np.ndarray p_found = _output(c_out, 3, shape, np.bool_)
+    cdef np.uint8_t[::1] c_found = p_found.reshape(n).view(np.uint8)
+    cdef SpiceBoolean c_found_i = 0
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, shape)
+    # main loop
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                sincpt_c(
+                    c_method.at(i),
+                    c_target.at(i),
+                    c_ets.at(i),
+                    c_fixref.at(i),
+                    c_abcorr.at(i),
+                    c_obsrvr.at(i),
+                    c_dref.at(i),
+                    c_dvec.at(i),
+                    &c_spoint[i, 0],
+                    &c_trgepc[i],
+                    &c_srfvec[i, 0],
+                    &c_found_i
+                )
+                c_found[i] = c_found_i
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        return c_errors.finish((p_spoint, p_trgepc, p_srfvec, p_found))
 
 
 def sincpt(
@@ -8011,6 +10358,100 @@ def sincpt(
         return sincpt_v(method, target, et, fixref, abcorr, obsrvr, dref, dvec)
 
 
+@boundscheck(False)
+@wraparound(False)
+def srfnrm_v(
+    str method,
+    str target,
+    double et,
+    str fixref,
+    srfpts,
+    *,
+    object out=None,
+    str errors="raise"
+    ) -> Vector_N:
+    """
+    Vectorized version of :py:meth:`~spiceypy.cyice.cyice.srfnrm`
+
+    srfpts may have any number of leading dimensions, for example the
+    (H, W, 3) output of :py:meth:`latsrf_v`, the normals have the same
+    leading dimensions. CSPICE maps all points in one call, contiguous
+    float64 input is not copied.
+
+    Map array of surface points on a specified target body to
+    the corresponding unit length outward surface normal vectors.
+
+    The surface of the target body may be represented by a triaxial
+    ellipsoid or by topographic data provided by DSK files.
+
+    https://naif.jpl.nasa.gov/pub/naif/misc/toolkit_docs_N0067/C/cspice/srfnrm_c.html
+
+    :param method: Computation method.
+    :param target: Name of target body.
+    :param et: Epoch in TDB seconds past J2000 TDB.
+    :param fixref: Body-fixed, body-centered target body frame.
+    :param srfpts: Array of surface points.
+    :param out: Optional preallocated output array.
+    :param errors: Error handling mode, "raise" (default) or "mask". An error
+        fails all points as they are computed together.
+    :return: Array of outward, unit length normal vectors.
+    """
+    cdef tuple shape = _outer_shape(srfpts)
+    cdef Py_ssize_t n = _shape_size(shape)
+    # initialize c variables
+    cdef const char* c_method = method
+    cdef const char* c_target = target
+    cdef const char* c_fixref = fixref
+    cdef const np.double_t[:, ::1] c_srfpts = _packed(srfpts, shape, 3, "srfpts")
+    cdef tuple c_out = _check_out(out, 1)
+    # initialize output arrays
+    cdef np.ndarray p_normls = _output(c_out, 0, shape + (3,), np.double)
+    cdef np.double_t[:, ::1] c_normls = p_normls.reshape(n, 3)
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, shape)
+    if n == 0:
+        return c_errors.finish(p_normls)
+    with _cspice:
+        with nogil:
+            srfnrm_c(
+                c_method,
+                c_target,
+                et,
+                c_fixref,
+                <SpiceInt> n,
+                <ConstSpiceDouble (*)[3]> &c_srfpts[0, 0],
+                <SpiceDouble (*)[3]> &c_normls[0, 0]
+            )
+            c_errors.capture_many(0, n, 1)
+        c_errors.check(None)
+        return c_errors.finish(p_normls)
+
+
+def srfnrm(
+    method: str,
+    target: str,
+    et: float,
+    fixref: str,
+    srfpts: Vector_N
+    ) -> Vector_N:
+    """
+    Map array of surface points on a specified target body to
+    the corresponding unit length outward surface normal vectors.
+
+    The surface of the target body may be represented by a triaxial
+    ellipsoid or by topographic data provided by DSK files.
+
+    https://naif.jpl.nasa.gov/pub/naif/misc/toolkit_docs_N0067/C/cspice/srfnrm_c.html
+
+    :param method: Computation method.
+    :param target: Name of target body.
+    :param et: Epoch in TDB seconds past J2000 TDB.
+    :param fixref: Body-fixed, body-centered target body frame.
+    :param srfpts: Array of surface points.
+    :return: Array of outward, unit length normal vectors.
+    """
+    return srfnrm_v(method, target, et, fixref, srfpts)
+
+
 cpdef np.ndarray[np.double_t, ndim=1, mode='c'] srfrec_s(
     body: int, 
     longitude: float, 
@@ -8032,12 +10473,13 @@ cpdef np.ndarray[np.double_t, ndim=1, mode='c'] srfrec_s(
     # allocate output array
     cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_rec = np.empty(3, dtype=np.double, order='C')
     cdef np.double_t[::1] c_rec = p_rec
-    srfrec_c(
-        body, 
-        longitude, 
-        latitude, 
-        &c_rec[0],
-    )
+    with _cspice:
+        srfrec_c(
+            body, 
+            longitude, 
+            latitude, 
+            &c_rec[0],
+        )
     return p_rec
 
 
@@ -8046,7 +10488,8 @@ cpdef np.ndarray[np.double_t, ndim=1, mode='c'] srfrec_s(
 cpdef np.ndarray[np.double_t, ndim=2, mode='c'] srfrec_v(
     int body, 
     const double[::1] longitude, 
-    const double[::1] latitude
+    const double[::1] latitude,
+    object out=None
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.srfrec`
@@ -8059,25 +10502,28 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] srfrec_v(
     :param body: NAIF integer code of an extended body.
     :param longitude: Longitude of point in radians.
     :param latitude: Latitude of point in radians.
+    :param out: Optional preallocated output arrays, one per returned array.
     :return: Rectangular coordinates of the point, same units as used in radii definition (typically km).
     """
     cdef SpiceInt c_body = body
     cdef const np.double_t[::1] c_lon = np.ascontiguousarray(longitude, dtype=np.double)
     cdef Py_ssize_t i, n = c_lon.shape[0]
     cdef const np.double_t[::1] c_lat = np.ascontiguousarray(latitude, dtype=np.double)
+    cdef tuple c_out = _check_out(out, 1)
     # allocate output array
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_rec = np.empty((n,3), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_rec = _output(c_out, 0, (n, 3), np.double)
     cdef np.double_t[:,::1] c_rec = p_rec
     # TODO fix strides lookups below
     _check_same_len(n, c_lat.shape[0], "longitude", "latitude")
-    with nogil:
-        for i in range(n):
-            srfrec_c(
-                c_body, 
-                c_lon[i], 
-                c_lat[i], 
-                &c_rec[i, 0]
-            )
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                srfrec_c(
+                    c_body, 
+                    c_lon[i], 
+                    c_lat[i], 
+                    &c_rec[i, 0]
+                )
     return p_rec
 
 
@@ -8148,18 +10594,19 @@ def subpnt_s(
     cdef np.double_t[::1] c_srfvec = p_srfvec
     cdef double c_trgepc = 0.0
     # perform the call
-    subpnt_c(
-        c_method,
-        c_target,
-        c_et,
-        c_fixref,
-        c_abcorr,
-        c_obsrvr,
-        &c_spoint[0],
-        &c_trgepc,
-        &c_srfvec[0]
-        )
-    check_for_spice_error()
+    with _cspice:
+        subpnt_c(
+            c_method,
+            c_target,
+            c_et,
+            c_fixref,
+            c_abcorr,
+            c_obsrvr,
+            &c_spoint[0],
+            &c_trgepc,
+            &c_srfvec[0]
+            )
+        check_for_spice_error()
 
     return p_spoint, c_trgepc, p_srfvec
 
@@ -8167,16 +10614,22 @@ def subpnt_s(
 @boundscheck(False)
 @wraparound(False)
 def subpnt_v(
-    str method,
-    str target,
-    double[::1] ets,
-    str fixref,
-    str abcorr,
-    str obsrvr
+    method,
+    target,
+    ets,
+    fixref,
+    abcorr,
+    obsrvr,
+    *,
+    object out=None,
+    str errors="raise"
     ) -> tuple[Vector_N, Double_N, Vector_N]:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.subpnt`
 
+    All arguments except the output and error options broadcast against each other
+    following NumPy rules, string arguments may be arrays of names.
+
     Compute the rectangular coordinates of the sub-observer point on
     a target body at a specified epoch, optionally corrected for
     light time and stellar aberration.
@@ -8189,44 +10642,53 @@ def subpnt_v(
     :param fixref: Body-fixed, body-centered target body frame.
     :param abcorr: Aberration correction.
     :param obsrvr: Name of observing body.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return:
             Sub-observer point on the target body,
             Sub-observer point epoch,
             Vector from observer to sub-observer point.
     """
-    # get size of input array
-    cdef const np.double_t[::1] c_ets = np.ascontiguousarray(ets, dtype=np.double)
-    cdef Py_ssize_t i, n = c_ets.shape[0]
-    # convert strings
-    cdef const char* c_method = method
-    cdef const char* c_target = target
-    cdef const char* c_fixref = fixref
-    cdef const char* c_abcorr = abcorr
-    cdef const char* c_obsrvr = obsrvr
-    # Allocate output floats and arrays with appropriate shapes.
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_spoint = np.empty((n, 3), dtype=np.double, order='C')
-    cdef np.double_t[:, ::1] c_spoint = p_spoint
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_srfvec = np.empty((n, 3), dtype=np.double, order='C')
-    cdef np.double_t[:, ::1] c_srfvec = p_srfvec
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_trgepc = np.empty(n, dtype=np.double, order='C')
-    cdef np.double_t[::1] c_trgepc = p_trgepc
-    # perform the call
-    with nogil:
-        for i in range(n):
-            subpnt_c(
-                c_method,
-                c_target,
-                c_ets[i],
-                c_fixref,
-                c_abcorr,
-                c_obsrvr,
-                &c_spoint[i, 0],
-                &c_trgepc[i],
-                &c_srfvec[i, 0]
-            )
-    check_for_spice_error()
-
-    return p_spoint, p_trgepc, p_srfvec
+    # broadcast the arguments against each other
+    cdef tuple shape = np.broadcast_shapes(
+        np.shape(method), np.shape(target), np.shape(ets), np.shape(fixref), np.shape(abcorr), np.shape(obsrvr)
+    )
+    cdef Py_ssize_t i, n = _shape_size(shape)
+    # initialize c variables
+    cdef _StrArg c_method = _StrArg(method, shape)
+    cdef _StrArg c_target = _StrArg(target, shape)
+    cdef _DblArg c_ets    = _DblArg(ets, shape)
+    cdef _StrArg c_fixref = _StrArg(fixref, shape)
+    cdef _StrArg c_abcorr = _StrArg(abcorr, shape)
+    cdef _StrArg c_obsrvr = _StrArg(obsrvr, shape)
+    cdef tuple c_out = _check_out(out, 3)
+    # initialize output arrays
+    cdef np.ndarray p_spoint = _output(c_out, 0, shape + (3,), np.double)
+    cdef np.double_t[:, ::1] c_spoint = p_spoint.reshape(n, 3)
+    cdef np.ndarray p_trgepc = _output(c_out, 1, shape, np.double)
+    cdef np.double_t[::1] c_trgepc = p_trgepc.reshape(n)
+    cdef np.ndarray p_srfvec = _output(c_out, 2, shape + (3,), np.double)
+    cdef np.double_t[:, ::1] c_srfvec = p_srfvec.reshape(n, 3)
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, shape)
+    # main loop
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                subpnt_c(
+                    c_method.at(i),
+                    c_target.at(i),
+                    c_ets.at(i),
+                    c_fixref.at(i),
+                    c_abcorr.at(i),
+                    c_obsrvr.at(i),
+                    &c_spoint[i, 0],
+                    &c_trgepc[i],
+                    &c_srfvec[i, 0]
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        return c_errors.finish((p_spoint, p_trgepc, p_srfvec))
 
 
 def subpnt(
@@ -8308,18 +10770,19 @@ def subslr_s(
     cdef np.double_t[::1] c_srfvec = p_srfvec
     cdef double c_trgepc = 0.0
     # perform the call
-    subslr_c(
-        c_method,
-        c_target,
-        c_et,
-        c_fixref,
-        c_abcorr,
-        c_obsrvr,
-        &c_spoint[0],
-        &c_trgepc,
-        &c_srfvec[0]
-        )
-    check_for_spice_error()
+    with _cspice:
+        subslr_c(
+            c_method,
+            c_target,
+            c_et,
+            c_fixref,
+            c_abcorr,
+            c_obsrvr,
+            &c_spoint[0],
+            &c_trgepc,
+            &c_srfvec[0]
+            )
+        check_for_spice_error()
 
     return p_spoint, c_trgepc, p_srfvec
 
@@ -8327,16 +10790,22 @@ def subslr_s(
 @boundscheck(False)
 @wraparound(False)
 def subslr_v(
-    str method,
-    str target,
-    double[::1] ets,
-    str fixref,
-    str abcorr,
-    str obsrvr
+    method,
+    target,
+    ets,
+    fixref,
+    abcorr,
+    obsrvr,
+    *,
+    object out=None,
+    str errors="raise"
     ) -> tuple[Vector_N, Double_N, Vector_N]:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.subslr`
 
+    All arguments except the output and error options broadcast against each other
+    following NumPy rules, string arguments may be arrays of names.
+
     Compute the rectangular coordinates of the sub-solar point on
     a target body at a specified epoch, optionally corrected for
     light time and stellar aberration.
@@ -8351,44 +10820,53 @@ def subslr_v(
     :param fixref: Body-fixed, body-centered target body frame.
     :param abcorr: Aberration correction.
     :param obsrvr: Name of observing body.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return:
             Sub-solar point on the target body in km,
             Sub-solar point epoch,
             Vector from observer to sub-solar point in km.
     """
-    # get size of input array
-    cdef const np.double_t[::1] c_ets = np.ascontiguousarray(ets, dtype=np.double)
-    cdef Py_ssize_t i, n = c_ets.shape[0]
-    # convert strings
-    cdef const char* c_method = method
-    cdef const char* c_target = target
-    cdef const char* c_fixref = fixref
-    cdef const char* c_abcorr = abcorr
-    cdef const char* c_obsrvr = obsrvr
-    # Allocate output floats and arrays with appropriate shapes.
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_spoint = np.empty((n, 3), dtype=np.double, order='C')
-    cdef np.double_t[:, ::1] c_spoint = p_spoint
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_srfvec = np.empty((n, 3), dtype=np.double, order='C')
-    cdef np.double_t[:, ::1] c_srfvec = p_srfvec
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_trgepc = np.empty(n, dtype=np.double, order='C')
-    cdef np.double_t[::1] c_trgepc = p_trgepc
-    # perform the call
-    with nogil:
-        for i in range(n):
-            subslr_c(
-                c_method,
-                c_target,
-                c_ets[i],
-                c_fixref,
-                c_abcorr,
-                c_obsrvr,
-                &c_spoint[i, 0],
-                &c_trgepc[i],
-                &c_srfvec[i, 0]
-            )
-    check_for_spice_error()
-
-    return p_spoint, p_trgepc, p_srfvec
+    # broadcast the arguments against each other
+    cdef tuple shape = np.broadcast_shapes(
+        np.shape(method), np.shape(target), np.shape(ets), np.shape(fixref), np.shape(abcorr), np.shape(obsrvr)
+    )
+    cdef Py_ssize_t i, n = _shape_size(shape)
+    # initialize c variables
+    cdef _StrArg c_method = _StrArg(method, shape)
+    cdef _StrArg c_target = _StrArg(target, shape)
+    cdef _DblArg c_ets    = _DblArg(ets, shape)
+    cdef _StrArg c_fixref = _StrArg(fixref, shape)
+    cdef _StrArg c_abcorr = _StrArg(abcorr, shape)
+    cdef _StrArg c_obsrvr = _StrArg(obsrvr, shape)
+    cdef tuple c_out = _check_out(out, 3)
+    # initialize output arrays
+    cdef np.ndarray p_spoint = _output(c_out, 0, shape + (3,), np.double)
+    cdef np.double_t[:, ::1] c_spoint = p_spoint.reshape(n, 3)
+    cdef np.ndarray p_trgepc = _output(c_out, 1, shape, np.double)
+    cdef np.double_t[::1] c_trgepc = p_trgepc.reshape(n)
+    cdef np.ndarray p_srfvec = _output(c_out, 2, shape + (3,), np.double)
+    cdef np.double_t[:, ::1] c_srfvec = p_srfvec.reshape(n, 3)
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, shape)
+    # main loop
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                subslr_c(
+                    c_method.at(i),
+                    c_target.at(i),
+                    c_ets.at(i),
+                    c_fixref.at(i),
+                    c_abcorr.at(i),
+                    c_obsrvr.at(i),
+                    &c_spoint[i, 0],
+                    &c_trgepc[i],
+                    &c_srfvec[i, 0]
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        return c_errors.finish((p_spoint, p_trgepc, p_srfvec))
 
 
 def subslr(
@@ -8430,7 +10908,10 @@ def subslr(
 def sxform_s(
     str instring,
     str tostring,
-    double et
+    double et,
+    *,
+    object out=None,
+    bint astuple=False
     ) -> Matrix_6:
     """
     Scalar version of :py:meth:`~spiceypy.cyice.cyice.sxform`
@@ -8444,6 +10925,8 @@ def sxform_s(
     :param instring: Name of the frame to transform from.
     :param tostring: Name of the frame to transform to.
     :param et: Epoch of the state transformation matrix.
+    :param out: Optional preallocated array the state transformation matrix is written to.
+    :param astuple: Return the state transformation matrix as nested tuples of floats instead of an array.
     :return: A state transformation matrix.
     """
     # initialize c variables
@@ -8451,28 +10934,36 @@ def sxform_s(
     cdef const char* c_instring = instring
     cdef const char* c_tostring = tostring
     # initialize output
-    cdef np.ndarray[np.double_t, ndim=2, mode="c"] p_xform = np.empty((6, 6), dtype=np.double, order='C')
-    cdef np.double_t[:, ::1] c_xform = p_xform
-    sxform_c(
-        c_instring,
-        c_tostring,
-        c_et,
-        <SpiceDouble (*)[6]> &c_xform[0, 0]
-    )
-    check_for_spice_error()
-    return p_xform
+    cdef double[36] t_xform
+    cdef np.ndarray p_xform = _scalar_output(out, astuple, 0, 1, 6, 6)
+    cdef double* c_xform = _output_data(p_xform, t_xform)
+    with _cspice:
+        sxform_c(
+            c_instring,
+            c_tostring,
+            c_et,
+            <SpiceDouble (*)[6]> c_xform
+        )
+        check_for_spice_error()
+    return _scalar_result(p_xform, c_xform, 6, 6)
 
 
 @boundscheck(False)
 @wraparound(False)
 def sxform_v(
-    str instring,
-    str tostring,
-    double[::1] ets
+    instring,
+    tostring,
+    ets,
+    *,
+    object out=None,
+    str errors="raise"
     ) -> Matrix_N_6:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.sxform`
 
+    All arguments except the output and error options broadcast against each other
+    following NumPy rules, string arguments may be arrays of names.
+
     Return the state transformation matrix from one frame to
     another at a specified epoch.
 
@@ -8482,27 +10973,38 @@ def sxform_v(
     :param instring: Name of the frame to transform from.
     :param tostring: Name of the frame to transform to.
     :param et: Epochs of the state transformation matrix.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return: A state transformation matrix.
     """
-    cdef const np.double_t[::1] c_ets = np.ascontiguousarray(ets, dtype=np.double)
-    cdef Py_ssize_t i, n = c_ets.shape[0]
-    cdef const char* c_instring = instring
-    cdef const char* c_tostring = tostring
-    # initialize output
-    cdef np.ndarray[np.double_t, ndim=3, mode="c"] p_xform = np.empty((n, 6, 6), dtype=np.double, order='C')
-    cdef np.double_t[:, :, ::1] c_xform = p_xform
-    # pointer to element
-    cdef SpiceDouble* base = &c_xform[0, 0, 0]
-    with nogil:
-        for i in range(n):
-            sxform_c(
-                c_instring,
-                c_tostring,
-                c_ets[i],
-                <SpiceDouble (*)[6]> (base + i*36)
-            )
-    check_for_spice_error()
-    return p_xform
+    # broadcast the arguments against each other
+    cdef tuple shape = np.broadcast_shapes(
+        np.shape(instring), np.shape(tostring), np.shape(ets)
+    )
+    cdef Py_ssize_t i, n = _shape_size(shape)
+    # initialize c variables
+    cdef _StrArg c_instring = _StrArg(instring, shape)
+    cdef _StrArg c_tostring = _StrArg(tostring, shape)
+    cdef _DblArg c_ets      = _DblArg(ets, shape)
+    cdef tuple c_out = _check_out(out, 1)
+    # initialize output arrays
+    cdef np.ndarray p_xform = _output(c_out, 0, shape + (6, 6), np.double)
+    cdef np.double_t[:, :, ::1] c_xform = p_xform.reshape(n, 6, 6)
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, shape)
+    # main loop
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                sxform_c(
+                    c_instring.at(i),
+                    c_tostring.at(i),
+                    c_ets.at(i),
+                    <SpiceDouble (*)[6]> &c_xform[i, 0, 0]
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        return c_errors.finish(p_xform)
 
 
 def sxform(
@@ -8594,24 +11096,25 @@ def tangpt_s(
     cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_srfvec = np.empty(3, dtype=np.double, order='C')
     cdef np.double_t[::1] c_srfvec = p_srfvec
     # perform the call
-    tangpt_c(
-        c_method,
-        c_target,
-        c_et,
-        c_fixref,
-        c_abcorr,
-        c_corloc,
-        c_obsrvr,
-        c_dref,
-        &dvec[0],
-        &c_tanpt[0],
-        &c_alt,
-        &c_vrange,
-        &c_srfpt[0],
-        &c_trgepc,
-        &c_srfvec[0]
-    )
-    check_for_spice_error()
+    with _cspice:
+        tangpt_c(
+            c_method,
+            c_target,
+            c_et,
+            c_fixref,
+            c_abcorr,
+            c_corloc,
+            c_obsrvr,
+            c_dref,
+            &dvec[0],
+            &c_tanpt[0],
+            &c_alt,
+            &c_vrange,
+            &c_srfpt[0],
+            &c_trgepc,
+            &c_srfvec[0]
+        )
+        check_for_spice_error()
     # return values
     return p_tanpt, c_alt, c_vrange, p_srfpt, c_trgepc, p_srfvec
 
@@ -8627,7 +11130,10 @@ def tangpt_v(
     str corloc,
     str obsrvr,
     str dref,
-    double[::1] dvec
+    double[::1] dvec,
+    *,
+    object out=None,
+    str errors="raise"
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.tangpt`
@@ -8654,6 +11160,8 @@ def tangpt_v(
     :param obsrvr: Name of observing body.
     :param dref: Reference frame of ray direction vector.
     :param dvec: Ray direction vector.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return: "Tangent point": point on ray nearest to surface, Altitude of
      tangent point above surface, Distance of tangent point from observer,
      Point on surface nearest to tangent point, Epoch associated with
@@ -8670,42 +11178,47 @@ def tangpt_v(
     cdef const char* c_corloc = corloc
     cdef const char* c_obsrvr = obsrvr
     cdef const char* c_dref   = dref
+    cdef tuple c_out = _check_out(out, 6)
     # Allocate output floats and arrays with appropriate shapes.
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_tanpt = np.empty((n, 3), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_tanpt = _output(c_out, 0, (n, 3), np.double)
     cdef np.double_t[:, ::1] c_tanpt = p_tanpt
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_alt = np.empty(n, dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_alt = _output(c_out, 1, (n,), np.double)
     cdef np.double_t[::1] c_alt = p_alt
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_vrange = np.empty(n, dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_vrange = _output(c_out, 2, (n,), np.double)
     cdef np.double_t[::1] c_vrange = p_vrange
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_srfpt = np.empty((n, 3), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_srfpt = _output(c_out, 3, (n, 3), np.double)
     cdef np.double_t[:, ::1] c_srfpt = p_srfpt
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_srfvec = np.empty((n, 3), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_srfvec = _output(c_out, 5, (n, 3), np.double)
     cdef np.double_t[:, ::1] c_srfvec = p_srfvec
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_trgepc = np.empty(n, dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_trgepc = _output(c_out, 4, (n,), np.double)
     cdef np.double_t[::1] c_trgepc = p_trgepc
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
     # perform the calls
-    with nogil:
-        for i in range(n):
-            tangpt_c(
-                c_method,
-                c_target,
-                c_ets[i],
-                c_fixref,
-                c_abcorr,
-                c_corloc,
-                c_obsrvr,
-                c_dref,
-                &dvec[0],
-                &c_tanpt[i, 0],
-                &c_alt[i],
-                &c_vrange[i],
-                &c_srfpt[i, 0],
-                &c_trgepc[i],
-                &c_srfvec[i, 0]
-            )
-    check_for_spice_error()
-    # return values
-    return p_tanpt, p_alt, p_vrange, p_srfpt, p_trgepc, p_srfvec
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                tangpt_c(
+                    c_method,
+                    c_target,
+                    c_ets[i],
+                    c_fixref,
+                    c_abcorr,
+                    c_corloc,
+                    c_obsrvr,
+                    c_dref,
+                    &dvec[0],
+                    &c_tanpt[i, 0],
+                    &c_alt[i],
+                    &c_vrange[i],
+                    &c_srfpt[i, 0],
+                    &c_trgepc[i],
+                    &c_srfvec[i, 0]
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        # return values
+        return c_errors.finish((p_tanpt, p_alt, p_vrange, p_srfpt, p_trgepc, p_srfvec))
 
 
 def tangpt(
@@ -8823,28 +11336,29 @@ cpdef tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] termpt_s(
     cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_trmvcs = np.empty((c_maxn, 3), dtype=np.double, order='C')
     cdef np.double_t[:,::1] c_trmvcs = p_trmvcs
     # call the c function
-    with nogil:
-        termpt_c(
-            method,
-            ilusrc,
-            target,
-            et,
-            fixref,
-            abcorr,
-            corloc,
-            obsrvr,
-            &c_refvec[0],
-            rolstp,
-            ncuts,
-            schstp,
-            soltol,
-            maxn,
-            &c_npts[0],
-            <SpiceDouble (*)[3]> &c_points[0, 0],
-            &c_epochs[0],
-            <SpiceDouble (*)[3]> &c_trmvcs[0, 0]
-        )
-    check_for_spice_error()
+    with _cspice:
+        with nogil:
+            termpt_c(
+                method,
+                ilusrc,
+                target,
+                et,
+                fixref,
+                abcorr,
+                corloc,
+                obsrvr,
+                &c_refvec[0],
+                rolstp,
+                ncuts,
+                schstp,
+                soltol,
+                maxn,
+                &c_npts[0],
+                <SpiceDouble (*)[3]> &c_points[0, 0],
+                &c_epochs[0],
+                <SpiceDouble (*)[3]> &c_trmvcs[0, 0]
+            )
+        check_for_spice_error()
     # return the results
     return p_npts, p_points, p_epochs, p_trmvcs
 
@@ -8865,7 +11379,9 @@ cpdef tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] termpt_v(
     int ncuts,
     double schstp,
     double soltol,
-    int maxn
+    int maxn,
+    str errors="raise",
+    object out=None
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.termpt`
@@ -8900,6 +11416,8 @@ cpdef tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] termpt_v(
     :param schstp: Angular step size for searching.
     :param soltol: Solution convergence tolerance.
     :param maxn: Maximum number of entries in output arrays.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return: 
         Counts of terminator points corresponding to cuts, 
         Terminator points in km, 
@@ -8912,41 +11430,46 @@ cpdef tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] termpt_v(
     cdef Py_ssize_t c_maxn = maxn
     cdef const np.double_t[::1] c_refvec = np.ascontiguousarray(refvec, dtype=np.double)
     cdef const SpiceDouble* c_refvec_ptr = &c_refvec[0]
+    cdef tuple c_out = _check_out(out, 4)
     # allocate outputs
-    cdef np.ndarray[np.int32_t, ndim=2, mode='c'] p_npts = np.empty((n, c_maxn), dtype=np.int32, order='C')
+    cdef np.ndarray[np.int32_t, ndim=2, mode='c'] p_npts = _output(c_out, 0, (n, c_maxn), np.int32)
     cdef int[:,::1] c_npts = p_npts
-    cdef np.ndarray[np.double_t, ndim=3, mode='c'] p_points = np.empty((n, c_maxn, 3), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=3, mode='c'] p_points = _output(c_out, 1, (n, c_maxn, 3), np.double)
     cdef np.double_t[:,:,::1] c_points = p_points
-    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_epochs = np.empty((n, c_maxn), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=2, mode='c'] p_epochs = _output(c_out, 2, (n, c_maxn), np.double)
     cdef np.double_t[:,::1] c_epochs = p_epochs
-    cdef np.ndarray[np.double_t, ndim=3, mode='c'] p_trmvcs = np.empty((n, c_maxn, 3), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=3, mode='c'] p_trmvcs = _output(c_out, 3, (n, c_maxn, 3), np.double)
     cdef np.double_t[:,:,::1] c_trmvcs = p_trmvcs
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
     # call the c function
-    with nogil:
-        for i in range(n):
-            termpt_c(
-                method,
-                ilusrc,
-                target,
-                c_ets[i],
-                fixref,
-                abcorr,
-                corloc,
-                obsrvr,
-                c_refvec_ptr,
-                rolstp,
-                ncuts,
-                schstp,
-                soltol,
-                maxn,
-                &c_npts[i, 0],
-                <SpiceDouble (*)[3]> &c_points[i, 0, 0],
-                &c_epochs[i, 0],
-                <SpiceDouble (*)[3]> &c_trmvcs[i, 0, 0]
-            )
-    check_for_spice_error()
-    # return the results
-    return p_npts, p_points, p_epochs, p_trmvcs
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                termpt_c(
+                    method,
+                    ilusrc,
+                    target,
+                    c_ets[i],
+                    fixref,
+                    abcorr,
+                    corloc,
+                    obsrvr,
+                    c_refvec_ptr,
+                    rolstp,
+                    ncuts,
+                    schstp,
+                    soltol,
+                    maxn,
+                    &c_npts[i, 0],
+                    <SpiceDouble (*)[3]> &c_points[i, 0, 0],
+                    &c_epochs[i, 0],
+                    <SpiceDouble (*)[3]> &c_trmvcs[i, 0, 0]
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        # return the results
+        return c_errors.finish((p_npts, p_points, p_epochs, p_trmvcs))
 
 
 def termpt(
@@ -9029,13 +11552,14 @@ def timout_s(
     cdef double c_et = et
     cdef const char* c_pictur = pictur
     cdef char[TIMELEN] c_buffer
-    timout_c(
-        c_et,
-        c_pictur,
-        TIMELEN,
-        &c_buffer[0]
-    )
-    check_for_spice_error()
+    with _cspice:
+        timout_c(
+            c_et,
+            c_pictur,
+            TIMELEN,
+            &c_buffer[0]
+        )
+        check_for_spice_error()
     return PyUnicode_DecodeUTF8(c_buffer, strlen(c_buffer), "strict")
 
 
@@ -9043,7 +11567,9 @@ def timout_s(
 @wraparound(False)
 def timout_v(
     double[::1] ets,
-    str pictur
+    str pictur,
+    *,
+    str errors="raise"
     ) -> String_N:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.timout`
@@ -9056,6 +11582,7 @@ def timout_v(
 
     :param ets: Epochs in seconds past the ephemeris epoch J2000.
     :param pictur: A format specification for the output string.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return: A string representation of the input epoch.
     """
     cdef const np.double_t[::1] c_ets = np.ascontiguousarray(ets, dtype=np.double)
@@ -9067,19 +11594,23 @@ def timout_v(
     cdef np.ndarray[np.uint8_t, ndim=2, mode='c'] p_outputs = np.zeros((n, TIMELEN), dtype=np.uint8, order='C')
     cdef np.uint8_t[:, ::1] c_outputs = p_outputs
     cdef char* base = <char*> &c_outputs[0, 0]
-    with nogil:
-        for i in range(n):
-            timout_c(
-                c_ets[i],
-                c_pictur,
-                TIMELEN,
-                base + i*TIMELEN
-            )
-    check_for_spice_error()
-    # return values
-    py_outputs = p_outputs.view(p_np_s_dtype).reshape(n)
-    py_outputs = np.char.rstrip(py_outputs).astype(p_np_u_dtype)
-    return py_outputs
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                timout_c(
+                    c_ets[i],
+                    c_pictur,
+                    TIMELEN,
+                    base + i*TIMELEN
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        # return values
+        py_outputs = p_outputs.view(p_np_s_dtype).reshape(n)
+        py_outputs = np.char.rstrip(py_outputs).astype(p_np_u_dtype)
+        return c_errors.finish(py_outputs)
 
 
 def timout(
@@ -9143,18 +11674,19 @@ def trgsep_s(
     cdef const char* c_frame2  = frame2
     cdef const char* c_obsrvr  = obsrvr
     cdef const char* c_abcorr  = abcorr
-    c_angsep = trgsep_c(
-        c_et,
-        c_targ1,
-        c_shape1,
-        c_frame1,
-        c_targ2,
-        c_shape2,
-        c_frame2,
-        c_obsrvr,
-        c_abcorr
-    )
-    check_for_spice_error()
+    with _cspice:
+        c_angsep = trgsep_c(
+            c_et,
+            c_targ1,
+            c_shape1,
+            c_frame1,
+            c_targ2,
+            c_shape2,
+            c_frame2,
+            c_obsrvr,
+            c_abcorr
+        )
+        check_for_spice_error()
     return c_angsep
 
 
@@ -9169,7 +11701,10 @@ def trgsep_v(
     str shape2,
     str frame2,
     str obsrvr,
-    str abcorr
+    str abcorr,
+    *,
+    object out=None,
+    str errors="raise"
     ) -> Double_N:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.trgsep`
@@ -9188,6 +11723,8 @@ def trgsep_v(
     :param frame2: Reference frame of second target (UNUSED).
     :param obsrvr: Observing body name.
     :param abcorr: Aberration corrections flag.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return: angular separation in radians.
     """
     cdef const np.double_t[::1] c_ets = np.ascontiguousarray(ets, dtype=np.double)
@@ -9200,24 +11737,29 @@ def trgsep_v(
     cdef const char* c_frame2  = frame2
     cdef const char* c_obsrvr  = obsrvr
     cdef const char* c_abcorr  = abcorr
+    cdef tuple c_out = _check_out(out, 1)
     # initialize output
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_angseps = np.empty(n, dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_angseps = _output(c_out, 0, (n,), np.double)
     cdef np.double_t[::1] c_angseps = p_angseps
-    with nogil:
-        for i in range(n):
-            c_angseps[i] = trgsep_c(
-                c_ets[i],
-                c_targ1,
-                c_shape1,
-                c_frame1,
-                c_targ2,
-                c_shape2,
-                c_frame2,
-                c_obsrvr,
-                c_abcorr
-            )
-    check_for_spice_error()
-    return p_angseps
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                c_angseps[i] = trgsep_c(
+                    c_ets[i],
+                    c_targ1,
+                    c_shape1,
+                    c_frame1,
+                    c_targ2,
+                    c_shape2,
+                    c_frame2,
+                    c_obsrvr,
+                    c_abcorr
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_ets)
+        return c_errors.finish(p_angseps)
 
 
 def trgsep(
@@ -9303,12 +11845,13 @@ def unitim_s(
     cdef double c_epoch = epoch
     cdef const char* c_insys = insys
     cdef const char* c_outsys = outsys
-    c_unitim = unitim_c(
-        c_epoch,
-        c_insys,
-        c_outsys
-    )
-    check_for_spice_error()
+    with _cspice:
+        c_unitim = unitim_c(
+            c_epoch,
+            c_insys,
+            c_outsys
+        )
+        check_for_spice_error()
     return c_unitim
 
 
@@ -9318,6 +11861,9 @@ def unitim_v(
         double[::1] epochs,
         insys: str,
         outsys: str,
+    *,
+    object out=None,
+    str errors="raise"
     ) -> Double_N:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.unitim`
@@ -9330,6 +11876,8 @@ def unitim_v(
     :param epochs: Epochs to be converted.
     :param insys: The time scale associated with the input epoch.
     :param outsys: The time scale associated with the function value.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return:
             The float in outsys that is equivalent
             to the epoch on the insys time scale.
@@ -9338,19 +11886,24 @@ def unitim_v(
     cdef Py_ssize_t i, n = c_epochs.shape[0]
     cdef const char* c_insys = insys
     cdef const char* c_outsys = outsys
+    cdef tuple c_out = _check_out(out, 1)
     # initialize output
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_unitims = np.empty(n, dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_unitims = _output(c_out, 0, (n,), np.double)
     cdef np.double_t[::1] c_unitims = p_unitims
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
     # perform the actual call
-    with nogil:
-        for i in range(n):
-            c_unitims[i] = unitim_c(
-                c_epochs[i],
-                c_insys,
-                c_outsys
-            )
-    check_for_spice_error()
-    return p_unitims
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                c_unitims[i] = unitim_c(
+                    c_epochs[i],
+                    c_insys,
+                    c_outsys
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(c_epochs)
+        return c_errors.finish(p_unitims)
 
 
 def unitim(
@@ -9386,7 +11939,8 @@ def unload(str filename) -> None:
     :param filename: The name of a kernel to unload.
     """
     cdef const char* c_file = filename
-    unload_c(c_file)
+    with _cspice:
+        unload_c(c_file)
 
 
 def utc2et_s(const char* utcstr)-> float:
@@ -9402,18 +11956,22 @@ def utc2et_s(const char* utcstr)-> float:
     :return: Output epoch, ephemeris seconds past J2000.
     """
     cdef double c_et = 0.0
-    utc2et_c(
-        utcstr,
-        &c_et
-    )
-    check_for_spice_error()
+    with _cspice:
+        utc2et_c(
+            utcstr,
+            &c_et
+        )
+        check_for_spice_error()
     return c_et
 
 
 @boundscheck(False)
 @wraparound(False)
 def utc2et_v(
-    np.ndarray utcstr
+    np.ndarray utcstr,
+    *,
+    object out=None,
+    str errors="raise"
     ) -> Double_N:
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.utc2et`
@@ -9424,24 +11982,31 @@ def utc2et_v(
     https://naif.jpl.nasa.gov/pub/naif/misc/toolkit_docs_N0067/C/cspice/utc2et_c.html
 
     :param utcstr: Input time strings, UTC.
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return: Output epochs, ephemeris seconds past J2000.
     """
     cdef Py_ssize_t i, n = utcstr.shape[0]
+    cdef tuple c_out = _check_out(out, 1)
     # initialize output
-    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_ets = np.empty(n, dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=1, mode='c'] p_ets = _output(c_out, 0, (n,), np.double)
     cdef np.double_t[::1] c_ets = p_ets
     cdef const char* c_utcstr
     # coerce unicode to a byte-string array
     if utcstr.dtype.kind == 'U':
         utcstr = np.char.encode(utcstr, 'ascii')
-    for i in range(n):
-        c_utcstr = utcstr[i]
-        utc2et_c(
-            c_utcstr,
-            &c_ets[i]
-        )
-    check_for_spice_error()
-    return p_ets
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
+    with _cspice:
+        for i in range(n):
+            c_utcstr = utcstr[i]
+            utc2et_c(
+                c_utcstr,
+                &c_ets[i]
+            )
+            if c_errors.capture(i):
+                break
+        c_errors.check(utcstr)
+        return c_errors.finish(p_ets)
 
 
 def utc2et(utcstr: str | String_N)-> float | Double_N:
@@ -9460,6 +12025,184 @@ def utc2et(utcstr: str | String_N)-> float | Double_N:
         return utc2et_v(utcstr)
 
 
+#W
+
+
+cdef tuple _dskmi2_sizes(Py_ssize_t np_, double finscl, int corscl):
+    # first guess of the dskmi2 workspace, voxel pointer and voxel-plate list
+    # sizes of a surface of np_ plates. About 2.5 np_ corscl / finscl**2 fine
+    # voxels are used and each plate is listed in about 1 + 2 / finscl + 6 /
+    # finscl**2 of them, the guesses leave some room on top of that.
+    cdef Py_ssize_t voxpsz = <Py_ssize_t> (4.0 * np_ * corscl / (finscl * finscl)) + 8 * corscl * corscl * corscl
+    cdef Py_ssize_t voxlsz = <Py_ssize_t> (np_ * (1.5 + 3.0 / finscl + 8.0 / (finscl * finscl))) + 1000
+    return max(voxpsz, voxlsz, 3 * np_), voxpsz, voxlsz
+
+
+cdef tuple _dskmi2_grow(
+    const np.double_t[:, ::1] vrtces,
+    const np.int32_t[:, ::1] plates,
+    double finscl,
+    int corscl,
+    bint makvtl
+    ):
+    # spatial index of a mesh and the sizes it was made with, starting from
+    # the guessed sizes and doubling the one dskmi2 reports as too small
+    cdef Py_ssize_t worksz, voxpsz, voxlsz, spxisz, attempt = 0
+    worksz, voxpsz, voxlsz = _dskmi2_sizes(plates.shape[0], finscl, corscl)
+    while True:
+        spxisz = DSK02_IXIFIX + voxpsz + voxlsz + vrtces.shape[0]
+        if makvtl:
+            spxisz += vrtces.shape[0] + 3 * plates.shape[0]
+        try:
+            spaixd, spaixi = _dskmi2(vrtces, plates, finscl, corscl, worksz, voxpsz, voxlsz, makvtl, spxisz)
+            return spaixd, spaixi, worksz, voxpsz, voxlsz, spxisz
+        except SpiceyError as error:
+            if attempt == DSK02_RETRIES:
+                raise
+            attempt += 1
+            if error.short in ("SPICE(WORKSPACETOOSMALL)", "SPICE(CELLARRAYTOOSMALL)"):
+                worksz *= 2
+            elif error.short == "SPICE(AVALOUTOFRANGE)":
+                voxpsz *= 2
+                worksz = max(worksz, voxpsz)
+            elif error.short in ("SPICE(PLATELISTTOOSMALL)", "SPICE(BARRAYTOOSMALL)"):
+                voxlsz *= 2
+            else:
+                raise
+
+
+def write_dsk_type2(
+    object dsk,
+    vrtces,
+    plates,
+    int center,
+    int surfid,
+    str frame,
+    double first,
+    double last,
+    *,
+    int dclass=2,
+    int corsys=1,
+    object corpar=None,
+    object bounds=None,
+    double finscl=5.0,
+    int corscl=4,
+    bint makvtl=True,
+    object max_plates=None,
+    str ifname=None,
+    int ncomch=0
+    ) -> list[DSK02Segment]:
+    """
+    Write a triangular plate model to a DSK file as type 2 segments.
+
+    Each segment is indexed with dskmi2, bounded with dskrb2 and written
+    with dskw02, the arrays are passed to CSPICE without a copy when they
+    are C contiguous float64 and int32 arrays. The dskmi2 workspace and
+    index sizes are estimated from the plate count and the voxel scales and
+    doubled, rebuilding the index, when dskmi2 finds one of them too small.
+
+    The model is written as one segment unless max_plates is given, then
+    each run of at most max_plates consecutive plates forms a segment with
+    the vertices its plates use. A type 2 segment holds at most 32000000
+    plates and 16000002 vertices.
+
+    The coverage of the first two coordinates is the whole body for
+    latitudinal and planetodetic coordinates and the extent of the
+    segment's vertices for rectangular coordinates, bounds sets it to
+    ((mncor1, mxcor1), (mncor2, mxcor2)) for all segments instead.
+
+    https://naif.jpl.nasa.gov/pub/naif/misc/toolkit_docs_N0067/C/cspice/dskw02_c.html
+
+    :param dsk: Name of a new DSK file, or handle of a DSK file open for writing.
+    :param vrtces: (NV, 3) vertices.
+    :param plates: (NP, 3) plates, 1-based indices of their vertices.
+    :param center: Central body ID code.
+    :param surfid: Surface ID code.
+    :param frame: Reference frame.
+    :param first: Coverage start time.
+    :param last: Coverage stop time.
+    :param dclass: Data class, 1 for a single-valued surface, 2 for a general surface.
+    :param corsys: Coordinate system code, 1 latitudinal, 3 rectangular, 4 planetodetic.
+    :param corpar: Coordinate system parameters, zeros by default.
+    :param bounds: Coverage bounds of the first two coordinates.
+    :param finscl: Fine voxel scale.
+    :param corscl: Coarse voxel scale.
+    :param makvtl: Vertex plate list flag.
+    :param max_plates: Largest number of plates in a segment.
+    :param ifname: Internal file name of a new DSK file, by default its base name.
+    :param ncomch: Number of comment characters to allocate in a new DSK file.
+    :return: DSK02Segment for each segment written, giving the index of its first plate in plates, its vertex and plate counts, range of the third coordinate, dskmi2 sizes and seconds spent in dskmi2, dskrb2 and dskw02.
+    """
+    cdef np.ndarray p_vrtces = _packed(vrtces, _outer_shape(vrtces), 3, "vrtces")
+    cdef np.ndarray p_plates = _packed(plates, _outer_shape(plates), 3, "plates", np.int32)
+    cdef Py_ssize_t nv = p_vrtces.shape[0], n = p_plates.shape[0]
+    cdef Py_ssize_t step = n if max_plates is None else max_plates
+    cdef np.ndarray p_corpar = np.zeros(10) if corpar is None else _core_array(corpar, (10,), "corpar")
+    cdef np.ndarray p_bounds = np.empty(6)
+    cdef const char* c_frame = frame
+    cdef SpiceInt handle = 0
+    cdef bint opened = not isinstance(dsk, int)
+    cdef list segments = []
+    cdef Py_ssize_t start
+    if n == 0:
+        raise ValueError("plates must hold at least one plate")
+    if p_plates.min() < 1 or p_plates.max() > nv:
+        raise ValueError(f"plates must hold vertex indices from 1 to {nv}")
+    if step < 1:
+        raise ValueError(f"max_plates must be positive, got {max_plates}")
+    if bounds is not None:
+        p_bounds[:4] = np.reshape(bounds, 4)
+    elif corsys != 3:
+        p_bounds[:4] = (-np.pi, np.pi, -np.pi / 2, np.pi / 2)
+    if opened:
+        fname = os.fsencode(dsk)
+        if not ifname:
+            ifname = os.path.basename(os.fsdecode(dsk))[:60]
+        c_ifname = ifname.encode("ascii", "replace")
+        with _cspice:
+            dskopn_c(fname, c_ifname, ncomch, &handle)
+            check_for_spice_error()
+    else:
+        handle = dsk
+    try:
+        for start in range(0, n, step):
+            seg_plates = p_plates[start:start + step]
+            seg_vrtces = p_vrtces
+            if step < n:
+                # renumber the plates to the vertices they use
+                used, inverse = np.unique(seg_plates, return_inverse=True)
+                seg_vrtces = p_vrtces[used - 1]
+                seg_plates = (inverse.reshape(-1, 3) + 1).astype(np.int32)
+            t0 = perf_counter()
+            spaixd, spaixi, worksz, voxpsz, voxlsz, spxisz = _dskmi2_grow(
+                seg_vrtces, seg_plates, finscl, corscl, makvtl
+            )
+            t1 = perf_counter()
+            mncor3, mxcor3 = _dskrb2(seg_vrtces, seg_plates, corsys, p_corpar)
+            t2 = perf_counter()
+            if bounds is None and corsys == 3:
+                p_bounds[:4] = (
+                    seg_vrtces[:, 0].min(), seg_vrtces[:, 0].max(),
+                    seg_vrtces[:, 1].min(), seg_vrtces[:, 1].max()
+                )
+            p_bounds[4:] = (mncor3, mxcor3)
+            _dskw02(
+                handle, center, surfid, dclass, c_frame, corsys, p_corpar, p_bounds,
+                first, last, seg_vrtces, seg_plates, spaixd, spaixi
+            )
+            t3 = perf_counter()
+            segments.append(DSK02Segment(
+                start, len(seg_vrtces), len(seg_plates), mncor3, mxcor3,
+                worksz, voxpsz, voxlsz, spxisz, t1 - t0, t2 - t1, t3 - t2
+            ))
+    finally:
+        if opened:
+            with _cspice:
+                dskcls_c(handle, SPICETRUE)
+                check_for_spice_error()
+    return segments
+
+
 #X 
 
 
@@ -9493,24 +12236,27 @@ cpdef np.ndarray[np.double_t, ndim=1, mode='c'] xfmsta_s(
     # initialize output
     cdef np.ndarray[np.double_t, ndim=1, mode="c"] p_state = np.empty(6, dtype=np.double, order='C')
     cdef np.double_t[::1] c_state = p_state
-    xfmsta_c(
-        &c_input_state[0],
-        input_coord_sys,
-        output_coord_sys,
-        body,
-        &c_state[0]    
-    )
-    check_for_spice_error()
+    with _cspice:
+        xfmsta_c(
+            &c_input_state[0],
+            input_coord_sys,
+            output_coord_sys,
+            body,
+            &c_state[0]    
+        )
+        check_for_spice_error()
     return p_state
 
 
 @boundscheck(False)
 @wraparound(False)
-cpdef np.ndarray[np.double_t, ndim=2, mode='c'] xfmsta_v(
+cpdef object xfmsta_v(
     const double[:,::1] input_state, 
     const char* input_coord_sys,
     const char* output_coord_sys,
     const char* body,
+    str errors="raise",
+    object out=None
     ):
     """
     Vectorized version of :py:meth:`~spiceypy.cyice.cyice.xfmsta`
@@ -9525,6 +12271,8 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] xfmsta_v(
     :param body:
                 Name or NAIF ID of body with which coordinates
                 are associated (if applicable).
+    :param out: Optional preallocated output arrays, one per returned array.
+    :param errors: Error handling mode, "raise" (default) or "mask".
     :return: Converted output states
     """
     # initialize c variables
@@ -9532,21 +12280,26 @@ cpdef np.ndarray[np.double_t, ndim=2, mode='c'] xfmsta_v(
     if c_input_state.shape[1] != 6:
         raise ValueError(f'in xfmsta_v, state vector had shape {c_input_state.shape[1]}, not 6 as expected')
     cdef Py_ssize_t i, n = c_input_state.shape[0]
+    cdef tuple c_out = _check_out(out, 1)
     # initialize output
-    cdef np.ndarray[np.double_t, ndim=2, mode="c"] p_states = np.empty((n,6), dtype=np.double, order='C')
+    cdef np.ndarray[np.double_t, ndim=2, mode="c"] p_states = _output(c_out, 0, (n, 6), np.double)
     cdef np.double_t[:, ::1] c_states = p_states
+    cdef _ErrorCapture c_errors = _ErrorCapture(errors, (n,))
     # pointer to element
-    with nogil:
-        for i in range(n):
-            xfmsta_c(
-                &c_input_state[i, 0],
-                input_coord_sys,
-                output_coord_sys,
-                body,
-                &c_states[i, 0]
-            )
-    check_for_spice_error()
-    return p_states
+    with _cspice:
+        with nogil:
+            for i in range(n):
+                xfmsta_c(
+                    &c_input_state[i, 0],
+                    input_coord_sys,
+                    output_coord_sys,
+                    body,
+                    &c_states[i, 0]
+                )
+                if c_errors.capture(i):
+                    break
+        c_errors.check(None)
+        return c_errors.finish(p_states)
 
 
 def xfmsta(
@@ -9576,3 +12329,8 @@ def xfmsta(
     else:
         raise RuntimeError(f'xfmsta provided wrong shape for state: {ndim}')
 
+
+# wrappers generated from the CSPICE prototypes in cyice.pxd, see
+# spiceypy/utils/gen_wrappers.py, the build writes the file next to cyice.c
+
+include "cyice_wrappers.pxi"
@@ -14,36 +14,47 @@ from .utils import support_types as stypes
 from .utils.exceptions import NotFoundError
 
 
+def _found_result(res, name: str):
+    """
+    Internal function raising NotFoundError for the false found flags at the
+    end of the result of a spice function, the result without them otherwise.
+    """
+    found = res[-1]
+    if isinstance(found, bool) and not found:
+        raise NotFoundError(
+            "Spice returns not found for function: {}".format(name),
+            found=found,
+        )
+    elif stypes.is_iterable(found) and not all(found):
+        raise NotFoundError(
+            "Spice returns not found in a series of calls for function: {}".format(
+                name
+            ),
+            found=found,
+        )
+    actualres = res[0:-1]
+    if len(actualres) == 1:
+        return actualres[0]
+    return actualres
+
+
 def spice_found_exception_thrower(f: Callable) -> Callable:
     """
     Decorator for wrapping functions that use status codes
     """
+    combined = getattr(f, "with_found_check", None)
+    if combined is not None:
+        # f is wrapped by spice_error_check, check both in a single wrapper
+        return combined()
+    local = config._local
+    name = f.__name__
 
     @functools.wraps(f)
     def wrapper(*args, **kwargs):
         res = f(*args, **kwargs)
-        if config.catch_false_founds:
-            found = res[-1]
-            if isinstance(found, bool) and not found:
-                raise NotFoundError(
-                    "Spice returns not found for function: {}".format(f.__name__),
-                    found=found,
-                )
-            elif stypes.is_iterable(found) and not all(found):
-                raise NotFoundError(
-                    "Spice returns not found in a series of calls for function: {}".format(
-                        f.__name__
-                    ),
-                    found=found,
-                )
-            else:
-                actualres = res[0:-1]
-                if len(actualres) == 1:
-                    return actualres[0]
-                else:
-                    return actualres
-        else:
-            return res
+        if local.catch_false_founds:
+            return _found_result(res, name)
+        return res
 
     return wrapper
 
@@ -0,0 +1,163 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) [2015-2025] [Andrew Annex]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import ctypes
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Tuple
+
+import numpy
+from numpy import ndarray
+
+from .utils.cspice_signatures import SIGNATURES
+from .utils.libspicehelper import libspice
+
+__all__ = ["CFunction", "cspice_functions", "cstring", "numba_externals"]
+
+
+class CFunction(NamedTuple):
+    """
+    Address and signature of a CSPICE function in the loaded library.
+
+    The types are the names used in utils/cspice_signatures.py: SpiceInt is a
+    C int, SpiceDouble a double, SpiceChar * a null terminated string, and
+    arrays such as SpiceDouble[3][3] are passed as a pointer to their first
+    element. restype is None for void functions, argtypes is None for
+    variadic functions.
+    """
+
+    name: str
+    address: int
+    restype: Optional[str]
+    argtypes: Optional[Tuple[str, ...]]
+
+
+_functions: Dict[str, CFunction] = {}
+
+
+def cspice_functions() -> Dict[str, CFunction]:
+    """
+    Return the address and signature of every CSPICE function SpiceyPy calls,
+    by function name, for example "spkpos_c".
+
+    The functions are called without SpiceyPy's error checks or spice_lock,
+    see numba_externals.
+
+    :return: dict of CFunction
+    """
+    if not _functions:
+        for name, (restype, argtypes) in SIGNATURES.items():
+            address = ctypes.cast(getattr(libspice, name), ctypes.c_void_p).value
+            _functions[name] = CFunction(name, address, restype, argtypes)
+    return dict(_functions)
+
+
+def cstring(text: str = "", size: Optional[int] = None) -> ndarray:
+    """
+    Return a null terminated string as a uint8 array, to pass as SpiceChar *
+    from compiled code with its ctypes attribute.
+
+    :param text: string to encode
+    :param size: size of the array in bytes, for output strings
+    :return: uint8 array
+    """
+    encoded = text.encode("utf-8")
+    size = len(encoded) + 1 if size is None else size
+    if size <= len(encoded):
+        raise ValueError(f"{size} bytes are too few for {text!r}")
+    buffer = numpy.zeros(size, dtype=numpy.uint8)
+    buffer[: len(encoded)] = numpy.frombuffer(encoded, dtype=numpy.uint8)
+    return buffer
+
+
+def _numba_type(name: str, types: Any) -> Any:
+    # the numba type of a type name of the signature table
+    if name == "SpiceInt":
+        return types.int32
+    if name == "SpiceDouble":
+        return types.float64
+    if name == "SpiceChar":
+        return types.int8
+    if name.startswith("SpiceDouble"):
+        return types.CPointer(types.float64)
+    if name.startswith("SpiceInt"):
+        return types.CPointer(types.int32)
+    # strings, cells and other structures, and callbacks
+    return types.voidptr
+
+
+def numba_externals(names: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """
+    Register CSPICE functions with Numba and return them as external
+    functions that can be called in nopython mode.
+
+    Double and int arrays are passed as pointers, for example the ctypes
+    attribute of a float64 array, strings as the ctypes attribute of a
+    cstring array and other pointers as a void pointer. The calls bypass
+    SpiceyPy: call failed_c after a call and getmsg_c and reset_c to get
+    and clear an error, and hold spiceypy.spice_lock around the compiled
+    code when other threads call SpiceyPy.
+
+    Example, the position of the moon in the IAU_EARTH frame in one loop:
+
+    >>> ext = numba_externals(["spkpos_c", "pxform_c", "mxv_c", "failed_c"])
+    >>> spkpos_c, pxform_c, mxv_c, failed_c = ext.values()
+    >>> @numba.njit
+    ... def positions(ets, target, ref, frame, abcorr, obs, out):
+    ...     pos, lt, rot = np.empty(3), np.empty(1), np.empty((3, 3))
+    ...     for i in range(ets.shape[0]):
+    ...         spkpos_c(target.ctypes, ets[i], ref.ctypes, abcorr.ctypes, obs.ctypes, pos.ctypes, lt.ctypes)
+    ...         pxform_c(ref.ctypes, frame.ctypes, ets[i], rot.ctypes)
+    ...         mxv_c(rot.ctypes, pos.ctypes, out[i].ctypes)
+    ...         if failed_c():
+    ...             return i
+    ...     return -1
+    >>> strings = [cstring(s) for s in ("MOON", "J2000", "IAU_EARTH", "LT+S", "EARTH")]
+    >>> failed_at = positions(ets, *strings, out)
+
+    :param names: functions to register, defaults to every function that is not variadic
+    :return: dict of numba.types.ExternalFunction by function name
+    """
+    try:
+        import llvmlite.binding as llvm
+        from numba import types
+    except ImportError as ie:
+        raise ImportError(
+            "numba_externals requires numba, install it with pip install numba"
+        ) from ie
+    functions = cspice_functions()
+    if names is None:
+        names = [name for name, f in functions.items() if f.argtypes is not None]
+    externals = {}
+    for name in names:
+        function = functions[name]
+        if function.argtypes is None:
+            raise ValueError(f"{name} is variadic and cannot be called from numba")
+        llvm.add_symbol(name, function.address)
+        restype = (
+            types.void
+            if function.restype is None
+            else _numba_type(function.restype, types)
+        )
+        argtypes = [_numba_type(argtype, types) for argtype in function.argtypes]
+        externals[name] = types.ExternalFunction(name, restype(*argtypes))
+    return externals
@@ -0,0 +1,382 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) [2015-2025] [Andrew Annex]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import math
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy
+from numpy import ndarray
+
+from . import config
+from .spiceypy import _cyice_dispatched, furnsh, kclear, kdata, ktotal
+from .utils.exceptions import (
+    NotFoundError,
+    SpiceyError,
+    dynamically_instantiate_spiceyerror,
+)
+
+__all__ = ["ParallelExecutor", "loaded_kernels"]
+
+
+def loaded_kernels() -> List[str]:
+    """
+    Return the kernels loaded in this process, in load order, as they
+    need to be passed to furnsh to rebuild the kernel pool.
+
+    Kernels loaded through a meta-kernel are left out as loading the
+    meta-kernel again loads them.
+
+    :return: list of kernel file names
+    """
+    kernels = []
+    for i in range(ktotal("ALL")):
+        file, _, source, _ = kdata(i, "ALL")
+        if source == "":
+            kernels.append(file)
+    return kernels
+
+
+def _init_worker(kernels: List[str], catch_false_founds: bool) -> None:
+    # replay the parent's kernel pool and found flag handling in a new worker
+    config.catch_false_founds = catch_false_founds
+    kclear()
+    if kernels:
+        furnsh(kernels)
+
+
+def _attach(name: str) -> SharedMemory:
+    # attach to a block owned by the parent, which alone unlinks it. Before
+    # python 3.13 attaching registers the block again with the resource tracker
+    # the workers share with the parent, which the parent's unlink then clears.
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    return SharedMemory(name=name)
+
+
+def _resolve(function: Union[str, Callable]) -> Callable:
+    if callable(function):
+        return function
+    from . import cyice
+
+    return getattr(cyice, function)
+
+
+def _is_array(arg: Any) -> bool:
+    return not isinstance(arg, (str, bytes)) and numpy.ndim(arg) > 0
+
+
+def _run_chunk(
+    function: Union[str, Callable],
+    args: tuple,
+    kwargs: dict,
+    outputs: Sequence[Tuple[str, tuple, str]],
+    start: int,
+    stop: int,
+) -> Optional[dict]:
+    # evaluate one chunk in a worker and write the results into shared memory,
+    # errors are sent back as plain data to be raised again by the parent
+    try:
+        res = _resolve(function)(*args, **kwargs)
+    except NotFoundError as err:
+        return {"kind": "NotFoundError", "message": err.message}
+    except SpiceyError as err:
+        return {
+            "kind": "SpiceyError",
+            "short": err.short,
+            "explain": err.explain,
+            "long": err.long,
+            "traceback": err.traceback,
+            "index": err.index,
+            "epoch": err.epoch,
+        }
+    if not isinstance(res, tuple):
+        res = (res,)
+    for value, (name, shape, dtype) in zip(res, outputs):
+        shm = _attach(name)
+        try:
+            view = ndarray(shape, dtype=dtype, buffer=shm.buf)
+            view[start:stop] = value
+            del view
+        finally:
+            shm.close()
+    return None
+
+
+class _SharedResult:
+    # the base of a result array viewing a shared memory block, the block is
+    # closed and unlinked once the last array viewing it is gone
+    def __init__(self, shm: SharedMemory, shape: tuple, dtype: str) -> None:
+        view = ndarray(shape, dtype=dtype, buffer=shm.buf)
+        # only the address is kept, an exported buffer would prevent closing
+        self.__array_interface__ = view.__array_interface__
+        del view
+        self._shm = shm
+
+    def __del__(self) -> None:
+        self._shm.close()
+        self._shm.unlink()
+
+
+def _raise_chunk_error(error: dict, start: int) -> None:
+    # raise a worker error with its element index made relative to the whole call
+    if error["kind"] == "NotFoundError":
+        raise NotFoundError(error["message"])
+    index = error["index"]
+    if isinstance(index, tuple):
+        index = (index[0] + start,) + index[1:]
+    elif index is not None:
+        index = index + start
+    raise dynamically_instantiate_spiceyerror(
+        short=error["short"],
+        explain=error["explain"],
+        long=error["long"],
+        traceback=error["traceback"],
+        index=index,
+        epoch=error["epoch"],
+    )
+
+
+class ParallelExecutor:
+    """
+    Run the vectorized (_v) functions of cyice over chunks of their epochs
+    in a pool of worker processes.
+
+    CSPICE keeps its state in process wide globals and cannot run two calls
+    at once in one process, so the executor starts worker processes, loads
+    the kernels loaded in the parent (see loaded_kernels) into each of them
+    and splits the epoch arrays of a call into chunks. Workers write their
+    results straight into shared memory arrays, results are never pickled,
+    and the returned arrays are views of that shared memory, not copies.
+
+    Only kernels are replayed, kernel pool variables set with the pdpool
+    family of functions are not seen by the workers.
+
+    Example:
+
+    >>> with ParallelExecutor(max_workers=4) as executor:
+    ...     states, lts = executor.run("spkezr_v", "MOON", ets, "J2000", "LT+S", "EARTH")
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        kernels: Optional[Iterable[str]] = None,
+        mp_context: Optional[Any] = None,
+    ) -> None:
+        """
+        :param max_workers: number of worker processes, defaults to the number of CPUs
+        :param kernels: kernels to load in the workers, defaults to the kernels loaded in this process
+        :param mp_context: multiprocessing context, defaults to the spawn context
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.kernels = loaded_kernels() if kernels is None else list(kernels)
+        if mp_context is None:
+            mp_context = multiprocessing.get_context("spawn")
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(self.kernels, config.catch_false_founds),
+        )
+
+    def __enter__(self) -> "ParallelExecutor":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.shutdown()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the worker processes.
+
+        :param wait: wait for pending chunks to finish
+        """
+        self._pool.shutdown(wait=wait)
+
+    def run(
+        self,
+        function: Union[str, Callable],
+        *args,
+        split: Optional[Sequence[int]] = None,
+        chunksize: Optional[int] = None,
+        **kwargs,
+    ) -> Union[ndarray, Tuple[ndarray, ...]]:
+        """
+        Call a vectorized function over chunks of its arguments in the workers.
+
+        The results are identical to calling the function in this process,
+        including errors="mask" outputs and the index and epoch of a raised
+        SpiceyError. The outputs view the shared memory the workers wrote
+        them to, a block is released when the last array viewing it, such as
+        a slice of an output, is deleted.
+
+        :param function: cyice function or its name, for example "spkezr_v"
+        :param args: positional arguments of the function
+        :param split: positions of the arguments to split into chunks along their
+                      first axis, which must be the first axis of the outputs.
+                      Defaults to the epoch argument of the functions spiceypy
+                      dispatches to cyice, or else to the first array argument and
+                      every other array argument of the same length, whichever
+                      spans the first axis of the outputs, the call runs in this
+                      process when neither does. Pass it explicitly when an
+                      argument that is not per epoch, such as the surface points
+                      of ilumin_v, happens to have that length.
+        :param chunksize: number of elements per chunk, defaults to four chunks per worker
+        :param kwargs: keyword arguments of the function, for example errors
+        :return: the outputs of the function
+        """
+        if "out" in kwargs:
+            raise ValueError("out is not supported, results are returned")
+        func = _resolve(function)
+        if (
+            callable(function)
+            and getattr(func, "__module__", "") == "spiceypy.cyice.cyice"
+        ):
+            # send cyice functions by name, workers import cyice themselves
+            function = func.__name__
+        args = list(args)
+        if split is not None:
+            candidates = [list(split)]
+        else:
+            candidates = self._split_positions(func.__name__, args)
+        for positions in candidates:
+            n = len(args[positions[0]])
+            if any(len(args[i]) != n for i in positions):
+                raise ValueError("the split arguments must have the same length")
+            size = chunksize or max(1, math.ceil(n / (4 * self.max_workers)))
+            if n <= size:
+                return func(*args, **kwargs)
+            # evaluate the first element here to learn the outputs, this also
+            # raises argument errors before any worker is involved
+            probe = func(*self._chunk(args, positions, 0, 1), **kwargs)
+            probe = probe if isinstance(probe, tuple) else (probe,)
+            # the first two elements tell whether the split axis is the first
+            # axis of the outputs, it is not when the split arguments broadcast
+            # against arguments with more axes, such as (N,) epochs against
+            # (M, 1) targets
+            try:
+                second = func(*self._chunk(args, positions, 0, 2), **kwargs)
+            except (ValueError, SpiceyError):
+                second = None
+            if self._leading(probe, second):
+                split, chunksize = positions, size
+                break
+        else:
+            if split is not None:
+                raise ValueError(
+                    "the split arguments do not span the first axis of the outputs"
+                )
+            return func(*args, **kwargs)
+        single = not isinstance(second, tuple)
+        blocks = []
+        try:
+            outputs = []
+            for value in probe:
+                value = numpy.asarray(value)
+                shape = (n,) + value.shape[1:]
+                size = max(1, math.prod(shape) * value.dtype.itemsize)
+                shm = SharedMemory(create=True, size=size)
+                blocks.append(shm)
+                outputs.append((shm.name, shape, value.dtype.str))
+            starts = range(0, n, chunksize)
+            futures = [
+                self._pool.submit(
+                    _run_chunk,
+                    function,
+                    self._chunk(args, split, start, min(start + chunksize, n)),
+                    kwargs,
+                    outputs,
+                    start,
+                    min(start + chunksize, n),
+                )
+                for start in starts
+            ]
+            # serial calls stop at the first failing element, so the first failing chunk wins
+            for start, future in zip(starts, futures):
+                error = future.result()
+                if error is not None:
+                    for pending in futures:
+                        pending.cancel()
+                    _raise_chunk_error(error, start)
+            # hand the blocks over to the returned arrays
+            res = []
+            for _, shape, dtype in outputs:
+                res.append(numpy.asarray(_SharedResult(blocks.pop(0), shape, dtype)))
+        finally:
+            for shm in blocks:
+                shm.close()
+                shm.unlink()
+        return res[0] if single else tuple(res)
+
+    @staticmethod
+    def _split_positions(name: str, args: List[Any]) -> List[List[int]]:
+        # the default splits to try in turn: the epoch argument of a function
+        # spiceypy dispatches to cyice, then the first array argument and the
+        # other arrays matching its length, leaving out the fixed vectors of
+        # a dispatched function
+        candidates = []
+        fixed = set()
+        info = _cyice_dispatched.get(name[:-2] if name.endswith("_v") else name)
+        if info is not None:
+            spec, epoch, _ = info
+            fixed = {i for i, kind in enumerate(spec) if kind in "vw"}
+            if 0 <= epoch < len(args) and _is_array(args[epoch]):
+                candidates.append([epoch])
+        first = None
+        positions = []
+        for i, arg in enumerate(args):
+            if i in fixed or not _is_array(arg):
+                continue
+            if first is None:
+                first = len(arg)
+                positions.append(i)
+            elif len(arg) == first:
+                positions.append(i)
+        if positions and positions not in candidates:
+            candidates.append(positions)
+        return candidates
+
+    @staticmethod
+    def _leading(first: tuple, second: Any) -> bool:
+        # whether going from one to two elements only grows the first axis of each output
+        if second is None:
+            return False
+        second = second if isinstance(second, tuple) else (second,)
+        for a, b in zip(first, second):
+            shape = numpy.shape(a)
+            if shape[:1] != (1,) or numpy.shape(b) != (2,) + shape[1:]:
+                return False
+        return True
+
+    @staticmethod
+    def _chunk(args: List[Any], split: Sequence[int], start: int, stop: int) -> tuple:
+        chunk = list(args)
+        for i in split:
+            chunk[i] = numpy.asarray(args[i])[start:stop]
+        return tuple(chunk)
@@ -24,6 +24,7 @@ SOFTWARE.
 
 import ctypes
 import functools
+import inspect
 import warnings
 from contextlib import contextmanager
 from datetime import datetime, timezone
@@ -34,6 +35,7 @@ from numpy import ndarray, str_
 
 from . import config
 from .found_catcher import (
+    _found_result,
     found_check,
     found_check_off,
     found_check_on,
@@ -42,6 +44,7 @@ from .found_catcher import (
     spice_found_exception_thrower,
 )
 from .utils import support_types as stypes
+from .utils import vectormath
 from .utils.callbacks import (
     UDBAIL,
     UDFUNB,
@@ -70,6 +73,7 @@ from .utils.exceptions import (
     dynamically_instantiate_spiceyerror,
 )
 from .utils.libspicehelper import cspice_flavor, libspice
+from .utils.locking import spice_lock
 from .utils.support_types import (
     Cell_Bool,
     Cell_Char,
@@ -132,7 +136,7 @@ def check_for_spice_error(f: Optional[Callable]) -> None:
     :param f: function
     :raise SpiceyError:
     """
-    if failed():
+    if libspice.failed_c():
         short = getmsg("SHORT", 26)
         explain = getmsg("EXPLAIN", 100).strip()
         long = getmsg("LONG", 1841).strip()
@@ -150,19 +154,290 @@ def spice_error_check(f):
 
     :return:
     """
+    return _error_check_wrapper(f, False)
 
-    @functools.wraps(f)
-    def with_errcheck(*args, **kwargs):
-        try:
-            res = f(*args, **kwargs)
-            check_for_spice_error(f)
+
+def _error_check_wrapper(f: Callable, found: bool) -> Callable:
+    """
+    Internal function building the single wrapper of a ctypes function. It
+    holds the CSPICE lock until the error status of the call is read and,
+    when found is set, also does the work of spice_found_exception_thrower.
+
+    :param f: function
+    :param found: check the found flag at the end of the result
+    :return: wrapped function
+    """
+    failed = libspice.failed_c
+    try_acquire = spice_lock.try_acquire
+    acquire = spice_lock.acquire
+    release = spice_lock.release
+    local = config._local
+    name = f.__name__
+
+    if found:
+
+        @functools.wraps(f)
+        def with_errcheck(*args, **kwargs):
+            if not try_acquire():
+                acquire()
+            try:
+                res = f(*args, **kwargs)
+                if failed():
+                    check_for_spice_error(f)
+            finally:
+                release()
+            if local.catch_false_founds:
+                return _found_result(res, name)
             return res
-        except BaseException:
-            raise
+
+    else:
+
+        @functools.wraps(f)
+        def with_errcheck(*args, **kwargs):
+            if not try_acquire():
+                acquire()
+            try:
+                res = f(*args, **kwargs)
+                if failed():
+                    check_for_spice_error(f)
+                return res
+            finally:
+                release()
+
+        # used by spice_found_exception_thrower to replace both wrappers with one
+        with_errcheck.with_found_check = lambda: _error_check_wrapper(f, True)
 
     return with_errcheck
 
 
+def spice_locked(f):
+    """
+    Decorator serializing a function that reads or changes the spice error
+    status without checking it, see spiceypy.utils.locking.
+
+    :return:
+    """
+
+    @functools.wraps(f)
+    def with_lock(*args, **kwargs):
+        spice_lock.acquire()
+        try:
+            return f(*args, **kwargs)
+        finally:
+            spice_lock.release()
+
+    return with_lock
+
+
+# lazily imported compiled cyice module, False once the import has failed
+_cyice = None
+
+
+def _load_cyice():
+    """
+    Internal function to import spiceypy.cyice on first use
+
+    :return: the cyice module, or None if it is not available on this platform
+    """
+    global _cyice
+    if _cyice is None:
+        try:
+            from . import cyice as _module
+        except ImportError:
+            _module = False
+        _cyice = _module
+    return _cyice or None
+
+
+_real_types = (float, int, numpy.integer, numpy.floating)
+
+# spec, epoch index and parameter names of the cyice_dispatch decorated functions by name
+_cyice_dispatched = {}
+
+
+def _cyice_epoch(kind: str, x):
+    """
+    Internal function to coerce the epoch like argument of a cyice dispatched call.
+
+    :param kind: e for double epochs, t for time strings
+    :param x: the argument
+    :return: the coerced argument, or None if it is not supported
+    """
+    if kind == "e":
+        if isinstance(x, _real_types):
+            return float(x)
+        if isinstance(x, (str, bytes, dict)) or not hasattr(x, "__iter__"):
+            return None
+        x = numpy.ascontiguousarray(x, dtype=numpy.float64)
+        if x.ndim == 0:
+            return float(x)
+    else:
+        if isinstance(x, str):
+            return str(x)
+        if isinstance(x, bytes) or not stypes.is_iterable(x):
+            return None
+        x = numpy.asarray(x)
+        if x.dtype.kind != "U":
+            return None
+    return x if x.ndim == 1 else None
+
+
+def _cyice_args(
+    spec: str, epoch: int, names: Tuple[str, ...], args: tuple, kwargs: dict
+):
+    """
+    Internal function to coerce the arguments of a ctypes wrapper call into the
+    positional arguments of the matching cyice _s or _v function.
+
+    Each character of spec describes one parameter:
+        s: string, i: integer, d: double, b: boolean,
+        v: double 3-vector, w: double 6-vector,
+        e: double epoch, t: time string, either of which may be a scalar or
+        an iterable and so select between the _s and _v function.
+
+    :param spec: parameter description string
+    :param epoch: index of the e or t parameter in spec, -1 if there is none
+    :param names: parameter names of the ctypes wrapper
+    :param args: positional arguments
+    :param kwargs: keyword arguments
+    :return: tuple of vectorized flag and argument list, None if the call is not supported
+    """
+    if kwargs:
+        if len(args) + len(kwargs) != len(spec):
+            return None
+        try:
+            args = args + tuple(kwargs[name] for name in names[len(args) :])
+        except KeyError:
+            return None
+    elif len(args) != len(spec):
+        return None
+    out = list(args)
+    n = -1
+    # the epoch like argument decides between the _s and _v function so do it first
+    if epoch >= 0:
+        x = _cyice_epoch(spec[epoch], out[epoch])
+        if x is None:
+            return None
+        if isinstance(x, ndarray):
+            n = x.shape[0]
+        out[epoch] = x
+    for i, kind in enumerate(spec):
+        x = out[i]
+        if kind == "s":
+            if type(x) is not str:
+                if not isinstance(x, str):
+                    return None
+                out[i] = str(x)
+        elif kind == "d":
+            if type(x) is not float:
+                if not isinstance(x, _real_types):
+                    return None
+                out[i] = float(x)
+        elif kind == "i":
+            if not isinstance(x, (int, numpy.integer)) or isinstance(x, bool):
+                return None
+        elif kind == "b":
+            if not isinstance(x, (int, numpy.bool_, numpy.integer)):
+                return None
+            out[i] = bool(x)
+        elif kind in "vw":
+            if isinstance(x, (str, bytes)):
+                return None
+            try:
+                x = numpy.ascontiguousarray(x, dtype=numpy.float64)
+            except (TypeError, ValueError):
+                return None
+            # cyice reads the vectors without bounds checks so the size must be exact
+            if x.shape != ((6,) if kind == "w" else (3,)):
+                return None
+            out[i] = x
+    return n >= 0, out
+
+
+def cyice_dispatch(spec: str) -> Callable:
+    """
+    Decorator for routing a ctypes wrapper to its cyice counterpart.
+
+    When config.use_cyice is set and spiceypy.cyice can be imported, calls
+    whose arguments match spec (see _cyice_args) are sent to the
+    cyice _s function, or to the _v function when the epoch argument is iterable.
+    All other calls run the ctypes wrapper as before.
+
+    :param spec: parameter description string
+    :return: decorator
+    """
+
+    def decorator(f: Callable) -> Callable:
+        code = inspect.unwrap(f).__code__
+        names = code.co_varnames[: code.co_argcount]
+        epoch = max(spec.find("e"), spec.find("t"))
+        scalar_name = f"{f.__name__}_s"
+        vector_name = f"{f.__name__}_v"
+        _cyice_dispatched[f.__name__] = (spec, epoch, names)
+
+        @functools.wraps(f)
+        def with_cyice(*args, **kwargs):
+            if config.use_cyice and (cyice := _load_cyice()) is not None:
+                coerced = _cyice_args(spec, epoch, names, args, kwargs)
+                if coerced is not None:
+                    vectorized, cargs = coerced
+                    if vectorized:
+                        return getattr(cyice, vector_name)(*cargs)
+                    return getattr(cyice, scalar_name)(*cargs)
+            return f(*args, **kwargs)
+
+        return with_cyice
+
+    return decorator
+
+
+def vectormath_dispatch(spec: str) -> Callable:
+    """
+    Decorator for routing a vector or matrix wrapper to spiceypy.utils.vectormath.
+
+    Each character of spec gives the dimensions of one parameter of a single
+    call: v for a vector, m for a matrix, d for a double and i for an integer.
+    When config.use_vectormath is set, calls with a numpy array argument that
+    has more dimensions, a stack of vectors, matrices or angles, run the
+    NumPy function of the same name in one vectorized operation with the
+    same results as the CSPICE routine. All other calls run the ctypes
+    wrapper as before, which is faster for a single vector.
+
+    :param spec: parameter description string
+    :return: decorator
+    """
+    ndims = tuple({"v": 1, "m": 2, "d": 0}.get(kind) for kind in spec)
+
+    def decorator(f: Callable) -> Callable:
+        fast = getattr(vectormath, f.__name__)
+        code = inspect.unwrap(f).__code__
+        names = dict(zip(code.co_varnames[: code.co_argcount], ndims))
+
+        @functools.wraps(f)
+        def with_vectormath(*args, **kwargs):
+            if config.use_vectormath:
+                for arg, ndim in zip(args, ndims):
+                    if (
+                        isinstance(arg, ndarray)
+                        and ndim is not None
+                        and arg.ndim > ndim
+                    ):
+                        return fast(*args, **kwargs)
+                for name, arg in kwargs.items():
+                    ndim = names.get(name)
+                    if (
+                        isinstance(arg, ndarray)
+                        and ndim is not None
+                        and arg.ndim > ndim
+                    ):
+                        return fast(*args, **kwargs)
+            return f(*args, **kwargs)
+
+        return with_vectormath
+
+    return decorator
+
+
 def cell_double(cell_size: int) -> SpiceCell:
     return stypes.SPICEDOUBLE_CELL(cell_size)
 
@@ -503,7 +778,7 @@ def bodc2n(code: int, lenout: int = _default_len_out) -> Union[Tuple[str, bool],
     :return: A common name for the body identified by code.
     """
     code = ctypes.c_int(code)
-    name = stypes.string_to_char_p(" " * lenout)
+    name = stypes.string_to_char_p(lenout)
     lenout = ctypes.c_int(lenout)
     found = ctypes.c_int()
     libspice.bodc2n_c(code, lenout, name, ctypes.byref(found))
@@ -524,7 +799,7 @@ def bodc2s(code: int, lenout: int = _default_len_out) -> str:
     :return: String corresponding to 'code'.
     """
     code = ctypes.c_int(code)
-    name = stypes.string_to_char_p(" " * lenout)
+    name = stypes.string_to_char_p(lenout)
     lenout = ctypes.c_int(lenout)
     libspice.bodc2s_c(code, lenout, name)
     return stypes.to_python_string(name)
@@ -1795,6 +2070,7 @@ def conics(elts: ndarray, et: float) -> ndarray:
     return stypes.c_vector_to_python(state)
 
 
+@cyice_dispatch("ess")
 @spice_error_check
 def convrt(
     x: Union[float, Iterable[float]], inunit: str, outunit: str
@@ -1915,6 +2191,7 @@ def cvpool(agent: str) -> bool:
     return bool(update.value)
 
 
+@cyice_dispatch("ddd")
 def cyllat(r: float, clon: float, z: float) -> Tuple[float, float, float]:
     """
     Convert from cylindrical to latitudinal coordinates.
@@ -1938,6 +2215,7 @@ def cyllat(r: float, clon: float, z: float) -> Tuple[float, float, float]:
     return radius.value, lon.value, lat.value
 
 
+@cyice_dispatch("ddd")
 def cylrec(r: float, lon: float, z: float) -> ndarray:
     """
     Convert from cylindrical to rectangular coordinates.
@@ -1957,6 +2235,7 @@ def cylrec(r: float, lon: float, z: float) -> ndarray:
     return stypes.c_vector_to_python(rectan)
 
 
+@cyice_dispatch("ddd")
 def cylsph(r: float, clon: float, z: float) -> Tuple[float, float, float]:
     """
     Convert from cylindrical to spherical coordinates.
@@ -2852,6 +3131,7 @@ def daswbr(handle: int) -> None:
     libspice.daswbr_c(_handle)
 
 
+@cyice_dispatch("dddbb")
 @spice_error_check
 def dazldr(x: float, y: float, z: float, azccw: bool, elplsz: bool) -> ndarray:
     """
@@ -2877,6 +3157,7 @@ def dazldr(x: float, y: float, z: float, azccw: bool, elplsz: bool) -> ndarray:
     return stypes.c_matrix_to_numpy(_jacobi)
 
 
+@cyice_dispatch("ddd")
 @spice_error_check
 def dcyldr(x: float, y: float, z: float) -> ndarray:
     """
@@ -2898,6 +3179,7 @@ def dcyldr(x: float, y: float, z: float) -> ndarray:
     return stypes.c_matrix_to_numpy(jacobi)
 
 
+@cyice_dispatch("es")
 @spice_error_check
 def deltet(epoch: float, eptype: str) -> float:
     """
@@ -2916,7 +3198,6 @@ def deltet(epoch: float, eptype: str) -> float:
     return delta.value
 
 
-@spice_error_check
 def det(m1: ndarray) -> float:
     """
     Compute the determinant of a double precision 3x3 matrix.
@@ -2930,6 +3211,7 @@ def det(m1: ndarray) -> float:
     return libspice.det_c(m1)
 
 
+@cyice_dispatch("ddddd")
 @spice_error_check
 def dgeodr(x: float, y: float, z: float, re: float, f: float) -> ndarray:
     """
@@ -3135,6 +3417,7 @@ def dlafps(
     return prvdsc, bool(found.value)
 
 
+@cyice_dispatch("ddd")
 @spice_error_check
 def dlatdr(x: float, y: float, z: float) -> ndarray:
     """
@@ -3212,6 +3495,7 @@ def dp2hx(number: float, lenout: int = _default_len_out) -> str:
     return stypes.to_python_string(string)
 
 
+@cyice_dispatch("sddddd")
 @spice_error_check
 def dpgrdr(body: str, x: float, y: float, z: float, re: float, f: float) -> ndarray:
     """
@@ -3278,6 +3562,7 @@ def dpr() -> float:
     return libspice.dpr_c()
 
 
+@cyice_dispatch("dddbb")
 @spice_error_check
 def drdazl(inrange: float, az: float, el: float, azccw: bool, elplsz: bool) -> ndarray:
     """
@@ -3303,6 +3588,7 @@ def drdazl(inrange: float, az: float, el: float, azccw: bool, elplsz: bool) -> n
     return stypes.c_matrix_to_numpy(_jacobi)
 
 
+@cyice_dispatch("ddd")
 @spice_error_check
 def drdcyl(r: float, lon: float, z: float) -> ndarray:
     """
@@ -3324,6 +3610,7 @@ def drdcyl(r: float, lon: float, z: float) -> ndarray:
     return stypes.c_matrix_to_numpy(jacobi)
 
 
+@cyice_dispatch("ddddd")
 @spice_error_check
 def drdgeo(lon: float, lat: float, alt: float, re: float, f: float) -> ndarray:
     """
@@ -3349,6 +3636,7 @@ def drdgeo(lon: float, lat: float, alt: float, re: float, f: float) -> ndarray:
     return stypes.c_matrix_to_numpy(jacobi)
 
 
+@cyice_dispatch("ddd")
 @spice_error_check
 def drdlat(r: float, lon: float, lat: float) -> ndarray:
     """
@@ -3370,6 +3658,7 @@ def drdlat(r: float, lon: float, lat: float) -> ndarray:
     return stypes.c_matrix_to_numpy(jacobi)
 
 
+@cyice_dispatch("sddddd")
 @spice_error_check
 def drdpgr(
     body: str, lon: float, lat: float, alt: float, re: float, f: float
@@ -3399,6 +3688,7 @@ def drdpgr(
     return stypes.c_matrix_to_numpy(jacobi)
 
 
+@cyice_dispatch("ddd")
 @spice_error_check
 def drdsph(r: float, colat: float, lon: float) -> ndarray:
     """
@@ -4086,6 +4376,7 @@ def dskz02(handle: int, dladsc: SpiceDLADescr) -> Tuple[int, int]:
     return nv.value, np.value
 
 
+@cyice_dispatch("ddd")
 @spice_error_check
 def dsphdr(x: float, y: float, z: float) -> ndarray:
     """
@@ -5541,6 +5832,7 @@ def eqstr(a: str, b: str) -> bool:
     )
 
 
+@spice_locked
 def erract(op: str, lenout: int, action: Optional[str] = None) -> str:
     """
     Retrieve or set the default error action.
@@ -5563,6 +5855,7 @@ def erract(op: str, lenout: int, action: Optional[str] = None) -> str:
     return stypes.to_python_string(actionptr)
 
 
+@spice_locked
 def errch(marker: str, string: str) -> None:
     """
     Substitute a character string for the first occurrence of
@@ -5578,6 +5871,7 @@ def errch(marker: str, string: str) -> None:
     libspice.errch_c(marker, string)
 
 
+@spice_locked
 def errdev(op: str, lenout: int, device: str) -> str:
     """
     Retrieve or set the name of the current output device for error messages.
@@ -5597,6 +5891,7 @@ def errdev(op: str, lenout: int, device: str) -> str:
     return stypes.to_python_string(deviceptr)
 
 
+@spice_locked
 def errdp(marker: str, number: float) -> None:
     """
     Substitute a double precision number for the first occurrence of
@@ -5612,6 +5907,7 @@ def errdp(marker: str, number: float) -> None:
     libspice.errdp_c(marker, number)
 
 
+@spice_locked
 def errint(marker: str, number: int) -> None:
     """
     Substitute an integer for the first occurrence of a marker found
@@ -5627,6 +5923,7 @@ def errint(marker: str, number: int) -> None:
     libspice.errint_c(marker, number)
 
 
+@spice_locked
 def errprt(op: str, lislen: int, inlist: str) -> str:
     """
     Retrieve or set the list of error message items to be output when an
@@ -5729,6 +6026,7 @@ def et2lst(
     )
 
 
+@cyice_dispatch("esi")
 @spice_error_check
 def et2utc(
     et: Union[float, Iterable[float]],
@@ -5764,6 +6062,7 @@ def et2utc(
         return stypes.to_python_string(utcstr)
 
 
+@cyice_dispatch("e")
 @spice_error_check
 def etcal(
     et: Union[float, ndarray], lenout: int = _default_len_out
@@ -5929,6 +6228,7 @@ def expool(name: str) -> bool:
 # F
 
 
+@spice_locked
 def failed() -> bool:
     """
     True if an error condition has been signalled via sigerr_c.
@@ -5957,6 +6257,7 @@ def fn2lun(fname: str) -> int:
     return unit_out.value
 
 
+@cyice_dispatch("svssse")
 @spice_error_check
 def fovray(
     inst: str,
@@ -5993,6 +6294,7 @@ def fovray(
     return bool(visible.value)
 
 
+@cyice_dispatch("sssssse")
 @spice_error_check
 def fovtrg(
     inst: str,
@@ -6205,6 +6507,7 @@ def gdpool(name: str, start: int, room: int) -> Union[Tuple[ndarray, bool], ndar
     return stypes.c_vector_to_python(values)[0 : n.value], bool(found.value)
 
 
+@cyice_dispatch("ddddd")
 @spice_error_check
 def georec(lon: float, lat: float, alt: float, re: float, f: float) -> ndarray:
     """
@@ -6300,8 +6603,8 @@ def getfov(
             FOV boundary vectors.
     """
     instid = ctypes.c_int(instid)
-    shape = stypes.string_to_char_p(" " * shapelen)
-    framen = stypes.string_to_char_p(" " * framelen)
+    shape = stypes.string_to_char_p(shapelen)
+    framen = stypes.string_to_char_p(framelen)
     shapelen = ctypes.c_int(shapelen)
     framelen = ctypes.c_int(framelen)
     bsight = stypes.empty_double_vector(3)
@@ -6345,8 +6648,8 @@ def getfvn(
             FOV boundary vectors.
     """
     inst = stypes.string_to_char_p(inst)
-    shape = stypes.string_to_char_p(" " * shapelen)
-    framen = stypes.string_to_char_p(" " * framelen)
+    shape = stypes.string_to_char_p(shapelen)
+    framen = stypes.string_to_char_p(framelen)
     shapelen = ctypes.c_int(shapelen)
     framelen = ctypes.c_int(framelen)
     bsight = stypes.empty_double_vector(3)
@@ -6365,6 +6668,7 @@ def getfvn(
     )
 
 
+@spice_locked
 def getmsg(option: str, lenout: int = _default_len_out) -> str:
     """
     Retrieve the current short error message,
@@ -7807,7 +8111,6 @@ def hx2dp(string: str) -> Union[float, str]:
 # I
 
 
-@spice_error_check
 def ident() -> ndarray:
     """
     This routine returns the 3x3 identity matrix.
@@ -7866,6 +8169,7 @@ def illum(
     return phase.value, solar.value, emissn.value
 
 
+@cyice_dispatch("sssesssv")
 @spice_error_check
 def illumf(
     method: str,
@@ -7951,6 +8255,7 @@ def illumf(
     )
 
 
+@cyice_dispatch("sssesssv")
 @spice_error_check
 def illumg(
     method: str,
@@ -8026,6 +8331,7 @@ def illumg(
     )
 
 
+@cyice_dispatch("ssesssv")
 @spice_error_check
 def ilumin(
     method: str,
@@ -8256,7 +8562,6 @@ def inter(a: SpiceCell, b: SpiceCell) -> SpiceCell:
     return c
 
 
-@spice_error_check
 def intmax() -> int:
     """
     Return the value of the largest (positive) number representable
@@ -8269,7 +8574,6 @@ def intmax() -> int:
     return libspice.intmax_c()
 
 
-@spice_error_check
 def intmin() -> int:
     """
     Return the value of the smallest (negative) number representable
@@ -8706,8 +9010,8 @@ def kinfo(
     typlen = ctypes.c_int(typlen)
     srclen = ctypes.c_int(srclen)
     file = stypes.string_to_char_p(file)
-    filtyp = stypes.string_to_char_p(" " * typlen.value)
-    source = stypes.string_to_char_p(" " * srclen.value)
+    filtyp = stypes.string_to_char_p(typlen.value)
+    source = stypes.string_to_char_p(srclen.value)
     handle = ctypes.c_int()
     found = ctypes.c_int()
     libspice.kinfo_c(
@@ -8857,6 +9161,7 @@ def lastnb(string: str) -> int:
     return libspice.lastnb_c(string)
 
 
+@cyice_dispatch("ddd")
 def latcyl(radius: float, lon: float, lat: float) -> Tuple[float, float, float]:
     """
     Convert from latitudinal coordinates to cylindrical coordinates.
@@ -8880,6 +9185,7 @@ def latcyl(radius: float, lon: float, lat: float) -> Tuple[float, float, float]:
     return r.value, lonc.value, z.value
 
 
+@cyice_dispatch("ddd")
 def latrec(radius: float, longitude: float, latitude: float) -> ndarray:
     """
     Convert from latitudinal coordinates to rectangular coordinates.
@@ -8899,6 +9205,7 @@ def latrec(radius: float, longitude: float, latitude: float) -> ndarray:
     return stypes.c_vector_to_python(rectan)
 
 
+@cyice_dispatch("ddd")
 def latsph(radius: float, lon: float, lat: float) -> Tuple[float, float, float]:
     """
     Convert from latitudinal coordinates to spherical coordinates.
@@ -9232,6 +9539,7 @@ def lparss(inlist: str, delims: str, nmax: int = 20, length: int = 50) -> SpiceC
     return return_set
 
 
+@cyice_dispatch("ses")
 @spice_error_check
 def lspcn(body: str, et: float, abcorr: str) -> float:
     """
@@ -9375,6 +9683,7 @@ def lstlti(x: int, n: int, array: Union[ndarray, Iterable[int]]) -> int:
     return libspice.lstlti_c(x, n, array)
 
 
+@cyice_dispatch("eisi")
 @spice_error_check
 def ltime(etobs: float, obs: int, direct: str, targ: int) -> Tuple[float, float]:
     """
@@ -9609,7 +9918,6 @@ def matchw(string: str, templ: str, wstr: str, wchr: str) -> bool:
 # odd as arguments must be parsed and not really important
 
 
-@spice_error_check
 def mequ(m1: ndarray) -> ndarray:
     """
     Set one double precision 3x3 matrix equal to another.
@@ -9625,7 +9933,6 @@ def mequ(m1: ndarray) -> ndarray:
     return stypes.c_matrix_to_numpy(mout)
 
 
-@spice_error_check
 def mequg(m1: ndarray, nr: int, nc: int) -> ndarray:
     """
     Set one double precision matrix of arbitrary size equal to another.
@@ -9653,7 +9960,6 @@ def mequg(m1: ndarray, nr: int, nc: int) -> ndarray:
 # odd as arguments must be parsed and not really important
 
 
-@spice_error_check
 def mtxm(m1: ndarray, m2: ndarray) -> ndarray:
     """
     Multiply the transpose of a 3x3 matrix and a 3x3 matrix.
@@ -9698,7 +10004,7 @@ def mtxmg(m1: ndarray, m2: ndarray) -> ndarray:
     return stypes.c_matrix_to_numpy(mout)
 
 
-@spice_error_check
+@vectormath_dispatch("mv")
 def mtxv(m1: ndarray, vin: ndarray) -> ndarray:
     """
     Multiplies the transpose of a 3x3 matrix
@@ -9717,6 +10023,7 @@ def mtxv(m1: ndarray, vin: ndarray) -> ndarray:
     return stypes.c_vector_to_python(vout)
 
 
+@vectormath_dispatch("mv")
 @spice_error_check
 def mtxvg(m1: ndarray, v2: ndarray) -> ndarray:
     """
@@ -9740,7 +10047,7 @@ def mtxvg(m1: ndarray, v2: ndarray) -> ndarray:
     return stypes.c_vector_to_python(vout)
 
 
-@spice_error_check
+@vectormath_dispatch("mm")
 def mxm(
     m1: Union[ndarray, Iterable[Iterable[float]]],
     m2: Union[ndarray, Iterable[Iterable[float]]],
@@ -9761,6 +10068,7 @@ def mxm(
     return stypes.c_matrix_to_numpy(mout)
 
 
+@vectormath_dispatch("mm")
 @spice_error_check
 def mxmg(
     m1: Union[ndarray, Iterable[Iterable[float]]],
@@ -9786,7 +10094,6 @@ def mxmg(
     return stypes.c_matrix_to_numpy(mout)
 
 
-@spice_error_check
 def mxmt(
     m1: Union[ndarray, Iterable[Iterable[float]]],
     m2: Union[ndarray, Iterable[Iterable[float]]],
@@ -9832,7 +10139,7 @@ def mxmtg(
     return stypes.c_matrix_to_numpy(mout)
 
 
-@spice_error_check
+@vectormath_dispatch("mv")
 def mxv(m1: ndarray, vin: ndarray) -> ndarray:
     """
     Multiply a 3x3 double precision matrix with a
@@ -9851,6 +10158,7 @@ def mxv(m1: ndarray, vin: ndarray) -> ndarray:
     return stypes.c_vector_to_python(vout)
 
 
+@vectormath_dispatch("mv")
 @spice_error_check
 def mxvg(
     m1: Union[ndarray, Iterable[Iterable[float]]],
@@ -10088,6 +10396,7 @@ def nvp2pl(
 # O
 
 
+@cyice_dispatch("sssssssse")
 @spice_error_check
 def occult(
     target1: str,
@@ -10505,6 +10814,7 @@ def pdpool(name: str, dvals: Union[ndarray, Iterable[float]]) -> None:
     libspice.pdpool_c(name, n, dvals)
 
 
+@cyice_dispatch("sddddd")
 @spice_error_check
 def pgrrec(
     body: str, lon: float, lat: float, alt: float, re: float, f: float
@@ -10533,6 +10843,7 @@ def pgrrec(
     return stypes.c_vector_to_python(rectan)
 
 
+@cyice_dispatch("essss")
 @spice_error_check
 def phaseq(et: float, target: str, illmn: str, obsrvr: str, abcorr: str) -> float:
     """
@@ -10926,6 +11237,7 @@ def psv2pl(point: ndarray, span1: ndarray, span2: ndarray) -> Plane:
 # skip putcml, is this really needed for python users?
 
 
+@cyice_dispatch("sse")
 @spice_error_check
 def pxform(fromstr: str, tostr: str, et: float) -> ndarray:
     """
@@ -10992,6 +11304,7 @@ def q2m(q: ndarray) -> ndarray:
 
 
 # @spice_error_check
+@spice_locked
 def qcktrc(tracelen: int = _default_len_out) -> str:
     """
     Return a string containing a traceback.
@@ -11074,7 +11387,7 @@ def qxq(
 # R
 
 
-@spice_error_check
+@cyice_dispatch("ddd")
 def radrec(inrange: float, ra: float, dec: float) -> ndarray:
     """
     Convert from range, right ascension, and declination to rectangular
@@ -11156,6 +11469,7 @@ def rdtext(
     return stypes.to_python_string(line), bool(eof.value)
 
 
+@cyice_dispatch("vbb")
 @spice_error_check
 def recazl(
     rectan: Union[ndarray, Iterable[float]], azccw: bool, elplsz: bool
@@ -11191,7 +11505,7 @@ def recazl(
     return _range.value, _az.value, _el.value
 
 
-@spice_error_check
+@cyice_dispatch("v")
 def reccyl(rectan: Union[ndarray, Iterable[float]]) -> Tuple[float, float, float]:
     """
     Convert from rectangular to cylindrical coordinates.
@@ -11212,6 +11526,7 @@ def reccyl(rectan: Union[ndarray, Iterable[float]]) -> Tuple[float, float, float
     return radius.value, lon.value, z.value
 
 
+@cyice_dispatch("vdd")
 @spice_error_check
 def recgeo(
     rectan: Union[ndarray, Iterable[float]], re: float, f: float
@@ -11246,7 +11561,7 @@ def recgeo(
     return longitude.value, latitude.value, alt.value
 
 
-@spice_error_check
+@cyice_dispatch("v")
 def reclat(rectan: Union[ndarray, Iterable[float]]) -> Tuple[float, float, float]:
     """
     Convert from rectangular coordinates to latitudinal coordinates.
@@ -11266,6 +11581,7 @@ def reclat(rectan: Union[ndarray, Iterable[float]]) -> Tuple[float, float, float
     return radius.value, longitude.value, latitude.value
 
 
+@cyice_dispatch("svdd")
 @spice_error_check
 def recpgr(
     body: str, rectan: Union[ndarray, Iterable[float]], re: float, f: float
@@ -11297,7 +11613,7 @@ def recpgr(
     return lon.value, lat.value, alt.value
 
 
-@spice_error_check
+@cyice_dispatch("v")
 def recrad(rectan: Union[ndarray, Iterable[float]]) -> Tuple[float, float, float]:
     """
     Convert rectangular coordinates to range, right ascension, and declination.
@@ -11320,7 +11636,7 @@ def recrad(rectan: Union[ndarray, Iterable[float]]) -> Tuple[float, float, float
     return outrange.value, ra.value, dec.value
 
 
-@spice_error_check
+@cyice_dispatch("v")
 def recsph(rectan: ndarray) -> Tuple[float, float, float]:
     """
     Convert from rectangular coordinates to spherical coordinates.
@@ -11641,6 +11957,7 @@ def repmot(
     return stypes.to_python_string(out)
 
 
+@spice_locked
 def reset() -> None:
     """
     Reset the SPICE error status to a value of "no error."
@@ -11665,7 +11982,7 @@ def return_c() -> bool:
     return bool(libspice.return_c())
 
 
-@spice_error_check
+@vectormath_dispatch("di")
 def rotate(angle: float, iaxis: int) -> ndarray:
     """
     Calculate the 3x3 rotation matrix generated by a rotation
@@ -11685,7 +12002,7 @@ def rotate(angle: float, iaxis: int) -> ndarray:
     return stypes.c_matrix_to_numpy(mout)
 
 
-@spice_error_check
+@vectormath_dispatch("mdi")
 def rotmat(m1: ndarray, angle: float, iaxis: int) -> ndarray:
     """
     Rotmat applies a rotation of angle radians about axis iaxis to a
@@ -11823,12 +12140,13 @@ def scdecd(
     """
     sc = ctypes.c_int(sc)
     sclkdp = ctypes.c_double(sclkdp)
-    sclkch = stypes.string_to_char_p(" " * lenout)
+    sclkch = stypes.string_to_char_p(lenout)
     lenout = ctypes.c_int(lenout)
     libspice.scdecd_c(sc, sclkdp, lenout, sclkch)
     return stypes.to_python_string(sclkch)
 
 
+@cyice_dispatch("ie")
 @spice_error_check
 def sce2c(sc: int, et: float) -> float:
     """
@@ -11851,6 +12169,7 @@ def sce2c(sc: int, et: float) -> float:
     return sclkdp.value
 
 
+@cyice_dispatch("ie")
 @spice_error_check
 def sce2s(sc: int, et: float, lenout: int = _default_len_out) -> str:
     """
@@ -11866,7 +12185,7 @@ def sce2s(sc: int, et: float, lenout: int = _default_len_out) -> str:
     """
     sc = ctypes.c_int(sc)
     et = ctypes.c_double(et)
-    sclkch = stypes.string_to_char_p(" " * lenout)
+    sclkch = stypes.string_to_char_p(lenout)
     lenout = ctypes.c_int(lenout)
     libspice.sce2s_c(sc, et, lenout, sclkch)
     return stypes.to_python_string(sclkch)
@@ -11985,6 +12304,7 @@ def scs2e(sc: int, sclkch: str) -> float:
     return et.value
 
 
+@cyice_dispatch("ie")
 @spice_error_check
 def sct2e(sc: int, sclkdp: Union[float, Iterable[float]]) -> Union[float, ndarray]:
     """
@@ -12150,6 +12470,7 @@ def shelli(ndim: int, array: Union[ndarray, Iterable[int]]) -> ndarray:
     return stypes.c_vector_to_python(array)
 
 
+@spice_locked
 def sigerr(message: str) -> None:
     """
     Inform the CSPICE error processing mechanism that an error has
@@ -12163,6 +12484,7 @@ def sigerr(message: str) -> None:
     libspice.sigerr_c(message)
 
 
+@cyice_dispatch("ssessssv")
 @spice_found_exception_thrower
 @spice_error_check
 def sincpt(
@@ -12258,6 +12580,7 @@ def spd() -> float:
     return libspice.spd_c()
 
 
+@cyice_dispatch("ddd")
 def sphcyl(radius: float, colat: float, slon: float) -> Tuple[float, float, float]:
     """
     Convert from spherical coordinates to cylindrical coordinates.
@@ -12284,6 +12607,7 @@ def sphcyl(radius: float, colat: float, slon: float) -> Tuple[float, float, floa
     return r.value, clon.value, z.value
 
 
+@cyice_dispatch("ddd")
 def sphlat(r: float, colat: float, lons: float) -> Tuple[float, float, float]:
     """
     Convert from spherical coordinates to latitudinal coordinates.
@@ -12310,7 +12634,7 @@ def sphlat(r: float, colat: float, lons: float) -> Tuple[float, float, float]:
     return radius.value, lon.value, lat.value
 
 
-@spice_error_check
+@cyice_dispatch("ddd")
 def sphrec(r: float, colat: float, lon: float) -> ndarray:
     """
     Convert from spherical coordinates to rectangular coordinates.
@@ -12330,6 +12654,7 @@ def sphrec(r: float, colat: float, lon: float) -> ndarray:
     return stypes.c_vector_to_python(rectan)
 
 
+@cyice_dispatch("iessi")
 @spice_error_check
 def spkacs(
     targ: int, et: float, ref: str, abcorr: str, obs: int
@@ -12366,6 +12691,7 @@ def spkacs(
     return stypes.c_vector_to_python(starg), lt.value, dlt.value
 
 
+@cyice_dispatch("iesws")
 @spice_error_check
 def spkapo(
     targ: int, et: float, ref: str, sobs: ndarray, abcorr: str
@@ -12430,6 +12756,7 @@ def spkapp(
     return stypes.c_vector_to_python(starg), lt.value
 
 
+@cyice_dispatch("iesswv")
 @spice_error_check
 def spkaps(
     targ: int,
@@ -12592,6 +12919,7 @@ def spkcov(spk: str, idcode: int, cover: Optional[SpiceCell] = None) -> SpiceCel
     return cover
 
 
+@cyice_dispatch("sesssvss")
 @spice_error_check
 def spkcpo(
     target: str,
@@ -12648,6 +12976,7 @@ def spkcpo(
     return stypes.c_vector_to_python(state), lt.value
 
 
+@cyice_dispatch("vssessss")
 @spice_error_check
 def spkcpt(
     trgpos: Union[ndarray, Iterable[float]],
@@ -12704,6 +13033,7 @@ def spkcpt(
     return stypes.c_vector_to_python(state), lt.value
 
 
+@cyice_dispatch("sessswdss")
 @spice_error_check
 def spkcvo(
     target: str,
@@ -12764,6 +13094,7 @@ def spkcvo(
     return stypes.c_vector_to_python(state), lt.value
 
 
+@cyice_dispatch("wdssessss")
 @spice_error_check
 def spkcvt(
     trgsta: Union[ndarray, Iterable[float]],
@@ -12824,6 +13155,7 @@ def spkcvt(
     return stypes.c_vector_to_python(state), lt.value
 
 
+@cyice_dispatch("iessi")
 @spice_error_check
 def spkez(
     targ: int, et: float, ref: str, abcorr: str, obs: int
@@ -12855,6 +13187,7 @@ def spkez(
     return stypes.c_vector_to_python(starg), lt.value
 
 
+@cyice_dispatch("iessi")
 @spice_error_check
 def spkezp(
     targ: int, et: float, ref: str, abcorr: str, obs: int
@@ -12886,6 +13219,7 @@ def spkezp(
     return stypes.c_vector_to_python(ptarg), lt.value
 
 
+@cyice_dispatch("sesss")
 @spice_error_check
 def spkezr(
     targ: str, et: Union[ndarray, float], ref: str, abcorr: str, obs: str
@@ -12930,6 +13264,7 @@ def spkezr(
         return stypes.c_vector_to_python(starg), lt.value
 
 
+@cyice_dispatch("iesi")
 @spice_error_check
 def spkgeo(targ: int, et: float, ref: str, obs: int) -> Tuple[ndarray, float]:
     """
@@ -12956,6 +13291,7 @@ def spkgeo(targ: int, et: float, ref: str, obs: int) -> Tuple[ndarray, float]:
     return stypes.c_vector_to_python(state), lt.value
 
 
+@cyice_dispatch("iesi")
 @spice_error_check
 def spkgps(targ: int, et: float, ref: str, obs: int) -> Tuple[ndarray, float]:
     """
@@ -12997,6 +13333,7 @@ def spklef(filename: str) -> int:
     return handle.value
 
 
+@cyice_dispatch("iessw")
 @spice_error_check
 def spkltc(
     targ: int, et: float, ref: str, abcorr: str, stobs: ndarray
@@ -13120,6 +13457,7 @@ def spkpds(
     return stypes.c_vector_to_python(descr)
 
 
+@cyice_dispatch("sesss")
 @spice_error_check
 def spkpos(
     targ: str, et: Union[float, ndarray], ref: str, abcorr: str, obs: str
@@ -13226,6 +13564,7 @@ def spksfs(
     )
 
 
+@cyice_dispatch("ies")
 @spice_error_check
 def spkssb(targ: int, et: float, ref: str) -> ndarray:
     """
@@ -14123,6 +14462,7 @@ def srfnrm(
     return stypes.c_matrix_to_numpy(normls)
 
 
+@cyice_dispatch("idd")
 @spice_error_check
 def srfrec(body: int, longitude: float, latitude: float) -> ndarray:
     """
@@ -14393,6 +14733,7 @@ def stpool(
     return stypes.to_python_string(strout), sizet.value, bool(found.value)
 
 
+@cyice_dispatch("t")
 @spice_error_check
 def str2et(time: Union[str, Iterable[str]]) -> Union[float, ndarray]:
     """
@@ -14483,6 +14824,7 @@ def et2datetime(et: Union[Iterable[float], float]) -> Union[ndarray, datetime]:
         return fromisoformat(result)
 
 
+@cyice_dispatch("ssesss")
 @spice_error_check
 def subpnt(
     method: str, target: str, et: float, fixref: str, abcorr: str, obsrvr: str
@@ -14586,6 +14928,7 @@ def subpt(
         return stypes.c_vector_to_python(spoint), alt.value
 
 
+@cyice_dispatch("ssesss")
 @spice_error_check
 def subslr(
     method: str, target: str, et: float, fixref: str, abcorr: str, obsrvr: str
@@ -14801,6 +15144,7 @@ def swpool(agent: str, nnames: int, lenvals: int, names: Iterable[str]) -> None:
     libspice.swpool_c(agent, nnames, lenvals, names)
 
 
+@cyice_dispatch("sse")
 @spice_error_check
 def sxform(instring: str, tostring: str, et: Union[float, ndarray]) -> ndarray:
     """
@@ -14853,6 +15197,7 @@ def szpool(name: str) -> Union[Tuple[int, bool], int]:
 # T
 
 
+@cyice_dispatch("ssesssssv")
 @spice_error_check
 def tangpt(
     method: str,
@@ -15060,6 +15405,7 @@ def timdef(action: str, item: str, lenout: int, value: Optional[str] = None) ->
     return stypes.to_python_string(value)
 
 
+@cyice_dispatch("es")
 @spice_error_check
 def timout(
     et: Union[ndarray, float], pictur: str, lenout: int = _default_len_out
@@ -15156,6 +15502,7 @@ def tkfram(typid: int) -> Union[Tuple[ndarray, int, bool], Tuple[ndarray, int]]:
 
 
 # @spice_error_check
+@spice_locked
 def tkvrsn(item: str) -> str:
     """
     Given an item such as the Toolkit or an entry point name, return
@@ -15233,7 +15580,6 @@ def tpictr(
     return stypes.to_python_string(pictur), ok.value, stypes.to_python_string(errmsg)
 
 
-@spice_error_check
 def trace(matrix: Union[ndarray, Iterable[Iterable[float]]]) -> float:
     """
     Return the trace of a 3x3 matrix.
@@ -15292,6 +15638,7 @@ def trcoff() -> None:
     libspice.trcoff_c()
 
 
+@cyice_dispatch("essssssss")
 @spice_error_check
 def trgsep(
     et: float,
@@ -15479,13 +15826,12 @@ def ucase(inchar: str, lenout: Optional[int] = None) -> str:
     if lenout is None:
         lenout = len(inchar) + 1
     inchar = stypes.string_to_char_p(inchar)
-    outchar = stypes.string_to_char_p(" " * lenout)
+    outchar = stypes.string_to_char_p(lenout)
     lenout = ctypes.c_int(lenout)
     libspice.ucase_c(inchar, lenout, outchar)
     return stypes.to_python_string(outchar)
 
 
-@spice_error_check
 def ucrss(v1: ndarray, v2: ndarray) -> ndarray:
     """
     Compute the normalized cross product of two 3-vectors.
@@ -15503,6 +15849,7 @@ def ucrss(v1: ndarray, v2: ndarray) -> ndarray:
     return stypes.c_vector_to_python(vout)
 
 
+@spice_locked
 def uddc(udfunc: UDFUNC, x: float, dx: float) -> bool:
     """
     SPICE private routine intended solely for the support of SPICE
@@ -15614,6 +15961,7 @@ def union(a: SpiceCell, b: SpiceCell) -> SpiceCell:
     return c
 
 
+@cyice_dispatch("ess")
 @spice_error_check
 def unitim(epoch: float, insys: str, outsys: str) -> float:
     """
@@ -15652,7 +16000,6 @@ def unload(filename: Union[str, Iterable[str]]) -> None:
         libspice.unload_c(filename)
 
 
-@spice_error_check
 def unorm(v1: ndarray) -> Tuple[ndarray, float]:
     """
     Normalize a double precision 3-vector and return its magnitude.
@@ -15669,7 +16016,6 @@ def unorm(v1: ndarray) -> Tuple[ndarray, float]:
     return stypes.c_vector_to_python(vout), vmag.value
 
 
-@spice_error_check
 def unormg(v1: ndarray) -> Tuple[ndarray, float]:
     """
     Normalize a double precision vector of arbitrary dimension and
@@ -15689,6 +16035,7 @@ def unormg(v1: ndarray) -> Tuple[ndarray, float]:
     return stypes.c_vector_to_python(vout), vmag.value
 
 
+@cyice_dispatch("t")
 @spice_error_check
 def utc2et(utcstr: str) -> float:
     """
@@ -15710,7 +16057,7 @@ def utc2et(utcstr: str) -> float:
 # V
 
 
-@spice_error_check
+@vectormath_dispatch("vv")
 def vadd(
     v1: Union[ndarray, Iterable[float]], v2: Union[ndarray, Iterable[float]]
 ) -> ndarray:
@@ -15728,7 +16075,7 @@ def vadd(
     return stypes.c_vector_to_python(vout)
 
 
-@spice_error_check
+@vectormath_dispatch("vv")
 def vaddg(
     v1: Union[ndarray, Iterable[float]], v2: Union[ndarray, Iterable[float]]
 ) -> ndarray:
@@ -15768,7 +16115,7 @@ def valid(insize: int, n: int, inset: SpiceCell) -> SpiceCell:
     return inset
 
 
-@spice_error_check
+@vectormath_dispatch("vv")
 def vcrss(v1: ndarray, v2: ndarray) -> ndarray:
     """
     Compute the cross product of two 3-dimensional vectors.
@@ -15786,7 +16133,6 @@ def vcrss(v1: ndarray, v2: ndarray) -> ndarray:
     return stypes.c_vector_to_python(vout)
 
 
-@spice_error_check
 def vdist(v1: ndarray, v2: ndarray) -> float:
     """
     Return the distance between two three-dimensional vectors.
@@ -15802,7 +16148,6 @@ def vdist(v1: ndarray, v2: ndarray) -> float:
     return libspice.vdist_c(v1, v2)
 
 
-@spice_error_check
 def vdistg(v1: ndarray, v2: ndarray) -> float:
     """
     Return the distance between two vectors of arbitrary dimension.
@@ -15820,7 +16165,7 @@ def vdistg(v1: ndarray, v2: ndarray) -> float:
     return libspice.vdistg_c(v1, v2, ndim)
 
 
-@spice_error_check
+@vectormath_dispatch("vv")
 def vdot(v1: ndarray, v2: ndarray) -> float:
     """
     Compute the dot product of two double precision, 3-dimensional vectors.
@@ -15836,7 +16181,7 @@ def vdot(v1: ndarray, v2: ndarray) -> float:
     return libspice.vdot_c(v1, v2)
 
 
-@spice_error_check
+@vectormath_dispatch("vv")
 def vdotg(v1: ndarray, v2: ndarray) -> float:
     """
     Compute the dot product of two double precision vectors of
@@ -15855,7 +16200,6 @@ def vdotg(v1: ndarray, v2: ndarray) -> float:
     return libspice.vdotg_c(v1, v2, ndim)
 
 
-@spice_error_check
 def vequ(v1: ndarray) -> ndarray:
     """
     Make one double precision 3-dimensional vector equal to another.
@@ -15871,7 +16215,6 @@ def vequ(v1: ndarray) -> ndarray:
     return stypes.c_vector_to_python(vout)
 
 
-@spice_error_check
 def vequg(v1: ndarray) -> ndarray:
     """
     Make one double precision vector of arbitrary dimension equal to another.
@@ -15890,7 +16233,7 @@ def vequg(v1: ndarray) -> ndarray:
     return stypes.c_vector_to_python(vout)
 
 
-@spice_error_check
+@vectormath_dispatch("v")
 def vhat(v1: ndarray) -> ndarray:
     """
     Find the unit vector along a double precision 3-dimensional vector.
@@ -15906,7 +16249,7 @@ def vhat(v1: ndarray) -> ndarray:
     return stypes.c_vector_to_python(vout)
 
 
-@spice_error_check
+@vectormath_dispatch("v")
 def vhatg(v1: ndarray) -> ndarray:
     """
     Find the unit vector along a double precision vector of arbitrary dimension.
@@ -15924,7 +16267,6 @@ def vhatg(v1: ndarray) -> ndarray:
     return stypes.c_vector_to_python(vout)
 
 
-@spice_error_check
 def vlcom(
     a: float,
     v1: Union[ndarray, Iterable[float]],
@@ -15952,7 +16294,6 @@ def vlcom(
     return stypes.c_vector_to_python(sumv)
 
 
-@spice_error_check
 def vlcom3(
     a: float,
     v1: Union[ndarray, Iterable[float]],
@@ -15986,7 +16327,6 @@ def vlcom3(
     return stypes.c_vector_to_python(sumv)
 
 
-@spice_error_check
 def vlcomg(
     n: int,
     a: float,
@@ -16017,7 +16357,6 @@ def vlcomg(
     return stypes.c_vector_to_python(sumv)
 
 
-@spice_error_check
 def vminug(vin: ndarray) -> ndarray:
     """
     Negate a double precision vector of arbitrary dimension.
@@ -16035,7 +16374,6 @@ def vminug(vin: ndarray) -> ndarray:
     return stypes.c_vector_to_python(vout)
 
 
-@spice_error_check
 def vminus(vin: ndarray) -> ndarray:
     """
     Negate a double precision 3-dimensional vector.
@@ -16051,7 +16389,7 @@ def vminus(vin: ndarray) -> ndarray:
     return stypes.c_vector_to_python(vout)
 
 
-@spice_error_check
+@vectormath_dispatch("v")
 def vnorm(v: ndarray) -> float:
     """
     Compute the magnitude of a double precision, 3-dimensional vector.
@@ -16065,7 +16403,7 @@ def vnorm(v: ndarray) -> float:
     return libspice.vnorm_c(v)
 
 
-@spice_error_check
+@vectormath_dispatch("v")
 def vnormg(v: ndarray) -> float:
     """
     Compute the magnitude of a double precision vector of arbitrary dimension.
@@ -16081,7 +16419,6 @@ def vnormg(v: ndarray) -> float:
     return libspice.vnormg_c(v, ndim)
 
 
-@spice_error_check
 def vpack(x: float, y: float, z: float) -> ndarray:
     """
     Pack three scalar components into a vector.
@@ -16101,7 +16438,6 @@ def vpack(x: float, y: float, z: float) -> ndarray:
     return stypes.c_vector_to_python(vout)
 
 
-@spice_error_check
 def vperp(a: ndarray, b: ndarray) -> ndarray:
     """
     Find the component of a vector that is perpendicular to a second
@@ -16162,7 +16498,6 @@ def vprjpi(
     return stypes.c_vector_to_python(vout), bool(found.value)
 
 
-@spice_error_check
 def vproj(a: ndarray, b: ndarray) -> ndarray:
     """
     Find the projection of one vector onto another vector.
@@ -16202,7 +16537,6 @@ def vprojg(a: ndarray, b: ndarray) -> ndarray:
     return stypes.c_vector_to_python(vout)
 
 
-@spice_error_check
 def vrel(
     v1: Union[ndarray, Iterable[float]], v2: Union[ndarray, Iterable[float]]
 ) -> float:
@@ -16220,7 +16554,6 @@ def vrel(
     return libspice.vrel_c(v1, v2)
 
 
-@spice_error_check
 def vrelg(
     v1: Union[ndarray, Iterable[float]], v2: Union[ndarray, Iterable[float]]
 ) -> float:
@@ -16240,7 +16573,7 @@ def vrelg(
     return libspice.vrelg_c(v1, v2, ndim)
 
 
-@spice_error_check
+@vectormath_dispatch("vvd")
 def vrotv(v: ndarray, axis: ndarray, theta: float) -> ndarray:
     """
     Rotate a vector about a specified axis vector by a
@@ -16261,7 +16594,6 @@ def vrotv(v: ndarray, axis: ndarray, theta: float) -> ndarray:
     return stypes.c_vector_to_python(r)
 
 
-@spice_error_check
 def vscl(s: float, v1: ndarray) -> ndarray:
     """
     Multiply a scalar and a 3-dimensional double precision vector.
@@ -16279,7 +16611,6 @@ def vscl(s: float, v1: ndarray) -> ndarray:
     return stypes.c_vector_to_python(vout)
 
 
-@spice_error_check
 def vsclg(s: float, v1: ndarray) -> ndarray:
     """
     Multiply a scalar and a double precision vector of arbitrary dimension.
@@ -16299,7 +16630,7 @@ def vsclg(s: float, v1: ndarray) -> ndarray:
     return stypes.c_vector_to_python(vout)
 
 
-@spice_error_check
+@vectormath_dispatch("vv")
 def vsep(v1: ndarray, v2: ndarray) -> float:
     """
     Find the separation angle in radians between two double
@@ -16317,7 +16648,7 @@ def vsep(v1: ndarray, v2: ndarray) -> float:
     return libspice.vsep_c(v1, v2)
 
 
-@spice_error_check
+@vectormath_dispatch("vv")
 def vsepg(v1: ndarray, v2: ndarray) -> float:
     """
     Find the separation angle in radians between two double
@@ -16337,7 +16668,7 @@ def vsepg(v1: ndarray, v2: ndarray) -> float:
     return libspice.vsepg_c(v1, v2, ndim)
 
 
-@spice_error_check
+@vectormath_dispatch("vv")
 def vsub(v1: ndarray, v2: ndarray) -> ndarray:
     """
     Compute the difference between two 3-dimensional,
@@ -16356,7 +16687,7 @@ def vsub(v1: ndarray, v2: ndarray) -> ndarray:
     return stypes.c_vector_to_python(vout)
 
 
-@spice_error_check
+@vectormath_dispatch("vv")
 def vsubg(v1: ndarray, v2: ndarray) -> ndarray:
     """
     Compute the difference between two double precision
@@ -16377,7 +16708,6 @@ def vsubg(v1: ndarray, v2: ndarray) -> ndarray:
     return stypes.c_vector_to_python(vout)
 
 
-@spice_error_check
 def vtmv(v1: ndarray, matrix: ndarray, v2: ndarray) -> float:
     """
     Multiply the transpose of a 3-dimensional column vector
@@ -16396,7 +16726,6 @@ def vtmv(v1: ndarray, matrix: ndarray, v2: ndarray) -> float:
     return libspice.vtmv_c(v1, matrix, v2)
 
 
-@spice_error_check
 def vtmvg(v1: ndarray, matrix: ndarray, v2: ndarray) -> float:
     """
     Multiply the transpose of a n-dimensional
@@ -16419,7 +16748,6 @@ def vtmvg(v1: ndarray, matrix: ndarray, v2: ndarray) -> float:
     return libspice.vtmvg_c(v1, matrix, v2, nrow, ncol)
 
 
-@spice_error_check
 def vupack(v: ndarray) -> Tuple[float, float, float]:
     """
     Unpack three scalar components from a vector.
@@ -16437,7 +16765,6 @@ def vupack(v: ndarray) -> Tuple[float, float, float]:
     return x.value, y.value, z.value
 
 
-@spice_error_check
 def vzero(v: ndarray) -> bool:
     """
     Indicate whether a 3-vector is the zero vector.
@@ -16451,7 +16778,6 @@ def vzero(v: ndarray) -> bool:
     return bool(libspice.vzero_c(v))
 
 
-@spice_error_check
 def vzerog(v: ndarray) -> bool:
     """
     Indicate whether a general-dimensional vector is the zero vector.
@@ -16929,7 +17255,7 @@ def xfmsta(
     return stypes.c_vector_to_python(output_state)
 
 
-@spice_error_check
+@vectormath_dispatch("m")
 def xpose(m: Union[ndarray, Iterable[Iterable[float]]]) -> ndarray:
     """
     Transpose a 3x3 matrix
@@ -16945,7 +17271,6 @@ def xpose(m: Union[ndarray, Iterable[Iterable[float]]]) -> ndarray:
     return stypes.c_matrix_to_numpy(mout)
 
 
-@spice_error_check
 def xpose6(m: Union[ndarray, Iterable[Iterable[float]]]) -> ndarray:
     """
     Transpose a 6x6 matrix
@@ -16962,6 +17287,7 @@ def xpose6(m: Union[ndarray, Iterable[Iterable[float]]]) -> ndarray:
 
 
 @spice_error_check
+@vectormath_dispatch("m")
 def xposeg(matrix: Union[ndarray, Iterable[Iterable[float]]]) -> ndarray:
     """
     Transpose a matrix of arbitrary size
@@ -0,0 +1,224 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) [2015-2025] [Andrew Annex]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+
+import pytest
+import numpy as np
+import numpy.testing as npt
+
+import spiceypy as spice
+from spiceypy import aio
+from spiceypy.aio import AsyncSpice
+from spiceypy.tests.gettestkernels import download_kernels, CoreKernels
+from spiceypy.utils.locking import spice_lock
+
+BAD_ET = 1.0e12
+
+
+@pytest.fixture(autouse=True)
+def clear_kernel_pool_and_reset():
+    spice.kclear()
+    spice.reset()
+    spice.furnsh(CoreKernels.testMetaKernel)
+    # yield for test
+    yield
+    # clear kernel pool again
+    spice.kclear()
+    spice.reset()
+
+
+def setup_module(module):
+    download_kernels()
+
+
+async def queue_while_busy(engine, calls, cancel=()):
+    # hold the SPICE lock so the calls pile up in the queue, then let them run
+    spice_lock.acquire()
+    try:
+        tasks = [asyncio.create_task(engine.run(*call)) for call in calls]
+        await asyncio.sleep(0.1)
+        for i in cancel:
+            tasks[i].cancel()
+        await asyncio.sleep(0)
+    finally:
+        spice_lock.release()
+    return tasks
+
+
+def test_aio_module_functions():
+    async def main():
+        state, lt = await aio.spkezr("MOON", 0.0, "J2000", "LT+S", "EARTH")
+        et = await aio.run("str2et", "2000 JAN 01 12:00:00 TDB")
+        return state, lt, et
+
+    state, lt, et = asyncio.run(main())
+    expected_state, expected_lt = spice.spkezr("MOON", 0.0, "J2000", "LT+S", "EARTH")
+    npt.assert_array_equal(state, expected_state)
+    assert lt == expected_lt
+    assert et == 0.0
+
+
+def test_aio_unknown_function():
+    with pytest.raises(AttributeError):
+        aio.not_a_spice_function
+
+
+def test_aio_concurrent_calls():
+    ets = np.linspace(0.0, 86400.0 * 30, 50)
+
+    async def main():
+        async with AsyncSpice(max_pending=8) as engine:
+            return await asyncio.gather(
+                *[engine.spkezr("MOON", et, "J2000", "LT+S", "EARTH") for et in ets]
+            )
+
+    results = asyncio.run(main())
+    for et, (state, lt) in zip(ets, results):
+        expected_state, expected_lt = spice.spkezr("MOON", et, "J2000", "LT+S", "EARTH")
+        npt.assert_array_equal(state, expected_state)
+        assert lt == expected_lt
+
+
+def test_aio_merges_calls():
+    pytest.importorskip("spiceypy.cyice")
+    ets = np.linspace(0.0, 86400.0 * 30, 20)
+
+    async def main():
+        async with AsyncSpice() as engine:
+            tasks = await queue_while_busy(
+                engine,
+                [(spice.spkezr, "MOON", et, "J2000", "LT+S", "EARTH") for et in ets],
+            )
+            return await asyncio.gather(*tasks), engine.merged
+
+    results, merged = asyncio.run(main())
+    # the first call may already be running when the others are queued
+    assert merged >= len(ets) - 1
+    for et, (state, lt) in zip(ets, results):
+        expected_state, expected_lt = spice.spkezr("MOON", et, "J2000", "LT+S", "EARTH")
+        npt.assert_allclose(state, expected_state, rtol=1e-14)
+        assert lt == pytest.approx(expected_lt, rel=1e-14)
+        assert isinstance(lt, float)
+
+
+def test_aio_merged_errors_stay_with_their_call():
+    ets = [0.0, 3600.0, BAD_ET, 7200.0]
+
+    async def main():
+        async with AsyncSpice() as engine:
+            tasks = await queue_while_busy(
+                engine,
+                [(spice.spkpos, "MOON", et, "J2000", "NONE", "EARTH") for et in ets],
+            )
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert isinstance(results[2], spice.SpiceyError)
+    for et, result in zip(ets, results):
+        if et != BAD_ET:
+            npt.assert_array_equal(
+                result[0], spice.spkpos("MOON", et, "J2000", "NONE", "EARTH")[0]
+            )
+    assert not spice.failed()
+
+
+def test_aio_cancel_queued_call():
+    async def main():
+        async with AsyncSpice() as engine:
+            tasks = await queue_while_busy(
+                engine,
+                [
+                    (spice.str2et, "2000 JAN 01 12:00:00 TDB"),
+                    (spice.kclear,),
+                    (spice.str2et, "2000 JAN 01 12:00:00 TDB"),
+                ],
+                cancel=[1],
+            )
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+    first, cleared, last = asyncio.run(main())
+    assert isinstance(cleared, asyncio.CancelledError)
+    assert first == last == 0.0
+    assert spice.ktotal("ALL") > 0
+
+
+def test_aio_found_check_follows_the_caller():
+    async def main():
+        async with AsyncSpice() as engine:
+            with spice.no_found_check():
+                unchecked = await engine.bodn2c("NOT A BODY")
+            with pytest.raises(spice.NotFoundError):
+                await engine.bodn2c("NOT A BODY")
+            return unchecked
+
+    assert asyncio.run(main()) == (0, False)
+
+
+def test_aio_reused_across_event_loops():
+    # more calls than free slots, so callers of every loop have to wait
+    async def main(vdot, n):
+        return await asyncio.gather(
+            *[vdot([1.0, 2.0, 3.0], [1.0, 0.0, float(i)]) for i in range(n)]
+        )
+
+    engine = AsyncSpice(max_pending=2)
+    try:
+        for _ in range(2):
+            results = asyncio.run(main(engine.vdot, 50))
+            assert results == [1.0 + 3.0 * i for i in range(50)]
+    finally:
+        engine.close()
+    for _ in range(2):
+        results = asyncio.run(main(aio.vdot, 3000))
+        assert results == [1.0 + 3.0 * i for i in range(3000)]
+
+
+def test_aio_cancel_waiting_for_a_slot():
+    async def main(engine):
+        tasks = await queue_while_busy(
+            engine, [(spice.bodn2c, "EARTH")] * 4, cancel=[2]
+        )
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    engine = AsyncSpice(max_pending=1)
+    try:
+        results = asyncio.run(main(engine))
+        assert isinstance(results[2], asyncio.CancelledError)
+        assert [results[i] for i in (0, 1, 3)] == [399, 399, 399]
+        # the slot of the cancelled caller was not lost
+        assert asyncio.run(main(engine))[3] == 399
+    finally:
+        engine.close()
+
+
+def test_aio_closed():
+    engine = AsyncSpice()
+    engine.close()
+
+    async def main():
+        await engine.str2et("2000 JAN 01 12:00:00 TDB")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(main())
@@ -0,0 +1,138 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) [2015-2025] [Andrew Annex]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import pytest
+import numpy as np
+import numpy.testing as npt
+
+import spiceypy as spice
+from spiceypy.tests.gettestkernels import download_kernels, CoreKernels
+
+cyice = pytest.importorskip("spiceypy.cyice")
+
+
+@pytest.fixture(autouse=True)
+def clear_kernel_pool_and_reset():
+    spice.kclear()
+    spice.reset()
+    spice.furnsh(CoreKernels.testMetaKernel)
+    # yield for test
+    yield
+    # clear kernel pool again
+    spice.kclear()
+    spice.reset()
+
+
+def setup_module(module):
+    download_kernels()
+
+
+def test_broadcast_spkezr_v_targets_by_epochs():
+    targets = np.array(["MOON", "SUN", "MARS BARYCENTER"])
+    ets = np.linspace(0.0, 86400.0, 5)
+    states, lts = cyice.spkezr_v(targets[:, None], ets, "J2000", "LT+S", "EARTH")
+    assert states.shape == (3, 5, 6)
+    assert lts.shape == (3, 5)
+    for i, target in enumerate(targets):
+        exp_states, exp_lts = cyice.spkezr_v(target, ets, "J2000", "LT+S", "EARTH")
+        npt.assert_array_equal(states[i], exp_states)
+        npt.assert_array_equal(lts[i], exp_lts)
+
+
+def test_broadcast_spkpos_v_observers():
+    ets = np.linspace(0.0, 86400.0, 4)
+    observers = np.array([b"EARTH", b"SUN", b"EARTH", b"SUN"])
+    positions, lts = cyice.spkpos_v("MOON", ets, "J2000", "NONE", observers)
+    assert positions.shape == (4, 3)
+    for i in range(4):
+        exp_pos, exp_lt = spice.spkpos("MOON", ets[i], "J2000", "NONE", observers[i])
+        npt.assert_array_almost_equal(positions[i], exp_pos)
+        assert lts[i] == pytest.approx(exp_lt)
+
+
+def test_broadcast_epoch_grid():
+    ets = np.linspace(0.0, 86400.0, 6).reshape(2, 3)
+    states, lts = cyice.spkezr_v("MOON", ets, "J2000", "NONE", "EARTH")
+    assert states.shape == (2, 3, 6)
+    assert lts.shape == (2, 3)
+    exp_states, exp_lts = cyice.spkezr_v("MOON", ets.ravel(), "J2000", "NONE", "EARTH")
+    npt.assert_array_equal(states.reshape(6, 6), exp_states)
+    xforms = cyice.pxform_v("J2000", np.array(["IAU_EARTH", "IAU_MOON"])[:, None], ets)
+    assert xforms.shape == (2, 3, 3, 3)
+    npt.assert_array_equal(xforms[1, 2], cyice.pxform_s("J2000", "IAU_MOON", ets[1, 2]))
+
+
+def test_broadcast_scalar_arguments():
+    states, lts = cyice.spkezr_v("MOON", 0.0, "J2000", "NONE", "EARTH")
+    assert states.shape == (6,)
+    assert lts.shape == ()
+    exp_states, exp_lt = cyice.spkezr_s("MOON", 0.0, "J2000", "NONE", "EARTH")
+    npt.assert_array_equal(states, exp_states)
+
+
+def test_broadcast_ilumin_v_single_point():
+    ets = np.linspace(0.0, 86400.0, 4)
+    spoint = cyice.subpnt_s(
+        "NEAR POINT/ELLIPSOID", "EARTH", 0.0, "IAU_EARTH", "LT+S", "MOON"
+    )[0]
+    trgepc, srfvec, phase, incdnc, emissn = cyice.ilumin_v(
+        "ELLIPSOID", "EARTH", ets, "IAU_EARTH", "LT+S", "MOON", spoint
+    )
+    assert trgepc.shape == (4,)
+    assert srfvec.shape == (4, 3)
+    # points still form the innermost axis when given as an array
+    res = cyice.ilumin_v(
+        "ELLIPSOID", "EARTH", ets, "IAU_EARTH", "LT+S", "MOON", np.array([spoint] * 2)
+    )
+    assert res[1].shape == (4, 2, 3)
+    npt.assert_array_equal(res[2][:, 1], phase)
+
+
+def test_broadcast_out_and_errors():
+    targets = np.array(["MOON", "SUN"])
+    ets = np.array([0.0, 1.0e12])
+    states = np.empty((2, 2, 6))
+    lts = np.empty((2, 2))
+    res = cyice.spkezr_v(
+        targets[:, None],
+        ets,
+        "J2000",
+        "NONE",
+        "EARTH",
+        out=(states, lts),
+        errors="mask",
+    )
+    assert res[0] is states
+    failed, messages = res[2], res[3]
+    assert failed.shape == (2, 2)
+    npt.assert_array_equal(failed, [[False, True], [False, True]])
+    with pytest.raises(spice.SpiceyError) as excinfo:
+        cyice.spkezr_v(targets[:, None], ets, "J2000", "NONE", "EARTH")
+    assert excinfo.value.index == (0, 1)
+    assert excinfo.value.epoch == 1.0e12
+
+
+def test_broadcast_incompatible_shapes():
+    with pytest.raises(ValueError):
+        cyice.spkezr_v(np.array(["MOON", "SUN"]), np.zeros(3), "J2000", "NONE", "EARTH")
@@ -0,0 +1,255 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) [2015-2025] [Andrew Annex]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import pytest
+import numpy as np
+import numpy.testing as npt
+
+import spiceypy as spice
+from spiceypy import config
+from spiceypy.tests.gettestkernels import download_kernels, CoreKernels
+
+cyice = pytest.importorskip("spiceypy.cyice")
+
+
+@pytest.fixture(autouse=True)
+def clear_kernel_pool_and_reset():
+    spice.kclear()
+    spice.reset()
+    spice.furnsh(CoreKernels.testMetaKernel)
+    # yield for test
+    yield
+    # clear kernel pool again
+    spice.kclear()
+    spice.reset()
+    config.use_cyice = True
+
+
+def setup_module(module):
+    download_kernels()
+
+
+def assert_same(cy_res, ct_res):
+    assert type(cy_res) is type(ct_res)
+    if isinstance(cy_res, tuple):
+        assert len(cy_res) == len(ct_res)
+        for cy, ct in zip(cy_res, ct_res):
+            assert_same(cy, ct)
+    elif isinstance(cy_res, np.ndarray):
+        npt.assert_array_equal(cy_res, ct_res)
+        assert cy_res.shape == ct_res.shape
+    else:
+        assert cy_res == ct_res
+
+
+def run_both(function, *args, **kwargs):
+    config.use_cyice = True
+    cy_res = function(*args, **kwargs)
+    config.use_cyice = False
+    ct_res = function(*args, **kwargs)
+    config.use_cyice = True
+    return cy_res, ct_res
+
+
+ET = 86400.0 * 365.25
+ETS = ET + np.arange(10) * 3600.0
+
+
+@pytest.mark.parametrize(
+    ["name", "args"],
+    [
+        ("convrt", (1.0, "KM", "M")),
+        ("convrt", ([1.0, 2.0], "KM", "M")),
+        ("deltet", (ET, "ET")),
+        ("et2utc", (ET, "C", 3)),
+        ("et2utc", (ETS, "ISOC", 3)),
+        ("etcal", (ET,)),
+        ("etcal", (ETS,)),
+        ("lspcn", ("EARTH", ET, "LT+S")),
+        ("phaseq", (ET, "MOON", "SUN", "EARTH", "LT+S")),
+        ("pxform", ("J2000", "IAU_EARTH", ET)),
+        ("spkez", (301, ET, "J2000", "LT+S", 399)),
+        ("spkezp", (301, ET, "J2000", "LT+S", 399)),
+        ("spkezr", ("MOON", ET, "J2000", "LT+S", "EARTH")),
+        ("spkezr", ("MOON", ETS, "IAU_EARTH", "CN+S", "EARTH")),
+        ("spkezr", ("MOON", list(ETS), "J2000", "NONE", "EARTH")),
+        ("spkgeo", (301, ET, "J2000", 399)),
+        ("spkgps", (301, ET, "J2000", 399)),
+        ("spkpos", ("MOON", ET, "J2000", "LT+S", "EARTH")),
+        ("spkpos", ("MOON", ETS, "J2000", "LT+S", "EARTH")),
+        ("spkssb", (301, ET, "J2000")),
+        ("str2et", ("2000-01-01T12:00:00",)),
+        ("str2et", (["2000-01-01T12:00:00", "Thu Mar 20 12:53:29 PST 1997"],)),
+        ("subpnt", ("NEAR POINT/ELLIPSOID", "EARTH", ET, "IAU_EARTH", "LT+S", "MOON")),
+        ("subslr", ("INTERCEPT/ELLIPSOID", "EARTH", ET, "IAU_EARTH", "LT+S", "MOON")),
+        ("sxform", ("J2000", "IAU_EARTH", ET)),
+        ("sxform", ("J2000", "IAU_EARTH", ETS)),
+        ("timout", (ET, "YYYY-MON-DD HR:MN:SC.### ::TDB")),
+        ("timout", (ETS, "YYYY-MON-DD HR:MN:SC.### ::TDB")),
+        (
+            "trgsep",
+            (
+                ET,
+                "MOON",
+                "POINT",
+                "IAU_MOON",
+                "SUN",
+                "POINT",
+                "IAU_SUN",
+                "EARTH",
+                "LT+S",
+            ),
+        ),
+        ("unitim", (ET, "ET", "TAI")),
+        ("utc2et", ("2000-01-01T12:00:00",)),
+        ("reclat", ([1.0, 2.0, 3.0],)),
+        ("recsph", ([1.0, 2.0, 3.0],)),
+        ("reccyl", ([1.0, 2.0, 3.0],)),
+        ("recrad", ([1.0, 2.0, 3.0],)),
+        ("recgeo", ([1000.0, 2000.0, 3000.0], 6378.14, 0.00335)),
+        ("recpgr", ("EARTH", [1000.0, 2000.0, 3000.0], 6378.14, 0.00335)),
+        ("recazl", ([1.0, 2.0, 3.0], True, False)),
+        ("latrec", (1.0, 0.5, 0.25)),
+        ("sphrec", (1.0, 0.5, 0.25)),
+        ("cylrec", (1.0, 0.5, 0.25)),
+        ("radrec", (1.0, 0.5, 0.25)),
+        ("latcyl", (1.0, 0.5, 0.25)),
+        ("latsph", (1.0, 0.5, 0.25)),
+        ("cyllat", (1.0, 0.5, 0.25)),
+        ("cylsph", (1.0, 0.5, 0.25)),
+        ("sphcyl", (1.0, 0.5, 0.25)),
+        ("sphlat", (1.0, 0.5, 0.25)),
+        ("georec", (0.5, 0.25, 10.0, 6378.14, 0.00335)),
+        ("pgrrec", ("EARTH", 0.5, 0.25, 10.0, 6378.14, 0.00335)),
+        ("srfrec", (399, 0.5, 0.25)),
+    ],
+)
+def test_cyice_dispatch_parity(name, args):
+    cy_res, ct_res = run_both(getattr(spice, name), *args)
+    assert_same(cy_res, ct_res)
+
+
+def test_cyice_dispatch_parity_surface_point():
+    dvec = spice.spkpos("EARTH", ET, "J2000", "LT+S", "MOON")[0]
+    cy_res, ct_res = run_both(
+        spice.sincpt,
+        "ELLIPSOID",
+        "EARTH",
+        ET,
+        "IAU_EARTH",
+        "LT+S",
+        "MOON",
+        "J2000",
+        list(dvec),
+    )
+    assert_same(cy_res, ct_res)
+    spoint = spice.subpnt(
+        "NEAR POINT/ELLIPSOID", "EARTH", ET, "IAU_EARTH", "LT+S", "MOON"
+    )[0]
+    for args in [
+        ("ELLIPSOID", "EARTH", ET, "IAU_EARTH", "LT+S", "MOON", spoint),
+        ("ELLIPSOID", "EARTH", "SUN", ET, "IAU_EARTH", "LT+S", "MOON", spoint),
+    ]:
+        function = spice.ilumin if len(args) == 7 else spice.illumg
+        cy_res, ct_res = run_both(function, *args)
+        assert_same(cy_res, ct_res)
+
+
+def test_cyice_dispatch_parity_observer_state():
+    stobs = spice.spkssb(399, ET, "J2000")
+    for function, args in [
+        (spice.spkltc, (301, ET, "J2000", "LT+S", stobs)),
+        (spice.spkaps, (301, ET, "J2000", "LT+S", stobs, [0.0, 0.0, 1e-6])),
+        (spice.spkacs, (301, ET, "J2000", "CN+S", 399)),
+        (spice.spkapo, (301, ET, "J2000", stobs, "LT+S")),
+        (spice.ltime, (ET, 399, "->", 301)),
+    ]:
+        cy_res, ct_res = run_both(function, *args)
+        assert_same(cy_res, ct_res)
+    # arrays of epochs take the vectorized path
+    starg, lt, dlt = spice.spkltc(301, ETS, "J2000", "LT+S", stobs)
+    assert starg.shape == (10, 6) and lt.shape == dlt.shape == (10,)
+    ptarg, lt = spice.spkapo(301, ETS, "J2000", stobs, "LT+S")
+    assert ptarg.shape == (10, 3)
+
+
+def test_cyice_dispatch_keywords_and_numpy_scalars():
+    cy_res, ct_res = run_both(
+        spice.spkezr,
+        np.str_("MOON"),
+        np.float32(ET),
+        ref="J2000",
+        abcorr="LT+S",
+        obs="EARTH",
+    )
+    assert_same(cy_res, ct_res)
+
+
+def test_cyice_dispatch_routes_to_cyice(monkeypatch):
+    calls = []
+
+    def spkezr_s(*args):
+        calls.append(args)
+        return "cyice"
+
+    monkeypatch.setattr(cyice, "spkezr_s", spkezr_s)
+    assert spice.spkezr("MOON", ET, "J2000", "NONE", "EARTH") == "cyice"
+    assert calls == [("MOON", ET, "J2000", "NONE", "EARTH")]
+    config.use_cyice = False
+    state, lt = spice.spkezr("MOON", ET, "J2000", "NONE", "EARTH")
+    assert state.shape == (6,)
+    assert len(calls) == 1
+
+
+def test_cyice_dispatch_unsupported_arguments_use_ctypes(monkeypatch):
+    def fail(*args):
+        raise AssertionError("cyice should not be called")
+
+    monkeypatch.setattr(cyice, "et2utc_s", fail)
+    monkeypatch.setattr(cyice, "spkezr_s", fail)
+    # extra lenout argument
+    assert spice.et2utc(ET, "C", 0, 40) == "2000 DEC 31 17:58:56"
+    # bytes strings
+    state, lt = spice.spkezr(b"MOON", ET, b"J2000", b"NONE", b"EARTH")
+    assert state.shape == (6,)
+
+
+def test_cyice_dispatch_errors():
+    for flag in (True, False):
+        config.use_cyice = flag
+        with pytest.raises(spice.utils.exceptions.SpiceIDCODENOTFOUND):
+            spice.spkezr("MOON", ETS, "J2000", "LT+S", "NOT_A_BODY")
+        assert not spice.failed()
+        with pytest.raises(spice.NotFoundError):
+            spice.sincpt(
+                "ELLIPSOID",
+                "EARTH",
+                ET,
+                "IAU_EARTH",
+                "LT+S",
+                "MOON",
+                "J2000",
+                [0.0, 0.0, 1.0],
+            )
+        assert not spice.failed()
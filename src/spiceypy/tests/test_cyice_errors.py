@@ -0,0 +1,152 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) [2015-2025] [Andrew Annex]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import pytest
+import numpy as np
+import numpy.testing as npt
+
+import spiceypy as spice
+from spiceypy.tests.gettestkernels import download_kernels, CoreKernels
+from spiceypy.utils.exceptions import SpiceyError
+
+cyice = pytest.importorskip("spiceypy.cyice")
+
+# an epoch far beyond the coverage of the test SPK
+BAD_ET = 1.0e12
+
+
+@pytest.fixture(autouse=True)
+def clear_kernel_pool_and_reset():
+    spice.kclear()
+    spice.reset()
+    spice.furnsh(CoreKernels.testMetaKernel)
+    # yield for test
+    yield
+    # clear kernel pool again
+    spice.kclear()
+    spice.reset()
+
+
+def setup_module(module):
+    download_kernels()
+
+
+def test_errors_raise_is_default():
+    ets = np.array([0.0, BAD_ET, 3600.0])
+    with pytest.raises(SpiceyError):
+        cyice.spkezr_v("MARS", ets, "J2000", "LT+S", "EARTH")
+    with pytest.raises(SpiceyError):
+        cyice.spkezr_v("MARS", ets, "J2000", "LT+S", "EARTH", errors="raise")
+
+
+def test_errors_raise_reports_failing_element():
+    ets = np.array([0.0, 3600.0, BAD_ET, BAD_ET + 1.0])
+    with pytest.raises(SpiceyError) as exc_info:
+        cyice.spkezr_v("MARS", ets, "J2000", "LT+S", "EARTH")
+    assert exc_info.value.short == "SPICE(SPKINSUFFDATA)"
+    assert exc_info.value.index == 2
+    assert exc_info.value.epoch == BAD_ET
+    assert "Failed at element 2" in str(exc_info.value)
+    assert not spice.failed()
+
+
+def test_errors_raise_reports_failing_time_string():
+    times = np.array(["2000-01-01T12:00:00", "not a time"])
+    with pytest.raises(SpiceyError) as exc_info:
+        cyice.str2et_v(times)
+    assert exc_info.value.index == 1
+    assert exc_info.value.epoch == "not a time"
+
+
+def test_errors_raise_reports_failing_element_2d():
+    points = np.array([[6378.0, 0.0, 0.0], [0.0, 6378.0, 0.0]])
+    ets = np.array([0.0, BAD_ET])
+    with pytest.raises(SpiceyError) as exc_info:
+        cyice.ilumin_v("ELLIPSOID", "EARTH", ets, "IAU_EARTH", "NONE", "MOON", points)
+    assert exc_info.value.index == (1, 0)
+    assert exc_info.value.epoch == BAD_ET
+
+
+def test_errors_invalid_mode():
+    with pytest.raises(ValueError):
+        cyice.spkezr_v("MARS", np.zeros(2), "J2000", "NONE", "EARTH", errors="ignore")
+
+
+def test_errors_mask_spkezr_v():
+    ets = np.array([0.0, BAD_ET, 3600.0, BAD_ET])
+    states, lts, failed, messages = cyice.spkezr_v(
+        "MARS", ets, "J2000", "LT+S", "EARTH", errors="mask"
+    )
+    assert not spice.failed()
+    npt.assert_array_equal(failed, [False, True, False, True])
+    npt.assert_array_equal(
+        messages, ["", "SPICE(SPKINSUFFDATA)", "", "SPICE(SPKINSUFFDATA)"]
+    )
+    assert np.isnan(states[failed]).all()
+    assert np.isnan(lts[failed]).all()
+    # the good rows match a clean call
+    good_states, good_lts = cyice.spkezr_v(
+        "MARS", ets[~failed], "J2000", "LT+S", "EARTH"
+    )
+    npt.assert_array_equal(states[~failed], good_states)
+    npt.assert_array_equal(lts[~failed], good_lts)
+
+
+def test_errors_mask_no_failures():
+    ets = np.array([0.0, 3600.0])
+    mats, failed, messages = cyice.pxform_v("J2000", "IAU_EARTH", ets, errors="mask")
+    npt.assert_array_equal(mats, cyice.pxform_v("J2000", "IAU_EARTH", ets))
+    assert not failed.any()
+    npt.assert_array_equal(messages, ["", ""])
+
+
+def test_errors_mask_str2et_v():
+    times = np.array(["2000-01-01T12:00:00", "not a time", "2000-01-02T12:00:00"])
+    ets, failed, messages = cyice.str2et_v(times, errors="mask")
+    npt.assert_array_equal(failed, [False, True, False])
+    assert np.isnan(ets[1])
+    assert messages[1].startswith("SPICE(")
+    npt.assert_array_equal(ets[[0, 2]], cyice.str2et_v(times[[0, 2]]))
+
+
+def test_errors_mask_with_found_flags():
+    et = 0.0
+    dvec, _ = spice.spkpos("EARTH", et, "J2000", "NONE", "MOON")
+    ets = np.array([et, BAD_ET])
+    spoint, trgepc, srfvec, failed, messages = cyice.sincpt_v(
+        "ELLIPSOID",
+        "EARTH",
+        ets,
+        "IAU_EARTH",
+        "NONE",
+        "MOON",
+        "J2000",
+        dvec,
+        errors="mask",
+    )
+    npt.assert_array_equal(failed, [False, True])
+    assert messages[1] != ""
+    assert np.isfinite(spoint[0]).all()
+    assert np.isnan(spoint[1]).all()
+    assert np.isnan(trgepc[1])
@@ -0,0 +1,425 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) [2015-2025] [Andrew Annex]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import pytest
+import numpy as np
+import numpy.testing as npt
+
+import spiceypy as spice
+from spiceypy.utils import support_types as stypes
+from spiceypy.tests.gettestkernels import download_kernels, CoreKernels
+from spiceypy.utils import gen_wrappers
+
+cyice = pytest.importorskip("spiceypy.cyice")
+
+GENERATED = {wrapper.name: wrapper for wrapper in gen_wrappers.wrappers()}
+# wrappers compared to ctypes on random inputs, the EK readers need an EK
+# and a query and are covered by test_generated_ek
+WRAPPERS = {
+    name: wrapper
+    for name, wrapper in GENERATED.items()
+    if wrapper.batched and not name.startswith("ek")
+}
+N = 4
+
+# inputs that need a meaningful value, by argument name
+STRINGS = {"name": "EARTH", "frname": "IAU_EARTH", "item": "RADII"}
+STRINGS.update(ref="J2000", abcorr="LT+S", direct="->")
+INTS = {"body": 399, "iaxis": 2, "indexa": 1, "indexp": 2, "targ": 301, "obs": 399}
+INTS.update(axis3=3, axis2=1, axis1=3, axisa=3, axisb=1, axisc=3)
+# matrix inputs that must be rotations or state transformations
+ROTATIONS = {"r", "matrix", "rot", "xform"}
+# points that must lie outside of the ellipsoids, whose radii are below 1
+OUTSIDE = {"viewpt"}
+
+
+@pytest.fixture(autouse=True)
+def clear_kernel_pool_and_reset():
+    spice.kclear()
+    spice.reset()
+    spice.furnsh(CoreKernels.testMetaKernel)
+    # yield for test
+    yield
+    # clear kernel pool again
+    spice.kclear()
+    spice.reset()
+
+
+def setup_module(module):
+    download_kernels()
+
+
+def rotations(shape, rng):
+    q, r = np.linalg.qr(rng.normal(size=shape + (3, 3)))
+    q = q * np.sign(np.diagonal(r, axis1=-2, axis2=-1))[..., None, :]
+    return q * np.sign(np.linalg.det(q))[..., None, None]
+
+
+def transforms(shape, rng):
+    xform = np.zeros(shape + (6, 6))
+    rot = rotations(shape, rng)
+    av = rng.normal(size=shape + (3,))
+    omega = np.cross(av[..., None, :], np.eye(3))
+    xform[..., :3, :3] = xform[..., 3:, 3:] = rot
+    xform[..., 3:, :3] = rot @ omega
+    return xform
+
+
+def inputs(wrapper, shape, rng):
+    # random inputs of a generated wrapper, with batch dimensions shape
+    args = []
+    for argument in wrapper.inputs:
+        if argument.kind == "double":
+            args.append(rng.uniform(0.1, 1.0, shape))
+        elif argument.kind == "int":
+            args.append(np.full(shape, INTS.get(argument.name, 3), dtype=np.int32))
+        elif argument.kind == "bool":
+            args.append(rng.integers(0, 2, shape).astype(bool))
+        elif argument.kind == "string":
+            args.append(np.full(shape, STRINGS.get(argument.name, "EARTH")))
+        elif argument.name in ROTATIONS and argument.shape == (3, 3):
+            args.append(rotations(shape, rng))
+        elif argument.name in ROTATIONS and argument.shape == (6, 6):
+            args.append(transforms(shape, rng))
+        elif argument.name in OUTSIDE:
+            v = rng.normal(size=shape + (3,))
+            v *= (
+                rng.uniform(2.0, 3.0, shape + (1,))
+                / np.linalg.norm(v, axis=-1)[..., None]
+            )
+            args.append(v)
+        else:
+            args.append(rng.normal(size=shape + argument.shape))
+    if wrapper.name == "surfpt":
+        # rays pointing at the center always hit the ellipsoid
+        args[1] = -args[0]
+    return args
+
+
+def ctypes_args(wrapper, args):
+    # the ctypes functions take planes as spiceypy Plane structures
+    return [
+        (
+            stypes.Plane.from_buffer_copy(np.ascontiguousarray(arg, dtype=np.double))
+            if argument.struct == "SpicePlane"
+            else arg
+        )
+        for argument, arg in zip(wrapper.inputs, args)
+    ]
+
+
+def assert_same(result, expected):
+    if hasattr(expected, "_fields_"):
+        # ctypes structures such as ellipses compare by their doubles
+        expected = np.frombuffer(expected, dtype=np.double)
+    if isinstance(expected, tuple):
+        assert len(result) == len(expected)
+        for r, e in zip(result, expected):
+            npt.assert_array_equal(r, e)
+    else:
+        npt.assert_array_equal(result, expected)
+
+
+def test_generated_names():
+    for name, wrapper in GENERATED.items():
+        functions = (name, f"{name}_s", f"{name}_v") if wrapper.batched else (name,)
+        for function in functions:
+            assert function in cyice.__all__
+            assert callable(getattr(cyice, function))
+        if not wrapper.batched:
+            assert not hasattr(cyice, f"{name}_v")
+
+
+@pytest.mark.parametrize("name", sorted(WRAPPERS))
+def test_generated_scalar_matches_ctypes(name):
+    args = [
+        arg.item() if arg.ndim == 0 else arg
+        for arg in inputs(WRAPPERS[name], (), np.random.default_rng(15))
+    ]
+    expected = getattr(spice, name)(*ctypes_args(WRAPPERS[name], args))
+    assert_same(getattr(cyice, f"{name}_s")(*args), expected)
+    assert_same(getattr(cyice, name)(*args), expected)
+
+
+@pytest.mark.parametrize("name", sorted(WRAPPERS))
+def test_generated_vectorized_matches_ctypes(name):
+    args = inputs(WRAPPERS[name], (N,), np.random.default_rng(15))
+    result = getattr(cyice, f"{name}_v")(*args)
+    assert_same(getattr(cyice, name)(*args), result)
+    for i in range(N):
+        row = [arg[i].item() if arg.ndim == 1 else arg[i] for arg in args]
+        expected = getattr(spice, name)(*ctypes_args(WRAPPERS[name], row))
+        if isinstance(expected, tuple):
+            assert_same(tuple(r[i] for r in result), expected)
+        else:
+            assert_same(result[i], expected)
+
+
+def test_generated_broadcasting():
+    rng = np.random.default_rng(15)
+    m = rng.normal(size=(2, 1, 3, 3))
+    v = rng.normal(size=(5, 3))
+    res = cyice.mxv_v(m, v)
+    assert res.shape == (2, 5, 3)
+    npt.assert_array_equal(res[1, 3], spice.mxv(m[1, 0], v[3]))
+    angles = np.linspace(0.0, 1.0, 3)
+    mats = cyice.rotate(angles, 3)
+    assert mats.shape == (3, 3, 3)
+    npt.assert_array_equal(mats[2], spice.rotate(1.0, 3))
+
+
+def test_generated_out_and_errors():
+    rng = np.random.default_rng(15)
+    v1, v2 = rng.normal(size=(2, 10, 3))
+    vout = np.empty((10, 3))
+    assert cyice.vadd_v(v1, v2, out=vout) is vout
+    npt.assert_array_equal(vout, v1 + v2)
+    codes, failed, messages = cyice.bodn2c_v(["EARTH", ""], errors="mask")
+    npt.assert_array_equal(codes, [399, 0])
+    npt.assert_array_equal(failed, [False, True])
+    assert messages[1] == "SPICE(EMPTYSTRING)"
+    with pytest.raises(spice.utils.exceptions.NotFoundError):
+        cyice.bodn2c_v(["EARTH", "NOT A BODY"])
+    with pytest.raises(ValueError):
+        cyice.mxv_s(np.eye(3)[:, :2], [1.0, 2.0, 3.0])
+
+
+def test_generated_rotations_chain():
+    # matrices from pxform_v and sxform_v feed the attitude wrappers directly
+    ets = np.linspace(0.0, 1.0e6, 7)
+    rot = cyice.pxform_v("J2000", "IAU_EARTH", ets)
+    xform = cyice.sxform_v("J2000", "IAU_EARTH", ets)
+    q = cyice.m2q_v(rot)
+    assert q.shape == (7, 4)
+    npt.assert_allclose(cyice.q2m_v(q), rot, atol=1e-14)
+    r, av = cyice.xf2rav_v(xform)
+    npt.assert_array_equal(r, rot)
+    npt.assert_allclose(cyice.rav2xf_v(r, av), xform, atol=1e-14)
+    eulang, unique = cyice.xf2eul_v(xform, 1, 2, 3)
+    assert unique.all()
+    npt.assert_allclose(cyice.eul2xf_v(eulang, 1, 2, 3), xform, atol=1e-14)
+    for i, et in enumerate(ets):
+        npt.assert_array_equal(q[i], spice.m2q(spice.pxform("J2000", "IAU_EARTH", et)))
+
+
+def test_generated_jacobians():
+    # the jacobians of a conversion and of its inverse are inverse matrices
+    rng = np.random.default_rng(15)
+    rectan = rng.uniform(0.5, 2.0, size=(50, 3))
+    radius, lon, lat = cyice.reclat_v(rectan).T
+    product = cyice.dlatdr_v(*rectan.T) @ cyice.drdlat_v(radius, lon, lat)
+    npt.assert_allclose(product, np.broadcast_to(np.eye(3), (50, 3, 3)), atol=1e-12)
+    # boolean flags broadcast like the other arguments
+    jacobi = cyice.dazldr_v(*rectan.T, [[True], [False]], False)
+    assert jacobi.shape == (2, 50, 3, 3)
+    npt.assert_array_equal(jacobi[1, 7], spice.dazldr(*rectan[7], False, False))
+
+
+def test_generated_ellipsoids():
+    rng = np.random.default_rng(15)
+    positn = rng.normal(size=(20, 3)) * 10.0
+    radii = rng.uniform(1.0, 2.0, size=(20, 3))
+    # every other ray points away from the ellipsoid and misses it
+    u = -positn * np.where(np.arange(20) % 2, -1.0, 1.0)[:, None]
+    with pytest.raises(spice.utils.exceptions.NotFoundError):
+        cyice.surfpt_v(positn, u, *radii.T)
+    with spice.no_found_check():
+        point, found = cyice.surfpt_v(positn, u, *radii.T)
+    outside = np.sum((positn / radii) ** 2, axis=1) > 1.0
+    npt.assert_array_equal(found, ~outside | (np.arange(20) % 2 == 0))
+    for i in np.flatnonzero(found):
+        npt.assert_array_equal(point[i], spice.surfpt(positn[i], u[i], *radii[i]))
+    # one ellipsoid for all positions
+    npoint, alt = cyice.nearpt_v(positn, 1.0, 2.0, 3.0)
+    assert npoint.shape == (20, 3) and alt.shape == (20,)
+    npt.assert_array_equal(npoint[3], spice.nearpt(positn[3], 1.0, 2.0, 3.0)[0])
+    # planes and ellipses are arrays of the doubles of the CSPICE structs
+    plane = spice.nvc2pl([0.0, 0.0, 1.0], 2.0)
+    nxpts, xpt = cyice.inrypl_v(positn, -positn, plane)
+    npt.assert_array_equal(xpt[5], spice.inrypl(positn[5], -positn[5], plane)[1])
+    nxpts_arrays, _ = cyice.inrypl_v(positn, -positn, [0.0, 0.0, 1.0, 2.0])
+    npt.assert_array_equal(nxpts, nxpts_arrays)
+    viewpt = positn[np.linalg.norm(positn, axis=1) > 20.0]
+    limb = cyice.edlimb_v(1.0, 2.0, 3.0, viewpt)
+    assert limb.shape == (len(viewpt), 9)
+    expected = spice.edlimb(1.0, 2.0, 3.0, viewpt[0])
+    npt.assert_array_equal(limb[0, :3], expected.center)
+    npt.assert_array_equal(limb[0, 3:6], expected.semi_major)
+    npt.assert_array_equal(limb[0, 6:], expected.semi_minor)
+
+
+def test_generated_light_time():
+    # observer states that are not in any SPK, here the earth's shifted by 1000 km
+    ets = spice.str2et("Jan 1 2004 5:00 PM") + np.arange(8) * 3600.0
+    stobs = cyice.spkssb_v(399, ets, "J2000") + [1000.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+    starg, lt, dlt = cyice.spkltc_v(301, ets, "J2000", "NONE", stobs)
+    assert starg.shape == (8, 6) and lt.shape == dlt.shape == (8,)
+    npt.assert_allclose(starg + stobs, cyice.spkssb_v(301, ets, "J2000"), rtol=1e-12)
+    # corrected states and positions agree with the scalar functions row by row
+    accobs = np.zeros((8, 3))
+    corrected, lts, _ = cyice.spkaps_v(301, ets, "J2000", "LT+S", stobs, accobs)
+    ptarg, _ = cyice.spkapo_v(301, ets, "J2000", stobs, "LT+S")
+    apparent = cyice.stelab_v(starg[:, :3], stobs[:, 3:])
+    for i, et in enumerate(ets):
+        expected = spice.spkaps(301, et, "J2000", "LT+S", stobs[i], accobs[i])
+        npt.assert_array_equal(corrected[i], expected[0])
+        assert lts[i] == expected[1]
+        npt.assert_array_equal(
+            ptarg[i], spice.spkapo(301, et, "J2000", stobs[i], "LT+S")[0]
+        )
+        npt.assert_array_equal(apparent[i], spice.stelab(starg[i, :3], stobs[i, 3:]))
+    npt.assert_allclose(ptarg, corrected[:, :3], rtol=1e-10)
+    # one observer state for several targets
+    pos, _ = cyice.spkapo_v([301, 10], ets[0], "J2000", stobs[0], "NONE")
+    assert pos.shape == (2, 3)
+    ettarg, elapsd = cyice.ltime_v(ets, 399, ["->", "<-"] * 4, 301)
+    npt.assert_allclose(np.abs(ettarg - ets), elapsd, rtol=1e-7)
+
+
+def window(*endpoints):
+    cell = stypes.SPICEDOUBLE_CELL(20)
+    for left, right in zip(endpoints[::2], endpoints[1::2]):
+        spice.wninsd(left, right, cell)
+    return cell
+
+
+def test_generated_windows():
+    a = [1.0, 3.0, 7.0, 11.0, 23.0, 27.0]
+    b = [2.0, 6.0, 8.0, 10.0, 16.0, 18.0]
+    # windows are arrays of endpoints and the given ones are left unchanged
+    arr = np.array(a)
+    npt.assert_array_equal(cyice.wninsd(12.0, 14.0, arr), [1, 3, 7, 11, 12, 14, 23, 27])
+    npt.assert_array_equal(arr, a)
+    assert cyice.wncard(a) == spice.wncard(window(*a)) == 3
+    for name in ("wndifd", "wnintd", "wnunid"):
+        expected = getattr(spice, name)(window(*a), window(*b))
+        npt.assert_array_equal(getattr(cyice, name)(a, b), list(expected))
+    # spiceypy cells are accepted as inputs
+    npt.assert_array_equal(cyice.wnunid(window(*a), b), cyice.wnunid(a, b))
+    npt.assert_array_equal(
+        cyice.wncomd(2.0, 20.0, a), list(spice.wncomd(2.0, 20.0, window(*a)))
+    )
+    for name, args in (
+        ("wncond", (1.0, 1.0)),
+        ("wnexpd", (1.0, 1.0)),
+        ("wnextd", ("R",)),
+        ("wnfild", (5.0,)),
+        ("wnfltd", (3.0,)),
+    ):
+        cell = window(*a)
+        getattr(spice, name)(*args, cell)
+        npt.assert_array_equal(getattr(cyice, name)(*args, a), list(cell))
+    assert cyice.wnelmd(8.0, a) is spice.wnelmd(8.0, window(*a)) is True
+    assert cyice.wnincd(12.0, 13.0, a) is spice.wnincd(12.0, 13.0, window(*a)) is False
+    assert cyice.wnreld(a, "<>", b) == spice.wnreld(window(*a), "<>", window(*b))
+    assert cyice.wnfetd(a, 1) == spice.wnfetd(window(*a), 1)
+    assert cyice.wnsumd(a) == spice.wnsumd(window(*a))
+    endpoints = [5.0, 8.0, 1.0, 3.0, 2.0, 4.0]
+    cell = stypes.SPICEDOUBLE_CELL(20)
+    for endpoint in endpoints:
+        spice.appndd(endpoint, cell)
+    npt.assert_array_equal(
+        cyice.wnvald(20, 6, endpoints), list(spice.wnvald(20, 6, cell))
+    )
+    with pytest.raises(ValueError):
+        cyice.wncard([1.0, 2.0, 3.0])
+    with pytest.raises(ValueError):
+        cyice.wnextd("LR", a)
+    with pytest.raises(spice.utils.exceptions.SpiceyError):
+        cyice.wnfetd(a, 3)
+
+
+def test_generated_geometry_finders():
+    et0 = spice.str2et("2007 JAN 01 00:00:00 TDB")
+    et1 = spice.str2et("2007 APR 01 00:00:00 TDB")
+    cnfine = [et0, et1]
+    result = cyice.gfdist(
+        "moon", "none", "earth", ">", 400000, 0.0, spice.spd(), 1000, cnfine
+    )
+    expected = spice.gfdist(
+        "moon", "none", "earth", ">", 400000, 0.0, spice.spd(), 1000, window(*cnfine)
+    )
+    assert len(result) == 8
+    npt.assert_array_equal(result, list(expected))
+    args = ("sun", "iau_earth", "none", "earth", "latitudinal", "latitude")
+    args += ("<", 0.0, 0.0, 30.0 * spice.spd(), 1000)
+    npt.assert_array_equal(
+        cyice.gfposc(*args, cnfine), list(spice.gfposc(*args, window(*cnfine)))
+    )
+    args = ("MOON", "SPHERE", "NULL", "SUN", "SPHERE", "NULL", "NONE", "EARTH")
+    args += ("LOCMAX", 0.0, 0.0, 6.0 * spice.spd(), 1000)
+    result = cyice.gfsep(*args, cnfine)
+    npt.assert_array_equal(result, list(spice.gfsep(*args, window(*cnfine))))
+    # the result window holds size endpoints
+    with pytest.raises(spice.utils.exceptions.SpiceyError):
+        cyice.gfsep(*args, cnfine, size=len(result) - 2)
+
+
+def test_generated_ek(tmp_path):
+    ekpath = str(tmp_path / "generated.ek")
+    handle = cyice.ekopn(ekpath, ekpath, 0)
+    segno = spice.ekbseg(
+        handle,
+        "TEST_TABLE_GENERATED",
+        ["I1", "D1", "C1"],
+        [
+            "DATATYPE = INTEGER, NULLS_OK = TRUE",
+            "DATATYPE = DOUBLE PRECISION",
+            "DATATYPE = CHARACTER*(*)",
+        ],
+    )
+    for i, (c1, d1) in enumerate([("one", 1.5), ("two", 2.5), ("three", 3.5)]):
+        recno = cyice.ekappr(handle, segno)
+        spice.ekacei(handle, segno, recno, "I1", 1, [i], i == 1)
+        spice.ekaced(handle, segno, recno, "D1", 1, [d1], False)
+        spice.ekacec(handle, segno, recno, "C1", 1, [c1], False)
+    cyice.ekcls(handle)
+    spice.kclear()
+    handle = cyice.eklef(ekpath)
+    assert cyice.ekntab() == 1
+    assert cyice.ektnam(0) == "TEST_TABLE_GENERATED"
+    assert cyice.ekccnt("TEST_TABLE_GENERATED") == 3
+    assert cyice.eknseg(handle) == 1
+    query = "SELECT I1, D1, C1 FROM TEST_TABLE_GENERATED ORDER BY D1"
+    assert cyice.ekfind(query) == (3, False, "")
+    nmrows, error, errmsg = cyice.ekfind("SELECT X1 FROM NOT_A_TABLE", 100)
+    assert error and errmsg == spice.ekfind("SELECT X1 FROM NOT_A_TABLE", 100)[2]
+    assert cyice.ekfind(query)[0] == 3
+    rows = np.arange(3)
+    npt.assert_array_equal(cyice.eknelt(0, rows), [1, 1, 1])
+    # a column is read in one call, null entries are flagged
+    ints, nulls = cyice.ekgi(0, rows, 0)
+    npt.assert_array_equal(ints[[0, 2]], [0, 2])
+    npt.assert_array_equal(nulls, [False, True, False])
+    npt.assert_array_equal(cyice.ekgd(1, rows, 0)[0], [1.5, 2.5, 3.5])
+    strings, nulls = cyice.ekgc(2, rows, 0)
+    npt.assert_array_equal(strings, ["one", "two", "three"])
+    for row in range(3):
+        assert cyice.ekgc(2, row, 0) == spice.ekgc(2, row, 0)
+        assert cyice.ekgd(1, row, 0) == spice.ekgd(1, row, 0)
+    assert cyice.ekgc(2, 2, 0, 4) == ("thr", False)
+    with pytest.raises(spice.utils.exceptions.SpiceyError):
+        cyice.ekgi(0, 3, 0)
+    cyice.ekuef(handle)
+    assert cyice.ekntab() == 0
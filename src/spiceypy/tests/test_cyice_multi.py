@@ -0,0 +1,104 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) [2015-2025] [Andrew Annex]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import pytest
+import numpy as np
+import numpy.testing as npt
+
+import spiceypy as spice
+from spiceypy.tests.gettestkernels import download_kernels, CoreKernels
+
+cyice = pytest.importorskip("spiceypy.cyice")
+
+
+@pytest.fixture(autouse=True)
+def clear_kernel_pool_and_reset():
+    spice.kclear()
+    spice.reset()
+    spice.furnsh(CoreKernels.testMetaKernel)
+    # yield for test
+    yield
+    # clear kernel pool again
+    spice.kclear()
+    spice.reset()
+
+
+def setup_module(module):
+    download_kernels()
+
+
+TARGETS = ["MOON", "SUN", "MARS BARYCENTER", "EARTH BARYCENTER"]
+
+
+@pytest.mark.parametrize("ref", ["J2000", "ECLIPJ2000", "IAU_EARTH", "IAU_MOON"])
+def test_spkezr_targets_geometric_matches_spkezr(ref):
+    ets = np.linspace(0.0, 86400.0 * 30, 25)
+    states, lts = cyice.spkezr_targets(TARGETS, ets, ref, "NONE", "EARTH")
+    assert states.shape == (len(TARGETS), 25, 6)
+    assert lts.shape == (len(TARGETS), 25)
+    for k, target in enumerate(TARGETS):
+        exp_states, exp_lts = cyice.spkezr_v(target, ets, ref, "NONE", "EARTH")
+        npt.assert_array_equal(states[k], exp_states)
+        npt.assert_array_equal(lts[k], exp_lts)
+
+
+@pytest.mark.parametrize("abcorr", ["LT", "LT+S", "CN+S", "XLT+S"])
+@pytest.mark.parametrize("ref", ["J2000", "IAU_EARTH", "IAU_MOON"])
+def test_spkezr_targets_corrected(ref, abcorr):
+    ets = np.linspace(0.0, 86400.0 * 30, 25)
+    states, lts = cyice.spkezr_targets(TARGETS, ets, ref, abcorr, "MOON")
+    for k, target in enumerate(TARGETS):
+        exp_states, exp_lts = cyice.spkezr_v(target, ets, ref, abcorr, "MOON")
+        npt.assert_allclose(states[k], exp_states, rtol=1e-12, atol=1e-9)
+        npt.assert_allclose(lts[k], exp_lts, rtol=1e-14)
+
+
+def test_spkezr_targets_codes_and_out():
+    ets = np.linspace(0.0, 86400.0, 5)
+    states = np.empty((2, 5, 6))
+    lts = np.empty((2, 5))
+    res = cyice.spkezr_targets(
+        np.array([301, 10]), ets, "J2000", "LT+S", 399, out=(states, lts)
+    )
+    assert res[0] is states
+    assert res[1] is lts
+    exp_states, _ = cyice.spkezr_v("SUN", ets, "J2000", "LT+S", "EARTH")
+    npt.assert_array_equal(states[1], exp_states)
+
+
+def test_spkezr_targets_errors():
+    ets = np.array([0.0, 1.0e12])
+    with pytest.raises(spice.SpiceyError) as excinfo:
+        cyice.spkezr_targets(TARGETS, ets, "J2000", "NONE", "EARTH")
+    assert excinfo.value.index == (0, 1)
+    assert excinfo.value.epoch == 1.0e12
+    states, lts, failed, messages = cyice.spkezr_targets(
+        TARGETS, ets, "J2000", "LT+S", "EARTH", errors="mask"
+    )
+    npt.assert_array_equal(failed[:, 0], False)
+    npt.assert_array_equal(failed[:, 1], True)
+    assert np.isnan(states[:, 1]).all()
+    assert messages[0, 1] == "SPICE(SPKINSUFFDATA)"
+    with pytest.raises(spice.NotFoundError):
+        cyice.spkezr_targets(["MOON", "NOT A BODY"], ets, "J2000", "NONE", "EARTH")
@@ -0,0 +1,167 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) [2015-2025] [Andrew Annex]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import pytest
+import numpy as np
+import numpy.testing as npt
+
+import spiceypy as spice
+from spiceypy.tests.gettestkernels import download_kernels, CoreKernels
+
+cyice = pytest.importorskip("spiceypy.cyice")
+
+
+@pytest.fixture(autouse=True)
+def clear_kernel_pool_and_reset():
+    spice.kclear()
+    spice.reset()
+    spice.furnsh(CoreKernels.testMetaKernel)
+    # yield for test
+    yield
+    # clear kernel pool again
+    spice.kclear()
+    spice.reset()
+
+
+def setup_module(module):
+    download_kernels()
+
+
+def test_out_spkezr_v():
+    ets = np.linspace(0.0, 86400.0, 10)
+    states = np.empty((10, 6))
+    lts = np.empty(10)
+    res_states, res_lts = cyice.spkezr_v(
+        "MOON", ets, "J2000", "LT+S", "EARTH", out=(states, lts)
+    )
+    assert res_states is states
+    assert res_lts is lts
+    exp_states, exp_lts = cyice.spkezr_v("MOON", ets, "J2000", "LT+S", "EARTH")
+    npt.assert_array_equal(states, exp_states)
+    npt.assert_array_equal(lts, exp_lts)
+
+
+def test_out_single_array_and_slices():
+    ets = np.linspace(0.0, 86400.0, 10)
+    xforms = np.zeros((2, 10, 3, 3))
+    # write into a slice of a larger result tensor
+    res = cyice.pxform_v("J2000", "IAU_EARTH", ets, out=xforms[1])
+    assert np.shares_memory(res, xforms)
+    npt.assert_array_equal(xforms[1], cyice.pxform_v("J2000", "IAU_EARTH", ets))
+    assert not xforms[0].any()
+    rec = np.ones((10, 3))
+    lat = np.empty((10, 3))
+    assert cyice.reclat_v(rec, out=lat) is lat
+    npt.assert_array_equal(lat, cyice.reclat_v(rec))
+
+
+def test_out_found_flags():
+    et = 0.0
+    dvec, _ = spice.spkpos("EARTH", et, "J2000", "NONE", "MOON")
+    ets = np.array([et, et + 1.0])
+    out = (np.empty((2, 3)), np.empty(2), np.empty((2, 3)), np.zeros(2, dtype=np.bool_))
+    spice.config.catch_false_founds = False
+    try:
+        res = cyice.sincpt_v(
+            "ELLIPSOID",
+            "EARTH",
+            ets,
+            "IAU_EARTH",
+            "NONE",
+            "MOON",
+            "J2000",
+            dvec,
+            out=out,
+        )
+    finally:
+        spice.config.catch_false_founds = True
+    assert all(r is o for r, o in zip(res, out))
+    assert out[3].all()
+
+
+@pytest.mark.parametrize(
+    "out, error",
+    [
+        ((np.empty((3, 6)),), ValueError),
+        ((np.empty((3, 6)), np.empty(4)), ValueError),
+        ((np.empty((3, 6)), np.empty(3, dtype=np.float32)), TypeError),
+        ((np.empty((3, 12))[:, ::2], np.empty(3)), ValueError),
+        ((np.empty((3, 6)), [0.0, 0.0, 0.0]), TypeError),
+    ],
+)
+def test_out_validation(out, error):
+    with pytest.raises(error):
+        cyice.spkezr_v("MOON", np.zeros(3), "J2000", "NONE", "EARTH", out=out)
+
+
+@pytest.mark.parametrize(
+    "name, args, shape",
+    [
+        ("spkezr_s", ("MOON", 0.0, "J2000", "LT+S", "EARTH"), (6,)),
+        ("spkpos_s", ("MOON", 0.0, "J2000", "LT+S", "EARTH"), (3,)),
+        ("spkez_s", (301, 0.0, "J2000", "LT+S", 399), (6,)),
+        ("spkezp_s", (301, 0.0, "J2000", "LT+S", 399), (3,)),
+        ("spkgeo_s", (301, 0.0, "J2000", 399), (6,)),
+        ("spkgps_s", (301, 0.0, "J2000", 399), (3,)),
+        ("spkssb_s", (301, 0.0, "J2000"), (6,)),
+        ("pxform_s", ("J2000", "IAU_EARTH", 0.0), (3, 3)),
+        ("sxform_s", ("J2000", "IAU_EARTH", 0.0), (6, 6)),
+        ("mxv_s", (np.eye(3), [1.0, 2.0, 3.0]), (3,)),
+        ("rotate_s", (0.5, 3), (3, 3)),
+    ],
+)
+def test_out_scalar(name, args, shape):
+    func = getattr(cyice, name)
+    exp = func(*args)
+    out = np.empty(shape)
+    res = func(*args, out=out)
+    tup = func(*args, astuple=True)
+    if isinstance(exp, tuple):
+        assert res[0] is out
+        assert res[1:] == exp[1:]
+        assert tup[1:] == exp[1:]
+        exp, tup = exp[0], tup[0]
+    else:
+        assert res is out
+    npt.assert_array_equal(out, exp)
+    assert isinstance(tup, tuple)
+    rows = tup if isinstance(tup[0], tuple) else (tup,)
+    assert all(type(v) is float for row in rows for v in row)
+    npt.assert_array_equal(np.array(tup), exp)
+
+
+@pytest.mark.parametrize(
+    "kwargs, error",
+    [
+        ({"out": np.empty(6), "astuple": True}, ValueError),
+        ({"out": np.empty(3)}, ValueError),
+        ({"out": np.empty(6, dtype=np.float32)}, ValueError),
+        ({"out": np.empty(12)[::2]}, ValueError),
+        ({"out": [0.0] * 6}, TypeError),
+        ({"out": (np.empty(6), np.empty(1))}, ValueError),
+    ],
+)
+def test_out_scalar_validation(kwargs, error):
+    with pytest.raises(error):
+        cyice.spkezr_s("MOON", 0.0, "J2000", "NONE", "EARTH", **kwargs)
@@ -22,6 +22,12 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import ctypes
+import subprocess
+import sys
+
+import pytest
+
 import spiceypy
 
 
@@ -45,3 +51,62 @@ def test_star_import():
 def test_all_has_no_duplicates():
     duplicates = sorted({n for n in spiceypy.__all__ if spiceypy.__all__.count(n) > 1})
     assert not duplicates, f"duplicate __all__ entries: {duplicates}"
+
+
+def test_prototypes_are_bound_on_first_use():
+    code = (
+        "import spiceypy\n"
+        "from spiceypy.utils.libspicehelper import libspice, _signatures\n"
+        "assert 'b1900_c' not in vars(libspice)\n"
+        "spiceypy.b1900()\n"
+        "assert libspice.b1900_c.restype is _signatures['b1900_c'].restype\n"
+        "print(len(vars(libspice)), len(_signatures))\n"
+    )
+    res = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    bound, recorded = map(int, res.stdout.split())
+    assert bound < 50 < recorded
+
+
+def test_signature_table_is_up_to_date():
+    from spiceypy.utils import gen_signatures
+
+    if not gen_signatures.PXD.exists():
+        pytest.skip("cyice.pxd is not installed")
+    assert (
+        gen_signatures.main(["--check"]) == 0
+    ), "cyice.pxd changed, run python -m spiceypy.utils.gen_signatures"
+
+
+def test_signature_table_matches_library():
+    from spiceypy.utils import callbacks
+    from spiceypy.utils.libspicehelper import _signatures, libspice
+
+    for name, signature in _signatures.items():
+        func = getattr(libspice, name)
+        assert func.restype is signature.restype
+        if signature.argtypes is not None:
+            assert func.argtypes == signature.argtypes
+    assert _signatures["axisar_c"].argtypes == [
+        ctypes.c_double * 3,
+        ctypes.c_double,
+        (ctypes.c_double * 3) * 3,
+    ]
+    assert _signatures["gfuds_c"].argtypes[:2] == [callbacks.UDFUNS, callbacks.UDFUNB]
+    assert _signatures["tkvrsn_c"].restype is ctypes.c_char_p
+    assert _signatures["maxd_c"].argtypes is None
+
+
+def test_exception_classes_are_created_on_demand():
+    from spiceypy.utils import exceptions
+
+    cls = exceptions.SpiceNOSUCHFILE
+    assert cls is exceptions.SpiceNOSUCHFILE
+    assert issubclass(cls, exceptions.SpiceyPyIOError)
+    assert cls.__module__ == "spiceypy.utils.exceptions"
+    assert exceptions.exceptions["SPICE(NOSUCHFILE)"] is cls
+    assert "SpiceBADARCHTYPE" in dir(exceptions)
+    assert "SPICE(NOTAREALERROR)" not in exceptions.exceptions
+    with pytest.raises(AttributeError):
+        exceptions.SpiceNOTAREALERROR
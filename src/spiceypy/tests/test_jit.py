@@ -0,0 +1,147 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) [2015-2025] [Andrew Annex]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import ctypes
+
+import pytest
+import numpy as np
+import numpy.testing as npt
+
+import spiceypy as spice
+from spiceypy.jit import cspice_functions, cstring, numba_externals
+from spiceypy.tests.gettestkernels import download_kernels, CoreKernels
+
+
+@pytest.fixture(autouse=True)
+def clear_kernel_pool_and_reset():
+    spice.kclear()
+    spice.reset()
+    spice.furnsh(CoreKernels.testMetaKernel)
+    # yield for test
+    yield
+    # clear kernel pool again
+    spice.kclear()
+    spice.reset()
+
+
+def setup_module(module):
+    download_kernels()
+
+
+def test_cspice_functions():
+    functions = cspice_functions()
+    spkpos = functions["spkpos_c"]
+    assert spkpos.address == ctypes.cast(spice.libspice.spkpos_c, ctypes.c_void_p).value
+    assert spkpos.restype is None
+    assert spkpos.argtypes == (
+        "SpiceChar *",
+        "SpiceDouble",
+        "SpiceChar *",
+        "SpiceChar *",
+        "SpiceChar *",
+        "SpiceDouble[3]",
+        "SpiceDouble *",
+    )
+    assert functions["failed_c"].restype == "SpiceInt"
+    assert functions["reset_c"].argtypes == ()
+    assert functions["maxd_c"].argtypes is None
+    # the addresses can be called like any other C function
+    failed = ctypes.CFUNCTYPE(ctypes.c_int)(functions["failed_c"].address)
+    assert failed() == 0
+
+
+def test_cstring():
+    npt.assert_array_equal(cstring("MOON"), [77, 79, 79, 78, 0])
+    assert cstring(size=8).tolist() == [0] * 8
+    with pytest.raises(ValueError):
+        cstring("MOON", 4)
+
+
+def test_numba_externals_fused_loop():
+    numba = pytest.importorskip("numba")
+    externals = numba_externals(["spkpos_c", "pxform_c", "mxv_c", "failed_c"])
+    spkpos_c = externals["spkpos_c"]
+    pxform_c = externals["pxform_c"]
+    mxv_c = externals["mxv_c"]
+    failed_c = externals["failed_c"]
+
+    @numba.njit
+    def fused(target, ets, ref, frame, abcorr, obs, out):
+        pos = np.empty(3)
+        lt = np.empty(1)
+        rot = np.empty((3, 3))
+        for i in range(ets.shape[0]):
+            spkpos_c(
+                target.ctypes,
+                ets[i],
+                ref.ctypes,
+                abcorr.ctypes,
+                obs.ctypes,
+                pos.ctypes,
+                lt.ctypes,
+            )
+            pxform_c(ref.ctypes, frame.ctypes, ets[i], rot.ctypes)
+            mxv_c(rot.ctypes, pos.ctypes, out[i].ctypes)
+            if failed_c():
+                return i
+        return -1
+
+    ets = spice.str2et("2000 JAN 01") + np.arange(10) * 3600.0
+    args = [cstring(text) for text in ("J2000", "IAU_EARTH", "LT+S", "EARTH")]
+    out = np.empty((10, 3))
+    assert fused(cstring("MOON"), ets, *args, out) == -1
+    for et, row in zip(ets, out):
+        pos, _ = spice.spkpos("MOON", et, "J2000", "LT+S", "EARTH")
+        npt.assert_array_almost_equal(
+            row, spice.mxv(spice.pxform("J2000", "IAU_EARTH", et), pos)
+        )
+    # errors are left for the compiled code to check and reset
+    assert fused(cstring("NOTABODY"), ets, *args, out) == 0
+    assert spice.failed()
+    assert spice.getmsg("SHORT", 40) == "SPICE(IDCODENOTFOUND)"
+    spice.reset()
+
+
+def test_numba_externals_errors():
+    numba = pytest.importorskip("numba")
+    externals = numba_externals(["sigerr_c", "getmsg_c", "failed_c", "reset_c"])
+    sigerr_c = externals["sigerr_c"]
+    getmsg_c = externals["getmsg_c"]
+    failed_c = externals["failed_c"]
+    reset_c = externals["reset_c"]
+
+    @numba.njit
+    def raise_and_clear(short, option, msg):
+        sigerr_c(short.ctypes)
+        failed = failed_c()
+        getmsg_c(option.ctypes, msg.shape[0], msg.ctypes)
+        reset_c()
+        return failed
+
+    msg = cstring(size=41)
+    assert raise_and_clear(cstring("SPICE(JITERROR)"), cstring("SHORT"), msg) == 1
+    assert msg.tobytes().split(b"\0")[0].decode() == "SPICE(JITERROR)"
+    assert not spice.failed()
+    with pytest.raises(ValueError):
+        numba_externals(["maxd_c"])
@@ -0,0 +1,183 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) [2015-2025] [Andrew Annex]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import threading
+import time
+
+import pytest
+import numpy as np
+import numpy.testing as npt
+
+import spiceypy as spice
+from spiceypy.tests.gettestkernels import download_kernels, CoreKernels
+from spiceypy.utils.locking import SpiceLock, spice_lock
+
+BAD_ET = 1.0e12
+N_THREADS = 4
+
+
+@pytest.fixture(autouse=True)
+def clear_kernel_pool_and_reset():
+    spice.kclear()
+    spice.reset()
+    spice.furnsh(CoreKernels.testMetaKernel)
+    # yield for test
+    yield
+    # clear kernel pool again
+    spice.kclear()
+    spice.reset()
+    spice.found_check_on()
+
+
+def setup_module(module):
+    download_kernels()
+
+
+def run_threads(target, n=N_THREADS):
+    # run target(k) in n threads and re-raise the first exception
+    errors = []
+
+    def wrapper(k):
+        try:
+            target(k)
+        except BaseException as err:
+            errors.append(err)
+
+    threads = [threading.Thread(target=wrapper, args=(k,)) for k in range(n)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+
+
+def test_lock_is_reentrant():
+    with spice_lock:
+        with spice_lock:
+            et = spice.str2et("2000 JAN 01 12:00:00 TDB")
+    assert et == 0.0
+
+
+def test_lock_counts_contention():
+    lock = SpiceLock()
+    lock.acquire()
+    thread = threading.Thread(target=lambda: lock.acquire() and lock.release())
+    thread.start()
+    time.sleep(0.05)
+    lock.release()
+    thread.join()
+    stats = lock.stats()
+    assert stats["contentions"] == 1
+    assert stats["wait_time"] > 0.0
+    lock.reset_stats()
+    assert lock.stats() == {"contentions": 0, "wait_time": 0.0}
+
+
+def test_spice_calls_wait_for_the_lock():
+    spice_lock.reset_stats()
+    result = []
+    with spice_lock:
+        thread = threading.Thread(
+            target=lambda: result.append(spice.str2et("2000 JAN 01 12:00:00 TDB"))
+        )
+        thread.start()
+        time.sleep(0.05)
+        assert result == []
+    thread.join()
+    assert result == [0.0]
+    assert spice_lock.contentions == 1
+
+
+def test_threads_ctypes():
+    ets = np.linspace(0.0, 86400.0 * 365.0, 200)
+    expected = [spice.spkezr("MOON", et, "J2000", "LT+S", "EARTH") for et in ets]
+
+    def work(k):
+        for et, (state, lt) in zip(ets, expected):
+            got_state, got_lt = spice.spkezr("MOON", et, "J2000", "LT+S", "EARTH")
+            npt.assert_array_equal(got_state, state)
+            assert got_lt == lt
+
+    run_threads(work)
+
+
+def test_threads_errors_stay_in_their_thread():
+    # errors raised in one thread never surface in calls made by another
+    def work(k):
+        for _ in range(200):
+            if k % 2:
+                with pytest.raises(spice.SpiceyError):
+                    spice.spkezr("MOON", BAD_ET, "J2000", "NONE", "EARTH")
+            else:
+                spice.spkezr("MOON", 0.0, "J2000", "NONE", "EARTH")
+
+    run_threads(work)
+    assert not spice.failed()
+
+
+def test_threads_cyice():
+    cyice = pytest.importorskip("spiceypy.cyice")
+    ets = np.linspace(0.0, 86400.0 * 365.0, 1000)
+    expected_states, expected_lts = cyice.spkezr_v(
+        "MOON", ets, "J2000", "LT+S", "EARTH"
+    )
+
+    def work(k):
+        for _ in range(5):
+            if k % 2:
+                with pytest.raises(spice.SpiceyError):
+                    cyice.spkezr_v(
+                        "MOON", np.append(ets, BAD_ET), "J2000", "NONE", "EARTH"
+                    )
+            states, lts = cyice.spkezr_v("MOON", ets, "J2000", "LT+S", "EARTH")
+            npt.assert_array_equal(states, expected_states)
+            npt.assert_array_equal(lts, expected_lts)
+
+    run_threads(work)
+    assert not spice.failed()
+
+
+def test_found_check_is_per_thread():
+    started = threading.Event()
+    finished = threading.Event()
+    seen = []
+
+    def work():
+        with spice.no_found_check():
+            started.set()
+            finished.wait(5)
+            seen.append(spice.bodn2c("NOT A BODY"))
+
+    thread = threading.Thread(target=work)
+    thread.start()
+    started.wait(5)
+    # the other thread disabled the found check for itself only
+    assert spice.get_found_catch_state()
+    with pytest.raises(spice.NotFoundError):
+        spice.bodn2c("NOT A BODY")
+    finished.set()
+    thread.join()
+    assert seen == [(0, False)]
+    assert spice.get_found_catch_state()
@@ -0,0 +1,180 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) [2015-2025] [Andrew Annex]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import gc
+import weakref
+
+import pytest
+import numpy as np
+import numpy.testing as npt
+
+import spiceypy as spice
+from spiceypy.parallel import ParallelExecutor, loaded_kernels
+from spiceypy.tests.gettestkernels import download_kernels, CoreKernels, ExtraKernels
+
+cyice = pytest.importorskip("spiceypy.cyice")
+
+
+@pytest.fixture(autouse=True)
+def clear_kernel_pool_and_reset():
+    spice.kclear()
+    spice.reset()
+    spice.furnsh(CoreKernels.testMetaKernel)
+    # yield for test
+    yield
+    # clear kernel pool again
+    spice.kclear()
+    spice.reset()
+
+
+@pytest.fixture
+def executor():
+    with ParallelExecutor(max_workers=2) as ex:
+        yield ex
+
+
+def setup_module(module):
+    download_kernels()
+
+
+def test_loaded_kernels():
+    assert loaded_kernels() == [CoreKernels.testMetaKernel]
+    spice.furnsh(CoreKernels.spk)
+    assert loaded_kernels() == [CoreKernels.testMetaKernel, CoreKernels.spk]
+
+
+def test_parallel_spkezr_v(executor):
+    ets = np.linspace(0.0, 86400.0 * 365, 1000)
+    states, lts = executor.run(
+        cyice.spkezr_v, "MOON", ets, "J2000", "LT+S", "EARTH", chunksize=150
+    )
+    exp_states, exp_lts = cyice.spkezr_v("MOON", ets, "J2000", "LT+S", "EARTH")
+    npt.assert_array_equal(states, exp_states)
+    npt.assert_array_equal(lts, exp_lts)
+
+
+def test_parallel_outputs_view_shared_memory(executor):
+    ets = np.linspace(0.0, 86400.0 * 365, 1000)
+    states, lts = executor.run(
+        "spkezr_v", "MOON", ets, "J2000", "LT+S", "EARTH", chunksize=150
+    )
+    assert not states.flags.owndata
+    block = weakref.ref(states.base)
+    tail = states[-10:]
+    del states
+    gc.collect()
+    # the block stays mapped while a view of it is alive
+    assert block() is not None
+    npt.assert_array_equal(
+        tail, cyice.spkezr_v("MOON", ets[-10:], "J2000", "LT+S", "EARTH")[0]
+    )
+    del tail
+    gc.collect()
+    assert block() is None
+
+
+def test_parallel_single_output_and_strings(executor):
+    dates = np.array(["2000 JAN 01 12:00:00", "2010 MAR 03 01:02:03"] * 200)
+    ets = executor.run("str2et_v", dates, chunksize=64)
+    npt.assert_array_equal(ets, cyice.str2et_v(dates))
+    utcs = executor.run("et2utc_v", ets, "ISOC", 3, chunksize=64)
+    npt.assert_array_equal(utcs, cyice.et2utc_v(ets, "ISOC", 3))
+
+
+def test_parallel_errors(executor):
+    ets = np.linspace(0.0, 86400.0, 400)
+    ets[250] = 1.0e12
+    ets[390] = 1.0e12
+    with pytest.raises(spice.SpiceyError) as excinfo:
+        executor.run("spkezr_v", "MOON", ets, "J2000", "NONE", "EARTH", chunksize=50)
+    assert excinfo.value.short == "SPICE(SPKINSUFFDATA)"
+    assert excinfo.value.index == 250
+    assert excinfo.value.epoch == 1.0e12
+    res = executor.run(
+        "spkezr_v", "MOON", ets, "J2000", "NONE", "EARTH", chunksize=50, errors="mask"
+    )
+    exp = cyice.spkezr_v("MOON", ets, "J2000", "NONE", "EARTH", errors="mask")
+    for value, exp_value in zip(res, exp):
+        npt.assert_array_equal(value, exp_value)
+
+
+def test_parallel_broadcast_split(executor):
+    targets = np.array(["MOON", "SUN", "EARTH BARYCENTER", "MARS BARYCENTER"])
+    ets = np.linspace(0.0, 86400.0, 7)
+    states, lts = executor.run(
+        "spkezr_v", targets[:, None], ets, "J2000", "NONE", "EARTH", chunksize=1
+    )
+    exp_states, _ = cyice.spkezr_v(targets[:, None], ets, "J2000", "NONE", "EARTH")
+    npt.assert_array_equal(states, exp_states)
+
+
+def test_parallel_broadcast_epochs(executor):
+    targets = np.array(["MOON", "SUN", "EARTH BARYCENTER"])
+    ets = np.linspace(0.0, 86400.0, 9)
+    # (N, 1) epochs against (M,) targets split along the epochs
+    states, lts = executor.run(
+        "spkezr_v", targets, ets[:, None], "J2000", "NONE", "EARTH", chunksize=2
+    )
+    exp_states, exp_lts = cyice.spkezr_v(
+        targets, ets[:, None], "J2000", "NONE", "EARTH"
+    )
+    assert states.shape == (9, 3, 6)
+    npt.assert_array_equal(states, exp_states)
+    npt.assert_array_equal(lts, exp_lts)
+    # arguments of the same length broadcast against each other
+    axes = np.random.default_rng(0).normal(size=(8, 3))
+    angles = np.linspace(0.0, np.pi, 8)[:, None]
+    npt.assert_array_equal(
+        executor.run("axisar_v", axes, angles, chunksize=1),
+        cyice.axisar_v(axes, angles),
+    )
+    npt.assert_array_equal(
+        executor.run("axisar_v", axes[:5], angles, chunksize=2),
+        cyice.axisar_v(axes[:5], angles),
+    )
+    with pytest.raises(ValueError):
+        executor.run("axisar_v", axes[:5], angles, split=(0,), chunksize=2)
+
+
+def test_parallel_dskxv_v():
+    spice.furnsh(ExtraKernels.phobosDsk)
+    lons = np.linspace(-np.pi, np.pi, 400)
+    dirs = -np.array([spice.latrec(1.0, lon, 0.3) for lon in lons])
+    vertices = -1.0e3 * dirs
+    args = (False, "PHOBOS", [], 0.0, "IAU_PHOBOS")
+    exp_xpts, exp_founds = cyice.dskxv_v(*args, vertices, dirs)
+    # start the workers after furnsh so they load the DSK as well
+    with ParallelExecutor(max_workers=2) as executor:
+        # the surface list has no per ray values, name the ray arguments to split
+        xpts, founds = executor.run(
+            "dskxv_v", *args, vertices, dirs, split=(5, 6), chunksize=64
+        )
+        assert founds.all()
+        npt.assert_array_equal(xpts, exp_xpts)
+        npt.assert_array_equal(founds, exp_founds)
+        # a single vertex broadcast against the directions
+        xpts, founds = executor.run(
+            "dskxv_v", *args, [0.0, 0.0, 1.0e3], dirs, split=(6,), chunksize=64
+        )
+    npt.assert_array_equal(xpts, cyice.dskxv_v(*args, [0.0, 0.0, 1.0e3], dirs)[0])
@@ -0,0 +1,167 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) [2015-2025] [Andrew Annex]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import pytest
+import numpy as np
+import numpy.testing as npt
+
+import spiceypy as spice
+from spiceypy import config
+
+N = 500
+
+
+def vectors(rng, n, k=3):
+    # ordinary, tiny, huge, zero and signed zero components, and vectors
+    # close to parallel and antiparallel to exercise every branch
+    v = rng.normal(size=(n, k))
+    v[::5] *= 10.0 ** rng.integers(-300, 300, size=(len(v[::5]), k))
+    v[1::5] = rng.choice([0.0, -0.0, 1.0, -1.0], size=(len(v[1::5]), k))
+    v[2::5] *= 1e-310
+    return v
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(12345)
+
+
+def same_bits(batched, singles):
+    expected = np.array(singles, dtype=np.float64)
+    result = np.asarray(batched, dtype=np.float64)
+    assert result.shape == expected.shape
+    # compare the bit patterns so signed zeros and NaNs must match as well
+    npt.assert_array_equal(result.view(np.int64), expected.view(np.int64))
+
+
+def rows(*arrays):
+    return zip(*(a.tolist() for a in arrays))
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["vadd", "vsub", "vdot", "vcrss", "vsep", "vaddg", "vsubg", "vdotg", "vsepg"],
+)
+def test_vector_pairs(rng, name):
+    a = vectors(rng, N)
+    b = np.concatenate([vectors(rng, N - 100), a[:50] * 3.0, -a[50:100] * 0.5])
+    b[N - 100 :] += 1e-9 * rng.normal(size=(100, 3))
+    f = getattr(spice, name)
+    same_bits(f(a, b), [f(x, y) for x, y in rows(a, b)])
+
+
+@pytest.mark.parametrize("name", ["vhat", "vnorm", "vhatg", "vnormg"])
+def test_vectors(rng, name):
+    a = vectors(rng, N)
+    f = getattr(spice, name)
+    same_bits(f(a), [f(x) for x, in rows(a)])
+
+
+@pytest.mark.parametrize("k", [1, 2, 4, 7])
+def test_vector_g_sizes(rng, k):
+    a, b = vectors(rng, N, k), vectors(rng, N, k)
+    for name in ["vaddg", "vsubg", "vdotg", "vsepg"]:
+        f = getattr(spice, name)
+        same_bits(f(a, b), [f(x, y) for x, y in rows(a, b)])
+    for name in ["vhatg", "vnormg"]:
+        f = getattr(spice, name)
+        same_bits(f(a), [f(x) for x, in rows(a)])
+
+
+def test_matrices(rng):
+    m1 = vectors(rng, N, 9).reshape(N, 3, 3)
+    m2 = vectors(rng, N, 9).reshape(N, 3, 3)
+    v = vectors(rng, N)
+    same_bits(spice.mxv(m1, v), [spice.mxv(m, x) for m, x in rows(m1, v)])
+    same_bits(spice.mtxv(m1, v), [spice.mtxv(m, x) for m, x in rows(m1, v)])
+    same_bits(spice.mxm(m1, m2), [spice.mxm(m, x) for m, x in rows(m1, m2)])
+    same_bits(spice.xpose(m1), [spice.xpose(m) for m, in rows(m1)])
+
+
+@pytest.mark.parametrize("shape", [(1, 1), (2, 3), (3, 2), (4, 4)])
+def test_matrices_g(rng, shape):
+    nrow, ncol = shape
+    m1 = vectors(rng, N, nrow * ncol).reshape(N, nrow, ncol)
+    m2 = vectors(rng, N, ncol * 2).reshape(N, ncol, 2)
+    v, w = vectors(rng, N, ncol), vectors(rng, N, nrow)
+    same_bits(spice.mxvg(m1, v), [spice.mxvg(m, x) for m, x in rows(m1, v)])
+    same_bits(spice.mtxvg(m1, w), [spice.mtxvg(m, x) for m, x in rows(m1, w)])
+    same_bits(spice.mxmg(m1, m2), [spice.mxmg(m, x) for m, x in rows(m1, m2)])
+    same_bits(spice.xposeg(m1), [spice.xposeg(m) for m, in rows(m1)])
+
+
+@pytest.mark.parametrize("iaxis", [-1, 0, 1, 2, 3, 4])
+def test_rotations(rng, iaxis):
+    angles = np.concatenate([rng.normal(size=N // 2), 1e6 * rng.normal(size=N // 2)])
+    m1 = vectors(rng, N, 9).reshape(N, 3, 3)
+    same_bits(
+        spice.rotate(angles, iaxis), [spice.rotate(t, iaxis) for t in angles.tolist()]
+    )
+    same_bits(
+        spice.rotmat(m1, angles, iaxis),
+        [spice.rotmat(m, t, iaxis) for m, t in zip(m1.tolist(), angles.tolist())],
+    )
+
+
+def test_vrotv(rng):
+    v, axis = vectors(rng, N), vectors(rng, N)
+    theta = rng.normal(size=N) * 10.0
+    same_bits(
+        spice.vrotv(v, axis, theta),
+        [spice.vrotv(x, y, t) for x, y, t in zip(v.tolist(), axis.tolist(), theta)],
+    )
+
+
+def test_broadcasting(rng):
+    a = vectors(rng, 12).reshape(3, 4, 3)
+    b = np.array([1.0, -2.0, 0.5])
+    npt.assert_array_equal(spice.vdot(a, b), [[spice.vdot(x, b) for x in r] for r in a])
+    m = spice.rotate(0.25, 3)
+    assert spice.mxv(m, a).shape == (3, 4, 3)
+    npt.assert_array_equal(spice.mxv(m, a)[1, 2], spice.mxv(m, a[1, 2]))
+    assert spice.vrotv(a[0], b, 0.5).shape == (4, 3)
+    assert spice.rotmat(m, np.zeros(5), 1).shape == (5, 3, 3)
+
+
+def test_dispatch(monkeypatch):
+    a = np.ones((2, 3))
+    # single vectors take the ctypes path, which returns python floats
+    assert type(spice.vdot(a[0], a[1])) is float
+    assert type(spice.vdot([1.0, 1.0, 1.0], a[1])) is float
+    # stacks run in numpy, also when given by keyword
+    npt.assert_array_equal(spice.vdot(a, a), [3.0, 3.0])
+    npt.assert_array_equal(spice.vdot(v1=a[0], v2=a), [3.0, 3.0])
+    npt.assert_array_equal(spice.rotate(np.zeros(2), 3), [np.eye(3), np.eye(3)])
+    monkeypatch.setattr(config, "use_vectormath", False)
+    with pytest.raises(TypeError):
+        spice.rotate(np.zeros(2), 3)
+
+
+def test_shape_errors():
+    with pytest.raises(ValueError):
+        spice.vdot(np.ones((2, 4)), np.ones((2, 4)))
+    with pytest.raises(ValueError):
+        spice.mxv(np.ones((2, 3, 2)), np.ones((2, 3)))
+    with pytest.raises(ValueError):
+        spice.mxmg(np.ones((2, 3, 2)), np.ones((2, 3, 2)))
@@ -0,0 +1,660 @@
+"""
+Signatures of the CSPICE functions called through ctypes.
+
+Generated from the extern declarations in cyice/cyice.pxd by
+python -m spiceypy.utils.gen_signatures, do not edit.
+
+Each entry maps a function to its return type, None for void, and its argument
+types, None for variadic functions.
+"""
+
+# fmt: off
+SIGNATURES = {
+    "appndc_c": (None, ("SpiceChar *", "SpiceCell *")),
+    "appndd_c": (None, ("SpiceDouble", "SpiceCell *")),
+    "appndi_c": (None, ("SpiceInt", "SpiceCell *")),
+    "axisar_c": (None, ("SpiceDouble[3]", "SpiceDouble", "SpiceDouble[3][3]")),
+    "azlcpo_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceDouble", "SpiceChar *", "SpiceInt", "SpiceInt", "SpiceDouble[3]", "SpiceChar *", "SpiceChar *", "SpiceDouble[6]", "SpiceDouble *")),
+    "azlrec_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceInt", "SpiceInt", "SpiceDouble[3]")),
+    "b1900_c": ("SpiceDouble", ()),
+    "b1950_c": ("SpiceDouble", ()),
+    "badkpv_c": ("SpiceInt", ("SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceInt", "SpiceInt", "SpiceChar")),
+    "bltfrm_c": (None, ("SpiceInt", "SpiceCell *")),
+    "bodc2n_c": (None, ("SpiceInt", "SpiceInt", "SpiceChar *", "SpiceInt *")),
+    "bodc2s_c": (None, ("SpiceInt", "SpiceInt", "SpiceChar *")),
+    "boddef_c": (None, ("SpiceChar *", "SpiceInt")),
+    "bodeul_": (None, ("SpiceInt *", "SpiceDouble *", "SpiceDouble *", "SpiceDouble *", "SpiceDouble *", "SpiceDouble *")),
+    "bodfnd_c": ("SpiceInt", ("SpiceInt", "SpiceChar *")),
+    "bodn2c_c": (None, ("SpiceChar *", "SpiceInt *", "SpiceInt *")),
+    "bods2c_c": (None, ("SpiceChar *", "SpiceInt *", "SpiceInt *")),
+    "bodvar_c": (None, ("SpiceInt", "SpiceChar *", "SpiceInt *", "void *")),
+    "bodvcd_c": (None, ("SpiceInt", "SpiceChar *", "SpiceInt", "SpiceInt *", "void *")),
+    "bodvrd_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceInt", "SpiceInt *", "void *")),
+    "brcktd_c": ("SpiceDouble", ("SpiceDouble", "SpiceDouble", "SpiceDouble")),
+    "brckti_c": ("SpiceInt", ("SpiceInt", "SpiceInt", "SpiceInt")),
+    "bschoc_c": ("SpiceInt", ("SpiceChar *", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceInt *")),
+    "bschoi_c": ("SpiceInt", ("SpiceInt", "SpiceInt", "SpiceInt *", "SpiceInt *")),
+    "bsrchc_c": ("SpiceInt", ("SpiceChar *", "SpiceInt", "SpiceInt", "SpiceChar *")),
+    "bsrchd_c": ("SpiceInt", ("SpiceDouble", "SpiceInt", "SpiceDouble *")),
+    "bsrchi_c": ("SpiceInt", ("SpiceInt", "SpiceInt", "SpiceInt *")),
+    "card_c": ("SpiceInt", ("SpiceCell *",)),
+    "ccifrm_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceInt *", "SpiceChar *", "SpiceInt *", "SpiceInt *")),
+    "cgv2el_c": (None, ("SpiceDouble[3]", "SpiceDouble[3]", "SpiceDouble[3]", "SpiceEllipse *")),
+    "chbder_c": (None, ("SpiceDouble *", "SpiceInt", "SpiceDouble[2]", "SpiceDouble", "SpiceInt", "SpiceDouble *", "SpiceDouble *")),
+    "chbigr_c": (None, ("SpiceInt", "SpiceDouble *", "SpiceDouble[2]", "SpiceDouble", "SpiceDouble *", "SpiceDouble *")),
+    "chbint_c": (None, ("SpiceDouble *", "SpiceInt", "SpiceDouble[2]", "SpiceDouble", "SpiceDouble *", "SpiceDouble *")),
+    "chbval_c": (None, ("SpiceDouble *", "SpiceInt", "SpiceDouble[2]", "SpiceDouble", "SpiceDouble *")),
+    "chkin_c": (None, ("SpiceChar *",)),
+    "chkout_c": (None, ("SpiceChar *",)),
+    "cidfrm_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt *", "SpiceChar *", "SpiceInt *")),
+    "ckcls_c": (None, ("SpiceInt",)),
+    "ckcov_c": (None, ("SpiceChar *", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceDouble", "SpiceChar *", "SpiceCell *")),
+    "ckfrot_c": (None, ("SpiceInt", "SpiceDouble", "SpiceDouble[3][3]", "SpiceInt *", "SpiceInt *")),
+    "ckfxfm_c": (None, ("SpiceInt", "SpiceDouble", "SpiceDouble[6][6]", "SpiceInt *", "SpiceInt *")),
+    "ckgp_c": (None, ("SpiceInt", "SpiceDouble", "SpiceDouble", "SpiceChar *", "SpiceDouble[3][3]", "SpiceDouble *", "SpiceInt *")),
+    "ckgpav_c": (None, ("SpiceInt", "SpiceDouble", "SpiceDouble", "SpiceChar *", "SpiceDouble[3][3]", "SpiceDouble[3]", "SpiceDouble *", "SpiceInt *")),
+    "ckgr02_c": (None, ("SpiceInt", "SpiceDouble[5]", "SpiceInt", "SpiceDouble[10]")),
+    "ckgr03_c": (None, ("SpiceInt", "SpiceDouble[5]", "SpiceInt", "SpiceDouble[8]")),
+    "cklpf_c": (None, ("SpiceChar *", "SpiceInt *")),
+    "ckmeta_c": (None, ("SpiceInt", "SpiceChar *", "SpiceInt *")),
+    "cknr02_c": (None, ("SpiceInt", "SpiceDouble[5]", "SpiceInt *")),
+    "cknr03_c": (None, ("SpiceInt", "SpiceDouble[5]", "SpiceInt *")),
+    "ckobj_c": (None, ("SpiceChar *", "SpiceCell *")),
+    "ckopn_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceInt", "SpiceInt *")),
+    "ckupf_c": (None, ("SpiceInt",)),
+    "ckw01_c": (None, ("SpiceInt", "SpiceDouble", "SpiceDouble", "SpiceInt", "SpiceChar *", "SpiceInt", "SpiceChar *", "SpiceInt", "SpiceDouble *", "SpiceDouble (*)[4]", "SpiceDouble (*)[3]")),
+    "ckw02_c": (None, ("SpiceInt", "SpiceDouble", "SpiceDouble", "SpiceInt", "SpiceChar *", "SpiceChar *", "SpiceInt", "SpiceDouble *", "SpiceDouble *", "SpiceDouble (*)[4]", "SpiceDouble (*)[3]", "SpiceDouble *")),
+    "ckw03_c": (None, ("SpiceInt", "SpiceDouble", "SpiceDouble", "SpiceInt", "SpiceChar *", "SpiceInt", "SpiceChar *", "SpiceInt", "SpiceDouble *", "SpiceDouble (*)[4]", "SpiceDouble (*)[3]", "SpiceInt", "SpiceDouble *")),
+    "ckw05_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceDouble", "SpiceDouble", "SpiceInt", "SpiceChar *", "SpiceInt", "SpiceChar *", "SpiceInt", "SpiceDouble *", "void *", "SpiceDouble", "SpiceInt", "SpiceDouble *")),
+    "clight_c": ("SpiceDouble", ()),
+    "clpool_c": (None, ()),
+    "cltext_": (None, ("SpiceChar *", "SpiceInt")),
+    "cmprss_c": (None, ("SpiceChar", "SpiceInt", "SpiceChar *", "SpiceInt", "SpiceChar *")),
+    "cnmfrm_c": (None, ("SpiceChar *", "SpiceInt", "SpiceInt *", "SpiceChar *", "SpiceInt *")),
+    "conics_c": (None, ("SpiceDouble[8]", "SpiceDouble", "SpiceDouble[6]")),
+    "convrt_c": (None, ("SpiceDouble", "SpiceChar *", "SpiceChar *", "SpiceDouble *")),
+    "copy_c": (None, ("SpiceCell *", "SpiceCell *")),
+    "cpos_c": ("SpiceInt", ("SpiceChar *", "SpiceChar *", "SpiceInt")),
+    "cposr_c": ("SpiceInt", ("SpiceChar *", "SpiceChar *", "SpiceInt")),
+    "cvpool_c": (None, ("SpiceChar *", "SpiceInt *")),
+    "cyllat_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble *", "SpiceDouble *", "SpiceDouble *")),
+    "cylrec_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble[3]")),
+    "cylsph_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble *", "SpiceDouble *", "SpiceDouble *")),
+    "dafac_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "void *")),
+    "dafbbs_c": (None, ("SpiceInt",)),
+    "dafbfs_c": (None, ("SpiceInt",)),
+    "dafcls_c": (None, ("SpiceInt",)),
+    "dafcs_c": (None, ("SpiceInt",)),
+    "dafdc_c": (None, ("SpiceInt",)),
+    "dafec_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceInt *", "void *", "SpiceInt *")),
+    "daffna_c": (None, ("SpiceInt *",)),
+    "daffpa_c": (None, ("SpiceInt *",)),
+    "dafgda_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceDouble *")),
+    "dafgh_c": (None, ("SpiceInt *",)),
+    "dafgn_c": (None, ("SpiceInt", "SpiceChar *")),
+    "dafgs_c": (None, ("SpiceDouble *",)),
+    "dafgsr_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceInt", "SpiceDouble *", "SpiceInt *")),
+    "dafhsf_c": (None, ("SpiceInt", "SpiceInt *", "SpiceInt *")),
+    "dafopr_c": (None, ("SpiceChar *", "SpiceInt *")),
+    "dafopw_c": (None, ("SpiceChar *", "SpiceInt *")),
+    "dafps_c": (None, ("SpiceInt", "SpiceInt", "SpiceDouble *", "SpiceInt *", "SpiceDouble *")),
+    "dafrda_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceDouble *")),
+    "dafrfr_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt *", "SpiceInt *", "SpiceChar *", "SpiceInt *", "SpiceInt *", "SpiceInt *")),
+    "dafrs_c": (None, ("SpiceDouble *",)),
+    "dafus_c": (None, ("SpiceDouble *", "SpiceInt", "SpiceInt", "SpiceDouble *", "SpiceInt *")),
+    "dasac_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "void *")),
+    "dasadc_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceInt", "SpiceInt", "void *")),
+    "dasadd_c": (None, ("SpiceInt", "SpiceInt", "SpiceDouble *")),
+    "dasadi_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt *")),
+    "dascls_c": (None, ("SpiceInt",)),
+    "dasdc_c": (None, ("SpiceInt",)),
+    "dasec_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceInt *", "void *", "SpiceInt *")),
+    "dashfn_c": (None, ("SpiceInt", "SpiceInt", "SpiceChar *")),
+    "dashfs_c": (None, ("SpiceInt", "SpiceInt *", "SpiceInt *", "SpiceInt *", "SpiceInt *", "SpiceInt *", "SpiceInt[3]", "SpiceInt[3]", "SpiceInt[3]")),
+    "daslla_c": (None, ("SpiceInt", "SpiceInt *", "SpiceInt *", "SpiceInt *")),
+    "dasllc_c": (None, ("SpiceInt",)),
+    "dasonw_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceInt", "SpiceInt *")),
+    "dasopr_c": (None, ("SpiceChar *", "SpiceInt *")),
+    "dasops_c": (None, ("SpiceInt *",)),
+    "dasopw_c": (None, ("SpiceChar *", "SpiceInt *")),
+    "dasrdc_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceInt", "SpiceInt", "SpiceInt", "void *")),
+    "dasrdd_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceDouble *")),
+    "dasrdi_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceInt *")),
+    "dasrfr_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceChar *", "SpiceInt *", "SpiceInt *", "SpiceInt *", "SpiceInt *")),
+    "dasudc_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceInt", "SpiceInt", "SpiceInt", "void *")),
+    "dasudd_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceDouble *")),
+    "dasudi_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceInt *")),
+    "daswbr_c": (None, ("SpiceInt",)),
+    "dazldr_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceInt", "SpiceInt", "SpiceDouble[3][3]")),
+    "dcyldr_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble[3][3]")),
+    "deltet_c": (None, ("SpiceDouble", "SpiceChar *", "SpiceDouble *")),
+    "det_c": ("SpiceDouble", ("SpiceDouble[3][3]",)),
+    "dgeodr_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble[3][3]")),
+    "diags2_c": (None, ("SpiceDouble[2][2]", "SpiceDouble[2][2]", "SpiceDouble[2][2]")),
+    "diff_c": (None, ("SpiceCell *", "SpiceCell *", "SpiceCell *")),
+    "dlabbs_c": (None, ("SpiceInt", "SpiceDLADescr *", "SpiceInt *")),
+    "dlabfs_c": (None, ("SpiceInt", "SpiceDLADescr *", "SpiceInt *")),
+    "dlabns_c": (None, ("SpiceInt",)),
+    "dlaens_c": (None, ("SpiceInt",)),
+    "dlafns_c": (None, ("SpiceInt", "SpiceDLADescr *", "SpiceDLADescr *", "SpiceInt *")),
+    "dlafps_c": (None, ("SpiceInt", "SpiceDLADescr *", "SpiceDLADescr *", "SpiceInt *")),
+    "dlaopn_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceInt", "SpiceInt *")),
+    "dlatdr_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble[3][3]")),
+    "dnearp_c": (None, ("SpiceDouble[6]", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble[6]", "SpiceDouble[2]", "SpiceInt *")),
+    "dp2hx_c": (None, ("SpiceDouble", "SpiceInt", "SpiceChar *", "SpiceInt *")),
+    "dpgrdr_c": (None, ("SpiceChar *", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble[3][3]")),
+    "dpmax_c": ("SpiceDouble", ()),
+    "dpmin_c": ("SpiceDouble", ()),
+    "dpr_c": ("SpiceDouble", ()),
+    "drdazl_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceInt", "SpiceInt", "SpiceDouble[3][3]")),
+    "drdcyl_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble[3][3]")),
+    "drdgeo_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble[3][3]")),
+    "drdlat_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble[3][3]")),
+    "drdpgr_c": (None, ("SpiceChar *", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble[3][3]")),
+    "drdsph_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble[3][3]")),
+    "dskb02_c": (None, ("SpiceInt", "SpiceDLADescr *", "SpiceInt *", "SpiceInt *", "SpiceInt *", "SpiceDouble[3][2]", "SpiceDouble *", "SpiceDouble[3]", "SpiceInt[3]", "SpiceInt *", "SpiceInt *", "SpiceInt *", "SpiceInt *")),
+    "dskcls_c": (None, ("SpiceInt", "SpiceInt")),
+    "dskd02_c": (None, ("SpiceInt", "SpiceDLADescr *", "SpiceInt", "SpiceInt", "SpiceInt", "SpiceInt *", "SpiceDouble *")),
+    "dskgd_c": (None, ("SpiceInt", "SpiceDLADescr *", "SpiceDSKDescr *")),
+    "dskgtl_c": (None, ("SpiceInt", "SpiceDouble *")),
+    "dski02_c": (None, ("SpiceInt", "SpiceDLADescr *", "SpiceInt", "SpiceInt", "SpiceInt", "SpiceInt *", "SpiceInt *")),
+    "dskmi2_c": (None, ("SpiceInt", "SpiceDouble (*)[3]", "SpiceInt", "SpiceInt (*)[3]", "SpiceDouble", "SpiceInt", "SpiceInt", "SpiceInt", "SpiceInt", "SpiceInt", "SpiceInt", "SpiceInt (*)[2]", "SpiceDouble *", "SpiceInt *")),
+    "dskn02_c": (None, ("SpiceInt", "SpiceDLADescr *", "SpiceInt", "SpiceDouble *")),
+    "dskobj_c": (None, ("SpiceChar *", "SpiceCell *")),
+    "dskopn_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceInt", "SpiceInt *")),
+    "dskp02_c": (None, ("SpiceInt", "SpiceDLADescr *", "SpiceInt", "SpiceInt", "SpiceInt *", "SpiceInt (*)[3]")),
+    "dskrb2_c": (None, ("SpiceInt", "SpiceDouble (*)[3]", "SpiceInt", "SpiceInt (*)[3]", "SpiceInt", "SpiceDouble *", "SpiceDouble *", "SpiceDouble *")),
+    "dsksrf_c": (None, ("SpiceChar *", "SpiceInt", "SpiceCell *")),
+    "dskstl_c": (None, ("SpiceInt", "SpiceDouble")),
+    "dskv02_c": (None, ("SpiceInt", "SpiceDLADescr *", "SpiceInt", "SpiceInt", "SpiceInt *", "SpiceDouble (*)[3]")),
+    "dskw02_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceInt", "SpiceDouble *", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceInt", "SpiceDouble (*)[3]", "SpiceInt", "SpiceInt (*)[3]", "SpiceDouble *", "SpiceInt *")),
+    "dskx02_c": (None, ("SpiceInt", "SpiceDLADescr *", "SpiceDouble[3]", "SpiceDouble[3]", "SpiceInt *", "SpiceDouble[3]", "SpiceInt *")),
+    "dskxsi_c": (None, ("SpiceInt", "SpiceChar *", "SpiceInt", "SpiceInt *", "SpiceDouble", "SpiceChar *", "SpiceDouble[3]", "SpiceDouble[3]", "SpiceInt", "SpiceInt", "SpiceDouble[3]", "SpiceInt *", "SpiceDLADescr *", "SpiceDSKDescr *", "SpiceDouble *", "SpiceInt *", "SpiceInt *")),
+    "dskxv_c": (None, ("SpiceInt", "SpiceChar *", "SpiceInt", "SpiceInt *", "SpiceDouble", "SpiceChar *", "SpiceInt", "SpiceDouble (*)[3]", "SpiceDouble (*)[3]", "SpiceDouble (*)[3]", "SpiceInt *")),
+    "dskz02_c": (None, ("SpiceInt", "SpiceDLADescr *", "SpiceInt *", "SpiceInt *")),
+    "dsphdr_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble[3][3]")),
+    "dtpool_c": (None, ("SpiceChar *", "SpiceInt *", "SpiceInt *", "SpiceChar *")),
+    "ducrss_c": (None, ("SpiceDouble[6]", "SpiceDouble[6]", "SpiceDouble[6]")),
+    "dvcrss_c": (None, ("SpiceDouble[6]", "SpiceDouble[6]", "SpiceDouble[6]")),
+    "dvdot_c": ("SpiceDouble", ("SpiceDouble[6]", "SpiceDouble[6]")),
+    "dvhat_c": (None, ("SpiceDouble[6]", "SpiceDouble[6]")),
+    "dvnorm_c": ("SpiceDouble", ("SpiceDouble[6]",)),
+    "dvpool_c": (None, ("SpiceChar *",)),
+    "dvsep_c": ("SpiceDouble", ("SpiceDouble[6]", "SpiceDouble[6]")),
+    "edlimb_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble[3]", "SpiceEllipse *")),
+    "ednmpt_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble[3]", "SpiceDouble[3]")),
+    "edpnt_c": (None, ("SpiceDouble[3]", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble[3]")),
+    "edterm_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceInt", "SpiceDouble *", "SpiceDouble[3]", "void *")),
+    "ekacec_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceInt", "SpiceInt", "void *", "SpiceInt")),
+    "ekaced_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceInt", "SpiceDouble *", "SpiceInt")),
+    "ekacei_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceInt", "SpiceInt *", "SpiceInt")),
+    "ekaclc_c": (None, ("SpiceInt", "SpiceInt", "SpiceChar *", "SpiceInt", "void *", "SpiceInt *", "SpiceInt *", "SpiceInt *", "SpiceInt *")),
+    "ekacld_c": (None, ("SpiceInt", "SpiceInt", "SpiceChar *", "SpiceDouble *", "SpiceInt *", "SpiceInt *", "SpiceInt *", "SpiceInt *")),
+    "ekacli_c": (None, ("SpiceInt", "SpiceInt", "SpiceChar *", "SpiceInt *", "SpiceInt *", "SpiceInt *", "SpiceInt *", "SpiceInt *")),
+    "ekappr_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt *")),
+    "ekbseg_c": (None, ("SpiceInt", "SpiceChar *", "SpiceInt", "SpiceInt", "void *", "SpiceInt", "void *", "SpiceInt *")),
+    "ekccnt_c": (None, ("SpiceChar *", "SpiceInt *")),
+    "ekcii_c": (None, ("SpiceChar *", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceEKAttDsc *")),
+    "ekcls_c": (None, ("SpiceInt",)),
+    "ekdelr_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt")),
+    "ekffld_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt *")),
+    "ekfind_c": (None, ("SpiceChar *", "SpiceInt", "SpiceInt *", "SpiceInt *", "SpiceChar *")),
+    "ekgc_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceInt *", "SpiceInt *")),
+    "ekgd_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceDouble *", "SpiceInt *", "SpiceInt *")),
+    "ekgi_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceInt *", "SpiceInt *", "SpiceInt *")),
+    "ekifld_c": (None, ("SpiceInt", "SpiceChar *", "SpiceInt", "SpiceInt", "SpiceInt", "void *", "SpiceInt", "void *", "SpiceInt *", "SpiceInt *")),
+    "ekinsr_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt")),
+    "eklef_c": (None, ("SpiceChar *", "SpiceInt *")),
+    "eknelt_c": ("SpiceInt", ("SpiceInt", "SpiceInt")),
+    "eknseg_c": ("SpiceInt", ("SpiceInt",)),
+    "ekntab_c": (None, ("SpiceInt *",)),
+    "ekopn_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceInt", "SpiceInt *")),
+    "ekopr_c": (None, ("SpiceChar *", "SpiceInt *")),
+    "ekops_c": (None, ("SpiceInt *",)),
+    "ekopw_c": (None, ("SpiceChar *", "SpiceInt *")),
+    "ekpsel_c": (None, ("SpiceChar *", "SpiceInt", "SpiceInt", "SpiceInt", "SpiceInt *", "SpiceInt *", "SpiceInt *", "SpiceInt *", "SpiceInt *", "void *", "void *", "SpiceInt *", "SpiceChar *")),
+    "ekrcec_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceInt", "SpiceInt *", "void *", "SpiceInt *")),
+    "ekrced_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceInt *", "SpiceDouble *", "SpiceInt *")),
+    "ekrcei_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceInt *", "SpiceInt *", "SpiceInt *")),
+    "ekssum_c": (None, ("SpiceInt", "SpiceInt", "SpiceEKSegSum *")),
+    "ektnam_c": (None, ("SpiceInt", "SpiceInt", "SpiceChar *")),
+    "ekucec_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceInt", "SpiceInt", "void *", "SpiceInt")),
+    "ekuced_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceInt", "SpiceDouble *", "SpiceInt")),
+    "ekucei_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceInt", "SpiceInt *", "SpiceInt")),
+    "ekuef_c": (None, ("SpiceInt",)),
+    "el2cgv_c": (None, ("SpiceEllipse *", "SpiceDouble[3]", "SpiceDouble[3]", "SpiceDouble[3]")),
+    "elemc_c": ("SpiceInt", ("SpiceChar *", "SpiceCell *")),
+    "elemd_c": ("SpiceInt", ("SpiceDouble", "SpiceCell *")),
+    "elemi_c": ("SpiceInt", ("SpiceInt", "SpiceCell *")),
+    "eqncpv_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceDouble[9]", "SpiceDouble", "SpiceDouble", "SpiceDouble[6]")),
+    "eqstr_c": ("SpiceInt", ("SpiceChar *", "SpiceChar *")),
+    "erract_c": (None, ("SpiceChar *", "SpiceInt", "SpiceChar *")),
+    "errch_c": (None, ("SpiceChar *", "SpiceChar *")),
+    "errdev_c": (None, ("SpiceChar *", "SpiceInt", "SpiceChar *")),
+    "errdp_c": (None, ("SpiceChar *", "SpiceDouble")),
+    "errint_c": (None, ("SpiceChar *", "SpiceInt")),
+    "errprt_c": (None, ("SpiceChar *", "SpiceInt", "SpiceChar *")),
+    "esrchc_c": ("SpiceInt", ("SpiceChar *", "SpiceInt", "SpiceInt", "void *")),
+    "et2lst_c": (None, ("SpiceDouble", "SpiceInt", "SpiceDouble", "SpiceChar *", "SpiceInt", "SpiceInt", "SpiceInt *", "SpiceInt *", "SpiceInt *", "SpiceChar *", "SpiceChar *")),
+    "et2utc_c": (None, ("SpiceDouble", "SpiceChar *", "SpiceInt", "SpiceInt", "SpiceChar *")),
+    "etcal_c": (None, ("SpiceDouble", "SpiceInt", "SpiceChar *")),
+    "eul2m_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceInt", "SpiceInt", "SpiceInt", "SpiceDouble[3][3]")),
+    "eul2xf_c": (None, ("SpiceDouble[6]", "SpiceInt", "SpiceInt", "SpiceInt", "SpiceDouble[6][6]")),
+    "ev2lin_": (None, ("SpiceDouble *", "SpiceDouble *", "SpiceDouble *", "SpiceDouble *")),
+    "evsgp4_c": (None, ("SpiceDouble", "SpiceDouble[8]", "SpiceDouble[10]", "SpiceDouble[6]")),
+    "exists_c": ("SpiceInt", ("SpiceChar *",)),
+    "expool_c": (None, ("SpiceChar *", "SpiceInt *")),
+    "failed_c": ("SpiceInt", ()),
+    "fn2lun_": (None, ("SpiceChar *", "SpiceInt *", "SpiceInt")),
+    "fovray_c": (None, ("SpiceChar *", "SpiceDouble[3]", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble *", "SpiceInt *")),
+    "fovtrg_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble *", "SpiceInt *")),
+    "frame_c": (None, ("SpiceDouble[3]", "SpiceDouble[3]", "SpiceDouble[3]")),
+    "frinfo_c": (None, ("SpiceInt", "SpiceInt *", "SpiceInt *", "SpiceInt *", "SpiceInt *")),
+    "frmnam_c": (None, ("SpiceInt", "SpiceInt", "SpiceChar *")),
+    "ftncls_c": (None, ("SpiceInt",)),
+    "furnsh_c": (None, ("SpiceChar *",)),
+    "gcpool_c": (None, ("SpiceChar *", "SpiceInt", "SpiceInt", "SpiceInt", "SpiceInt *", "void *", "SpiceInt *")),
+    "gdpool_c": (None, ("SpiceChar *", "SpiceInt", "SpiceInt", "SpiceInt *", "SpiceDouble *", "SpiceInt *")),
+    "georec_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble[3]")),
+    "getcml_c": (None, ("SpiceInt", "SpiceChar *")),
+    "getelm_c": (None, ("SpiceInt", "SpiceInt", "void *", "SpiceDouble *", "SpiceDouble *")),
+    "getfat_c": (None, ("SpiceChar *", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceChar *")),
+    "getfov_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceChar *", "SpiceDouble[3]", "SpiceInt *", "SpiceDouble (*)[3]")),
+    "getfvn_c": (None, ("SpiceChar *", "SpiceInt", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceChar *", "SpiceDouble[3]", "SpiceInt *", "SpiceDouble (*)[3]")),
+    "getmsg_c": (None, ("SpiceChar *", "SpiceInt", "SpiceChar *")),
+    "gfbail_c": ("SpiceInt", ()),
+    "gfclrh_c": (None, ()),
+    "gfdist_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceInt", "SpiceCell *", "SpiceCell *")),
+    "gfevnt_c": (None, ("UDSTEP", "UDREFN", "SpiceChar *", "SpiceInt", "SpiceInt", "void *", "void *", "SpiceDouble *", "SpiceInt *", "SpiceInt *", "SpiceChar *", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceInt", "UDREPI", "UDREPU", "UDREPF", "SpiceInt", "SpiceInt", "UDBAIL", "SpiceCell *", "SpiceCell *")),
+    "gffove_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceDouble[3]", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble", "UDSTEP", "UDREFN", "SpiceInt", "UDREPI", "UDREPU", "UDREPF", "SpiceInt", "UDBAIL", "SpiceCell *", "SpiceCell *")),
+    "gfilum_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble[3]", "SpiceChar *", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceInt", "SpiceCell *", "SpiceCell *")),
+    "gfinth_c": (None, ("SpiceInt",)),
+    "gfocce_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble", "UDSTEP", "UDREFN", "SpiceInt", "UDREPI", "UDREPU", "UDREPF", "SpiceInt", "UDBAIL", "SpiceCell *", "SpiceCell *")),
+    "gfoclt_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble", "SpiceCell *", "SpiceCell *")),
+    "gfpa_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceInt", "SpiceCell *", "SpiceCell *")),
+    "gfposc_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceInt", "SpiceCell *", "SpiceCell *")),
+    "gfrefn_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceInt", "SpiceInt", "SpiceDouble *")),
+    "gfrepf_c": (None, ()),
+    "gfrepi_c": (None, ("SpiceCell *", "SpiceChar *", "SpiceChar *")),
+    "gfrepu_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceDouble")),
+    "gfrfov_c": (None, ("SpiceChar *", "SpiceDouble[3]", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble", "SpiceCell *", "SpiceCell *")),
+    "gfrr_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceInt", "SpiceCell *", "SpiceCell *")),
+    "gfsep_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceInt", "SpiceCell *", "SpiceCell *")),
+    "gfsntc_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble[3]", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceInt", "SpiceCell *", "SpiceCell *")),
+    "gfsstp_c": (None, ("SpiceDouble",)),
+    "gfstep_c": (None, ("SpiceDouble", "SpiceDouble *")),
+    "gfstol_c": (None, ("SpiceDouble",)),
+    "gfsubc_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceInt", "SpiceCell *", "SpiceCell *")),
+    "gftfov_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble", "SpiceCell *", "SpiceCell *")),
+    "gfudb_c": (None, ("UDFUNS", "UDFUNB", "SpiceDouble", "SpiceCell *", "SpiceCell *")),
+    "gfuds_c": (None, ("UDFUNS", "UDFUNB", "SpiceChar *", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceInt", "SpiceCell *", "SpiceCell *")),
+    "gipool_c": (None, ("SpiceChar *", "SpiceInt", "SpiceInt", "SpiceInt *", "SpiceInt *", "SpiceInt *")),
+    "gnpool_c": (None, ("SpiceChar *", "SpiceInt", "SpiceInt", "SpiceInt", "SpiceInt *", "void *", "SpiceInt *")),
+    "halfpi_c": ("SpiceDouble", ()),
+    "hrmesp_c": (None, ("SpiceInt", "SpiceDouble", "SpiceDouble", "SpiceDouble *", "SpiceDouble", "SpiceDouble *", "SpiceDouble *")),
+    "hrmint_c": (None, ("SpiceInt", "SpiceDouble *", "SpiceDouble *", "SpiceDouble", "SpiceDouble *", "SpiceDouble *", "SpiceDouble *")),
+    "hx2dp_c": (None, ("SpiceChar *", "SpiceInt", "SpiceDouble *", "SpiceInt *", "SpiceChar *")),
+    "ident_c": (None, ("SpiceDouble[3][3]",)),
+    "illum_c": (None, ("SpiceChar *", "SpiceDouble", "SpiceChar *", "SpiceChar *", "SpiceDouble[3]", "SpiceDouble *", "SpiceDouble *", "SpiceDouble *")),
+    "illumf_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble[3]", "SpiceDouble *", "SpiceDouble[3]", "SpiceDouble *", "SpiceDouble *", "SpiceDouble *", "SpiceInt *", "SpiceInt *")),
+    "illumg_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble[3]", "SpiceDouble *", "SpiceDouble[3]", "SpiceDouble *", "SpiceDouble *", "SpiceDouble *")),
+    "ilumin_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceDouble", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble[3]", "SpiceDouble *", "SpiceDouble[3]", "SpiceDouble *", "SpiceDouble *", "SpiceDouble *")),
+    "inedpl_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceDouble", "SpicePlane *", "SpiceEllipse *", "SpiceInt *")),
+    "inelpl_c": (None, ("SpiceEllipse *", "SpicePlane *", "SpiceInt *", "SpiceDouble[3]", "SpiceDouble[3]")),
+    "inrypl_c": (None, ("SpiceDouble[3]", "SpiceDouble[3]", "SpicePlane *", "SpiceInt *", "SpiceDouble[3]")),
+    "insrtc_c": (None, ("SpiceChar *", "SpiceCell *")),
+    "insrtd_c": (None, ("SpiceDouble", "SpiceCell *")),
+    "insrti_c": (None, ("SpiceInt", "SpiceCell *")),
+    "inter_c": (None, ("SpiceCell *", "SpiceCell *", "SpiceCell *")),
+    "intmax_c": ("SpiceInt", ()),
+    "intmin_c": ("SpiceInt", ()),
+    "invert_c": (None, ("SpiceDouble[3][3]", "SpiceDouble[3][3]")),
+    "invort_c": (None, ("SpiceDouble[3][3]", "SpiceDouble[3][3]")),
+    "invstm_c": (None, ("SpiceDouble[6][6]", "SpiceDouble[6][6]")),
+    "irfnam_": (None, ("SpiceInt *", "SpiceChar *", "SpiceInt")),
+    "irfnum_": (None, ("SpiceChar *", "SpiceInt *", "SpiceInt")),
+    "irfrot_": (None, ("SpiceInt *", "SpiceInt *", "SpiceDouble[3][3]")),
+    "irftrn_": (None, ("SpiceChar *", "SpiceChar *", "SpiceDouble[3][3]", "SpiceInt", "SpiceInt")),
+    "isordv_c": ("SpiceInt", ("SpiceInt *", "SpiceInt")),
+    "isrchc_c": ("SpiceInt", ("SpiceChar *", "SpiceInt", "SpiceInt", "void *")),
+    "isrchd_c": ("SpiceInt", ("SpiceDouble", "SpiceInt", "SpiceDouble *")),
+    "isrchi_c": ("SpiceInt", ("SpiceInt", "SpiceInt", "SpiceInt *")),
+    "isrot_c": ("SpiceInt", ("SpiceDouble[3][3]", "SpiceDouble", "SpiceDouble")),
+    "iswhsp_c": ("SpiceInt", ("SpiceChar *",)),
+    "j1900_c": ("SpiceDouble", ()),
+    "j1950_c": ("SpiceDouble", ()),
+    "j2000_c": ("SpiceDouble", ()),
+    "j2100_c": ("SpiceDouble", ()),
+    "jyear_c": ("SpiceDouble", ()),
+    "kclear_c": (None, ()),
+    "kdata_c": (None, ("SpiceInt", "SpiceChar *", "SpiceInt", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceInt *", "SpiceInt *")),
+    "kepleq_": ("SpiceDouble", ("SpiceDouble *", "SpiceDouble *", "SpiceDouble *")),
+    "kinfo_c": (None, ("SpiceChar *", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceChar *", "SpiceInt *", "SpiceInt *")),
+    "kplfrm_c": (None, ("SpiceInt", "SpiceCell *")),
+    "kpsolv_": ("SpiceDouble", ("SpiceDouble *",)),
+    "ktotal_c": (None, ("SpiceChar *", "SpiceInt *")),
+    "kxtrct_c": (None, ("SpiceChar *", "SpiceInt", "void *", "SpiceInt", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceInt *", "SpiceChar *")),
+    "lastnb_c": ("SpiceInt", ("SpiceChar *",)),
+    "latcyl_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble *", "SpiceDouble *", "SpiceDouble *")),
+    "latrec_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble[3]")),
+    "latsph_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble *", "SpiceDouble *", "SpiceDouble *")),
+    "latsrf_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceDouble", "SpiceChar *", "SpiceInt", "SpiceDouble (*)[2]", "SpiceDouble (*)[3]")),
+    "lcase_c": (None, ("SpiceChar *", "SpiceInt", "SpiceChar *")),
+    "ldpool_c": (None, ("SpiceChar *",)),
+    "lgresp_c": ("SpiceDouble", ("SpiceInt", "SpiceDouble", "SpiceDouble", "SpiceDouble *", "SpiceDouble")),
+    "lgrind_c": (None, ("SpiceInt", "SpiceDouble *", "SpiceDouble *", "SpiceDouble *", "SpiceDouble", "SpiceDouble *", "SpiceDouble *")),
+    "lgrint_c": ("SpiceDouble", ("SpiceInt", "SpiceDouble *", "SpiceDouble *", "SpiceDouble")),
+    "limbpt_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceDouble", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble[3]", "SpiceDouble", "SpiceInt", "SpiceDouble", "SpiceDouble", "SpiceInt", "SpiceInt *", "void *", "SpiceDouble *", "void *")),
+    "lmpool_c": (None, ("void *", "SpiceInt", "SpiceInt")),
+    "lparse_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceInt", "SpiceInt", "SpiceInt *", "void *")),
+    "lparsm_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceInt", "SpiceInt", "SpiceInt *", "void *")),
+    "lparss_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceCell *")),
+    "lspcn_c": ("SpiceDouble", ("SpiceChar *", "SpiceDouble", "SpiceChar *")),
+    "lstlec_c": ("SpiceInt", ("SpiceChar *", "SpiceInt", "SpiceInt", "void *")),
+    "lstled_c": ("SpiceInt", ("SpiceDouble", "SpiceInt", "SpiceDouble *")),
+    "lstlei_c": ("SpiceInt", ("SpiceInt", "SpiceInt", "SpiceInt *")),
+    "lstltc_c": ("SpiceInt", ("SpiceChar *", "SpiceInt", "SpiceInt", "void *")),
+    "lstltd_c": ("SpiceInt", ("SpiceDouble", "SpiceInt", "SpiceDouble *")),
+    "lstlti_c": ("SpiceInt", ("SpiceInt", "SpiceInt", "SpiceInt *")),
+    "ltime_c": (None, ("SpiceDouble", "SpiceInt", "SpiceChar *", "SpiceInt", "SpiceDouble *", "SpiceDouble *")),
+    "lx4dec_c": (None, ("SpiceChar *", "SpiceInt", "SpiceInt *", "SpiceInt *")),
+    "lx4num_c": (None, ("SpiceChar *", "SpiceInt", "SpiceInt *", "SpiceInt *")),
+    "lx4sgn_c": (None, ("SpiceChar *", "SpiceInt", "SpiceInt *", "SpiceInt *")),
+    "lx4uns_c": (None, ("SpiceChar *", "SpiceInt", "SpiceInt *", "SpiceInt *")),
+    "lxqstr_c": (None, ("SpiceChar *", "SpiceChar", "SpiceInt", "SpiceInt *", "SpiceInt *")),
+    "m2eul_c": (None, ("SpiceDouble[3][3]", "SpiceInt", "SpiceInt", "SpiceInt", "SpiceDouble *", "SpiceDouble *", "SpiceDouble *")),
+    "m2q_c": (None, ("SpiceDouble[3][3]", "SpiceDouble[4]")),
+    "matchi_c": ("SpiceInt", ("SpiceChar *", "SpiceChar *", "SpiceChar", "SpiceChar")),
+    "matchw_c": ("SpiceInt", ("SpiceChar *", "SpiceChar *", "SpiceChar", "SpiceChar")),
+    "maxd_c": ("SpiceDouble", None),
+    "mequ_c": (None, ("SpiceDouble[3][3]", "SpiceDouble[3][3]")),
+    "mequg_c": (None, ("void *", "SpiceInt", "SpiceInt", "void *")),
+    "mtxm_c": (None, ("SpiceDouble[3][3]", "SpiceDouble[3][3]", "SpiceDouble[3][3]")),
+    "mtxmg_c": (None, ("void *", "void *", "SpiceInt", "SpiceInt", "SpiceInt", "void *")),
+    "mtxv_c": (None, ("SpiceDouble[3][3]", "SpiceDouble[3]", "SpiceDouble[3]")),
+    "mtxvg_c": (None, ("void *", "void *", "SpiceInt", "SpiceInt", "void *")),
+    "mxm_c": (None, ("SpiceDouble[3][3]", "SpiceDouble[3][3]", "SpiceDouble[3][3]")),
+    "mxmg_c": (None, ("void *", "void *", "SpiceInt", "SpiceInt", "SpiceInt", "void *")),
+    "mxmt_c": (None, ("SpiceDouble[3][3]", "SpiceDouble[3][3]", "SpiceDouble[3][3]")),
+    "mxmtg_c": (None, ("void *", "void *", "SpiceInt", "SpiceInt", "SpiceInt", "void *")),
+    "mxv_c": (None, ("SpiceDouble[3][3]", "SpiceDouble[3]", "SpiceDouble[3]")),
+    "mxvg_c": (None, ("void *", "void *", "SpiceInt", "SpiceInt", "void *")),
+    "namfrm_c": (None, ("SpiceChar *", "SpiceInt *")),
+    "ncpos_c": ("SpiceInt", ("SpiceChar *", "SpiceChar *", "SpiceInt")),
+    "ncposr_c": ("SpiceInt", ("SpiceChar *", "SpiceChar *", "SpiceInt")),
+    "nearpt_c": (None, ("SpiceDouble[3]", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble[3]", "SpiceDouble *")),
+    "npedln_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble[3]", "SpiceDouble[3]", "SpiceDouble[3]", "SpiceDouble *")),
+    "npelpt_c": (None, ("SpiceDouble[3]", "SpiceEllipse *", "SpiceDouble[3]", "SpiceDouble *")),
+    "nplnpt_c": (None, ("SpiceDouble[3]", "SpiceDouble[3]", "SpiceDouble[3]", "SpiceDouble[3]", "SpiceDouble *")),
+    "nvc2pl_c": (None, ("SpiceDouble[3]", "SpiceDouble", "SpicePlane *")),
+    "nvp2pl_c": (None, ("SpiceDouble[3]", "SpiceDouble[3]", "SpicePlane *")),
+    "occult_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble", "SpiceInt *")),
+    "ordc_c": ("SpiceInt", ("SpiceChar *", "SpiceCell *")),
+    "ordd_c": ("SpiceInt", ("SpiceDouble", "SpiceCell *")),
+    "orderc_c": (None, ("SpiceInt", "void *", "SpiceInt", "SpiceInt *")),
+    "orderd_c": (None, ("SpiceDouble *", "SpiceInt", "SpiceInt *")),
+    "orderi_c": (None, ("SpiceInt *", "SpiceInt", "SpiceInt *")),
+    "ordi_c": ("SpiceInt", ("SpiceInt", "SpiceCell *")),
+    "oscelt_c": (None, ("SpiceDouble[6]", "SpiceDouble", "SpiceDouble", "SpiceDouble[8]")),
+    "oscltx_c": (None, ("SpiceDouble[6]", "SpiceDouble", "SpiceDouble", "SpiceDouble *")),
+    "pckcls_c": (None, ("SpiceInt",)),
+    "pckcov_c": (None, ("SpiceChar *", "SpiceInt", "SpiceCell *")),
+    "pckfrm_c": (None, ("SpiceChar *", "SpiceCell *")),
+    "pcklof_c": (None, ("SpiceChar *", "SpiceInt *")),
+    "pckopn_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceInt", "SpiceInt *")),
+    "pckuof_c": (None, ("SpiceInt",)),
+    "pckw02_c": (None, ("SpiceInt", "SpiceInt", "SpiceChar *", "SpiceDouble", "SpiceDouble", "SpiceChar *", "SpiceDouble", "SpiceInt", "SpiceInt", "SpiceDouble *", "SpiceDouble")),
+    "pcpool_c": (None, ("SpiceChar *", "SpiceInt", "SpiceInt", "void *")),
+    "pdpool_c": (None, ("SpiceChar *", "SpiceInt", "SpiceDouble *")),
+    "pgrrec_c": (None, ("SpiceChar *", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble[3]")),
+    "phaseq_c": ("SpiceDouble", ("SpiceDouble", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *")),
+    "pi_c": ("SpiceDouble", ()),
+    "pipool_c": (None, ("SpiceChar *", "SpiceInt", "SpiceInt *")),
+    "pjelpl_c": (None, ("SpiceEllipse *", "SpicePlane *", "SpiceEllipse *")),
+    "pl2nvc_c": (None, ("SpicePlane *", "SpiceDouble[3]", "SpiceDouble *")),
+    "pl2nvp_c": (None, ("SpicePlane *", "SpiceDouble[3]", "SpiceDouble[3]")),
+    "pl2psv_c": (None, ("SpicePlane *", "SpiceDouble[3]", "SpiceDouble[3]", "SpiceDouble[3]")),
+    "pltar_c": ("SpiceDouble", ("SpiceInt", "SpiceDouble (*)[3]", "SpiceInt", "SpiceInt (*)[3]")),
+    "pltexp_c": (None, ("SpiceDouble[3][3]", "SpiceDouble", "SpiceDouble[3][3]")),
+    "pltnp_c": (None, ("SpiceDouble[3]", "SpiceDouble[3]", "SpiceDouble[3]", "SpiceDouble[3]", "SpiceDouble[3]", "SpiceDouble *")),
+    "pltnrm_c": (None, ("SpiceDouble[3]", "SpiceDouble[3]", "SpiceDouble[3]", "SpiceDouble[3]")),
+    "pltvol_c": ("SpiceDouble", ("SpiceInt", "void *", "SpiceInt", "void *")),
+    "polyds_c": (None, ("SpiceDouble *", "SpiceInt", "SpiceInt", "SpiceDouble", "SpiceDouble *")),
+    "pos_c": ("SpiceInt", ("SpiceChar *", "SpiceChar *", "SpiceInt")),
+    "posr_c": ("SpiceInt", ("SpiceChar *", "SpiceChar *", "SpiceInt")),
+    "prop2b_c": (None, ("SpiceDouble", "SpiceDouble[6]", "SpiceDouble", "SpiceDouble[6]")),
+    "prsdp_c": (None, ("SpiceChar *", "SpiceDouble *")),
+    "prsint_c": (None, ("SpiceChar *", "SpiceInt *")),
+    "psv2pl_c": (None, ("SpiceDouble[3]", "SpiceDouble[3]", "SpiceDouble[3]", "SpicePlane *")),
+    "putcml_c": (None, ("SpiceInt", "SpiceChar *")),
+    "pxform_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceDouble", "SpiceDouble[3][3]")),
+    "pxfrm2_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceDouble", "SpiceDouble", "SpiceDouble[3][3]")),
+    "q2m_c": (None, ("SpiceDouble[4]", "SpiceDouble[3][3]")),
+    "qcktrc_c": (None, ("SpiceInt", "SpiceChar *")),
+    "qderiv_c": (None, ("SpiceInt", "SpiceDouble *", "SpiceDouble *", "SpiceDouble", "SpiceDouble *")),
+    "qdq2av_c": (None, ("SpiceDouble[4]", "SpiceDouble[4]", "SpiceDouble[3]")),
+    "qxq_c": (None, ("SpiceDouble[4]", "SpiceDouble[4]", "SpiceDouble[4]")),
+    "radrec_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble[3]")),
+    "rav2xf_c": (None, ("SpiceDouble[3][3]", "SpiceDouble[3]", "SpiceDouble[6][6]")),
+    "raxisa_c": (None, ("SpiceDouble[3][3]", "SpiceDouble[3]", "SpiceDouble *")),
+    "rdtext_c": (None, ("SpiceChar *", "SpiceInt", "SpiceChar *", "SpiceInt *")),
+    "recazl_c": (None, ("SpiceDouble[3]", "SpiceInt", "SpiceInt", "SpiceDouble *", "SpiceDouble *", "SpiceDouble *")),
+    "reccyl_c": (None, ("SpiceDouble[3]", "SpiceDouble *", "SpiceDouble *", "SpiceDouble *")),
+    "recgeo_c": (None, ("SpiceDouble[3]", "SpiceDouble", "SpiceDouble", "SpiceDouble *", "SpiceDouble *", "SpiceDouble *")),
+    "reclat_c": (None, ("SpiceDouble[3]", "SpiceDouble *", "SpiceDouble *", "SpiceDouble *")),
+    "recpgr_c": (None, ("SpiceChar *", "SpiceDouble[3]", "SpiceDouble", "SpiceDouble", "SpiceDouble *", "SpiceDouble *", "SpiceDouble *")),
+    "recrad_c": (None, ("SpiceDouble[3]", "SpiceDouble *", "SpiceDouble *", "SpiceDouble *")),
+    "recsph_c": (None, ("SpiceDouble[3]", "SpiceDouble *", "SpiceDouble *", "SpiceDouble *")),
+    "removc_c": (None, ("SpiceChar *", "SpiceCell *")),
+    "removd_c": (None, ("SpiceDouble", "SpiceCell *")),
+    "removi_c": (None, ("SpiceInt", "SpiceCell *")),
+    "reordc_c": (None, ("SpiceInt *", "SpiceInt", "SpiceInt", "void *")),
+    "reordd_c": (None, ("SpiceInt *", "SpiceInt", "SpiceDouble *")),
+    "reordi_c": (None, ("SpiceInt *", "SpiceInt", "SpiceInt *")),
+    "reordl_c": (None, ("SpiceInt *", "SpiceInt", "SpiceInt *")),
+    "repmc_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceInt", "SpiceChar *")),
+    "repmct_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceInt", "SpiceChar", "SpiceInt", "SpiceChar *")),
+    "repmd_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceDouble", "SpiceInt", "SpiceInt", "SpiceChar *")),
+    "repmf_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceDouble", "SpiceInt", "SpiceChar", "SpiceInt", "SpiceChar *")),
+    "repmi_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceInt", "SpiceInt", "SpiceChar *")),
+    "repmot_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceInt", "SpiceChar", "SpiceInt", "SpiceChar *")),
+    "reset_c": (None, ()),
+    "return_c": ("SpiceInt", ()),
+    "rotate_c": (None, ("SpiceDouble", "SpiceInt", "SpiceDouble[3][3]")),
+    "rotmat_c": (None, ("SpiceDouble[3][3]", "SpiceDouble", "SpiceInt", "SpiceDouble[3][3]")),
+    "rotvec_c": (None, ("SpiceDouble[3]", "SpiceDouble", "SpiceInt", "SpiceDouble[3]")),
+    "rpd_c": ("SpiceDouble", ()),
+    "rquad_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble[2]", "SpiceDouble[2]")),
+    "saelgv_c": (None, ("SpiceDouble[3]", "SpiceDouble[3]", "SpiceDouble[3]", "SpiceDouble[3]")),
+    "scard_c": (None, ("SpiceInt", "SpiceCell *")),
+    "scdecd_c": (None, ("SpiceInt", "SpiceDouble", "SpiceInt", "SpiceChar *")),
+    "sce2c_c": (None, ("SpiceInt", "SpiceDouble", "SpiceDouble *")),
+    "sce2s_c": (None, ("SpiceInt", "SpiceDouble", "SpiceInt", "SpiceChar *")),
+    "sce2t_c": (None, ("SpiceInt", "SpiceDouble", "SpiceDouble *")),
+    "scencd_c": (None, ("SpiceInt", "SpiceChar *", "SpiceDouble *")),
+    "scfmt_c": (None, ("SpiceInt", "SpiceDouble", "SpiceInt", "SpiceChar *")),
+    "scpart_c": (None, ("SpiceInt", "SpiceInt *", "SpiceDouble *", "SpiceDouble *")),
+    "scs2e_c": (None, ("SpiceInt", "SpiceChar *", "SpiceDouble *")),
+    "sct2e_c": (None, ("SpiceInt", "SpiceDouble", "SpiceDouble *")),
+    "sctiks_c": (None, ("SpiceInt", "SpiceChar *", "SpiceDouble *")),
+    "sdiff_c": (None, ("SpiceCell *", "SpiceCell *", "SpiceCell *")),
+    "set_c": ("SpiceInt", ("SpiceCell *", "SpiceChar *", "SpiceCell *")),
+    "setmsg_c": (None, ("SpiceChar *",)),
+    "shellc_c": (None, ("SpiceInt", "SpiceInt", "void *")),
+    "shelld_c": (None, ("SpiceInt", "SpiceDouble *")),
+    "shelli_c": (None, ("SpiceInt", "SpiceInt *")),
+    "sigerr_c": (None, ("SpiceChar *",)),
+    "sincpt_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceDouble", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble[3]", "SpiceDouble[3]", "SpiceDouble *", "SpiceDouble[3]", "SpiceInt *")),
+    "size_c": ("SpiceInt", ("SpiceCell *",)),
+    "spd_c": ("SpiceDouble", ()),
+    "sphcyl_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble *", "SpiceDouble *", "SpiceDouble *")),
+    "sphlat_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble *", "SpiceDouble *", "SpiceDouble *")),
+    "sphrec_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble[3]")),
+    "spk14a_c": (None, ("SpiceInt", "SpiceInt", "SpiceDouble *", "SpiceDouble *")),
+    "spk14b_c": (None, ("SpiceInt", "SpiceChar *", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceDouble", "SpiceDouble", "SpiceInt")),
+    "spk14e_c": (None, ("SpiceInt",)),
+    "spkacs_c": (None, ("SpiceInt", "SpiceDouble", "SpiceChar *", "SpiceChar *", "SpiceInt", "SpiceDouble[6]", "SpiceDouble *", "SpiceDouble *")),
+    "spkapo_c": (None, ("SpiceInt", "SpiceDouble", "SpiceChar *", "SpiceDouble[6]", "SpiceChar *", "SpiceDouble[3]", "SpiceDouble *")),
+    "spkapp_c": (None, ("SpiceInt", "SpiceDouble", "SpiceChar *", "SpiceDouble[6]", "SpiceChar *", "SpiceDouble[6]", "SpiceDouble *")),
+    "spkaps_c": (None, ("SpiceInt", "SpiceDouble", "SpiceChar *", "SpiceChar *", "SpiceDouble[6]", "SpiceDouble[3]", "SpiceDouble[6]", "SpiceDouble *", "SpiceDouble *")),
+    "spkcls_c": (None, ("SpiceInt",)),
+    "spkcov_c": (None, ("SpiceChar *", "SpiceInt", "SpiceCell *")),
+    "spkcpo_c": (None, ("SpiceChar *", "SpiceDouble", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble[3]", "SpiceChar *", "SpiceChar *", "SpiceDouble[6]", "SpiceDouble *")),
+    "spkcpt_c": (None, ("SpiceDouble[3]", "SpiceChar *", "SpiceChar *", "SpiceDouble", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble[6]", "SpiceDouble *")),
+    "spkcvo_c": (None, ("SpiceChar *", "SpiceDouble", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble[6]", "SpiceDouble", "SpiceChar *", "SpiceChar *", "SpiceDouble[6]", "SpiceDouble *")),
+    "spkcvt_c": (None, ("SpiceDouble[6]", "SpiceDouble", "SpiceChar *", "SpiceChar *", "SpiceDouble", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble[6]", "SpiceDouble *")),
+    "spkez_c": (None, ("SpiceInt", "SpiceDouble", "SpiceChar *", "SpiceChar *", "SpiceInt", "SpiceDouble[6]", "SpiceDouble *")),
+    "spkezp_c": (None, ("SpiceInt", "SpiceDouble", "SpiceChar *", "SpiceChar *", "SpiceInt", "SpiceDouble[3]", "SpiceDouble *")),
+    "spkezr_c": (None, ("SpiceChar *", "SpiceDouble", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble[6]", "SpiceDouble *")),
+    "spkgeo_c": (None, ("SpiceInt", "SpiceDouble", "SpiceChar *", "SpiceInt", "SpiceDouble[6]", "SpiceDouble *")),
+    "spkgps_c": (None, ("SpiceInt", "SpiceDouble", "SpiceChar *", "SpiceInt", "SpiceDouble[3]", "SpiceDouble *")),
+    "spklef_c": (None, ("SpiceChar *", "SpiceInt *")),
+    "spkltc_c": (None, ("SpiceInt", "SpiceDouble", "SpiceChar *", "SpiceChar *", "SpiceDouble[6]", "SpiceDouble[6]", "SpiceDouble *", "SpiceDouble *")),
+    "spkobj_c": (None, ("SpiceChar *", "SpiceCell *")),
+    "spkopa_c": (None, ("SpiceChar *", "SpiceInt *")),
+    "spkopn_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceInt", "SpiceInt *")),
+    "spkpds_c": (None, ("SpiceInt", "SpiceInt", "SpiceChar *", "SpiceInt", "SpiceDouble", "SpiceDouble", "SpiceDouble[5]")),
+    "spkpos_c": (None, ("SpiceChar *", "SpiceDouble", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble[3]", "SpiceDouble *")),
+    "spkpvn_c": (None, ("SpiceInt", "SpiceDouble[5]", "SpiceDouble", "SpiceInt *", "SpiceDouble[6]", "SpiceInt *")),
+    "spksfs_c": (None, ("SpiceInt", "SpiceDouble", "SpiceInt", "SpiceInt *", "SpiceDouble[5]", "SpiceChar *", "SpiceInt *")),
+    "spkssb_c": (None, ("SpiceInt", "SpiceDouble", "SpiceChar *", "SpiceDouble[6]")),
+    "spksub_c": (None, ("SpiceInt", "SpiceDouble[5]", "SpiceChar *", "SpiceDouble", "SpiceDouble", "SpiceInt")),
+    "spkuds_c": (None, ("SpiceDouble[5]", "SpiceInt *", "SpiceInt *", "SpiceInt *", "SpiceInt *", "SpiceDouble *", "SpiceDouble *", "SpiceInt *", "SpiceInt *")),
+    "spkuef_c": (None, ("SpiceInt",)),
+    "spkw02_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceDouble", "SpiceDouble", "SpiceChar *", "SpiceDouble", "SpiceInt", "SpiceInt", "SpiceDouble *", "SpiceDouble")),
+    "spkw03_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceDouble", "SpiceDouble", "SpiceChar *", "SpiceDouble", "SpiceInt", "SpiceInt", "SpiceDouble *", "SpiceDouble")),
+    "spkw05_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceDouble", "SpiceDouble", "SpiceChar *", "SpiceDouble", "SpiceInt", "SpiceDouble (*)[6]", "SpiceDouble *")),
+    "spkw08_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceDouble", "SpiceDouble", "SpiceChar *", "SpiceInt", "SpiceInt", "SpiceDouble (*)[6]", "SpiceDouble", "SpiceDouble")),
+    "spkw09_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceDouble", "SpiceDouble", "SpiceChar *", "SpiceInt", "SpiceInt", "SpiceDouble (*)[6]", "SpiceDouble *")),
+    "spkw10_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceDouble", "SpiceDouble", "SpiceChar *", "SpiceDouble[8]", "SpiceInt", "SpiceDouble *", "SpiceDouble *")),
+    "spkw12_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceDouble", "SpiceDouble", "SpiceChar *", "SpiceInt", "SpiceInt", "SpiceDouble (*)[6]", "SpiceDouble", "SpiceDouble")),
+    "spkw13_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceDouble", "SpiceDouble", "SpiceChar *", "SpiceInt", "SpiceInt", "SpiceDouble (*)[6]", "SpiceDouble *")),
+    "spkw15_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceDouble", "SpiceDouble", "SpiceChar *", "SpiceDouble", "SpiceDouble[3]", "SpiceDouble[3]", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble[3]", "SpiceDouble", "SpiceDouble", "SpiceDouble")),
+    "spkw17_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceDouble", "SpiceDouble", "SpiceChar *", "SpiceDouble", "SpiceDouble[9]", "SpiceDouble", "SpiceDouble")),
+    "spkw18_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceDouble", "SpiceDouble", "SpiceChar *", "SpiceInt", "SpiceInt", "void *", "SpiceDouble *")),
+    "spkw20_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceDouble", "SpiceDouble", "SpiceChar *", "SpiceDouble", "SpiceInt", "SpiceInt", "SpiceDouble *", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble")),
+    "srfc2s_c": (None, ("SpiceInt", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceInt *")),
+    "srfcss_c": (None, ("SpiceInt", "SpiceChar *", "SpiceInt", "SpiceChar *", "SpiceInt *")),
+    "srfnrm_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceDouble", "SpiceChar *", "SpiceInt", "SpiceDouble (*)[3]", "SpiceDouble (*)[3]")),
+    "srfrec_c": (None, ("SpiceInt", "SpiceDouble", "SpiceDouble", "SpiceDouble[3]")),
+    "srfs2c_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceInt *", "SpiceInt *")),
+    "srfscc_c": (None, ("SpiceChar *", "SpiceInt", "SpiceInt *", "SpiceInt *")),
+    "srfxpt_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceDouble", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble[3]", "SpiceDouble[3]", "SpiceDouble *", "SpiceDouble *", "SpiceDouble[3]", "SpiceInt *")),
+    "ssize_c": (None, ("SpiceInt", "SpiceCell *")),
+    "stelab_c": (None, ("SpiceDouble[3]", "SpiceDouble[3]", "SpiceDouble[3]")),
+    "stlabx_c": (None, ("SpiceDouble[3]", "SpiceDouble[3]", "SpiceDouble[3]")),
+    "stpool_c": (None, ("SpiceChar *", "SpiceInt", "SpiceChar *", "SpiceInt", "SpiceChar *", "SpiceInt *", "SpiceInt *")),
+    "str2et_c": (None, ("SpiceChar *", "SpiceDouble *")),
+    "subpnt_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceDouble", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble[3]", "SpiceDouble *", "SpiceDouble[3]")),
+    "subpt_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceDouble", "SpiceChar *", "SpiceChar *", "SpiceDouble[3]", "SpiceDouble *")),
+    "subslr_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceDouble", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble[3]", "SpiceDouble *", "SpiceDouble[3]")),
+    "subsol_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceDouble", "SpiceChar *", "SpiceChar *", "SpiceDouble[3]")),
+    "sumad_c": ("SpiceDouble", ("SpiceDouble *", "SpiceInt")),
+    "sumai_c": ("SpiceInt", ("SpiceInt *", "SpiceInt")),
+    "surfnm_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble[3]", "SpiceDouble[3]")),
+    "surfpt_c": (None, ("SpiceDouble[3]", "SpiceDouble[3]", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble[3]", "SpiceInt *")),
+    "surfpv_c": (None, ("SpiceDouble[6]", "SpiceDouble[6]", "SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble[6]", "SpiceInt *")),
+    "swpool_c": (None, ("SpiceChar *", "SpiceInt", "SpiceInt", "void *")),
+    "sxform_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceDouble", "SpiceDouble[6][6]")),
+    "szpool_c": (None, ("SpiceChar *", "SpiceInt *", "SpiceInt *")),
+    "tangpt_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceDouble", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble[3]", "SpiceDouble[3]", "SpiceDouble *", "SpiceDouble *", "SpiceDouble[3]", "SpiceDouble *", "SpiceDouble[3]")),
+    "termpt_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble[3]", "SpiceDouble", "SpiceInt", "SpiceDouble", "SpiceDouble", "SpiceInt", "SpiceInt *", "void *", "SpiceDouble *", "void *")),
+    "timdef_c": (None, ("SpiceChar *", "SpiceChar *", "SpiceInt", "SpiceChar *")),
+    "timout_c": (None, ("SpiceDouble", "SpiceChar *", "SpiceInt", "SpiceChar *")),
+    "tipbod_c": (None, ("SpiceChar *", "SpiceInt", "SpiceDouble", "SpiceDouble[3][3]")),
+    "tisbod_c": (None, ("SpiceChar *", "SpiceInt", "SpiceDouble", "SpiceDouble[6][6]")),
+    "tkfram_c": (None, ("SpiceInt", "SpiceDouble[3][3]", "SpiceInt *", "SpiceInt *")),
+    "tkvrsn_c": ("SpiceChar *", ("SpiceChar *",)),
+    "tparch_c": (None, ("SpiceChar *",)),
+    "tparse_c": (None, ("SpiceChar *", "SpiceInt", "SpiceDouble *", "SpiceChar *")),
+    "tpictr_c": (None, ("SpiceChar *", "SpiceInt", "SpiceInt", "SpiceChar *", "SpiceInt *", "SpiceChar *")),
+    "trace_c": ("SpiceDouble", ("SpiceDouble[3][3]",)),
+    "trcdep_c": (None, ("SpiceInt *",)),
+    "trcnam_c": (None, ("SpiceInt", "SpiceInt", "SpiceChar *")),
+    "trcoff_c": (None, ()),
+    "trgsep_c": ("SpiceDouble", ("SpiceDouble", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceChar *")),
+    "tsetyr_c": (None, ("SpiceInt",)),
+    "twopi_c": ("SpiceDouble", ()),
+    "twovec_c": (None, ("SpiceDouble[3]", "SpiceInt", "SpiceDouble[3]", "SpiceInt", "SpiceDouble[3][3]")),
+    "twovxf_c": (None, ("SpiceDouble[6]", "SpiceInt", "SpiceDouble[6]", "SpiceInt", "SpiceDouble[6][6]")),
+    "txtopn_": (None, ("SpiceChar *", "SpiceInt *", "SpiceInt")),
+    "tyear_c": ("SpiceDouble", ()),
+    "ucase_c": (None, ("SpiceChar *", "SpiceInt", "SpiceChar *")),
+    "ucrss_c": (None, ("SpiceDouble[3]", "SpiceDouble[3]", "SpiceDouble[3]")),
+    "uddc_c": (None, ("UDFUNS", "SpiceDouble", "SpiceDouble", "SpiceInt *")),
+    "uddf_c": (None, ("UDFUNS", "SpiceDouble", "SpiceDouble", "SpiceDouble *")),
+    "udf_c": (None, ("SpiceDouble", "SpiceDouble *")),
+    "union_c": (None, ("SpiceCell *", "SpiceCell *", "SpiceCell *")),
+    "unitim_c": ("SpiceDouble", ("SpiceDouble", "SpiceChar *", "SpiceChar *")),
+    "unload_c": (None, ("SpiceChar *",)),
+    "unorm_c": (None, ("SpiceDouble[3]", "SpiceDouble[3]", "SpiceDouble *")),
+    "unormg_c": (None, ("SpiceDouble *", "SpiceInt", "SpiceDouble *", "SpiceDouble *")),
+    "utc2et_c": (None, ("SpiceChar *", "SpiceDouble *")),
+    "vadd_c": (None, ("SpiceDouble[3]", "SpiceDouble[3]", "SpiceDouble[3]")),
+    "vaddg_c": (None, ("SpiceDouble *", "SpiceDouble *", "SpiceInt", "SpiceDouble *")),
+    "valid_c": (None, ("SpiceInt", "SpiceInt", "SpiceCell *")),
+    "vcrss_c": (None, ("SpiceDouble[3]", "SpiceDouble[3]", "SpiceDouble[3]")),
+    "vdist_c": ("SpiceDouble", ("SpiceDouble[3]", "SpiceDouble[3]")),
+    "vdistg_c": ("SpiceDouble", ("SpiceDouble *", "SpiceDouble *", "SpiceInt")),
+    "vdot_c": ("SpiceDouble", ("SpiceDouble[3]", "SpiceDouble[3]")),
+    "vdotg_c": ("SpiceDouble", ("SpiceDouble *", "SpiceDouble *", "SpiceInt")),
+    "vequ_c": (None, ("SpiceDouble[3]", "SpiceDouble[3]")),
+    "vequg_c": (None, ("SpiceDouble *", "SpiceInt", "SpiceDouble *")),
+    "vhat_c": (None, ("SpiceDouble[3]", "SpiceDouble[3]")),
+    "vhatg_c": (None, ("SpiceDouble *", "SpiceInt", "SpiceDouble *")),
+    "vlcom3_c": (None, ("SpiceDouble", "SpiceDouble[3]", "SpiceDouble", "SpiceDouble[3]", "SpiceDouble", "SpiceDouble[3]", "SpiceDouble[3]")),
+    "vlcom_c": (None, ("SpiceDouble", "SpiceDouble[3]", "SpiceDouble", "SpiceDouble[3]", "SpiceDouble[3]")),
+    "vlcomg_c": (None, ("SpiceInt", "SpiceDouble", "SpiceDouble *", "SpiceDouble", "SpiceDouble *", "SpiceDouble *")),
+    "vminug_c": (None, ("SpiceDouble *", "SpiceInt", "SpiceDouble *")),
+    "vminus_c": (None, ("SpiceDouble[3]", "SpiceDouble[3]")),
+    "vnorm_c": ("SpiceDouble", ("SpiceDouble[3]",)),
+    "vnormg_c": ("SpiceDouble", ("SpiceDouble *", "SpiceInt")),
+    "vpack_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceDouble", "SpiceDouble[3]")),
+    "vperp_c": (None, ("SpiceDouble[3]", "SpiceDouble[3]", "SpiceDouble[3]")),
+    "vprjp_c": (None, ("SpiceDouble[3]", "SpicePlane *", "SpiceDouble[3]")),
+    "vprjpi_c": (None, ("SpiceDouble[3]", "SpicePlane *", "SpicePlane *", "SpiceDouble[3]", "SpiceInt *")),
+    "vproj_c": (None, ("SpiceDouble[3]", "SpiceDouble[3]", "SpiceDouble[3]")),
+    "vprojg_c": (None, ("SpiceDouble *", "SpiceDouble *", "SpiceInt", "SpiceDouble *")),
+    "vrel_c": ("SpiceDouble", ("SpiceDouble[3]", "SpiceDouble[3]")),
+    "vrelg_c": ("SpiceDouble", ("SpiceDouble *", "SpiceDouble *", "SpiceInt")),
+    "vrotv_c": (None, ("SpiceDouble[3]", "SpiceDouble[3]", "SpiceDouble", "SpiceDouble[3]")),
+    "vscl_c": (None, ("SpiceDouble", "SpiceDouble[3]", "SpiceDouble[3]")),
+    "vsclg_c": (None, ("SpiceDouble", "SpiceDouble *", "SpiceInt", "SpiceDouble *")),
+    "vsep_c": ("SpiceDouble", ("SpiceDouble[3]", "SpiceDouble[3]")),
+    "vsepg_c": ("SpiceDouble", ("SpiceDouble *", "SpiceDouble *", "SpiceInt")),
+    "vsub_c": (None, ("SpiceDouble[3]", "SpiceDouble[3]", "SpiceDouble[3]")),
+    "vsubg_c": (None, ("SpiceDouble *", "SpiceDouble *", "SpiceInt", "SpiceDouble *")),
+    "vtmv_c": ("SpiceDouble", ("SpiceDouble[3]", "SpiceDouble[3][3]", "SpiceDouble[3]")),
+    "vtmvg_c": ("SpiceDouble", ("SpiceDouble *", "void *", "SpiceDouble *", "SpiceInt", "SpiceInt")),
+    "vupack_c": (None, ("SpiceDouble[3]", "SpiceDouble *", "SpiceDouble *", "SpiceDouble *")),
+    "vzero_c": ("SpiceInt", ("SpiceDouble[3]",)),
+    "vzerog_c": ("SpiceInt", ("SpiceDouble *", "SpiceInt")),
+    "wncard_c": ("SpiceInt", ("SpiceCell *",)),
+    "wncomd_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceCell *", "SpiceCell *")),
+    "wncond_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceCell *")),
+    "wndifd_c": (None, ("SpiceCell *", "SpiceCell *", "SpiceCell *")),
+    "wnelmd_c": ("SpiceInt", ("SpiceDouble", "SpiceCell *")),
+    "wnexpd_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceCell *")),
+    "wnextd_c": (None, ("SpiceChar", "SpiceCell *")),
+    "wnfetd_c": (None, ("SpiceCell *", "SpiceInt", "SpiceDouble *", "SpiceDouble *")),
+    "wnfild_c": (None, ("SpiceDouble", "SpiceCell *")),
+    "wnfltd_c": (None, ("SpiceDouble", "SpiceCell *")),
+    "wnincd_c": ("SpiceInt", ("SpiceDouble", "SpiceDouble", "SpiceCell *")),
+    "wninsd_c": (None, ("SpiceDouble", "SpiceDouble", "SpiceCell *")),
+    "wnintd_c": (None, ("SpiceCell *", "SpiceCell *", "SpiceCell *")),
+    "wnreld_c": ("SpiceInt", ("SpiceCell *", "SpiceChar *", "SpiceCell *")),
+    "wnsumd_c": (None, ("SpiceCell *", "SpiceDouble *", "SpiceDouble *", "SpiceDouble *", "SpiceInt *", "SpiceInt *")),
+    "wnunid_c": (None, ("SpiceCell *", "SpiceCell *", "SpiceCell *")),
+    "wnvald_c": (None, ("SpiceInt", "SpiceInt", "SpiceCell *")),
+    "writln_": (None, ("SpiceChar *", "SpiceInt *", "SpiceInt")),
+    "xf2eul_c": (None, ("SpiceDouble[6][6]", "SpiceInt", "SpiceInt", "SpiceInt", "SpiceDouble[6]", "SpiceInt *")),
+    "xf2rav_c": (None, ("SpiceDouble[6][6]", "SpiceDouble[3][3]", "SpiceDouble[3]")),
+    "xfmsta_c": (None, ("SpiceDouble[6]", "SpiceChar *", "SpiceChar *", "SpiceChar *", "SpiceDouble[6]")),
+    "xpose6_c": (None, ("SpiceDouble[6][6]", "SpiceDouble[6][6]")),
+    "xpose_c": (None, ("SpiceDouble[3][3]", "SpiceDouble[3][3]")),
+    "xposeg_c": (None, ("void *", "SpiceInt", "SpiceInt", "void *")),
+    "zzdynrot_": (None, ("SpiceInt *", "SpiceInt *", "SpiceDouble *", "SpiceDouble[3][3]", "SpiceInt *")),
+    "zzgetcml_c": (None, ("SpiceInt", "SpiceChar *", "SpiceInt")),
+    "zzgfsavh_c": (None, ("SpiceInt",)),
+}
+# fmt: on
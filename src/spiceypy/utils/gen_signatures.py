@@ -0,0 +1,210 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) [2015-2025] [Andrew Annex]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+# Generates cspice_signatures.py, the signature table of the ctypes functions,
+# from the extern declarations in cyice/cyice.pxd:
+#
+#     python -m spiceypy.utils.gen_signatures
+#
+# With --check the table is compared to the declarations instead of written,
+# the exit status is 1 if the table needs to be generated again.
+
+import argparse
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+PXD = Path(__file__).resolve().parent.parent / "cyice" / "cyice.pxd"
+TABLE = Path(__file__).resolve().parent / "cspice_signatures.py"
+
+# a signature is the return type, None for void, and the argument types, None
+# for variadic functions whose arguments ctypes must not check
+Signature = Tuple[Optional[str], Optional[Tuple[str, ...]]]
+
+# the pxd types reduced to the types ctypes distinguishes
+_BASES = {
+    "SpiceInt": "SpiceInt",
+    "ConstSpiceInt": "SpiceInt",
+    "SpiceBoolean": "SpiceInt",
+    "ConstSpiceBoolean": "SpiceInt",
+    "int": "SpiceInt",
+    "SpiceDouble": "SpiceDouble",
+    "ConstSpiceDouble": "SpiceDouble",
+    "double": "SpiceDouble",
+    "SpiceChar": "SpiceChar",
+    "ConstSpiceChar": "SpiceChar",
+    "char": "SpiceChar",
+    "ConstSpiceDLADescr": "SpiceDLADescr",
+    "ConstSpiceDSKDescr": "SpiceDSKDescr",
+    "ConstSpiceEllipse": "SpiceEllipse",
+    "ConstSpicePlane": "SpicePlane",
+    "void": "void",
+}
+
+_DECLARATION = re.compile(r"^\s*cdef\s+([\w ]+?)\s*(\**)\s*(\w+_c|\w+_)\s*\(", re.M)
+_ARGUMENT = re.compile(
+    r"^(?:const\s+)?(\w+)\s*(\**)\s*(?:\(\s*\*\s*\w*\s*\))?"
+    r"\s*((?:\[\d+\]\s*)*)\w*\s*((?:\[\d+\]\s*)*)$"
+)
+
+_HEADER = '''"""
+Signatures of the CSPICE functions called through ctypes.
+
+Generated from the extern declarations in cyice/cyice.pxd by
+python -m spiceypy.utils.gen_signatures, do not edit.
+
+Each entry maps a function to its return type, None for void, and its argument
+types, None for variadic functions.
+"""
+
+# fmt: off
+SIGNATURES = {
+'''
+
+
+def _normalize(text: str) -> str:
+    """
+    Reduce a pxd type to the type passed by ctypes: the const qualifiers,
+    SpiceBoolean and parameter names are dropped.
+
+    :param text: parameter or return type declaration
+    :return: normalized type, for example "SpiceDouble (*)[3]"
+    """
+    text = " ".join(text.split())
+    match = _ARGUMENT.match(text)
+    if match is None:
+        raise ValueError(f"unsupported declaration {text!r}")
+    base, stars, dims, named_dims = match.groups()
+    base = _BASES.get(base, base)
+    dims = "".join((dims + named_dims).split())
+    if "(" in text:
+        return f"{base} (*){dims}"
+    if dims:
+        return f"{base}{dims}"
+    if stars:
+        return f"{base} {stars}"
+    return base
+
+
+def _split(arguments: str) -> List[str]:
+    # split at the commas outside of parentheses
+    parts, depth, current = [], 0, ""
+    for char in arguments:
+        depth += char == "("
+        depth -= char == ")"
+        if char == "," and depth == 0:
+            parts.append(current)
+            current = ""
+        else:
+            current += char
+    parts.append(current)
+    return [part.strip() for part in parts if part.strip()]
+
+
+def declarations(text: str) -> Iterator[Tuple[str, str, List[str]]]:
+    """
+    Find the CSPICE function declarations of a pxd file.
+
+    :param text: contents of the pxd file
+    :return: function name, return type and argument declarations of each function
+    """
+    text = "\n".join(line.split("#")[0] for line in text.splitlines())
+    for match in _DECLARATION.finditer(text):
+        restype, stars, name = match.groups()
+        # the argument list ends at the parenthesis closing the one opened above
+        depth, end = 1, match.end()
+        while depth:
+            depth += text[end] == "("
+            depth -= text[end] == ")"
+            end += 1
+        yield name, restype + stars, _split(text[match.end() : end - 1])
+
+
+def parse_pxd(text: str) -> Dict[str, Signature]:
+    """
+    Read the CSPICE function declarations of a pxd file.
+
+    :param text: contents of the pxd file
+    :return: signature of each declared function, by function name
+    """
+    signatures = {}
+    for name, restype, arguments in declarations(text):
+        if name in signatures:
+            raise ValueError(f"{name} is declared twice")
+        restype = None if restype == "void" else _normalize(restype)
+        if arguments and arguments[-1] == "...":
+            argtypes = None
+        else:
+            argtypes = tuple(_normalize(argument) for argument in arguments)
+        signatures[name] = (restype, argtypes)
+    return signatures
+
+
+def _literal(value: Optional[Union[str, Tuple[str, ...]]]) -> str:
+    if value is None:
+        return "None"
+    if isinstance(value, str):
+        return f'"{value}"'
+    return f"({', '.join(map(_literal, value))}{',' if len(value) == 1 else ''})"
+
+
+def render(signatures: Dict[str, Signature]) -> str:
+    """
+    Write the signature table module, one line per function.
+
+    :param signatures: signature of each function, by function name
+    :return: source of cspice_signatures.py
+    """
+    lines = [_HEADER.rstrip("\n")]
+    for name in sorted(signatures):
+        restype, argtypes = signatures[name]
+        lines.append(f'    "{name}": ({_literal(restype)}, {_literal(argtypes)}),')
+    lines.append("}")
+    lines.append("# fmt: on")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="generate cspice_signatures.py from cyice.pxd"
+    )
+    parser.add_argument("--pxd", type=Path, default=PXD)
+    parser.add_argument("--output", type=Path, default=TABLE)
+    parser.add_argument(
+        "--check", action="store_true", help="compare instead of writing"
+    )
+    args = parser.parse_args(argv)
+    source = render(parse_pxd(args.pxd.read_text()))
+    if args.check:
+        if not args.output.exists() or args.output.read_text() != source:
+            print(f"{args.output} is out of date", file=sys.stderr)
+            return 1
+        return 0
+    args.output.write_text(source)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1058 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) [2015-2025] [Andrew Annex]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+# Generates cyice_wrappers.pxi, the _s, _v and dispatching cyice wrappers of
+# the CSPICE functions listed in WRAPPERS, from their prototypes in
+# cyice/cyice.pxd. The build runs it before cythonizing cyice.pyx, which
+# includes the generated file:
+#
+#     python src/spiceypy/utils/gen_wrappers.py build/cyice_wrappers.pxi
+#
+# The wrappers take the arguments of the spiceypy function of the same name
+# and reuse its docstring. The prototypes must be the ones of SpiceZpr.h,
+# const qualifiers and parameter names included, as they tell the inputs
+# from the outputs. Supported arguments are numbers, booleans, characters,
+# strings, vectors, matrices, planes, ellipses and windows as inputs, and
+# numbers, vectors, matrices, ellipses, found flags, strings and windows as
+# outputs. Planes and ellipses are passed as arrays of the doubles of their
+# CSPICE structs, windows as arrays of their interval endpoints. A string
+# output takes its length from the last integer input before it, which
+# keeps the default of the spiceypy argument.
+#
+# Functions taking windows, functions without inputs or outputs and the ones
+# in _UNBATCHED get a single wrapper named like the spiceypy function rather
+# than _s, _v and dispatching ones.
+#
+# The script only uses the standard library so that it runs before spiceypy
+# or CSPICE are installed.
+
+import argparse
+import ast
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+try:
+    from .gen_signatures import PXD, declarations
+except ImportError:  # run as a script by the build
+    from gen_signatures import PXD, declarations
+
+SOURCE = Path(__file__).resolve().parent.parent / "spiceypy.py"
+
+# CSPICE functions wrapped by the generated code
+WRAPPERS = (
+    # bodies and frames
+    "bodfnd_c",
+    "bodn2c_c",
+    "bods2c_c",
+    "namfrm_c",
+    # 3-vectors
+    "ucrss_c",
+    "unorm_c",
+    "vadd_c",
+    "vcrss_c",
+    "vdist_c",
+    "vdot_c",
+    "vhat_c",
+    "vlcom_c",
+    "vlcom3_c",
+    "vminus_c",
+    "vnorm_c",
+    "vpack_c",
+    "vperp_c",
+    "vproj_c",
+    "vrel_c",
+    "vrotv_c",
+    "vscl_c",
+    "vsep_c",
+    "vsub_c",
+    "vtmv_c",
+    "vupack_c",
+    "vzero_c",
+    # states
+    "ducrss_c",
+    "dvcrss_c",
+    "dvdot_c",
+    "dvhat_c",
+    "dvnorm_c",
+    "dvsep_c",
+    # 3x3 matrices
+    "det_c",
+    "invert_c",
+    "mtxm_c",
+    "mtxv_c",
+    "mxm_c",
+    "mxmt_c",
+    "mxv_c",
+    "rotate_c",
+    "rotmat_c",
+    "rotvec_c",
+    "trace_c",
+    "xpose_c",
+    # rotations and attitude
+    "axisar_c",
+    "eul2m_c",
+    "eul2xf_c",
+    "m2eul_c",
+    "m2q_c",
+    "q2m_c",
+    "qdq2av_c",
+    "qxq_c",
+    "rav2xf_c",
+    "raxisa_c",
+    "twovec_c",
+    "twovxf_c",
+    "xf2eul_c",
+    "xf2rav_c",
+    # coordinate jacobians
+    "dazldr_c",
+    "dcyldr_c",
+    "dgeodr_c",
+    "dlatdr_c",
+    "dpgrdr_c",
+    "drdazl_c",
+    "drdcyl_c",
+    "drdgeo_c",
+    "drdlat_c",
+    "drdpgr_c",
+    "drdsph_c",
+    "dsphdr_c",
+    # ellipsoids, rays and planes
+    "edlimb_c",
+    "ednmpt_c",
+    "edpnt_c",
+    "inrypl_c",
+    "nearpt_c",
+    "npedln_c",
+    "surfnm_c",
+    "surfpt_c",
+    # light time and aberration
+    "ltime_c",
+    "spkacs_c",
+    "spkaps_c",
+    "spkltc_c",
+    "stelab_c",
+    "stlabx_c",
+    # plates
+    "pltexp_c",
+    "pltnp_c",
+    "pltnrm_c",
+    # windows
+    "wncard_c",
+    "wncomd_c",
+    "wncond_c",
+    "wndifd_c",
+    "wnelmd_c",
+    "wnexpd_c",
+    "wnextd_c",
+    "wnfetd_c",
+    "wnfild_c",
+    "wnfltd_c",
+    "wnincd_c",
+    "wninsd_c",
+    "wnintd_c",
+    "wnreld_c",
+    "wnsumd_c",
+    "wnunid_c",
+    "wnvald_c",
+    # geometry finders
+    "gfdist_c",
+    "gfilum_c",
+    "gfoclt_c",
+    "gfpa_c",
+    "gfposc_c",
+    "gfrfov_c",
+    "gfrr_c",
+    "gfsep_c",
+    "gfsntc_c",
+    "gfstol_c",
+    "gfsubc_c",
+    "gftfov_c",
+    # E-kernels
+    "ekappr_c",
+    "ekccnt_c",
+    "ekcls_c",
+    "ekdelr_c",
+    "ekfind_c",
+    "ekgc_c",
+    "ekgd_c",
+    "ekgi_c",
+    "ekinsr_c",
+    "eklef_c",
+    "eknelt_c",
+    "eknseg_c",
+    "ekntab_c",
+    "ekopn_c",
+    "ekopr_c",
+    "ekops_c",
+    "ekopw_c",
+    "ektnam_c",
+    "ekuef_c",
+)
+
+# functions with inputs and outputs that are called one set of arguments at a
+# time: they open files, run queries, append records, or, for ektnam, look up
+# one of the few loaded tables
+_UNBATCHED = {
+    "ekappr_c",
+    "ekfind_c",
+    "eklef_c",
+    "ekopn_c",
+    "ekopr_c",
+    "ekopw_c",
+    "ektnam_c",
+}
+# windows the functions update in place, returned as new windows by the wrappers
+_UPDATED_CELLS = {
+    "wncond_c": "window",
+    "wnexpd_c": "window",
+    "wnextd_c": "window",
+    "wnfild_c": "window",
+    "wnfltd_c": "window",
+    "wninsd_c": "window",
+    "wnvald_c": "window",
+}
+# spiceypy arguments giving a size the windows must be able to hold, wnvald
+# sets the size of its window to it
+_CELL_SIZES = {"wnvald_c": "insize"}
+
+# names used by the generated code itself
+_RESERVED = {"i", "n", "shape", "out", "astuple", "errors", "size"}
+
+_ARGUMENT = re.compile(r"^(\w+)\s*((?:\[\d+\])*)\s*(\*?)\s*(\w+)$")
+
+# python annotations of the scalar and vectorized forms of each kind of value
+_ANNOTATIONS = {
+    "double": ("float", "Double_N"),
+    "int": ("int", "Int_N"),
+    "bool": ("bool", "Found_N"),
+    "string": ("str", "String_N"),
+    "char": ("str", "str"),
+    "length": ("int", "int"),
+    "cell": ("Window", "Window"),
+}
+_ARRAY_ANNOTATIONS = {
+    (3,): ("Vector", "Vector_N"),
+    (6,): ("State", "State_N"),
+    (3, 3): ("Matrix_3", "Matrix_N_3"),
+    (6, 6): ("Matrix_6", "Matrix_N_6"),
+}
+# CSPICE structs passed as arrays of doubles, by size and fields
+_STRUCTS = {
+    "SpicePlane": (4, "the normal vector and the constant"),
+    "SpiceEllipse": (9, "the center, semi-major and semi-minor axes"),
+}
+# boolean inputs are flags rather than found flags
+_INPUT_ANNOTATIONS = {"bool": ("bool", "Bool_N")}
+
+
+class Argument(NamedTuple):
+    """
+    An input or output of a wrapped function.
+
+    kind is one of double, int, bool, char, string, length, cell or array,
+    shape is the shape of an array and () otherwise. name is the name of the
+    parameter in the spiceypy function for inputs and the CSPICE parameter
+    name for outputs, "value" for the return value. struct is the CSPICE
+    struct an array stands for, if any. length is the input giving the size
+    of a string output, default the default value of an input.
+    """
+
+    name: str
+    kind: str
+    shape: Tuple[int, ...] = ()
+    struct: str = ""
+    length: str = ""
+    default: str = ""
+
+
+class Wrapper(NamedTuple):
+    """
+    A CSPICE function and the spiceypy function whose interface it gets.
+    """
+
+    cname: str
+    name: str
+    restype: Optional[str]
+    inputs: List[Argument]
+    outputs: List[Argument]
+    # the CSPICE arguments, by kind and name
+    arguments: List[Tuple[str, Argument]]
+    summary: List[str]
+    url: str
+    params: Dict[str, List[str]]
+    returns: List[str]
+    # whether the function gets _s, _v and dispatching wrappers
+    batched: bool
+
+    @property
+    def found(self) -> bool:
+        return any(o.name == "found" for o in self.outputs)
+
+    @property
+    def resized(self) -> List[Argument]:
+        """
+        The windows the wrappers return, whose size the caller may give.
+        """
+        return [a for d, a in self.arguments if a.kind == "cell" and d != "in"]
+
+
+def _classify(cname: str, text: str) -> Tuple[str, Argument]:
+    # direction and kind of a CSPICE parameter from its declaration
+    match = _ARGUMENT.match(" ".join(text.split()))
+    if match is None:
+        raise ValueError(f"{cname}: unsupported parameter {text!r}")
+    base, dims, star, name = match.groups()
+    shape = tuple(int(d) for d in re.findall(r"\d+", dims))
+    if shape and not star and base in ("SpiceDouble", "ConstSpiceDouble"):
+        return ("in" if base.startswith("Const") else "out"), Argument(
+            name, "array", shape
+        )
+    if not shape and not star:
+        kind = {
+            "SpiceDouble": "double",
+            "SpiceInt": "int",
+            "SpiceBoolean": "bool",
+            "SpiceChar": "char",
+        }
+        if base in kind:
+            return "in", Argument(name, kind[base])
+    if not shape and star and base in ("SpiceCell", "ConstSpiceCell"):
+        # the direction of a window depends on the spiceypy function
+        return "cell", Argument(name, "cell")
+    if not shape and star and base.replace("Const", "", 1) in _STRUCTS:
+        struct = base.replace("Const", "", 1)
+        return ("in" if base.startswith("Const") else "out"), Argument(
+            name, "array", (_STRUCTS[struct][0],), struct
+        )
+    if not shape and star:
+        kind = {
+            "ConstSpiceChar": "string",
+            "SpiceChar": "string",
+            "SpiceDouble": "double",
+            "SpiceInt": "int",
+            "SpiceBoolean": "bool",
+        }.get(base)
+        if kind is not None:
+            return ("in" if base == "ConstSpiceChar" else "out"), Argument(name, kind)
+    raise ValueError(f"{cname}: unsupported parameter {text!r}")
+
+
+def _docstring(name: str, function: ast.FunctionDef) -> Tuple[list, str, dict, list]:
+    # summary, NAIF url, parameter and return descriptions of a spiceypy function
+    doc = ast.get_docstring(function)
+    if doc is None:
+        raise ValueError(f"{name} has no docstring")
+    summary, url, params, returns = [], "", {}, []
+    current = summary
+    for line in doc.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("https://"):
+            url = stripped
+        elif stripped.startswith(":param "):
+            param, _, text = stripped[len(":param ") :].partition(":")
+            current = params[param.strip()] = [text.strip()]
+        elif stripped.startswith(":return:"):
+            current = returns
+            returns.append(stripped[len(":return:") :].strip())
+        elif not url:
+            summary.append(stripped)
+        elif stripped:
+            current.append(stripped)
+    while summary and not summary[-1]:
+        summary.pop()
+    return summary, url, params, [r for r in returns if r]
+
+
+def wrappers(
+    pxd: Path = PXD, source: Path = SOURCE, names: Tuple[str, ...] = WRAPPERS
+) -> List[Wrapper]:
+    """
+    Describe the wrappers of the given CSPICE functions.
+
+    :param pxd: pxd file holding the CSPICE prototypes
+    :param source: spiceypy.py, for the argument names and docstrings
+    :param names: CSPICE function names
+    :return: the wrappers, in the order of names
+    """
+    prototypes = {
+        name: (restype, arguments)
+        for name, restype, arguments in declarations(pxd.read_text())
+    }
+    functions = {
+        node.name: node
+        for node in ast.parse(source.read_text()).body
+        if isinstance(node, ast.FunctionDef)
+    }
+    result = []
+    for cname in names:
+        if cname not in prototypes:
+            raise ValueError(f"{cname} is not declared in {pxd.name}")
+        restype, declared = prototypes[cname]
+        name = cname[: -len("_c")]
+        if name not in functions:
+            raise ValueError(f"{name} is not a spiceypy function")
+        function = functions[name]
+        # the result cells spiceypy creates when none is given become outputs
+        pyargs = [
+            a
+            for a in function.args.args
+            if a.annotation is None
+            or ast.unparse(a.annotation) != "Optional[SpiceCell]"
+        ]
+        given = sum(
+            a.annotation is not None and ast.unparse(a.annotation) == "SpiceCell"
+            for a in pyargs
+        )
+        defaults = {
+            a.arg: ast.unparse(d)
+            for a, d in zip(
+                function.args.args[
+                    len(function.args.args) - len(function.args.defaults) :
+                ],
+                function.args.defaults,
+            )
+        }
+        arguments = []
+        for direction, argument in (_classify(cname, text) for text in declared):
+            # the windows spiceypy takes come first, the others are results
+            if direction == "cell":
+                if argument.name == _UPDATED_CELLS.get(cname):
+                    direction = "inout"
+                else:
+                    direction = "in" if given else "out"
+                given -= direction != "out"
+            elif direction == "out" and argument.kind == "string":
+                # sized by the last integer input before it
+                sizes = [
+                    k
+                    for k, (d, a) in enumerate(arguments)
+                    if d == "in" and a.kind == "int"
+                ]
+                if not sizes:
+                    raise ValueError(f"{cname}: no length given for {argument.name}")
+                length = arguments[sizes[-1]][1]._replace(kind="length")
+                arguments[sizes[-1]] = ("in", length)
+                argument = argument._replace(length=length.name)
+            arguments.append((direction, argument))
+        # the inputs take the names of the spiceypy arguments, in the same order
+        pynames = [a.arg for a in pyargs]
+        cinputs = [a for d, a in arguments if d in ("in", "inout")]
+        if len(pynames) != len(cinputs):
+            raise ValueError(
+                f"{name} takes {len(pynames)} arguments but {cname} has {len(cinputs)} inputs"
+            )
+        renamed = dict(zip((a.name for a in cinputs), pynames))
+        for k, (d, a) in enumerate(arguments):
+            if d in ("in", "inout"):
+                a = a._replace(
+                    name=renamed[a.name], default=defaults.get(renamed[a.name], "")
+                )
+            if a.length:
+                a = a._replace(length=renamed[a.length])
+            arguments[k] = (d, a)
+        inputs = [a for d, a in arguments if d in ("in", "inout")]
+        outputs = [a for d, a in arguments if d in ("out", "inout")]
+        if restype != "void":
+            kind = {"SpiceDouble": "double", "SpiceInt": "int", "SpiceBoolean": "bool"}
+            if restype not in kind:
+                raise ValueError(f"{cname}: unsupported return type {restype}")
+            outputs.insert(0, Argument("value", kind[restype]))
+        batched = (
+            cname not in _UNBATCHED
+            and bool(inputs)
+            and bool(outputs)
+            and all(a.kind not in ("cell", "char") for _, a in arguments)
+        )
+        results = [a for d, a in arguments if d == "out"]
+        clashes = ({a.name for a in inputs} & {o.name for o in results}) | (
+            {a.name for a in inputs + results} & (_RESERVED if batched else {"size"})
+        )
+        if clashes:
+            raise ValueError(f"{cname}: argument names {sorted(clashes)} clash")
+        summary, url, params, returns = _docstring(name, functions[name])
+        missing = [a.name for a in inputs if a.name not in params]
+        if missing:
+            raise ValueError(f"{name} does not document {missing}")
+        result.append(
+            Wrapper(
+                cname,
+                name,
+                restype,
+                inputs,
+                outputs,
+                arguments,
+                summary,
+                url,
+                params,
+                returns,
+                batched,
+            )
+        )
+    return result
+
+
+def _annotation(argument: Argument, vectorized: bool, inputs: bool = False) -> str:
+    if inputs and argument.kind in _INPUT_ANNOTATIONS:
+        pair = _INPUT_ANNOTATIONS[argument.kind]
+    elif argument.kind == "array":
+        pair = _ARRAY_ANNOTATIONS.get(argument.shape, ("np.ndarray", "np.ndarray"))
+    else:
+        pair = _ANNOTATIONS[argument.kind]
+    return pair[vectorized]
+
+
+def _returns(outputs: List[Argument], vectorized: bool) -> str:
+    types = [_annotation(o, vectorized) for o in outputs]
+    if not types:
+        return "None"
+    return types[0] if len(types) == 1 else f"tuple[{', '.join(types)}]"
+
+
+def _default(argument: Argument) -> str:
+    return f"={argument.default}" if argument.default else ""
+
+
+def _doc(
+    wrapper: Wrapper, first: List[str], extra: List[str], notes: Tuple[str, ...] = ()
+) -> List[str]:
+    # docstring lines of a wrapper, indented for the function body, first
+    # goes before the summary and notes after it
+    lines = ['"""', *first, *wrapper.summary, "", *notes, wrapper.url, ""]
+    for argument in wrapper.inputs:
+        text = wrapper.params[argument.name]
+        lines.append(f":param {argument.name}: {text[0]}")
+        lines.extend(f"    {line}" for line in text[1:])
+        if argument.struct:
+            lines.append(f"    {_struct_doc(argument)}")
+    lines.extend(extra)
+    if wrapper.returns:
+        lines.append(f":return: {wrapper.returns[0]}")
+        lines.extend(f"    {line}" for line in wrapper.returns[1:])
+        lines.extend(f"    {_struct_doc(o)}" for o in wrapper.outputs if o.struct)
+    lines.append('"""')
+    return [f"    {line}".rstrip() for line in lines]
+
+
+def _struct_doc(argument: Argument) -> str:
+    size, fields = _STRUCTS[argument.struct]
+    return f"The {argument.struct} {argument.name} is an array of {size} doubles, {fields}."
+
+
+def _pointer(argument: Argument, const: bool, address: str) -> str:
+    # pointer argument to a CSPICE function, cast when it points to a struct
+    if not argument.struct:
+        return address
+    return f"<{'Const' if const else ''}{argument.struct} *> {address}"
+
+
+def _matrix_cast(shape: Tuple[int, ...], const: bool) -> str:
+    return f"<{'ConstSpiceDouble' if const else 'SpiceDouble'} (*)[{shape[1]}]> "
+
+
+def _scalar_param(argument: Argument) -> str:
+    # parameter of a _s or single wrapper taking one value
+    ctype = {
+        "double": "double",
+        "int": "int",
+        "length": "int",
+        "bool": "bint",
+        "string": "const char*",
+        "char": "str",
+    }.get(argument.kind)
+    if ctype is None:
+        return argument.name
+    return f"{ctype} {argument.name}{_default(argument)}"
+
+
+def _scalar_output(output: Argument, body: List[str], returned: List[str]) -> None:
+    # declaration and returned value of a number, flag or string output of a
+    # _s or single wrapper
+    name = output.name
+    if output.kind == "double":
+        body.append(f"cdef double c_{name} = 0.0")
+        returned.append(f"c_{name}")
+    elif output.kind == "int":
+        body.append(f"cdef SpiceInt c_{name} = 0")
+        returned.append(f"c_{name}")
+    elif output.kind == "bool":
+        body.append(f"cdef SpiceBoolean c_{name} = SPICEFALSE")
+        returned.append(f"PyBool_FromLong(c_{name})")
+    else:
+        body.append(f"cdef bytearray b_{name} = bytearray({output.length})")
+        body.append(f"cdef char* c_{name} = b_{name}")
+        returned.append(
+            f'PyUnicode_DecodeUTF8(c_{name}, strlen(c_{name}), "replace").rstrip()'
+        )
+
+
+def _scalar(wrapper: Wrapper) -> List[str]:
+    """
+    The _s wrapper: converts the inputs, calls the function once and checks
+    the error status once.
+    """
+    params, body, call = [], [], []
+    for argument in wrapper.inputs:
+        name = argument.name
+        params.append(_scalar_param(argument))
+        if argument.kind == "array":
+            view = "[::1]" if len(argument.shape) == 1 else "[:, ::1]"
+            value = f"_struct_values({name})" if argument.struct else name
+            body.append(
+                f'cdef const np.double_t{view} c_{name} = _core_array({value}, {argument.shape}, "{name}")'
+            )
+    returned = []
+    arrays = [o for o in wrapper.outputs if o.kind == "array"]
+    for output in wrapper.outputs:
+        name = output.name
+        if output.kind == "array":
+            rows, cols = (*output.shape, 0)[:2]
+            shape = f"{arrays.index(output)}, {len(arrays)}, {rows}, {cols}"
+            body.append(f"cdef double[{rows * (cols or 1)}] t_{name}")
+            body.append(
+                f"cdef np.ndarray p_{name} = _scalar_output(out, astuple, {shape})"
+            )
+            body.append(f"cdef double* c_{name} = _output_data(p_{name}, t_{name})")
+            returned.append(f"_scalar_result(p_{name}, c_{name}, {rows}, {cols})")
+        else:
+            _scalar_output(output, body, returned)
+    for direction, argument in wrapper.arguments:
+        name = argument.name
+        if direction == "in":
+            if argument.kind != "array":
+                call.append(name)
+            elif len(argument.shape) == 1:
+                call.append(_pointer(argument, True, f"&c_{name}[0]"))
+            else:
+                call.append(f"{_matrix_cast(argument.shape, True)}&c_{name}[0, 0]")
+        elif argument.kind == "string":
+            call.append(f"c_{name}")
+        elif argument.kind != "array":
+            call.append(f"&c_{name}")
+        elif len(argument.shape) == 1:
+            call.append(_pointer(argument, False, f"c_{name}"))
+        else:
+            call.append(f"{_matrix_cast(argument.shape, False)}c_{name}")
+    extra = []
+    if arrays:
+        params.extend(["*", "object out=None", "bint astuple=False"])
+        extra = [
+            ":param out: Optional preallocated output arrays, one per returned array.",
+            ":param astuple: Return arrays as tuples of floats instead.",
+        ]
+    lines = ["@boundscheck(False)", "@wraparound(False)"]
+    if wrapper.found:
+        lines.append("@cyice_found_exception_thrower")
+    lines.append(f"def {wrapper.name}_s(")
+    lines.append(",\n".join(f"    {p}" for p in params))
+    lines.append(f"    ) -> {_returns(wrapper.outputs, False)}:")
+    lines.extend(
+        _doc(
+            wrapper,
+            [
+                f"Scalar version of :py:meth:`~spiceypy.cyice.cyice.{wrapper.name}`",
+                "",
+            ],
+            extra,
+        )
+    )
+    lines.extend(f"    {line}" for line in body)
+    lines.append("    with _cspice:")
+    assign = "c_value = " if wrapper.restype != "void" else ""
+    lines.append(f"        {assign}{wrapper.cname}(")
+    lines.append(",\n".join(f"            {c}" for c in call))
+    lines.append("        )")
+    lines.append("        check_for_spice_error()")
+    lines.append(f"    return {', '.join(returned)}")
+    return lines
+
+
+def _vectorized(wrapper: Wrapper) -> List[str]:
+    """
+    The _v wrapper: broadcasts the inputs against each other and calls the
+    function for each element in one loop without the GIL.
+    """
+    shapes, body, call, after = [], [], [], []
+    strings = any(o.kind == "string" for o in wrapper.outputs)
+    broadcast = [a for a in wrapper.inputs if a.kind != "length"]
+    for argument in wrapper.inputs:
+        if argument.struct:
+            body.append(f"{argument.name} = _struct_values({argument.name})")
+    for argument in broadcast:
+        name = argument.name
+        if argument.kind == "array":
+            core = len(argument.shape)
+            shapes.append(
+                f"_outer_shape({name})"
+                if core == 1
+                else f"_outer_shape({name}, {core})"
+            )
+        else:
+            shapes.append(f"np.shape({name})")
+    body.append("# broadcast the arguments against each other")
+    body.append(f"cdef tuple shape = np.broadcast_shapes({', '.join(shapes)})")
+    body.append("cdef Py_ssize_t i, n = _shape_size(shape)")
+    body.append("# initialize c variables")
+    width = max(len(a.name) for a in broadcast)
+    for argument in broadcast:
+        name = argument.name
+        pad = " " * (width - len(name))
+        if argument.kind == "array":
+            cls = "_VecArg" if len(argument.shape) == 1 else "_MatArg"
+            body.append(
+                f"cdef {cls} c_{name}{pad} = {cls}({name}, shape, {argument.shape[0]})"
+            )
+        else:
+            cls = {
+                "double": "_DblArg",
+                "int": "_IntArg",
+                "bool": "_IntArg",
+                "string": "_StrArg",
+            }[argument.kind]
+            body.append(f"cdef {cls} c_{name}{pad} = {cls}({name}, shape)")
+    if strings:
+        body.append("cdef tuple c_out = None")
+    else:
+        body.append(f"cdef tuple c_out = _check_out(out, {len(wrapper.outputs)})")
+    body.append("# initialize output arrays")
+    for k, output in enumerate(wrapper.outputs):
+        name = output.name
+        if output.kind == "string":
+            # one null terminated string per element
+            body.append(
+                f"cdef np.ndarray p_{name} = np.zeros((n, {output.length}), dtype=np.uint8)"
+            )
+            body.append(f"cdef np.uint8_t[:, ::1] c_{name} = p_{name}")
+        elif output.kind == "array":
+            body.append(
+                f"cdef np.ndarray p_{name} = _output(c_out, {k}, shape + {output.shape}, np.double)"
+            )
+            view = ", ".join([":"] * len(output.shape) + ["::1"])
+            dims = ", ".join(["n"] + [str(d) for d in output.shape])
+            body.append(f"cdef np.double_t[{view}] c_{name} = p_{name}.reshape({dims})")
+        elif output.kind == "double":
+            body.append(
+                f"cdef np.ndarray p_{name} = _output(c_out, {k}, shape, np.double)"
+            )
+            body.append(f"cdef np.double_t[::1] c_{name} = p_{name}.reshape(n)")
+        elif output.kind == "int":
+            body.append(
+                f"cdef np.ndarray p_{name} = _output(c_out, {k}, shape, np.int32)"
+            )
+            body.append(f"cdef np.int32_t[::1] c_{name} = p_{name}.reshape(n)")
+        else:
+            body.append(
+                f"cdef np.ndarray p_{name} = _output(c_out, {k}, shape, np.bool_)"
+            )
+            body.append(
+                f"cdef np.uint8_t[::1] c_{name} = p_{name}.reshape(n).view(np.uint8)"
+            )
+            if name != "value":
+                body.append(f"cdef SpiceBoolean c_{name}_i = SPICEFALSE")
+                after.append(f"c_{name}[i] = c_{name}_i")
+    body.append("cdef _ErrorCapture c_errors = _ErrorCapture(errors, shape)")
+    for direction, argument in wrapper.arguments:
+        name = argument.name
+        if direction == "in":
+            if argument.kind == "length":
+                call.append(name)
+            elif argument.kind == "array" and len(argument.shape) == 2:
+                call.append(f"{_matrix_cast(argument.shape, True)}c_{name}.at(i)")
+            else:
+                call.append(_pointer(argument, True, f"c_{name}.at(i)"))
+        elif argument.kind == "string":
+            call.append(f"<char *> &c_{name}[i, 0]")
+        elif argument.kind == "array":
+            if len(argument.shape) == 1:
+                call.append(_pointer(argument, False, f"&c_{name}[i, 0]"))
+            else:
+                call.append(f"{_matrix_cast(argument.shape, False)}&c_{name}[i, 0, 0]")
+        elif argument.kind == "int":
+            call.append(f"<SpiceInt *> &c_{name}[i]")
+        elif argument.kind == "bool":
+            call.append(f"&c_{name}_i")
+        else:
+            call.append(f"&c_{name}[i]")
+    epochs = "c_et" if any(a.name == "et" for a in wrapper.inputs) else "None"
+    returned = [
+        f"_strings(p_{o.name}, shape)" if o.kind == "string" else f"p_{o.name}"
+        for o in wrapper.outputs
+    ]
+    returned = returned[0] if len(returned) == 1 else f"({', '.join(returned)})"
+    lines = ["@boundscheck(False)", "@wraparound(False)"]
+    if wrapper.found:
+        lines.append("@cyice_found_exception_thrower")
+    lines.append(f"def {wrapper.name}_v(")
+    for argument in wrapper.inputs:
+        if argument.kind == "length":
+            lines.append(f"    {_scalar_param(argument)},")
+        else:
+            lines.append(f"    {argument.name},")
+    lines.append("    *,")
+    if not strings:
+        lines.append("    object out=None,")
+    lines.append('    str errors="raise"')
+    lines.append(f"    ) -> {_returns(wrapper.outputs, True)}:")
+    options = (
+        "the string lengths and the error option"
+        if strings
+        else "the output and error options"
+    )
+    doc = [
+        f"All arguments except {options} broadcast against each other",
+        "following NumPy rules"
+        + (
+            ", string arguments may be arrays of names."
+            if any(a.kind == "string" for a in wrapper.inputs)
+            else "."
+        ),
+        "",
+    ]
+    extra = [':param errors: Error handling mode, "raise" (default) or "mask".']
+    if not strings:
+        extra.insert(
+            0,
+            ":param out: Optional preallocated output arrays, one per returned array.",
+        )
+    lines.extend(
+        _doc(
+            wrapper,
+            [
+                f"Vectorized version of :py:meth:`~spiceypy.cyice.cyice.{wrapper.name}`",
+                "",
+                *doc,
+            ],
+            extra,
+        )
+    )
+    lines.extend(f"    {line}" for line in body)
+    lines.append("    # main loop")
+    lines.append("    with _cspice:")
+    lines.append("        with nogil:")
+    lines.append("            for i in range(n):")
+    assign = "c_value[i] = " if wrapper.restype != "void" else ""
+    lines.append(f"                {assign}{wrapper.cname}(")
+    lines.append(",\n".join(f"                    {c}" for c in call))
+    lines.append("                )")
+    lines.extend(f"                {line}" for line in after)
+    lines.append("                if c_errors.capture(i):")
+    lines.append("                    break")
+    lines.append(f"        c_errors.check({epochs})")
+    lines.append(f"        return c_errors.finish({returned})")
+    return lines
+
+
+def _dispatcher(wrapper: Wrapper) -> List[str]:
+    """
+    The wrapper calling _v when any argument holds several values and _s
+    otherwise.
+    """
+    params, tests = [], []
+    for argument in wrapper.inputs:
+        scalar, vectorized = (
+            _annotation(argument, False, inputs=True),
+            _annotation(argument, True, inputs=True),
+        )
+        union = scalar if scalar == vectorized else f"{scalar} | {vectorized}"
+        default = f" = {argument.default}" if argument.default else ""
+        params.append(f"    {argument.name}: {union}{default}")
+        if argument.kind != "length":
+            tests.append(f"_batched({argument.name}, {len(argument.shape)})")
+    names = ", ".join(a.name for a in wrapper.inputs)
+    lines = [f"def {wrapper.name}("]
+    lines.append(",\n".join(params))
+    lines.append(
+        f"    ) -> {_returns(wrapper.outputs, False)} | {_returns(wrapper.outputs, True)}:"
+    )
+    lines.extend(_doc(wrapper, [], []))
+    lines.extend(
+        f"    {a.name} = _struct_values({a.name})" for a in wrapper.inputs if a.struct
+    )
+    lines.append(f"    if {' or '.join(tests)}:")
+    lines.append(f"        return {wrapper.name}_v({names})")
+    lines.append("    else:")
+    lines.append(f"        return {wrapper.name}_s({names})")
+    return lines
+
+
+def _single(wrapper: Wrapper) -> List[str]:
+    """
+    The wrapper of a function that is not batched: converts the inputs,
+    calls the function once without the GIL and checks the error status.
+    """
+    params, body, call, returned = [], [], [], []
+    for argument in wrapper.inputs:
+        name = argument.name
+        params.append(_scalar_param(argument))
+        if argument.kind == "char":
+            body.append(f'cdef char c_{name} = _char({name}, "{name}")')
+        elif argument.kind == "array":
+            view = "[::1]" if len(argument.shape) == 1 else "[:, ::1]"
+            value = f"_struct_values({name})" if argument.struct else name
+            body.append(
+                f'cdef const np.double_t{view} c_{name} = _core_array({value}, {argument.shape}, "{name}")'
+            )
+    extra = []
+    if wrapper.resized:
+        params.extend(["*", "object size=None"])
+        needed = " + ".join(
+            f"len({a.name})" for a in wrapper.inputs if a.kind == "cell"
+        )
+        needed = f"{needed} + 2" if needed else "0"
+        if wrapper.cname in _CELL_SIZES:
+            needed = f"max({needed}, {_CELL_SIZES[wrapper.cname]})"
+        body.append(f"cdef Py_ssize_t c_size = _window_size(size, {needed})")
+        extra = [
+            ":param size: Number of endpoints the returned windows can hold, at least 2000",
+            "    by default and enough for the endpoints of the given windows.",
+        ]
+    for direction, argument in wrapper.arguments:
+        name = argument.name
+        if argument.kind == "cell":
+            value, capacity = (
+                ("None", "c_size")
+                if direction == "out"
+                else (name, "0" if direction == "in" else "c_size")
+            )
+            body.append(
+                f'cdef _Window w_{name} = _Window({value}, {capacity}, "{name}")'
+            )
+    for output in wrapper.outputs:
+        if output.kind == "cell":
+            returned.append(f"w_{output.name}.values()")
+        elif output.kind == "array":
+            raise ValueError(f"{wrapper.cname}: array outputs must be batched")
+        else:
+            _scalar_output(output, body, returned)
+    for direction, argument in wrapper.arguments:
+        name = argument.name
+        if argument.kind == "cell":
+            call.append(f"&w_{name}.cell")
+        elif direction == "in":
+            if argument.kind == "char":
+                call.append(f"c_{name}")
+            elif argument.kind != "array":
+                call.append(name)
+            elif len(argument.shape) == 1:
+                call.append(_pointer(argument, True, f"&c_{name}[0]"))
+            else:
+                call.append(f"{_matrix_cast(argument.shape, True)}&c_{name}[0, 0]")
+        elif argument.kind == "string":
+            call.append(f"c_{name}")
+        else:
+            call.append(f"&c_{name}")
+    notes = ()
+    if wrapper.resized:
+        notes = (
+            "Windows are given as arrays of their interval endpoints, or as spiceypy",
+            "SpiceCell, and returned as new arrays, the given windows are left unchanged.",
+            "",
+        )
+    elif any(a.kind == "cell" for _, a in wrapper.arguments):
+        notes = (
+            "Windows are given as arrays of their interval endpoints, or as spiceypy",
+            "SpiceCell.",
+            "",
+        )
+    lines = []
+    if wrapper.found:
+        lines.append("@cyice_found_exception_thrower")
+    if params:
+        lines.append(f"def {wrapper.name}(")
+        lines.append(",\n".join(f"    {p}" for p in params))
+        lines.append(f"    ) -> {_returns(wrapper.outputs, False)}:")
+    else:
+        lines.append(f"def {wrapper.name}() -> {_returns(wrapper.outputs, False)}:")
+    lines.extend(_doc(wrapper, [], extra, notes))
+    lines.extend(f"    {line}" for line in body)
+    lines.append("    with _cspice:")
+    lines.append("        with nogil:")
+    assign = "c_value = " if wrapper.restype != "void" else ""
+    lines.append(f"            {assign}{wrapper.cname}(")
+    lines.append(",\n".join(f"                {c}" for c in call))
+    lines.append("            )")
+    lines.append("        check_for_spice_error()")
+    if returned:
+        lines.append(f"    return {', '.join(returned)}")
+    return lines
+
+
+_HEADER = """\
+# Wrappers of CSPICE functions generated from their prototypes in cyice.pxd by
+# spiceypy/utils/gen_wrappers.py, do not edit. cyice.pyx includes this file.
+
+"""
+
+
+def render(generated: List[Wrapper]) -> str:
+    """
+    Write the wrappers, three functions per batched CSPICE function and one
+    per other function.
+
+    :param generated: the wrappers
+    :return: source of cyice_wrappers.pxi
+    """
+    parts = [_HEADER.rstrip("\n")]
+    parts.append(
+        "GENERATED = (\n"
+        + "".join(
+            f'    "{name}",\n'
+            for wrapper in generated
+            for name in (
+                (wrapper.name, f"{wrapper.name}_s", f"{wrapper.name}_v")
+                if wrapper.batched
+                else (wrapper.name,)
+            )
+        )
+        + ")"
+    )
+    for wrapper in generated:
+        if wrapper.batched:
+            functions = (_scalar(wrapper), _vectorized(wrapper), _dispatcher(wrapper))
+        else:
+            functions = (_single(wrapper),)
+        for lines in functions:
+            parts.append("\n".join(lines))
+    return "\n\n\n".join(parts) + "\n"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="generate the cyice wrappers from the prototypes in cyice.pxd"
+    )
+    parser.add_argument("output", type=Path)
+    parser.add_argument("--pxd", type=Path, default=PXD)
+    parser.add_argument("--source", type=Path, default=SOURCE)
+    args = parser.parse_args(argv)
+    source = render(wrappers(args.pxd, args.source))
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    # leave an up to date file alone so the build does not cythonize again
+    if not args.output.exists() or args.output.read_text() != source:
+        args.output.write_text(source)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
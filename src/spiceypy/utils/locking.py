@@ -0,0 +1,95 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) [2015-2025] [Andrew Annex]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import functools
+import threading
+from time import perf_counter
+from typing import Dict, Union
+
+__all__ = ["SpiceLock", "spice_lock"]
+
+
+class SpiceLock:
+    """
+    Process wide, reentrant lock serializing calls into CSPICE.
+
+    CSPICE keeps the kernel pool, its caches and the error status in global
+    variables, so only one thread at a time may be inside the library. The
+    ctypes wrappers and the cyice functions hold this lock from the first
+    CSPICE call until the error status of that call has been checked, while
+    threads that are not calling SPICE keep running in parallel. The same
+    thread may take the lock again, which happens when spiceypy functions
+    are called from gf search callbacks.
+
+    Contention is counted while holding the lock: contentions is the number
+    of acquisitions that had to wait for another thread and wait_time the
+    total time in seconds spent waiting.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        # acquire without waiting, True on success
+        self.try_acquire = functools.partial(self._lock.acquire, False)
+        self.release = self._lock.release
+        self.contentions = 0
+        self.wait_time = 0.0
+
+    def acquire(self) -> bool:
+        """
+        Acquire the lock, blocking until it is available.
+
+        :return: True
+        """
+        if not self.try_acquire():
+            start = perf_counter()
+            self._lock.acquire()
+            self.contentions += 1
+            self.wait_time += perf_counter() - start
+        return True
+
+    def __enter__(self) -> "SpiceLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.release()
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Return the contention counters.
+
+        :return: dict with the contentions count and the wait_time in seconds
+        """
+        return {"contentions": self.contentions, "wait_time": self.wait_time}
+
+    def reset_stats(self) -> None:
+        """
+        Reset the contention counters to zero.
+        """
+        with self:
+            self.contentions = 0
+            self.wait_time = 0.0
+
+
+spice_lock = SpiceLock()
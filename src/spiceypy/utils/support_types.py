@@ -67,6 +67,43 @@ from numpy import ctypeslib as numpc
 # Collection of supporting functions for wrapper functions
 __author__ = "AndrewAnnex"
 
+_float64 = numpy.dtype(numpy.float64)
+_int32 = numpy.dtype(numpy.int32)
+
+# ctypes array types by element type and numpy shape
+_array_types = {}
+
+# c_char_p of the input strings seen so far, see string_to_char_p
+_char_p_cache = {}
+_CHAR_P_CACHE_SIZE = 4096
+
+
+def _ctypes_array_type(ctype, shape):
+    try:
+        return _array_types[ctype, shape]
+    except KeyError:
+        tp = ctype
+        for dim in reversed(shape):
+            tp = tp * dim
+        _array_types[ctype, shape] = tp
+        return tp
+
+
+def _ndarray_to_ctypes(param, dtype, ctype):
+    """
+    Copy a numpy array into a new ctypes array of the same shape.
+
+    Copying a C contiguous array with from_buffer_copy is faster than the
+    memory sharing numpy.ctypeslib.as_ctypes for the small vectors and
+    matrices spice takes, and also works for read only and strided arrays.
+    Values are cast with same_kind casting like before.
+    """
+    if param.dtype != dtype or not param.flags.c_contiguous:
+        param = numpy.ascontiguousarray(
+            param.astype(dtype, casting="same_kind", copy=False)
+        )
+    return _ctypes_array_type(ctype, param.shape).from_buffer_copy(param)
+
 
 def to_double_vector(x):
     return DoubleArray.from_param(param=x)
@@ -150,6 +187,11 @@ def c_vector_to_python(x):
     :param x: ctypes array
     :return: Iterable
     """
+    element = getattr(x, "_type_", None)
+    if element is c_double:
+        return numpy.frombuffer(x, dtype=numpy.float64).copy()
+    elif element is c_int:
+        return numpy.frombuffer(x, dtype=numpy.int32).copy()
     if isinstance(x[0], bool):
         return numpy.frombuffer(x, dtype=numpy.bool_).copy()
     elif isinstance(x[0], int):
@@ -178,6 +220,10 @@ def string_to_char_p(inobject, inlen: int | None = None):
     """
     convert a python string to a char_p
 
+    Input strings are encoded once and the c_char_p is reused for the same
+    string afterwards, so spice must never write into the result of a
+    string. Output buffers are made by passing their length as an int.
+
     :param inobject: input string, int for getting null string of length of int
     :param inlen: optional parameter, length of a given string can be specified
     :return:
@@ -187,12 +233,20 @@ def string_to_char_p(inobject, inlen: int | None = None):
     if isinstance(inobject, bytes):
         return inobject
     if isinstance(inobject, c_int):
-        return string_to_char_p(" " * inobject.value)
+        return c_char_p(b" " * inobject.value)
     if isinstance(inobject, int):
-        return string_to_char_p(" " * inobject)
-    if isinstance(inobject, numpy.str_):
-        return c_char_p(inobject.encode(encoding="utf-8"))
-    return c_char_p(inobject.encode(encoding="UTF-8"))
+        return c_char_p(b" " * inobject)
+    if not isinstance(inobject, str):
+        return c_char_p(inobject.encode(encoding="UTF-8"))
+    try:
+        return _char_p_cache[inobject]
+    except KeyError:
+        pass
+    char_p = c_char_p(str(inobject).encode(encoding="UTF-8"))
+    if len(_char_p_cache) >= _CHAR_P_CACHE_SIZE:
+        _char_p_cache.clear()
+    _char_p_cache[inobject] = char_p
+    return char_p
 
 
 def list_to_char_array(arg, x_len=None, y_len=None):
@@ -239,12 +293,7 @@ class DoubleArrayType:
 
     # Cast from a numpy array,
     def from_ndarray(self, param):
-        # return param.data_as(POINTER(c_double))
-        # the above older method does not work with
-        # functions which take vectors of known size
-        return numpc.as_ctypes(
-            param.astype(numpy.float64, casting="same_kind", copy=False)
-        )
+        return _ndarray_to_ctypes(param, _float64, c_double)
 
 
 class DoubleMatrixType:
@@ -272,9 +321,7 @@ class DoubleMatrixType:
 
     # Cast from a numpy array
     def from_ndarray(self, param):
-        return numpc.as_ctypes(
-            param.astype(numpy.float64, casting="same_kind", copy=False)
-        )
+        return _ndarray_to_ctypes(param, _float64, c_double)
 
 
 class IntArrayType:
@@ -305,9 +352,7 @@ class IntArrayType:
     # Cast from a numpy array
     def from_ndarray(self, param):
         # cspice always uses a int size half as big as the float, ie int32 if a float64 system default
-        return numpc.as_ctypes(
-            param.astype(numpy.int32, casting="same_kind", copy=False)
-        )
+        return _ndarray_to_ctypes(param, _int32, c_int)
 
 
 class IntMatrixType:
@@ -336,9 +381,7 @@ class IntMatrixType:
     # Cast from a numpy array
     def from_ndarray(self, param):
         # cspice always uses a int size half as big as the float, ie int32 if a float64 system default
-        return numpc.as_ctypes(
-            param.astype(numpy.int32, casting="same_kind", copy=False)
-        )
+        return _ndarray_to_ctypes(param, _int32, c_int)
 
 
 DoubleArray = DoubleArrayType()
@@ -0,0 +1,571 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) [2015-2025] [Andrew Annex]
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+NumPy versions of the CSPICE vector and matrix routines.
+
+Vectors are the last axis of an array and matrices the last two, any leading
+axes are a stack of vectors or matrices that broadcast against each other.
+The operations are done in the order CSPICE does them, so that each element
+is bit for bit the result of the C routine: sums are written out rather than
+left to numpy.dot or numpy.sum, whose order and use of fused multiply-add
+differ, and sin, cos and asin are taken from the math module, as numpy may
+use its own SIMD versions that differ from the C library in the last bit.
+
+spiceypy.spiceypy calls these functions when an argument is a numpy array
+holding more than one vector, matrix or angle, see config.use_vectormath.
+"""
+
+import math
+from typing import Callable, Iterable, Tuple, Union
+
+import numpy
+from numpy import ndarray
+
+__all__ = [
+    "mtxv",
+    "mtxvg",
+    "mxm",
+    "mxmg",
+    "mxv",
+    "mxvg",
+    "rotate",
+    "rotmat",
+    "vadd",
+    "vaddg",
+    "vcrss",
+    "vdot",
+    "vdotg",
+    "vhat",
+    "vhatg",
+    "vnorm",
+    "vnormg",
+    "vrotv",
+    "vsep",
+    "vsepg",
+    "vsub",
+    "vsubg",
+    "xpose",
+    "xposeg",
+]
+
+ArrayLike = Union[ndarray, Iterable, float]
+
+# CSPICE returns inf and NaN without notice, so does this module
+_quiet = numpy.errstate(all="ignore")
+
+
+def _vectors(v: ArrayLike, size: int = 3) -> ndarray:
+    v = numpy.asarray(v, dtype=numpy.float64)
+    if v.ndim < 1 or (size and v.shape[-1] != size):
+        raise ValueError(
+            f"expected vectors of size {size or 'n'} along the last axis, got shape {v.shape}"
+        )
+    return v
+
+
+def _matrices(m: ArrayLike, shape: Tuple[int, int] = (3, 3)) -> ndarray:
+    m = numpy.asarray(m, dtype=numpy.float64)
+    if m.ndim < 2 or (shape[0] and m.shape[-2:] != shape):
+        raise ValueError(
+            f"expected {shape[0] or 'n'}x{shape[1] or 'm'} matrices along the last two axes, got shape {m.shape}"
+        )
+    return m
+
+
+def _scalar(x: ndarray) -> Union[ndarray, float]:
+    # numpy scalar for the result of a single vector, like the ctypes wrappers
+    return x[()] if x.ndim == 0 else x
+
+
+def _libm(func: Callable[[float], float], x: ArrayLike) -> Union[ndarray, float]:
+    # func from the math module, which calls the C library as CSPICE does
+    if numpy.ndim(x) == 0:
+        return func(x)
+    x = numpy.asarray(x, dtype=numpy.float64)
+    values = numpy.fromiter(map(func, x.ravel().tolist()), numpy.float64, x.size)
+    return values.reshape(x.shape)
+
+
+def _asin(x: float) -> float:
+    # NaN outside [-1, 1] like the C library instead of raising
+    return math.asin(x) if -1.0 <= x <= 1.0 else math.nan
+
+
+def _maxabs(v: ndarray) -> ndarray:
+    a = numpy.abs(v)
+    return numpy.maximum(a[..., 0], numpy.maximum(a[..., 1], a[..., 2]))
+
+
+@_quiet
+def vadd(v1: ArrayLike, v2: ArrayLike) -> ndarray:
+    """
+    Add two 3 dimensional vectors.
+
+    :param v1: First vectors to be added.
+    :param v2: Second vectors to be added.
+    :return: v1+v2
+    """
+    return _vectors(v1) + _vectors(v2)
+
+
+@_quiet
+def vaddg(v1: ArrayLike, v2: ArrayLike) -> ndarray:
+    """
+    Add two n-dimensional vectors.
+
+    :param v1: First vectors to be added.
+    :param v2: Second vectors to be added.
+    :return: v1+v2
+    """
+    return _vectors(v1, 0) + _vectors(v2, 0)
+
+
+@_quiet
+def vsub(v1: ArrayLike, v2: ArrayLike) -> ndarray:
+    """
+    Compute the difference between two 3-dimensional vectors.
+
+    :param v1: First vectors (minuend).
+    :param v2: Second vectors (subtrahend).
+    :return: v1-v2
+    """
+    return _vectors(v1) - _vectors(v2)
+
+
+@_quiet
+def vsubg(v1: ArrayLike, v2: ArrayLike) -> ndarray:
+    """
+    Compute the difference between two vectors of arbitrary dimension.
+
+    :param v1: First vectors (minuend).
+    :param v2: Second vectors (subtrahend).
+    :return: v1-v2
+    """
+    return _vectors(v1, 0) - _vectors(v2, 0)
+
+
+def _vdot(v1: ndarray, v2: ndarray) -> ndarray:
+    return v1[..., 0] * v2[..., 0] + v1[..., 1] * v2[..., 1] + v1[..., 2] * v2[..., 2]
+
+
+@_quiet
+def vdot(v1: ArrayLike, v2: ArrayLike) -> Union[ndarray, float]:
+    """
+    Compute the dot product of two 3-dimensional vectors.
+
+    :param v1: First vectors in the dot product.
+    :param v2: Second vectors in the dot product.
+    :return: dot product of v1 and v2.
+    """
+    return _scalar(_vdot(_vectors(v1), _vectors(v2)))
+
+
+def _vdotg(v1: ndarray, v2: ndarray) -> ndarray:
+    dot = numpy.zeros(numpy.broadcast_shapes(v1.shape[:-1], v2.shape[:-1]))
+    for i in range(v1.shape[-1]):
+        dot = dot + v1[..., i] * v2[..., i]
+    return dot
+
+
+@_quiet
+def vdotg(v1: ArrayLike, v2: ArrayLike) -> Union[ndarray, float]:
+    """
+    Compute the dot product of two vectors of arbitrary dimension.
+
+    :param v1: First vectors in the dot product.
+    :param v2: Second vectors in the dot product.
+    :return: dot product of v1 and v2.
+    """
+    v1 = _vectors(v1, 0)
+    return _scalar(_vdotg(v1, _vectors(v2, v1.shape[-1])))
+
+
+def _vcrss(v1: ndarray, v2: ndarray) -> ndarray:
+    shape = numpy.broadcast_shapes(v1.shape, v2.shape)
+    vout = numpy.empty(shape)
+    vout[..., 0] = v1[..., 1] * v2[..., 2] - v1[..., 2] * v2[..., 1]
+    vout[..., 1] = v1[..., 2] * v2[..., 0] - v1[..., 0] * v2[..., 2]
+    vout[..., 2] = v1[..., 0] * v2[..., 1] - v1[..., 1] * v2[..., 0]
+    return vout
+
+
+@_quiet
+def vcrss(v1: ArrayLike, v2: ArrayLike) -> ndarray:
+    """
+    Compute the cross product of two 3-dimensional vectors.
+
+    :param v1: Left hand vectors for cross product.
+    :param v2: Right hand vectors for cross product.
+    :return: Cross product v1 x v2.
+    """
+    return _vcrss(_vectors(v1), _vectors(v2))
+
+
+def _vnorm(v: ndarray) -> ndarray:
+    vmax = _maxabs(v)
+    t = v / vmax[..., None]
+    norm = vmax * numpy.sqrt(
+        t[..., 0] * t[..., 0] + t[..., 1] * t[..., 1] + t[..., 2] * t[..., 2]
+    )
+    return numpy.where(vmax == 0.0, 0.0, norm)
+
+
+@_quiet
+def vnorm(v: ArrayLike) -> Union[ndarray, float]:
+    """
+    Compute the magnitude of 3-dimensional vectors.
+
+    :param v: Vectors whose magnitude is to be found.
+    :return: magnitude of v calculated in a numerically stable way
+    """
+    return _scalar(_vnorm(_vectors(v)))
+
+
+def _vnormg(v: ndarray) -> ndarray:
+    scale = (
+        numpy.max(numpy.abs(v), axis=-1) if v.shape[-1] else numpy.zeros(v.shape[:-1])
+    )
+    norm = numpy.zeros(v.shape[:-1])
+    for i in range(v.shape[-1]):
+        t = v[..., i] / scale
+        norm = norm + t * t
+    norm = numpy.sqrt(norm) * scale
+    return numpy.where(scale == 0.0, 0.0, norm)
+
+
+@_quiet
+def vnormg(v: ArrayLike) -> Union[ndarray, float]:
+    """
+    Compute the magnitude of vectors of arbitrary dimension.
+
+    :param v: Vectors whose magnitude is to be found.
+    :return: magnitude of v calculated in a numerically stable way
+    """
+    return _scalar(_vnormg(_vectors(v, 0)))
+
+
+def _unit(v: ndarray, vmag: ndarray) -> ndarray:
+    return numpy.where(vmag[..., None] > 0.0, v / vmag[..., None], 0.0)
+
+
+@_quiet
+def vhat(v1: ArrayLike) -> ndarray:
+    """
+    Find the unit vectors along 3-dimensional vectors.
+
+    :param v1: Vectors to be unitized.
+    :return: Unit vectors v / abs(v), zero vectors for zero vectors.
+    """
+    v1 = _vectors(v1)
+    return _unit(v1, _vnorm(v1))
+
+
+@_quiet
+def vhatg(v1: ArrayLike) -> ndarray:
+    """
+    Find the unit vectors along vectors of arbitrary dimension.
+
+    :param v1: Vectors to be normalized.
+    :return: Unit vectors v / abs(v), zero vectors for zero vectors.
+    """
+    v1 = _vectors(v1, 0)
+    return _unit(v1, _vnormg(v1))
+
+
+def _twice_asin_half(chord: ndarray) -> ndarray:
+    # 2 asin(chord / 2), the angle between unit vectors chord apart
+    half = _libm(_asin, 0.5 * chord)
+    return half + half
+
+
+@_quiet
+def vsep(v1: ArrayLike, v2: ArrayLike) -> Union[ndarray, float]:
+    """
+    Find the separation angle in radians between two 3-dimensional
+    vectors. This angle is defined as zero if either vector is zero.
+
+    :param v1: First vectors.
+    :param v2: Second vectors.
+    :return: separation angle in radians
+    """
+    v1, v2 = _vectors(v1), _vectors(v2)
+    dmag1, dmag2 = _vnorm(v1), _vnorm(v2)
+    u1, u2 = _unit(v1, dmag1), _unit(v2, dmag2)
+    dot = _vdot(u1, u2)
+    # the chord between u1 and u2 for acute angles and between u1 and -u2
+    # for obtuse ones, the angle is pi/2 when the dot product is zero
+    angle = _twice_asin_half(numpy.where(dot > 0.0, _vnorm(u1 - u2), _vnorm(u1 + u2)))
+    sep = numpy.where(
+        dot > 0.0, angle, numpy.where(dot < 0.0, math.pi - angle, math.pi / 2)
+    )
+    return _scalar(numpy.where((dmag1 == 0.0) | (dmag2 == 0.0), 0.0, sep))
+
+
+@_quiet
+def vsepg(v1: ArrayLike, v2: ArrayLike) -> Union[ndarray, float]:
+    """
+    Find the separation angle in radians between two vectors of
+    arbitrary dimension. This angle is defined as zero if either
+    vector is zero.
+
+    :param v1: First vectors.
+    :param v2: Second vectors.
+    :return: separation angle in radians
+    """
+    v1 = _vectors(v1, 0)
+    v2 = _vectors(v2, v1.shape[-1])
+    dmag1, dmag2 = _vnormg(v1), _vnormg(v2)
+    shape = numpy.broadcast_shapes(dmag1.shape, dmag2.shape)
+    near, far = numpy.zeros(shape), numpy.zeros(shape)
+    r1, r2 = 1.0 / dmag1, 1.0 / dmag2
+    for i in range(v1.shape[-1]):
+        a, b = v1[..., i] * r1, v2[..., i] * r2
+        near = near + (a - b) * (a - b)
+        far = far + (a + b) * (a + b)
+    dot = _vdotg(v1, v2)
+    # unlike vsep_c, vsepg_c takes the chord between u1 and -u2 for acute
+    # angles and the one between u1 and u2 for obtuse ones
+    angle = _twice_asin_half(numpy.sqrt(numpy.where(dot > 0.0, far, near)))
+    sep = numpy.where(
+        dot > 0.0, math.pi - angle, numpy.where(dot < 0.0, angle, math.pi / 2)
+    )
+    return _scalar(numpy.where((dmag1 == 0.0) | (dmag2 == 0.0), 0.0, sep))
+
+
+def _vproj(a: ndarray, b: ndarray) -> ndarray:
+    biga, bigb = _maxabs(a), _maxabs(b)
+    r = a / biga[..., None]
+    t = b / bigb[..., None]
+    scale = _vdot(r, t) * biga / _vdot(t, t)
+    p = scale[..., None] * t
+    return numpy.where(((biga == 0.0) | (bigb == 0.0))[..., None], 0.0, p)
+
+
+@_quiet
+def vrotv(v: ArrayLike, axis: ArrayLike, theta: ArrayLike) -> ndarray:
+    """
+    Rotate vectors about specified axis vectors by specified angles
+    and return the rotated vectors.
+
+    :param v: Vectors to be rotated.
+    :param axis: Axes of the rotation.
+    :param theta: Angles of rotation (radians).
+    :return: Results of rotating v about axis by theta
+    """
+    v, axis = _vectors(v), _vectors(axis)
+    x = _unit(axis, _vnorm(axis))
+    p = _vproj(v, x)
+    v1 = v - p
+    v2 = _vcrss(x, v1)
+    c = numpy.asarray(_libm(math.cos, theta))[..., None]
+    s = numpy.asarray(_libm(math.sin, theta))[..., None]
+    r = (c * v1 + s * v2) + p
+    zero = numpy.all(axis == 0.0, axis=-1)[..., None]
+    return numpy.where(zero, v, r)
+
+
+@_quiet
+def mxv(m1: ArrayLike, vin: ArrayLike) -> ndarray:
+    """
+    Multiply 3x3 matrices with 3-dimensional vectors.
+
+    :param m1: 3x3 matrices.
+    :param vin: 3-dimensional vectors.
+    :return: 3-dimensional vectors.
+    """
+    m1, vin = _matrices(m1), _vectors(vin)[..., None, :]
+    return (
+        m1[..., :, 0] * vin[..., 0]
+        + m1[..., :, 1] * vin[..., 1]
+        + m1[..., :, 2] * vin[..., 2]
+    )
+
+
+@_quiet
+def mtxv(m1: ArrayLike, vin: ArrayLike) -> ndarray:
+    """
+    Multiply the transpose of 3x3 matrices on the left with vectors on
+    the right.
+
+    :param m1: 3x3 matrices.
+    :param vin: 3-dimensional vectors.
+    :return: 3-dimensional vectors.
+    """
+    m1, vin = _matrices(m1), _vectors(vin)[..., None, :]
+    return (
+        m1[..., 0, :] * vin[..., 0]
+        + m1[..., 1, :] * vin[..., 1]
+        + m1[..., 2, :] * vin[..., 2]
+    )
+
+
+@_quiet
+def mxm(m1: ArrayLike, m2: ArrayLike) -> ndarray:
+    """
+    Multiply two stacks of 3x3 matrices.
+
+    :param m1: 3x3 matrices.
+    :param m2: 3x3 matrices.
+    :return: 3x3 matrices m1 times m2.
+    """
+    m1, m2 = _matrices(m1), _matrices(m2)
+    return (
+        m1[..., :, 0, None] * m2[..., None, 0, :]
+        + m1[..., :, 1, None] * m2[..., None, 1, :]
+        + m1[..., :, 2, None] * m2[..., None, 2, :]
+    )
+
+
+@_quiet
+def xpose(m: ArrayLike) -> ndarray:
+    """
+    Transpose 3x3 matrices.
+
+    :param m: Matrices to be transposed.
+    :return: Transposed matrices.
+    """
+    return numpy.ascontiguousarray(numpy.swapaxes(_matrices(m), -1, -2))
+
+
+@_quiet
+def mxvg(m1: ArrayLike, v2: ArrayLike) -> ndarray:
+    """
+    Multiply matrices and vectors of arbitrary size.
+
+    :param m1: Left-hand matrices to be multiplied.
+    :param v2: Right-hand vectors to be multiplied.
+    :return: Product vectors m1*v2
+    """
+    m1 = _matrices(m1, (0, 0))
+    v2 = _vectors(v2, m1.shape[-1])[..., None, :]
+    shape = numpy.broadcast_shapes(m1.shape[:-1], v2.shape[:-1])
+    vout = numpy.zeros(shape)
+    for k in range(m1.shape[-1]):
+        vout = vout + m1[..., :, k] * v2[..., k]
+    return vout
+
+
+@_quiet
+def mtxvg(m1: ArrayLike, v2: ArrayLike) -> ndarray:
+    """
+    Multiply the transpose of matrices and vectors of arbitrary size.
+
+    :param m1: Left-hand matrices to be multiplied.
+    :param v2: Right-hand vectors to be multiplied.
+    :return: Product vectors m1 transpose * v2.
+    """
+    m1 = _matrices(m1, (0, 0))
+    v2 = _vectors(v2, m1.shape[-2])[..., None, :]
+    shape = numpy.broadcast_shapes(m1.shape[:-2] + m1.shape[-1:], v2.shape[:-1])
+    vout = numpy.zeros(shape)
+    for k in range(m1.shape[-2]):
+        vout = vout + m1[..., k, :] * v2[..., k]
+    return vout
+
+
+@_quiet
+def mxmg(m1: ArrayLike, m2: ArrayLike) -> ndarray:
+    """
+    Multiply two stacks of matrices of arbitrary size.
+
+    :param m1: nrow1 X ncol1 matrices.
+    :param m2: ncol1 X ncol2 matrices.
+    :return: nrow1 X ncol2 matrices.
+    """
+    m1 = _matrices(m1, (0, 0))
+    m2 = _matrices(m2, (0, 0))
+    if m2.shape[-2] != m1.shape[-1]:
+        raise ValueError(
+            f"cannot multiply matrices of shapes {m1.shape} and {m2.shape}"
+        )
+    shape = numpy.broadcast_shapes(
+        m1.shape[:-1] + m2.shape[-1:], m2.shape[:-2] + (1, 1)
+    )
+    mout = numpy.zeros(shape)
+    for k in range(m1.shape[-1]):
+        mout = mout + m1[..., :, k, None] * m2[..., None, k, :]
+    return mout
+
+
+@_quiet
+def xposeg(matrix: ArrayLike) -> ndarray:
+    """
+    Transpose matrices of arbitrary size, the matrices need not be square.
+
+    :param matrix: Matrices to be transposed.
+    :return: Transposed matrices.
+    """
+    return numpy.ascontiguousarray(numpy.swapaxes(_matrices(matrix, (0, 0)), -1, -2))
+
+
+def _axes(iaxis: int) -> Tuple[int, int, int]:
+    # the rotation axis and the two axes of the plane it rotates, in the
+    # cyclic order CSPICE uses
+    i1 = (int(iaxis) - 1) % 3
+    return i1, (i1 + 1) % 3, (i1 + 2) % 3
+
+
+@_quiet
+def rotate(angle: ArrayLike, iaxis: int) -> ndarray:
+    """
+    Calculate the 3x3 rotation matrices generated by rotations of
+    specified angles about a specified axis. This rotation is thought
+    of as rotating the coordinate system.
+
+    :param angle: Angles of rotation (radians).
+    :param iaxis: Axis of rotation X=1, Y=2, Z=3.
+    :return: Resulting rotation matrices
+    """
+    c, s = _libm(math.cos, angle), _libm(math.sin, angle)
+    i1, i2, i3 = _axes(iaxis)
+    mout = numpy.zeros(numpy.shape(angle) + (3, 3))
+    mout[..., i1, i1] = 1.0
+    mout[..., i2, i2] = c
+    mout[..., i2, i3] = s
+    mout[..., i3, i2] = -s
+    mout[..., i3, i3] = c
+    return mout
+
+
+@_quiet
+def rotmat(m1: ArrayLike, angle: ArrayLike, iaxis: int) -> ndarray:
+    """
+    Rotmat applies rotations of angle radians about axis iaxis to
+    matrices. This rotation is thought of as rotating the coordinate
+    system.
+
+    :param m1: Matrices to be rotated.
+    :param angle: Angles of rotation (radians).
+    :param iaxis: Axis of rotation X=1, Y=2, Z=3.
+    :return: Resulting rotated matrices
+    """
+    m1 = _matrices(m1)
+    c = numpy.asarray(_libm(math.cos, angle))[..., None]
+    s = numpy.asarray(_libm(math.sin, angle))[..., None]
+    i1, i2, i3 = _axes(iaxis)
+    shape = numpy.broadcast_shapes(m1.shape, numpy.shape(angle) + (3, 3))
+    mout = numpy.empty(shape)
+    mout[..., i1, :] = m1[..., i1, :]
+    mout[..., i2, :] = c * m1[..., i2, :] + s * m1[..., i3, :]
+    mout[..., i3, :] = -s * m1[..., i2, :] + c * m1[..., i3, :]
+    return mout